@@ -3,9 +3,14 @@ Chat History & Memory Management
 채팅 히스토리 아카이빙 및 메모리 관리
 - Supabase 영구 저장 지원
 - 로컬 파일 Fallback
+  - session_{id}.json: 작은 헤더 (세션 정보, 파일 목록, 메시지 수, 로그 오프셋)
+  - session_{id}.messages.jsonl: 메시지 append-only 로그 (메시지당 한 줄)
+  - 메시지 추가는 로그에 한 줄 append만 하고, 헤더는 파일 목록이 바뀔 때와
+    주기적 정리(compaction) 때만 다시 쓴다 → 세션이 길어져도 메시지당 쓰기량 일정
 """
 
 import json
+import os
 import re
 from pathlib import Path
 from datetime import datetime
@@ -48,6 +53,60 @@ def _sanitize_session_id(session_id: str, max_length: int = 100) -> str:
 
 logger = get_logger("memory")
 
+# 이 개수만큼 메시지가 쌓일 때마다 헤더의 메시지 수/로그 오프셋을 로그와 맞춘다
+COMPACT_EVERY_MESSAGES = 50
+
+
+def _message_log_path(session_file: Path) -> Path:
+    """session_{id}.json → session_{id}.messages.jsonl"""
+    return session_file.with_name(f"{session_file.stem}.messages.jsonl")
+
+
+def _read_message_log(log_file: Path, offset: int = 0) -> List[Dict[str, Any]]:
+    """로그에서 offset 이후 메시지 읽기 (중간에 끊긴 마지막 줄은 무시)"""
+    messages = []
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    messages.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return messages
+
+
+def _count_log_lines(log_file: Path, offset: int = 0) -> int:
+    """offset 이후 완결된 줄 수 (JSON 파싱 없이)"""
+    count = 0
+    try:
+        with open(log_file, 'rb') as f:
+            f.seek(offset)
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                count += chunk.count(b"\n")
+    except FileNotFoundError:
+        pass
+    return count
+
+
+def _session_message_count(header: Dict[str, Any], session_file: Path) -> int:
+    """헤더의 메시지 수 + 헤더 저장 이후 로그에 추가된 줄 수"""
+    if "messages" in header:  # 이전 형식 (메시지가 헤더에 포함)
+        return len(header.get("messages") or [])
+    log_file = _message_log_path(session_file)
+    synced_bytes = header.get("log_bytes", 0)
+    try:
+        log_size = log_file.stat().st_size
+    except FileNotFoundError:
+        return 0
+    if log_size < synced_bytes:  # 로그가 잘렸으면 헤더 값을 믿지 않고 전체를 센다
+        return _count_log_lines(log_file)
+    return header.get("message_count", 0) + _count_log_lines(log_file, synced_bytes)
+
 # Supabase 스토리지 (옵션)
 try:
     from .supabase_storage import SupabaseStorage
@@ -104,6 +163,10 @@ class ChatMemory:
 
         self._session_created = False
 
+        # 로그에 기록한 바이트 수 (헤더의 log_bytes 이후 줄은 읽을 때 추가로 센다)
+        self._log_bytes = 0
+        self._messages_since_compact = 0
+
     def remember(self, key: str, value: Any) -> None:
         """Cache a computed result for the current runtime."""
         self.cached_results[key] = value
@@ -127,15 +190,18 @@ class ChatMemory:
             raw_session_id = f"{nickname}_{company}_{date_str}"
             new_session_id = _sanitize_session_id(raw_session_id)
 
-            # 로컬: 기존 파일 삭제
+            # 로컬: 기존 헤더 삭제, 메시지 로그는 새 이름으로 이동
+            new_session_file = self.storage_dir / f"session_{new_session_id}.json"
+            old_log_file = _message_log_path(self.current_session_file)
             if self.current_session_file.exists():
                 self.current_session_file.unlink()
+            if self._log_bytes and old_log_file.exists():
+                os.replace(old_log_file, _message_log_path(new_session_file))
 
             # 새 세션 ID로 업데이트
-            old_session_id = self.session_id
             self.session_id = new_session_id
             self.session_metadata["session_id"] = new_session_id
-            self.current_session_file = self.storage_dir / f"session_{new_session_id}.json"
+            self.current_session_file = new_session_file
 
             # Supabase: 새 세션 생성
             if self.db:
@@ -166,8 +232,8 @@ class ChatMemory:
         if self.db:
             self.db.add_message(self.session_id, role, content, metadata)
 
-        # 로컬 저장
-        self._save_session()
+        # 로컬 저장 (로그에 한 줄 append)
+        self._append_message(message)
 
     def add_file_analysis(self, file_path: str):
         """분석된 파일 추가"""
@@ -198,10 +264,16 @@ class ChatMemory:
             self._save_session()
 
     def _save_session(self):
-        """현재 세션을 로컬 파일로 저장"""
+        """현재 세션 헤더를 로컬 파일로 저장 (메시지는 로그 파일에 따로 있음)"""
+        header = {key: value for key, value in self.session_metadata.items() if key != "messages"}
+        header["message_count"] = len(self.session_metadata["messages"])
+        header["log_bytes"] = self._log_bytes
+        self._messages_since_compact = 0
+        tmp_file = self.current_session_file.with_name(f"{self.current_session_file.name}.tmp")
         try:
-            with open(self.current_session_file, 'w', encoding='utf-8') as f:
-                json.dump(self.session_metadata, f, ensure_ascii=False, indent=2)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(header, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_file, self.current_session_file)
         except PermissionError as e:
             logger.error(f"Permission denied saving session to {self.current_session_file}: {e}")
         except OSError as e:
@@ -209,6 +281,46 @@ class ChatMemory:
         except Exception as e:
             logger.error(f"Unexpected error saving session: {e}", exc_info=True)
 
+    def _append_message(self, message: Dict[str, Any]):
+        """메시지를 로그에 한 줄 append, 주기적으로 헤더 동기화"""
+        log_file = _message_log_path(self.current_session_file)
+        line = (json.dumps(message, ensure_ascii=False) + "\n").encode("utf-8")
+        first_message = not self._log_bytes
+        try:
+            # 세션의 첫 메시지면 같은 ID의 이전 로그를 덮어쓴다 (헤더와 어긋나지 않게)
+            with open(log_file, 'wb' if first_message else 'ab') as f:
+                f.write(line)
+            self._log_bytes += len(line)
+        except OSError as e:
+            logger.error(f"OS error appending message to {log_file}: {e}")
+            self._truncate_torn_tail(log_file)
+            return
+
+        self._messages_since_compact += 1
+        if first_message or self._messages_since_compact >= COMPACT_EVERY_MESSAGES:
+            # 첫 메시지 때도 헤더를 써서 세션 목록에 바로 보이게 한다
+            self._compact_session()
+
+    def _truncate_torn_tail(self, log_file: Path):
+        """중간에 끊긴 쓰기가 남긴 마지막 줄 조각을 잘라낸다 (완결된 줄은 건드리지 않음)"""
+        try:
+            with open(log_file, 'r+b') as f:
+                size = f.seek(0, os.SEEK_END)
+                if size <= self._log_bytes:
+                    return
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    f.truncate(self._log_bytes)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"OS error repairing {log_file}: {e}")
+
+    def _compact_session(self):
+        """주기적 정리: 로그 꼬리를 복구하고 헤더의 메시지 수/오프셋을 로그와 맞춘다"""
+        self._truncate_torn_tail(_message_log_path(self.current_session_file))
+        self._save_session()
+
     def get_recent_sessions(self, limit: int = 5) -> List[Dict[str, Any]]:
         """최근 세션 목록 가져오기"""
         # Supabase 우선
@@ -217,10 +329,17 @@ class ChatMemory:
             if sessions:
                 return sessions
 
-        # 로컬 Fallback
+        # 로컬 Fallback (헤더만 읽고 메시지 수는 로그 꼬리만 센다)
+        def _last_modified(session_file: Path) -> float:
+            mtime = session_file.stat().st_mtime
+            log_file = _message_log_path(session_file)
+            if log_file.exists():
+                mtime = max(mtime, log_file.stat().st_mtime)
+            return mtime
+
         session_files = sorted(
             self.storage_dir.glob("session_*.json"),
-            key=lambda x: x.stat().st_mtime,
+            key=_last_modified,
             reverse=True
         )
 
@@ -229,13 +348,13 @@ class ChatMemory:
             try:
                 with open(session_file, 'r', encoding='utf-8') as f:
                     session_data = json.load(f)
-                    sessions.append({
-                        "session_id": session_data.get("session_id"),
-                        "start_time": session_data.get("start_time"),
-                        "message_count": len(session_data.get("messages", [])),
-                        "analyzed_files": session_data.get("analyzed_files", []),
-                        "file_path": str(session_file)
-                    })
+                sessions.append({
+                    "session_id": session_data.get("session_id"),
+                    "start_time": session_data.get("start_time"),
+                    "message_count": _session_message_count(session_data, session_file),
+                    "analyzed_files": session_data.get("analyzed_files", []),
+                    "file_path": str(session_file)
+                })
             except Exception:
                 continue
 
@@ -258,7 +377,12 @@ class ChatMemory:
             return None
 
         with open(session_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            session = json.load(f)
+        if "messages" not in session:
+            session["messages"] = _read_message_log(_message_log_path(session_file))
+            session["message_count"] = len(session["messages"])
+            session.pop("log_bytes", None)
+        return session
 
     def start_new_session(self, custom_session_id: str = None, user_info: Dict[str, Any] = None):
         """새 세션 시작 (기존 세션 파일은 유지)
@@ -278,6 +402,10 @@ class ChatMemory:
             else:
                 new_session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+        # 이전 세션 헤더를 로그와 맞춰 둔다
+        if self._messages_since_compact:
+            self._compact_session()
+
         self.session_id = new_session_id
         self.current_session_file = self.storage_dir / f"session_{new_session_id}.json"
 
@@ -292,6 +420,8 @@ class ChatMemory:
         }
 
         self._session_created = False
+        self._log_bytes = 0
+        self._messages_since_compact = 0
         if self.db:
             self.db.create_session(new_session_id, self.session_metadata.get("user_info"))
             self._session_created = True
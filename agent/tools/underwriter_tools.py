@@ -5,12 +5,14 @@ DART underwriter opinion JSONL search, TF-IDF similarity,
 PDF market evidence extraction, and data fetching.
 """
 
+import hashlib
 import json
 import math
 import os
 import re
 import subprocess
 import sys
+import zlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List
@@ -63,6 +65,11 @@ UNDERWRITER_CATEGORY_KEYWORDS = {
     },
 }
 
+# 유사도 검색 인덱스: 문자 n-gram을 crc32로 해시한 버킷을 어휘로 쓰는 희소 행렬.
+# JSONL 옆에 "<jsonl>.tfidf.npz"로 저장하고, JSONL 뒤에 줄이 추가되면 새 줄만 토큰화한다.
+UNDERWRITER_TFIDF_BUCKETS = 1 << 20
+UNDERWRITER_TFIDF_VERSION = 1
+
 _UNDERWRITER_TFIDF_CACHE = {
     "path": None,
     "mtime": None,
@@ -70,10 +77,8 @@ _UNDERWRITER_TFIDF_CACHE = {
     "min_n": None,
     "max_n": None,
     "max_text_chars": None,
-    "idf": None,
-    "vectors": None,
+    "index": None,
     "entries": None,
-    "texts": None,
 }
 
 # ========================================
@@ -404,20 +409,29 @@ def _generalize_underwriter_text(text: str, corp_name: str = None) -> str:
     return generalized
 
 
-def _parse_underwriter_jsonl(jsonl_path: str) -> List[Dict[str, Any]]:
+def _parse_underwriter_jsonl_bytes(data: bytes) -> List[Dict[str, Any]]:
+    """JSONL 바이트 → 레코드 목록. 줄 구분은 LF만 사용한다.
+
+    str.splitlines()는 U+0085/U+2028/U+2029에서도 나누는데, ensure_ascii=False로 저장된
+    본문에는 이 문자들이 그대로 들어 있어 레코드가 쪼개진다.
+    """
     entries = []
-    with open(jsonl_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+    for raw in data.split(b"\n"):
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line:
+            continue
+        try:
+            entries.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue
     return entries
 
 
+def _parse_underwriter_jsonl(jsonl_path: str) -> List[Dict[str, Any]]:
+    with open(jsonl_path, "rb") as f:
+        return _parse_underwriter_jsonl_bytes(f.read())
+
+
 def _normalize_similarity_text(text: str, max_chars: int = 2000) -> str:
     if not text:
         return ""
@@ -442,51 +456,149 @@ def _char_ngram_counts(text: str, min_n: int = 3, max_n: int = 5) -> Dict[str, i
     return counts
 
 
-def _build_tfidf_index(texts: List[str], min_n: int = 3, max_n: int = 5) -> tuple:
-    counts_list = [_char_ngram_counts(text, min_n=min_n, max_n=max_n) for text in texts]
-    df: Dict[str, int] = {}
-    for counts in counts_list:
-        for term in counts.keys():
-            df[term] = df.get(term, 0) + 1
-
-    doc_count = len(counts_list)
-    idf = {term: math.log((1 + doc_count) / (1 + freq)) + 1 for term, freq in df.items()}
-
-    vectors = []
-    for counts in counts_list:
-        vec: Dict[str, float] = {}
-        norm = 0.0
-        for term, tf in counts.items():
-            weight = (1 + math.log(tf)) * idf[term]
-            vec[term] = weight
-            norm += weight * weight
-        vectors.append((vec, math.sqrt(norm)))
-    return idf, vectors
-
-
-def _vectorize_query(text: str, idf: Dict[str, float], min_n: int = 3, max_n: int = 5) -> tuple:
-    counts = _char_ngram_counts(text, min_n=min_n, max_n=max_n)
-    vec: Dict[str, float] = {}
-    norm = 0.0
-    for term, tf in counts.items():
-        if term not in idf:
-            continue
-        weight = (1 + math.log(tf)) * idf[term]
-        vec[term] = weight
-        norm += weight * weight
-    return vec, math.sqrt(norm)
+def _ngram_bucket_weights(
+    text: str, min_n: int, max_n: int, buckets: int, memo: Dict[str, int] = None,
+) -> Dict[int, float]:
+    """문자 n-gram 빈도 → 해시 버킷별 로그 TF 가중치 (1 + log tf).
+
+    memo: 여러 문서를 토큰화할 때 n-gram → 버킷 결과를 재사용할 dict.
+    """
+    weights: Dict[int, float] = {}
+    for term, tf in _char_ngram_counts(text, min_n=min_n, max_n=max_n).items():
+        bucket = memo.get(term) if memo is not None else None
+        if bucket is None:
+            bucket = zlib.crc32(term.encode("utf-8")) % buckets
+            if memo is not None:
+                memo[term] = bucket
+        weights[bucket] = weights.get(bucket, 0.0) + 1 + math.log(tf)
+    return weights
+
+
+def _underwriter_similarity_text(entry: Dict[str, Any], max_text_chars: int) -> str:
+    combined = f"{entry.get('section_title', '')}\n{entry.get('section_text', '')}"
+    return _normalize_similarity_text(combined, max_chars=max_text_chars)
+
+
+def _build_tfidf_postings(texts: List[str], min_n: int, max_n: int, buckets: int, first_doc: int = 0) -> tuple:
+    """문서들을 토큰화해 버킷 순으로 정렬된 posting (post_buckets, post_docs, post_tf)."""
+    import numpy as np
+
+    memo: Dict[str, int] = {}
+    cols: List[int] = []
+    docs: List[int] = []
+    vals: List[float] = []
+    for doc_id, text in enumerate(texts, start=first_doc):
+        weights = _ngram_bucket_weights(text, min_n, max_n, buckets, memo)
+        cols.extend(weights.keys())
+        vals.extend(weights.values())
+        docs.extend([doc_id] * len(weights))
+    post_buckets = np.asarray(cols, dtype=np.int32)
+    order = np.argsort(post_buckets, kind="stable")
+    return (
+        post_buckets[order],
+        np.asarray(docs, dtype=np.int32)[order],
+        np.asarray(vals, dtype=np.float64)[order],
+    )
+
+
+def _merge_tfidf_postings(old: tuple, new: tuple) -> tuple:
+    """버킷 순 posting 두 개를 병합 (같은 버킷 안에서는 기존 문서가 앞)."""
+    import numpy as np
+
+    post_buckets, post_docs, post_tf = (np.concatenate([a, b]) for a, b in zip(old, new))
+    # 이미 정렬된 두 구간이므로 stable 정렬은 사실상 선형 병합
+    order = np.argsort(post_buckets, kind="stable")
+    return post_buckets[order], post_docs[order], post_tf[order]
+
+
+def _finalize_tfidf_index(postings: tuple, doc_count: int, buckets: int) -> Dict[str, Any]:
+    """버킷 순 posting(CSC 희소 행렬)에서 idf와 문서 norm으로 정규화된 가중치를 만든다.
+
+    idf와 문서 norm은 전체 문서 수에 의존하므로 저장하지 않고 로드/증분 갱신 때
+    numpy로 다시 계산한다 (토큰화에 비하면 무시할 수준).
+    """
+    import numpy as np
+
+    post_buckets, post_docs, post_tf = postings
+    df = np.bincount(post_buckets, minlength=buckets)
+    idf = np.log((1 + doc_count) / (1 + df)) + 1
+    weights = post_tf * idf[post_buckets]
+    norms = np.sqrt(np.bincount(post_docs, weights=weights * weights, minlength=doc_count))
+    post_ptr = np.zeros(buckets + 1, dtype=np.int64)
+    np.cumsum(df, out=post_ptr[1:])
+    return {
+        "postings": postings,
+        "doc_count": doc_count,
+        "buckets": buckets,
+        "df": df,
+        "idf": idf,
+        "post_ptr": post_ptr,
+        "post_docs": post_docs,
+        "post_weights": weights / np.where(norms > 0, norms, 1.0)[post_docs],
+    }
+
+
+def _score_tfidf_query(index: Dict[str, Any], text: str, min_n: int = 3, max_n: int = 5):
+    """질의와 모든 문서의 코사인 유사도 (posting list 위의 희소 mat-vec 한 번)."""
+    import numpy as np
+
+    scores = np.zeros(index["doc_count"], dtype=np.float64)
+    weights = _ngram_bucket_weights(text, min_n, max_n, index["buckets"])
+    if not weights:
+        return scores
+    q_buckets = np.fromiter(weights.keys(), dtype=np.int64, count=len(weights))
+    q_tf = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+    known = index["df"][q_buckets] > 0
+    q_buckets = q_buckets[known]
+    q_weights = q_tf[known] * index["idf"][q_buckets]
+    q_norm = math.sqrt(float(np.dot(q_weights, q_weights)))
+    if q_norm == 0:
+        return scores
+
+    starts = index["post_ptr"][q_buckets]
+    lengths = index["post_ptr"][q_buckets + 1] - starts
+    total = int(lengths.sum())
+    # 버킷별 [start, start+length) 구간을 이어 붙인 posting 위치
+    positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(total)
+    contrib = index["post_weights"][positions] * np.repeat(q_weights, lengths)
+    scores += np.bincount(index["post_docs"][positions], weights=contrib, minlength=index["doc_count"])
+    return scores / q_norm
+
+
+def _load_persisted_tfidf(index_path: Path) -> tuple:
+    import numpy as np
+
+    try:
+        with np.load(index_path, allow_pickle=False) as npz:
+            meta = json.loads(str(npz["meta"]))
+            postings = (npz["post_buckets"], npz["post_docs"], npz["post_tf"])
+    except (OSError, KeyError, ValueError) as e:
+        if index_path.exists():
+            logger.warning(f"Underwriter TF-IDF index unreadable, rebuilding: {e}")
+        return None, None
+    return meta, postings
+
 
+def _save_persisted_tfidf(index_path: Path, meta: Dict[str, Any], index: Dict[str, Any]) -> None:
+    import numpy as np
 
-def _cosine_similarity(vec_a: Dict[str, float], norm_a: float, vec_b: Dict[str, float], norm_b: float) -> float:
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    if len(vec_a) > len(vec_b):
-        vec_a, vec_b = vec_b, vec_a
-        norm_a, norm_b = norm_b, norm_a
-    dot = 0.0
-    for term, weight in vec_a.items():
-        dot += weight * vec_b.get(term, 0.0)
-    return dot / (norm_a * norm_b)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps(meta)),
+                post_buckets=index["postings"][0],
+                post_docs=index["postings"][1],
+                post_tf=index["postings"][2],
+            )
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logger.warning(f"Failed to persist underwriter TF-IDF index: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
 
 def _get_underwriter_tfidf_index(jsonl_path: str, min_n: int = 3, max_n: int = 5, max_text_chars: int = 2000):
@@ -503,20 +615,52 @@ def _get_underwriter_tfidf_index(jsonl_path: str, min_n: int = 3, max_n: int = 5
         and cache["min_n"] == min_n
         and cache["max_n"] == max_n
         and cache["max_text_chars"] == max_text_chars
-        and cache["idf"] is not None
-        and cache["vectors"] is not None
+        and cache["index"] is not None
         and cache["entries"] is not None
-        and cache["texts"] is not None
     ):
         return cache, None
 
-    entries = _parse_underwriter_jsonl(jsonl_path)
-    texts = []
-    for entry in entries:
-        combined = f"{entry.get('section_title', '')}\n{entry.get('section_text', '')}"
-        texts.append(_normalize_similarity_text(combined, max_chars=max_text_chars))
-
-    idf, vectors = _build_tfidf_index(texts, min_n=min_n, max_n=max_n)
+    with open(jsonl_path, "rb") as f:
+        data = f.read()
+    buckets = UNDERWRITER_TFIDF_BUCKETS
+    params = {
+        "version": UNDERWRITER_TFIDF_VERSION,
+        "min_n": min_n,
+        "max_n": max_n,
+        "max_text_chars": max_text_chars,
+        "buckets": buckets,
+    }
+    index_path = Path(f"{jsonl_path}.tfidf.npz")
+    meta, postings = _load_persisted_tfidf(index_path)
+
+    # 저장된 인덱스가 현재 파일의 앞부분(추가 전 내용)과 같으면 재사용/증분 갱신
+    prefix_size = 0
+    if meta and all(meta.get(k) == v for k, v in params.items()):
+        size = int(meta.get("size", -1))
+        if 0 <= size <= len(data) and data[size - 1 : size] in (b"\n", b""):
+            if hashlib.sha256(data[:size]).hexdigest() == meta.get("sha256"):
+                prefix_size = size
+
+    entries = _parse_underwriter_jsonl_bytes(data[:prefix_size])
+    if not prefix_size or len(entries) != meta.get("doc_count"):
+        prefix_size = 0
+        entries = []
+        postings = None
+
+    new_entries = _parse_underwriter_jsonl_bytes(data[prefix_size:])
+    if new_entries or postings is None:
+        texts = [_underwriter_similarity_text(entry, max_text_chars) for entry in new_entries]
+        new_postings = _build_tfidf_postings(texts, min_n, max_n, buckets, first_doc=len(entries))
+        postings = _merge_tfidf_postings(postings, new_postings) if postings is not None else new_postings
+        entries.extend(new_entries)
+
+    index = _finalize_tfidf_index(postings, len(entries), buckets)
+    if new_entries or not prefix_size or prefix_size != len(data):
+        _save_persisted_tfidf(
+            index_path,
+            {**params, "size": len(data), "sha256": hashlib.sha256(data).hexdigest(), "doc_count": len(entries)},
+            index,
+        )
 
     cache.update(
         {
@@ -526,10 +670,8 @@ def _get_underwriter_tfidf_index(jsonl_path: str, min_n: int = 3, max_n: int = 5
             "min_n": min_n,
             "max_n": max_n,
             "max_text_chars": max_text_chars,
-            "idf": idf,
-            "vectors": vectors,
+            "index": index,
             "entries": entries,
-            "texts": texts,
         }
     )
     return cache, None
@@ -784,11 +926,18 @@ def execute_search_underwriter_opinion_similar(
     if index_error:
         return {"success": False, "error": index_error}
 
+    import numpy as np
+
     query_text = _normalize_similarity_text(str(query), max_chars=max_text_chars)
-    query_vec, query_norm = _vectorize_query(query_text, index["idf"], min_n=3, max_n=5)
+    scores = _score_tfidf_query(index["index"], query_text, min_n=3, max_n=5)
+    candidates = np.flatnonzero(scores >= min_score)
+    candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
 
     results = []
-    for entry, (vec, norm) in zip(index["entries"], index["vectors"]):
+    for doc_id in candidates:
+        if top_k and len(results) >= top_k:
+            break
+        entry = index["entries"][doc_id]
         section_text = entry.get("section_text") or ""
         section_title = entry.get("section_title") or ""
         combined_text = f"{section_title}\n{section_text}"
@@ -804,10 +953,7 @@ def execute_search_underwriter_opinion_similar(
             if not ok:
                 continue
 
-        score = _cosine_similarity(query_vec, query_norm, vec, norm)
-        if score < min_score:
-            continue
-
+        score = float(scores[doc_id])
         snippet = _extract_snippet(section_text, [], max_chars=max_chars)
         results.append(
             {
@@ -823,10 +969,6 @@ def execute_search_underwriter_opinion_similar(
             }
         )
 
-    results.sort(key=lambda x: x.get("score", 0), reverse=True)
-    if top_k:
-        results = results[:top_k]
-
     patterns = []
     if return_patterns:
         seen = set()
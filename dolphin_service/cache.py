@@ -0,0 +1,150 @@
+"""
+Vision 처리 결과 캐시.
+
+키는 파일 경로가 아니라 PDF 내용 해시 기준이므로 같은 파일을 다른 임시 경로로
+다시 올려도 재사용된다. 두 종류의 항목을 한 저장소에 둔다.
+
+- 문서 결과: (내용 해시, 실제 읽은 페이지 수, 출력 모드)
+- 청크 결과: (내용 해시, 페이지 범위, DPI, 프로바이더/모델, 프롬프트 해시, max_tokens)
+  → max_pages가 다른 요청이나 일부 범위가 겹치는 요청도 이미 분석한 청크는 재호출하지 않음
+
+저장 형식은 {"stored_at": 저장 시각, "value": 결과}의 zlib 압축 JSON. TTL은 stored_at 기준의
+고정 만료다 (LRU를 위해 읽을 때마다 갱신되는 mtime과는 무관). 디스크 관리(원자적 쓰기, cache_max_mb 예산, LRU 삭제)는
+ralph.disk_lru.DiskLRU를 사용한다.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ralph.disk_lru import DiskLRU
+
+from .config import DOLPHIN_CONFIG
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".json.z"
+
+
+def content_hash(pdf_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """PDF 파일 내용의 sha256"""
+    hasher = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def prompt_hash(*parts: str) -> str:
+    """프롬프트 텍스트 해시 (프롬프트가 바뀌면 청크 캐시가 자동으로 무효화됨)"""
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:16]
+
+
+def document_key(digest: str, pages_read: int, output_mode: str) -> Dict[str, Any]:
+    return {
+        "kind": "document",
+        "version": DOLPHIN_CONFIG.get("cache_version", "1"),
+        "content": digest,
+        "pages": pages_read,
+        "output_mode": output_mode,
+    }
+
+
+def chunk_key(
+    digest: str,
+    page_range: Tuple[int, int],
+    *,
+    dpi: int,
+    provider: str,
+    model: str,
+    prompt: str,
+    max_tokens: int,
+    output_mode: str,
+) -> Dict[str, Any]:
+    return {
+        "kind": "chunk",
+        "version": DOLPHIN_CONFIG.get("cache_version", "1"),
+        "content": digest,
+        "pages": list(page_range),
+        "dpi": dpi,
+        "provider": provider,
+        "model": model,
+        "prompt": prompt,
+        "max_tokens": max_tokens,
+        "output_mode": output_mode,
+    }
+
+
+class VisionResultCache:
+    """내용 주소 기반, 바이트 상한이 있는 디스크 캐시"""
+
+    def __init__(self, root: Path, max_bytes: int, ttl_seconds: float = 0):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._disk = DiskLRU(self.root, max_bytes, pattern=f"*{_SUFFIX}")
+
+    def _path(self, key: Dict[str, Any]) -> Path:
+        serialized = json.dumps(key, sort_keys=True, separators=(",", ":"))
+        name = hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+        return self.root / name[:2] / f"{name}{_SUFFIX}"
+
+    def get(self, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        data = self._disk.read_bytes(path)
+        if data is None:
+            return None
+        try:
+            entry = json.loads(zlib.decompress(data).decode("utf-8"))
+            stored_at = float(entry["stored_at"])
+            value = entry["value"]
+        except (ValueError, TypeError, KeyError, zlib.error) as e:
+            logger.warning(f"캐시 읽기 실패: {e}")
+            self._disk.discard(path)
+            return None
+        if self.ttl_seconds and time.time() - stored_at > self.ttl_seconds:
+            self._disk.discard(path)
+            return None
+        return value
+
+    def put(self, key: Dict[str, Any], value: Dict[str, Any]) -> None:
+        entry = {"stored_at": time.time(), "value": value}
+        data = zlib.compress(
+            json.dumps(entry, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6
+        )
+        try:
+            evicted = self._disk.write_bytes(self._path(key), data)
+        except OSError as e:
+            logger.warning(f"캐시 저장 실패: {e}")
+            return
+        if evicted:
+            logger.info(f"캐시 {evicted}개 항목 삭제 (LRU)")
+
+
+_cache: Optional[VisionResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[VisionResultCache]:
+    """설정 기반 공용 캐시 (cache_enabled=False면 None)"""
+    global _cache
+    if not DOLPHIN_CONFIG.get("cache_enabled", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = VisionResultCache(
+                    Path(DOLPHIN_CONFIG["cache_dir"]),
+                    int(DOLPHIN_CONFIG.get("cache_max_mb", 1024)) * 1024 * 1024,
+                    ttl_seconds=DOLPHIN_CONFIG.get("cache_ttl_days", 7) * 86400,
+                )
+    return _cache
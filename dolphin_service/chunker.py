@@ -6,7 +6,7 @@ Uses greedy packing algorithm to maximize chunk utilization.
 """
 
 import logging
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 from .strategy import ProcessingStrategy
 
@@ -30,61 +30,85 @@ def estimate_base64_size_mb(images_base64: List[str]) -> float:
     return total_bytes / (1024 * 1024)
 
 
-def create_chunks(
-    images_base64: List[str],
+def iter_chunks(
+    images_base64: Iterable[str],
     strategy: ProcessingStrategy,
-) -> List[List[str]]:
-    """Split images into chunks based on strategy limits.
+) -> Iterator[List[str]]:
+    """Pack images into chunks incrementally as pages arrive.
 
-    Uses greedy packing to maximize chunk utilization while respecting:
-    - max_chunk_mb: Maximum MB per chunk (base64)
-    - chunk_pages: Maximum pages per chunk
+    Same greedy packing as create_chunks, but each chunk is yielded as soon
+    as it is complete: immediately when it reaches chunk_pages, or when the
+    next page would push it over max_chunk_mb. Callers can dispatch a chunk
+    while later pages are still being rendered.
 
     Args:
-        images_base64: List of base64 encoded page images
+        images_base64: Iterable (typically a generator) of base64 page images
         strategy: Processing strategy with limits
 
-    Returns:
-        List of chunks, where each chunk is a list of base64 images
+    Yields:
+        Lists of base64 images, in page order
     """
-    if not images_base64:
-        return []
-
     # If no Vision API, return all pages in one chunk
     if not strategy.use_vision:
-        return [images_base64]
+        chunk = list(images_base64)
+        if chunk:
+            yield chunk
+        return
 
-    # Greedy packing algorithm
-    chunks = []
-    current_chunk = []
+    current_chunk: List[str] = []
     current_size_mb = 0.0
+    count = 0
 
-    for idx, img_base64 in enumerate(images_base64):
+    for img_base64 in images_base64:
         img_size_mb = len(img_base64) / (1024 * 1024)
 
-        # Check if adding this image would exceed limits
-        would_exceed_size = (current_size_mb + img_size_mb) > strategy.max_chunk_mb
-        would_exceed_pages = len(current_chunk) >= strategy.chunk_pages
-
-        if current_chunk and (would_exceed_size or would_exceed_pages):
-            # Finalize current chunk and start new one
-            chunks.append(current_chunk)
-            logger.debug(
-                f"Chunk {len(chunks)}: {len(current_chunk)} pages, {current_size_mb:.2f} MB"
-            )
+        # Next page does not fit: finalize current chunk and start new one
+        if current_chunk and (current_size_mb + img_size_mb) > strategy.max_chunk_mb:
+            count += 1
+            logger.debug(f"Chunk {count}: {len(current_chunk)} pages, {current_size_mb:.2f} MB")
+            yield current_chunk
             current_chunk = []
             current_size_mb = 0.0
 
-        # Add image to current chunk
         current_chunk.append(img_base64)
         current_size_mb += img_size_mb
 
+        # Page limit reached: no later page can join this chunk
+        if len(current_chunk) >= strategy.chunk_pages:
+            count += 1
+            logger.debug(f"Chunk {count}: {len(current_chunk)} pages, {current_size_mb:.2f} MB")
+            yield current_chunk
+            current_chunk = []
+            current_size_mb = 0.0
+
     # Add final chunk if non-empty
     if current_chunk:
-        chunks.append(current_chunk)
-        logger.debug(
-            f"Chunk {len(chunks)}: {len(current_chunk)} pages, {current_size_mb:.2f} MB"
-        )
+        count += 1
+        logger.debug(f"Chunk {count}: {len(current_chunk)} pages, {current_size_mb:.2f} MB")
+        yield current_chunk
+
+
+def create_chunks(
+    images_base64: List[str],
+    strategy: ProcessingStrategy,
+) -> List[List[str]]:
+    """Split images into chunks based on strategy limits.
+
+    Uses greedy packing to maximize chunk utilization while respecting:
+    - max_chunk_mb: Maximum MB per chunk (base64)
+    - chunk_pages: Maximum pages per chunk
+
+    Args:
+        images_base64: List of base64 encoded page images
+        strategy: Processing strategy with limits
+
+    Returns:
+        List of chunks, where each chunk is a list of base64 images
+    """
+    if not images_base64:
+        return []
+
+    chunks = list(iter_chunks(images_base64, strategy))
 
     logger.info(
         f"Created {len(chunks)} chunks from {len(images_base64)} pages "
@@ -40,6 +40,9 @@ DOLPHIN_CONFIG = {
     "cache_enabled": True,
     "cache_ttl_days": 7,
     "cache_namespace": "dolphin_pdf",
+    "cache_dir": os.getenv("PDF_CACHE_DIR", "/tmp/claude_pdf_cache"),
+    "cache_max_mb": int(os.getenv("PDF_CACHE_MAX_MB", "1024")),  # 초과 시 LRU 삭제
+    "cache_version": "2",  # 결과 형식/파싱이 바뀌면 올림 (기존 항목 무효화)
 }
 
 # 재무제표 테이블 감지 키워드 (한국어/영어)
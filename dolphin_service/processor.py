@@ -6,15 +6,17 @@ Dolphin 대신 Claude Vision API를 기본으로 사용합니다.
 """
 
 import base64
-import hashlib
 import json
 import logging
 import os
+import queue
+import threading
 import time
-from datetime import datetime, timedelta
+from contextlib import closing
+from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 try:
     # Optional in minimal/runtime environments (e.g., worker containers).
     from dotenv import load_dotenv
@@ -26,9 +28,10 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if load_dotenv:
     load_dotenv(PROJECT_ROOT / ".env")
 
-from .config import DOLPHIN_CONFIG
+from .config import CHUNKING_CONFIG, DOLPHIN_CONFIG
 from . import classifier as doc_classifier
 from . import chunker
+from . import cache as result_cache
 from . import prompts as prompt_registry
 from .strategy import get_strategy, ProcessingStrategy
 from .table_extractor import extract_financial_tables
@@ -117,6 +120,7 @@ def _invoke_bedrock_anthropic_messages(
 ) -> tuple[str, Dict[str, int], str]:
     import boto3
     from botocore.config import Config
+    from ralph.vlm.rate_limiter import bedrock_call, estimate_tokens
 
     region = (os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION") or "ap-northeast-2").strip()
     client = boto3.client(
@@ -133,68 +137,73 @@ def _invoke_bedrock_anthropic_messages(
         "messages": [{"role": "user", "content": content_blocks}],
     }
 
-    resp = client.invoke_model(
-        modelId=model_id,
-        contentType="application/json",
-        accept="application/json",
-        body=json.dumps(payload).encode("utf-8"),
-    )
-    raw = resp.get("body").read()
-    parsed = json.loads(raw)
+    prompt_text = system_prompt + "".join(str(b.get("text") or "") for b in content_blocks)
+    images = sum(1 for b in content_blocks if b.get("type") == "image")
+    with bedrock_call(model_id, estimate_tokens(prompt_text, images, max_tokens)) as slot:
+        resp = client.invoke_model(
+            modelId=model_id,
+            contentType="application/json",
+            accept="application/json",
+            body=json.dumps(payload).encode("utf-8"),
+        )
+        raw = resp.get("body").read()
+        parsed = json.loads(raw)
+        usage = _normalize_usage(parsed.get("usage"))
+        slot.record_usage(usage.get("input_tokens", 0), usage.get("output_tokens", 0))
 
     text = _extract_text_blocks(parsed.get("content"))
-    usage = _normalize_usage(parsed.get("usage"))
     return text, usage, model_id
 
-# 캐시 디렉토리
-CACHE_DIR = Path(os.getenv("PDF_CACHE_DIR", "/tmp/claude_pdf_cache"))
-
 
-def _get_cache_path(pdf_path: str, max_pages: int, output_mode: str) -> Path:
-    """캐시 파일 경로 생성"""
-    # 파일 해시 생성
-    file_stat = Path(pdf_path).stat()
-    cache_key = f"{pdf_path}:{file_stat.st_size}:{file_stat.st_mtime}:{max_pages}:{output_mode}"
-    hash_key = hashlib.md5(cache_key.encode()).hexdigest()
-    return CACHE_DIR / f"{hash_key}.json"
+def _prefetch(items: Iterable[Any], maxsize: int) -> Iterator[Any]:
+    """items를 백그라운드 스레드에서 최대 maxsize개 앞서 생성.
 
+    생산 쪽 예외는 소비 쪽에서 다시 발생한다. 소비가 중단되면(close) 생산도 멈춘다.
+    """
+    buffer: "queue.Queue[tuple]" = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
 
-def _get_cached_result(cache_path: Path) -> Optional[Dict[str, Any]]:
-    """캐시된 결과 조회"""
-    if not DOLPHIN_CONFIG.get("cache_enabled", True):
-        return None
+    def put(message: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
 
-    if not cache_path.exists():
-        return None
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(("item", item)):
+                    break
+            else:
+                put(("done", None))
+        except BaseException as e:
+            put(("error", e))
+        finally:
+            close = getattr(items, "close", None)
+            if close:
+                close()
 
+    threading.Thread(target=produce, name="pdf-render", daemon=True).start()
     try:
-        # TTL 체크
-        ttl_days = DOLPHIN_CONFIG.get("cache_ttl_days", 7)
-        file_age = datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)
-        if file_age > timedelta(days=ttl_days):
-            cache_path.unlink()  # 만료된 캐시 삭제
-            return None
+        while True:
+            kind, value = buffer.get()
+            if kind == "done":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stop.set()
 
-        with open(cache_path, "r", encoding="utf-8") as f:
-            result = json.load(f)
-            result["cache_hit"] = True
-            return result
-    except Exception as e:
-        logger.warning(f"캐시 읽기 실패: {e}")
-        return None
 
+def _count_pages(pdf_path: str) -> int:
+    import fitz
 
-def _save_to_cache(cache_path: Path, result: Dict[str, Any]) -> None:
-    """결과를 캐시에 저장"""
-    if not DOLPHIN_CONFIG.get("cache_enabled", True):
-        return
-
-    try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
-    except Exception as e:
-        logger.warning(f"캐시 저장 실패: {e}")
+    with fitz.open(pdf_path) as doc:
+        return len(doc)
 
 
 class ClaudeVisionProcessor:
@@ -229,12 +238,26 @@ class ClaudeVisionProcessor:
         start_time = time.time()
         max_pages = max_pages or DOLPHIN_CONFIG["default_max_pages"]
 
-        # 캐시 확인
-        cache_path = _get_cache_path(pdf_path, max_pages, output_mode)
-        cached = _get_cached_result(cache_path)
-        if cached:
-            self._emit_progress(progress_callback, "complete", "캐시에서 로드됨")
-            return cached
+        # 캐시 확인 (내용 해시 기준이라 경로가 달라도 같은 파일이면 hit)
+        cache = result_cache.get_cache()
+        digest = ""
+        doc_key = None
+        if cache is not None:
+            try:
+                digest = result_cache.content_hash(pdf_path)
+                pages_read = min(_count_pages(pdf_path), max_pages)
+                doc_key = result_cache.document_key(digest, pages_read, output_mode)
+            except Exception as e:
+                logger.warning(f"캐시 키 생성 실패: {e}")
+                cache = None
+                digest = ""
+        if doc_key is not None:
+            cached = cache.get(doc_key)
+            if cached:
+                cached["file_path"] = pdf_path
+                cached["cache_hit"] = True
+                self._emit_progress(progress_callback, "complete", "캐시에서 로드됨")
+                return cached
 
         self._emit_progress(progress_callback, "loading", "PDF 로딩 중...")
 
@@ -259,46 +282,31 @@ class ClaudeVisionProcessor:
                 )
                 result = self._process_with_pymupdf(pdf_path, classification)
             else:
-                # Vision API 처리
+                # Vision API 처리: 렌더링(백그라운드) → 청크 패킹 → 청크가 차는 즉시 전송
                 self._emit_progress(
                     progress_callback,
                     "converting",
-                    f"PDF를 이미지로 변환 중 (DPI={strategy.dpi})...",
+                    f"PDF를 이미지로 변환하며 {strategy.model}로 분석 중 (DPI={strategy.dpi})...",
                 )
-                images_base64, total_pages = self._pdf_to_base64_images(
-                    pdf_path, max_pages, dpi_override=strategy.dpi
+                pages = _prefetch(
+                    self._iter_base64_images(pdf_path, max_pages, dpi_override=strategy.dpi),
+                    maxsize=max(1, strategy.chunk_pages),
                 )
+                with closing(pages):
+                    result = self._process_chunks_streaming(
+                        chunker.iter_chunks(pages, strategy),
+                        output_mode,
+                        progress_callback,
+                        strategy=strategy,
+                        digest=digest,
+                    )
 
-                if not images_base64:
+                if result is None:
                     return {
                         "success": False,
                         "error": "PDF에서 이미지를 추출할 수 없습니다",
                     }
 
-                # 스마트 청킹
-                chunks = chunker.create_chunks(images_base64, strategy)
-                self._emit_progress(
-                    progress_callback,
-                    "processing",
-                    f"{strategy.model}로 {len(images_base64)}페이지 분석 중 "
-                    f"({len(chunks)}청크)...",
-                )
-
-                if len(chunks) == 1:
-                    # 단일 청크: 기존 방식
-                    result = self._process_with_claude(
-                        chunks[0], output_mode, progress_callback,
-                        model_override=strategy.model,
-                        prompt_type=strategy.prompt_type,
-                        max_tokens_override=strategy.max_tokens,
-                    )
-                else:
-                    # 다중 청크: 병렬 처리
-                    result = self._process_chunks_parallel(
-                        chunks, output_mode, progress_callback,
-                        strategy=strategy,
-                    )
-
             # 3. 결과 조합
             processing_time = time.time() - start_time
 
@@ -324,11 +332,13 @@ class ClaudeVisionProcessor:
                 ),
                 "processing_time_seconds": processing_time,
                 "cache_hit": False,
+                "cached_chunks": result.get("cached_chunks", 0),
                 "cached_at": datetime.utcnow().isoformat(),
             }
 
-            # 캐시에 저장
-            _save_to_cache(cache_path, final_result)
+            # 캐시에 저장 (실패한 청크가 있으면 다음 요청에서 다시 시도하도록 저장하지 않음)
+            if doc_key is not None and not result.get("failed_chunks") and not result.get("error"):
+                cache.put(doc_key, final_result)
 
             self._emit_progress(
                 progress_callback,
@@ -343,50 +353,41 @@ class ClaudeVisionProcessor:
             logger.error(f"Claude Vision 처리 실패: {e}", exc_info=True)
             return self._fallback_to_pymupdf(pdf_path, max_pages, str(e))
 
-    def _pdf_to_base64_images(
+    def _iter_base64_images(
         self, pdf_path: str, max_pages: int, dpi_override: int = 0
-    ) -> tuple:
-        """PDF를 base64 인코딩된 이미지 리스트로 변환
+    ) -> Iterator[str]:
+        """PDF 페이지를 하나씩 렌더링해 base64 PNG로 생성
 
         Args:
             pdf_path: PDF 파일 경로
             max_pages: 최대 페이지 수
             dpi_override: 0이면 config 기본값, >0이면 해당 DPI 사용
 
-        Returns:
-            (images_base64: List[str], total_pages: int)
+        Yields:
+            페이지 순서대로 base64 인코딩된 PNG
         """
         try:
             import fitz  # PyMuPDF
         except ImportError as e:
             raise ImportError(f"PDF 변환에 PyMuPDF가 필요합니다: {e}")
 
-        doc = None
-        images_base64 = []
-
+        doc = fitz.open(pdf_path)
         try:
-            doc = fitz.open(pdf_path)
-            total_pages = len(doc)
-            pages_to_read = min(total_pages, max_pages)
+            pages_to_read = min(len(doc), max_pages)
 
             dpi = dpi_override if dpi_override > 0 else DOLPHIN_CONFIG.get("image_dpi", 150)
             zoom = dpi / 72
+            mat = fitz.Matrix(zoom, zoom)
 
             for i in range(pages_to_read):
-                page = doc[i]
-                mat = fitz.Matrix(zoom, zoom)
-                pix = page.get_pixmap(matrix=mat)
-
-                # PNG로 변환 후 base64 인코딩
+                pix = doc[i].get_pixmap(matrix=mat)
+                # PNG로 변환 후 base64 인코딩 (픽스맵은 다음 페이지 전에 해제)
                 img_bytes = pix.tobytes("png")
-                img_base64 = base64.standard_b64encode(img_bytes).decode("utf-8")
-                images_base64.append(img_base64)
-
-            return images_base64, total_pages
+                pix = None
+                yield base64.standard_b64encode(img_bytes).decode("utf-8")
 
         finally:
-            if doc:
-                doc.close()
+            doc.close()
 
     def _get_system_prompt(self) -> str:
         """VC 투자 분석 전문가 시스템 프롬프트 (하위 호환성)."""
@@ -493,50 +494,152 @@ class ClaudeVisionProcessor:
             parsed["usage"] = usage
         return parsed
 
-    def _process_chunks_parallel(
+    def _chunk_cache_key(
         self,
-        chunks: List[List[str]],
+        digest: str,
+        page_offset: int,
+        page_count: int,
+        output_mode: str,
+        strategy: Optional[ProcessingStrategy],
+    ) -> Dict[str, Any]:
+        """청크 캐시 키: 페이지 범위 + 요청을 결정하는 모델/프롬프트/DPI"""
+        provider = _llm_provider()
+        model = (strategy.model if strategy else None) or "claude-sonnet-4-5-20250929"
+        if provider == "bedrock":
+            try:
+                model = _resolve_bedrock_model_id(model)
+            except ValueError:
+                pass
+        system_prompt, user_prompt = prompt_registry.get_prompts(
+            strategy.prompt_type if strategy else "financial_structured",
+            output_mode=output_mode,
+            page_count=page_count or 1,
+        )
+        max_tokens = strategy.max_tokens if strategy and strategy.max_tokens > 0 else 16384
+        dpi = strategy.dpi if strategy and strategy.dpi > 0 else DOLPHIN_CONFIG.get("image_dpi", 150)
+        return result_cache.chunk_key(
+            digest,
+            (page_offset, page_offset + page_count),
+            dpi=dpi,
+            provider=provider,
+            model=model,
+            prompt=result_cache.prompt_hash(system_prompt, user_prompt),
+            max_tokens=max_tokens,
+            output_mode=output_mode,
+        )
+
+    def _process_chunk_cached(
+        self,
+        images_base64: List[str],
         output_mode: str,
         progress_callback: Optional[Callable] = None,
         strategy: Optional[ProcessingStrategy] = None,
+        page_offset: int = 0,
+        digest: str = "",
     ) -> Dict[str, Any]:
-        """다중 청크를 병렬로 처리 후 결과 병합."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-
-        page_offsets = chunker.compute_page_offsets(chunks)
-        chunk_results: List[Optional[Dict[str, Any]]] = [None] * len(chunks)
-
-        def process_chunk(idx: int) -> Dict[str, Any]:
-            return self._process_with_claude(
-                chunks[idx],
-                output_mode,
-                progress_callback=None,  # 청크별 콜백 비활성화
-                model_override=strategy.model if strategy else None,
-                prompt_type=strategy.prompt_type if strategy else "financial_structured",
-                max_tokens_override=strategy.max_tokens if strategy else 0,
-                page_offset=page_offsets[idx],
-            )
+        """청크 하나를 처리. 같은 내용/페이지 범위/모델/프롬프트로 분석한 결과가 있으면 재사용."""
+        cache = result_cache.get_cache() if digest else None
+        key = None
+        if cache is not None:
+            key = self._chunk_cache_key(digest, page_offset, len(images_base64), output_mode, strategy)
+            cached = cache.get(key)
+            if cached is not None:
+                cached.pop("usage", None)  # 이번 요청에서 쓴 토큰이 아님
+                cached["cache_hit"] = True
+                return cached
+
+        result = self._process_with_claude(
+            images_base64,
+            output_mode,
+            progress_callback,
+            model_override=strategy.model if strategy else None,
+            prompt_type=strategy.prompt_type if strategy else "financial_structured",
+            max_tokens_override=strategy.max_tokens if strategy else 0,
+            page_offset=page_offset,
+        )
+        # 호출 실패나 JSON 파싱에 실패한 응답은 다음 요청에서 다시 시도하도록 저장하지 않음
+        cacheable = output_mode == "text_only" or "structured_content" in result
+        if key is not None and cacheable and not result.get("error"):
+            cache.put(key, result)
+        return result
 
-        completed = 0
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {executor.submit(process_chunk, i): i for i in range(len(chunks))}
-            for future in as_completed(futures):
-                idx = futures[future]
+    def _process_chunks_streaming(
+        self,
+        chunks: Iterable[List[str]],
+        output_mode: str,
+        progress_callback: Optional[Callable] = None,
+        strategy: Optional[ProcessingStrategy] = None,
+        digest: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """청크가 만들어지는 대로 병렬 전송하고 결과를 페이지 순서로 병합.
+
+        동시에 메모리에 있는 청크는 처리 중인 max_workers개 + 패킹 중인 1개로 제한된다.
+        워커가 모두 바쁘면 다음 청크를 꺼내지 않으므로 렌더링도 그만큼만 앞서 나간다.
+        청크가 하나도 없으면 None. 모든 청크가 실패하면 RuntimeError를 던져
+        호출자가 PyMuPDF 폴백으로 넘어가게 하고, 일부만 실패하면 failed_chunks에 개수를 남긴다.
+        """
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        max_workers = max(1, int(CHUNKING_CONFIG.get("max_workers", 3)))
+        page_offsets: List[int] = []
+        chunk_results: Dict[int, Dict[str, Any]] = {}
+        pending: Dict[Any, int] = {}
+
+        def collect(block_until_one: bool) -> None:
+            done = wait(pending, return_when=FIRST_COMPLETED).done if block_until_one else list(pending)
+            for future in done:
+                idx = pending.pop(future)
                 try:
                     chunk_results[idx] = future.result()
                 except Exception as e:
                     logger.error(f"청크 {idx} 처리 실패: {e}")
                     chunk_results[idx] = {"content": "", "error": str(e)}
-                completed += 1
                 self._emit_progress(
                     progress_callback,
                     "processing",
-                    f"청크 {completed}/{len(chunks)} 완료",
+                    f"청크 {len(chunk_results)}/{len(page_offsets)} 완료",
+                )
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            offset = 0
+            for idx, chunk in enumerate(chunks):
+                if len(pending) >= max_workers:
+                    collect(block_until_one=True)
+                page_offsets.append(offset)
+                future = executor.submit(
+                    self._process_chunk_cached,
+                    chunk,
+                    output_mode,
+                    None,  # 청크별 콜백 비활성화
+                    strategy,
+                    offset,
+                    digest,
+                )
+                pending[future] = idx
+                self._emit_progress(
+                    progress_callback,
+                    "processing",
+                    f"청크 {idx + 1} 전송 (페이지 {offset + 1}-{offset + len(chunk)})",
                 )
+                offset += len(chunk)
+                chunk = None
+            while pending:
+                collect(block_until_one=True)
+        finally:
+            # 렌더링 실패 등으로 중단되면 아직 시작하지 않은 청크는 보내지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        # None 제거 및 병합
-        valid_results = [r for r in chunk_results if r is not None]
-        return chunker.merge_chunk_results(valid_results, page_offsets)
+        if not page_offsets:
+            return None
+        results = [chunk_results[i] for i in range(len(page_offsets))]
+        failed = [r for r in results if r.get("error")]
+        if len(failed) == len(results):
+            raise RuntimeError(f"모든 청크 처리 실패: {failed[0]['error']}")
+        merged = chunker.merge_chunk_results(results, page_offsets)
+        merged["cached_chunks"] = sum(1 for r in results if r.get("cache_hit"))
+        merged["failed_chunks"] = len(failed)
+        return merged
 
     def _process_with_pymupdf(
         self,
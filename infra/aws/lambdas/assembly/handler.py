@@ -5,11 +5,11 @@ Invoked by: Stream Processor Lambda (async) or DLQ Processor Lambda.
 
 Steps:
 1. Conditional write: fanout_status running → assembling (idempotent guard).
-2. Query all TASK records for the job.
-3. Parse task results, build CSV + JSON.
-4. Upload artifacts to S3.
-5. (Optional) Delete input files from S3.
-6. Mark JOB as succeeded with artifact metadata.
+2. Stream TASK records page by page into CSV + JSON files on local disk
+   (rows are never all held in memory, so job size does not bound Lambda memory).
+3. Upload artifacts to S3.
+4. (Optional) Delete input files from S3.
+5. Mark JOB as succeeded with artifact metadata.
 
 If assembly fails, marks JOB as failed so it doesn't hang in "assembling".
 """
@@ -17,7 +17,6 @@ If assembly fails, marks JOB as failed so it doesn't hang in "assembling".
 from __future__ import annotations
 
 import csv
-import io
 import json
 import logging
 import os
@@ -26,7 +25,7 @@ import tempfile
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterator, List, Optional
 
 import boto3
 from boto3.dynamodb.conditions import Key
@@ -70,32 +69,6 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         params = job.get("params", {}) if isinstance(job.get("params"), dict) else {}
         conditions: List[str] = [str(c) for c in (params.get("conditions") or []) if c]
 
-        # 3. Query all tasks.
-        tasks = _query_all_tasks(team_id, job_id)
-        tasks.sort(key=lambda t: str(t.get("sk", "")))
-
-        # 4. Parse results.
-        rows: List[Dict[str, Any]] = []
-        for task in tasks:
-            result_raw = task.get("result")
-            if isinstance(result_raw, str):
-                try:
-                    result_data = json.loads(result_raw)
-                except json.JSONDecodeError:
-                    result_data = {"filename": str(task.get("file_id", "")), "error": result_raw}
-            elif isinstance(result_raw, dict):
-                result_data = result_raw
-            else:
-                result_data = {
-                    "filename": str(task.get("file_id", "")),
-                    "error": str(task.get("error", "unknown")),
-                }
-            rows.append(result_data)
-
-        # 5. Build artifacts.
-        uploaded: List[Dict[str, Any]] = []
-        total_bytes = 0
-
         # Artifact labels by job type.
         _labels = {
             "condition_check": ("조건 검사 결과", "condition_check"),
@@ -103,44 +76,44 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         }
         label_prefix, artifact_prefix = _labels.get(job_type, ("결과", "results"))
 
+        uploaded: List[Dict[str, Any]] = []
+        total_bytes = 0
+        stats = _RowStats()
+
         with tempfile.TemporaryDirectory() as tmpdir:
+            # 3. Stream task results straight into the artifact files, then upload.
+            csv_writer: Optional[_ConditionCsvWriter] = None
             if job_type == "condition_check" and conditions:
-                csv_path, json_path = _build_condition_check_csv(
-                    Path(tmpdir), rows, conditions
+                csv_writer = _ConditionCsvWriter(Path(tmpdir), conditions)
+                json_writer = _JsonStreamWriter(
+                    Path(tmpdir) / "condition_check_results.json", "results", {"conditions": conditions},
                 )
-                # Upload CSV.
-                if csv_path.exists():
-                    dest_key = f"artifacts/{team_id}/{job_id}/{artifact_prefix}_csv.csv"
-                    size = _s3_upload(dest_key, csv_path, "text/csv")
-                    total_bytes += size
-                    uploaded.append({
-                        "artifactId": f"{artifact_prefix}_csv",
-                        "label": f"{label_prefix} (CSV)",
-                        "contentType": "text/csv",
-                        "s3Bucket": S3_BUCKET,
-                        "s3Key": dest_key,
-                        "sizeBytes": size,
-                    })
-                # Upload JSON.
-                if json_path.exists():
-                    dest_key = f"artifacts/{team_id}/{job_id}/{artifact_prefix}_json.json"
-                    size = _s3_upload(dest_key, json_path, "application/json")
-                    total_bytes += size
-                    uploaded.append({
-                        "artifactId": f"{artifact_prefix}_json",
-                        "label": f"{label_prefix} (JSON)",
-                        "contentType": "application/json",
-                        "s3Bucket": S3_BUCKET,
-                        "s3Key": dest_key,
-                        "sizeBytes": size,
-                    })
             else:
                 # Generic JSON output.
-                json_path = Path(tmpdir) / "results.json"
-                json_path.write_text(
-                    json.dumps({"total": len(rows), "results": rows}, ensure_ascii=False, indent=2),
-                    encoding="utf-8",
-                )
+                json_writer = _JsonStreamWriter(Path(tmpdir) / "results.json", "results")
+
+            for row in _iter_task_rows(team_id, job_id):
+                stats.add(row)
+                if csv_writer is not None:
+                    csv_writer.add(row)
+                json_writer.append(row)
+
+            json_path = json_writer.close({"total": stats.total})
+            csv_path = csv_writer.close() if csv_writer is not None else None
+
+            if csv_path is not None and csv_path.exists():
+                dest_key = f"artifacts/{team_id}/{job_id}/{artifact_prefix}_csv.csv"
+                size = _s3_upload(dest_key, csv_path, "text/csv")
+                total_bytes += size
+                uploaded.append({
+                    "artifactId": f"{artifact_prefix}_csv",
+                    "label": f"{label_prefix} (CSV)",
+                    "contentType": "text/csv",
+                    "s3Bucket": S3_BUCKET,
+                    "s3Key": dest_key,
+                    "sizeBytes": size,
+                })
+            if json_path.exists():
                 dest_key = f"artifacts/{team_id}/{job_id}/{artifact_prefix}_json.json"
                 size = _s3_upload(dest_key, json_path, "application/json")
                 total_bytes += size
@@ -153,7 +126,7 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     "sizeBytes": size,
                 })
 
-        # 6. Delete input files (security).
+        # 5. Delete input files (security).
         deleted_inputs: List[str] = []
         if DELETE_INPUTS:
             file_ids = job.get("input_file_ids", [])
@@ -174,31 +147,24 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                     except Exception:
                         pass  # Best-effort.
 
-        # 7. Finalize job.
-        success_count = sum(1 for r in rows if "error" not in r)
+        # 6. Finalize job.
+        total = stats.total
+        success_count = stats.success_count
         now = _now_iso()
 
-        # Aggregate token usage across all tasks.
-        total_input_tokens = 0
-        total_output_tokens = 0
-        for r in rows:
-            tu = r.get("token_usage") if isinstance(r.get("token_usage"), dict) else {}
-            total_input_tokens += int(tu.get("input_tokens", 0))
-            total_output_tokens += int(tu.get("output_tokens", 0))
-
         metrics = {
-            "total": len(rows),
+            "total": total,
             "success_count": success_count,
-            "failed_count": len(rows) - success_count,
+            "failed_count": total - success_count,
             "conditions": conditions,
             "artifacts_bytes": total_bytes,
             "deleted_inputs": deleted_inputs,
             "ended_at": now,
             "assembled_by": "lambda",
             "token_usage": {
-                "input_tokens": total_input_tokens,
-                "output_tokens": total_output_tokens,
-                "total_tokens": total_input_tokens + total_output_tokens,
+                "input_tokens": stats.input_tokens,
+                "output_tokens": stats.output_tokens,
+                "total_tokens": stats.input_tokens + stats.output_tokens,
             },
         }
 
@@ -228,12 +194,12 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
 
         log.info(
             "Assembly complete: job=%s artifacts=%d success=%d failed=%d",
-            job_id, len(uploaded), success_count, len(rows) - success_count,
+            job_id, len(uploaded), success_count, total - success_count,
         )
         job_title = str(job.get("title") or job_type)
         _send_webhook(
             job_id, job_title, "succeeded",
-            total=len(rows), success=success_count, failed=len(rows) - success_count,
+            total=total, success=success_count, failed=total - success_count,
         )
         return {"status": "OK", "artifacts": len(uploaded)}
 
@@ -342,21 +308,60 @@ def _try_claim_assembly(team_id: str, job_id: str) -> bool:
         return False
 
 
-def _query_all_tasks(team_id: str, job_id: str) -> List[Dict[str, Any]]:
-    """Query all TASK records for a job."""
+def _iter_task_pages(team_id: str, job_id: str) -> Iterator[List[Dict[str, Any]]]:
+    """Yield TASK records for a job one query page at a time, in sort-key order."""
     pk = f"TEAM#{team_id}"
     sk_prefix = f"TASK#{job_id}#"
-    items: List[Dict[str, Any]] = []
     kwargs: Dict[str, Any] = {
         "KeyConditionExpression": Key("pk").eq(pk) & Key("sk").begins_with(sk_prefix),
     }
     while True:
         resp = ddb.query(**kwargs)
-        items.extend(resp.get("Items", []))
+        yield resp.get("Items", [])
         if "LastEvaluatedKey" not in resp:
             break
         kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
-    return items
+
+
+def _task_result_row(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode the stored result of one TASK record."""
+    result_raw = task.get("result")
+    if isinstance(result_raw, str):
+        try:
+            return json.loads(result_raw)
+        except json.JSONDecodeError:
+            return {"filename": str(task.get("file_id", "")), "error": result_raw}
+    if isinstance(result_raw, dict):
+        return result_raw
+    return {
+        "filename": str(task.get("file_id", "")),
+        "error": str(task.get("error", "unknown")),
+    }
+
+
+def _iter_task_rows(team_id: str, job_id: str) -> Iterator[Dict[str, Any]]:
+    """Decoded task results in task order (DDB returns sort-key order), fetched lazily."""
+    for page in _iter_task_pages(team_id, job_id):
+        for task in page:
+            yield _task_result_row(task)
+
+
+class _RowStats:
+    """Job metric counters accumulated one row at a time."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.success_count = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def add(self, r: Dict[str, Any]) -> None:
+        self.total += 1
+        if "error" not in r:
+            self.success_count += 1
+        tu = r.get("token_usage") if isinstance(r.get("token_usage"), dict) else {}
+        self.input_tokens += int(tu.get("input_tokens", 0))
+        self.output_tokens += int(tu.get("output_tokens", 0))
 
 
 def _mark_file_deleted(team_id: str, file_id: str) -> None:
@@ -397,26 +402,56 @@ def _sanitize(value: Any) -> Any:
     return str(value)
 
 
-def _build_condition_check_csv(
-    output_dir: Path,
-    rows: List[Dict[str, Any]],
-    conditions: List[str],
-) -> Tuple[Path, Path]:
-    """Build CSV and JSON files from condition check results."""
-    buf = io.StringIO()
-    fieldnames = ["filename", "company_name", "method", "pages", "elapsed_s", "error"]
-    for c in conditions:
-        short = c[:30].replace(" ", "_")
-        fieldnames += [f"{short}_result", f"{short}_evidence"]
-    writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction="ignore")
-    writer.writeheader()
-    for r in rows:
+class _JsonStreamWriter:
+    """Writes ``{**head, array_key: [items...], **tail}`` one array item at a time."""
+
+    def __init__(self, path: Path, array_key: str, head: Optional[Dict[str, Any]] = None) -> None:
+        self.path = path
+        self.count = 0
+        self._fh: IO[str] = path.open("w", encoding="utf-8")
+        self._fh.write("{\n")
+        for key, value in (head or {}).items():
+            self._fh.write(f"  {self._dump(key)}: {self._dump(value, 1)},\n")
+        self._fh.write(f"  {self._dump(array_key)}: [")
+
+    @staticmethod
+    def _dump(value: Any, level: int = 0) -> str:
+        text = json.dumps(value, ensure_ascii=False, indent=2, default=str)
+        return text.replace("\n", "\n" + "  " * level) if level else text
+
+    def append(self, item: Any) -> None:
+        self._fh.write(",\n    " if self.count else "\n    ")
+        self._fh.write(self._dump(item, 2))
+        self.count += 1
+
+    def close(self, tail: Optional[Dict[str, Any]] = None) -> Path:
+        self._fh.write("\n  ]" if self.count else "]")
+        for key, value in (tail or {}).items():
+            self._fh.write(f",\n  {self._dump(key)}: {self._dump(value, 1)}")
+        self._fh.write("\n}")
+        self._fh.close()
+        return self.path
+
+
+class _ConditionCsvWriter:
+    """Writes condition check results to CSV one row at a time."""
+
+    def __init__(self, output_dir: Path, conditions: List[str]) -> None:
+        self.path = output_dir / "condition_check_results.csv"
+        self._shorts = [c[:30].replace(" ", "_") for c in conditions]
+        fieldnames = ["filename", "company_name", "method", "pages", "elapsed_s", "error"]
+        for short in self._shorts:
+            fieldnames += [f"{short}_result", f"{short}_evidence"]
+        self._fh: IO[str] = self.path.open("w", newline="", encoding="utf-8-sig")
+        self._writer = csv.DictWriter(self._fh, fieldnames=fieldnames, extrasaction="ignore")
+        self._writer.writeheader()
+
+    def add(self, r: Dict[str, Any]) -> None:
         row: Dict[str, Any] = {
             k: r.get(k, "") for k in ["filename", "company_name", "method", "pages", "elapsed_s", "error"]
         }
         cond_results = r.get("conditions") or []
-        for j, c in enumerate(conditions):
-            short = c[:30].replace(" ", "_")
+        for j, short in enumerate(self._shorts):
             if j < len(cond_results):
                 cr = cond_results[j]
                 row[f"{short}_result"] = "\u2713" if cr.get("result") else "\u2717"
@@ -424,15 +459,8 @@ def _build_condition_check_csv(
             else:
                 row[f"{short}_result"] = ""
                 row[f"{short}_evidence"] = ""
-        writer.writerow(row)
-
-    csv_path = output_dir / "condition_check_results.csv"
-    csv_path.write_text(buf.getvalue(), encoding="utf-8-sig")
+        self._writer.writerow(row)
 
-    json_path = output_dir / "condition_check_results.json"
-    json_path.write_text(
-        json.dumps({"conditions": conditions, "total": len(rows), "results": rows},
-                    ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    return csv_path, json_path
+    def close(self) -> Path:
+        self._fh.close()
+        return self.path
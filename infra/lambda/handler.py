@@ -38,45 +38,48 @@ def _run_parser(pdf_path: str, force_pro: bool = False) -> dict:
         render_pages,
         _PROMPT_OCR,
     )
+    from ralph.pdf_context import pdf_context
 
     model_pro  = os.getenv("RALPH_VLM_NOVA_MODEL_ID",      "us.amazon.nova-pro-v1:0")
     model_lite = os.getenv("RALPH_VLM_NOVA_LITE_MODEL_ID", "us.amazon.nova-lite-v1:0")
     region     = os.getenv("RALPH_VLM_NOVA_REGION",        "us-east-1")
     use_vlm    = os.getenv("RALPH_USE_VLM", "true").lower() != "false"
 
-    text, pages, blocks = extract_text(pdf_path)
-    quality, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
-    clf = classify_no_vlm(pdf_path, os.path.basename(pdf_path))
+    # 텍스트 추출 · 분류 · 렌더링이 같은 문서 핸들을 공유
+    with pdf_context(pdf_path) as pdf:
+        text, pages, blocks = extract_text(pdf)
+        quality, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
+        clf = classify_no_vlm(pdf, os.path.basename(pdf_path))
 
-    method = "pymupdf"
-    text_structure = "document"
-    visual_description = None
+        method = "pymupdf"
+        text_structure = "document"
+        visual_description = None
 
-    if force_pro and use_vlm:
-        try:
-            img = render_first_page(pdf_path, dpi=150)
-            visual_description = call_nova_visual(img, model_pro, region, _PROMPT_OCR)
-            method, text_structure = "nova_pro", "image"
-        except Exception as e:
-            visual_description = {"error": str(e)}
-            method, text_structure = "nova_error", "image"
-    elif is_poor and use_vlm:
-        try:
-            img = render_first_page(pdf_path)
-            visual_description = call_nova_visual(img, model_lite, region, _PROMPT_OCR)
-            method, text_structure = "nova_hybrid", "image"
-        except Exception as e:
-            visual_description = {"error": str(e)}
-            method, text_structure = "nova_error", "image"
-    elif is_fragmented and use_vlm:
-        try:
-            imgs = render_pages(pdf_path)
-            prompt = build_presentation_prompt([{"page": i + 1} for i in range(len(imgs))])
-            visual_description = call_nova_visual(imgs, model_pro, region, prompt, max_tokens=5000)
-            method, text_structure = "nova_presentation", "presentation"
-        except Exception as e:
-            visual_description = {"error": str(e)}
-            method, text_structure = "nova_error", "presentation"
+        if force_pro and use_vlm:
+            try:
+                img = render_first_page(pdf, dpi=150)
+                visual_description = call_nova_visual(img, model_pro, region, _PROMPT_OCR)
+                method, text_structure = "nova_pro", "image"
+            except Exception as e:
+                visual_description = {"error": str(e)}
+                method, text_structure = "nova_error", "image"
+        elif is_poor and use_vlm:
+            try:
+                img = render_first_page(pdf)
+                visual_description = call_nova_visual(img, model_lite, region, _PROMPT_OCR)
+                method, text_structure = "nova_hybrid", "image"
+            except Exception as e:
+                visual_description = {"error": str(e)}
+                method, text_structure = "nova_error", "image"
+        elif is_fragmented and use_vlm:
+            try:
+                imgs = render_pages(pdf)
+                prompt = build_presentation_prompt([{"page": i + 1} for i in range(len(imgs))])
+                visual_description = call_nova_visual(imgs, model_pro, region, prompt, max_tokens=5000)
+                method, text_structure = "nova_presentation", "presentation"
+            except Exception as e:
+                visual_description = {"error": str(e)}
+                method, text_structure = "nova_error", "presentation"
 
     return {
         "ok": True,
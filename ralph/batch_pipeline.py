@@ -3,6 +3,8 @@
 
 document_extraction 워커 핸들러에서 호출.
 문서별: parse_document() → confidence < 0.7이면 VLM 폴백.
+규칙 기반 단계는 RALPH_CPU_POOL_WORKERS가 설정되면 프로세스 풀에서 실행.
+레이아웃 분석 결과는 RALPH_LAYOUT_CACHE_DIR이 설정되면 파일 digest로 재사용 (ralph.layout.cache).
 결과: per-doc JSON + 전체 ZIP.
 """
 from __future__ import annotations
@@ -27,7 +29,8 @@ class _JSONEncoder(json.JSONEncoder):
             return o.isoformat()
         return super().default(o)
 
-from ralph.pipeline import parse_document, ParseResult
+from ralph import cpu_pool
+from ralph.pipeline import ParseResult
 from ralph.vlm import get_vlm_caller, VLMResult
 
 logger = logging.getLogger(__name__)
@@ -82,8 +85,8 @@ def process_single(doc: BatchDocInput) -> DocResult:
     """
     start = time.perf_counter()
 
-    # Stage 1: 규칙 기반 추출
-    parse_result = parse_document(doc.pdf_path, doc.doc_type)
+    # Stage 1: 규칙 기반 추출 (레이아웃 분석 · find_tables는 CPU 풀에서)
+    parse_result = cpu_pool.parse_document(doc.pdf_path, doc.doc_type)
 
     if parse_result.success and parse_result.confidence >= VLM_CONFIDENCE_THRESHOLD:
         elapsed = time.perf_counter() - start
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import re
 
-import fitz
+from ralph.pdf_context import PdfSource, pdf_context
 
 
 # 분류 규칙: (doc_type, keywords, weight)
@@ -37,29 +37,26 @@ _CLASSIFICATION_RULES: list[tuple[str, list[str], float]] = [
 ]
 
 
-def classify_document(pdf_path: str, max_pages: int = 2) -> tuple[str, float]:
+def classify_document(pdf_path: PdfSource, max_pages: int = 2) -> tuple[str, float]:
     """
     PDF 문서 타입 자동 분류.
 
     Args:
-        pdf_path: PDF 파일 경로
+        pdf_path: PDF 파일 경로 또는 PdfContext (열린 문서 재사용)
         max_pages: 분류에 사용할 최대 페이지 수
 
     Returns:
         (doc_type, confidence): 문서 타입과 분류 신뢰도
         분류 불가 시 ("unknown", 0.0)
     """
-    doc = fitz.open(pdf_path)
-    try:
-        pages_to_check = min(doc.page_count, max_pages)
+    with pdf_context(pdf_path) as pdf:
+        pages_to_check = min(pdf.page_count, max_pages)
         text = ""
         for i in range(pages_to_check):
-            text += doc[i].get_text()
+            text += pdf.page_text(i)
 
-        # 공백 제거 버전도 준비 (자간 확장된 문서 대응)
-        text_nospace = text.replace(" ", "").replace("\n", "")
-    finally:
-        doc.close()
+    # 공백 제거 버전도 준비 (자간 확장된 문서 대응)
+    text_nospace = text.replace(" ", "").replace("\n", "")
 
     for doc_type, keywords, weight in _CLASSIFICATION_RULES:
         for kw in keywords:
@@ -120,6 +120,133 @@ def should_merge_company_alias(left: object, right: object) -> bool:
     return False
 
 
+class _IndexedAlias:
+    """Alias encoded once: compact form, its bigrams and whether re-encoding is stable."""
+
+    __slots__ = ("name", "compact", "bigrams", "regular")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        encoded = encode_company_alias(name)
+        self.compact = str(encoded["compact"])
+        self.bigrams = encoded["bigrams"]
+        # should_merge_company_alias scores the re-encoded compact form. For almost every
+        # name that is the compact form itself; the rare exceptions (e.g. a doubled legal
+        # prefix) fall back to the reference comparison.
+        self.regular = str(encode_company_alias(self.compact)["compact"]) == self.compact
+
+
+def _indexed_should_merge(left: _IndexedAlias, right: _IndexedAlias, shared_bigrams: int) -> bool:
+    """should_merge_company_alias for two regular aliases, using the precomputed encodings."""
+    left_compact = left.compact
+    right_compact = right.compact
+    if not left_compact or not right_compact:
+        return False
+    if left_compact == right_compact:
+        return True
+
+    shorter, longer = (
+        (left_compact, right_compact)
+        if len(left_compact) <= len(right_compact)
+        else (right_compact, left_compact)
+    )
+    if len(shorter) >= 3 and longer.startswith(shorter):
+        return True
+    if len(shorter) >= 4 and shorter in longer and shorter[:2] == longer[:2]:
+        return True
+
+    threshold = 0.78 if len(shorter) >= 3 and shorter[:2] == longer[:2] else 0.88
+
+    shared_prefix = 0
+    for left_char, right_char in zip(shorter, longer):
+        if left_char != right_char:
+            break
+        shared_prefix += 1
+    prefix_score = shared_prefix / len(shorter)
+    if not left.bigrams and not right.bigrams:
+        jaccard = 0.0
+    else:
+        union = (len(left.bigrams) + len(right.bigrams) - shared_bigrams) or 1
+        jaccard = shared_bigrams / union
+    if (jaccard * 0.55) + (prefix_score * 0.45) >= threshold:
+        return True
+
+    # SequenceMatcher only when the cheap upper bounds still allow a merge.
+    matcher = SequenceMatcher(None, left_compact, right_compact)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+class CompanyAliasIndex:
+    """
+    Canonical alias groups with a bigram inverted index.
+
+    ``find`` returns the first added alias that ``should_merge_company_alias``
+    would accept, scoring only aliases that share a compact-form bigram (or are
+    identical). Every merge rule implies a shared bigram: prefix and containment
+    rules share the leading bigram, and a 0.88 similarity is unreachable without
+    one. So the result is identical to a linear scan.
+    """
+
+    def __init__(self) -> None:
+        self._entries: list[_IndexedAlias] = []
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, list[int]] = {}
+        self._irregular: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, name: str) -> int:
+        entry = _IndexedAlias(name)
+        position = len(self._entries)
+        self._entries.append(entry)
+        if not entry.regular:
+            self._irregular.append(position)
+        if entry.compact:
+            self._exact.setdefault(entry.compact, position)
+            for bigram in entry.bigrams:
+                self._postings.setdefault(bigram, []).append(position)
+        return position
+
+    def find(self, name: str) -> int | None:
+        query = _IndexedAlias(name)
+        if not query.compact:
+            return None
+        if not query.regular:
+            return next(
+                (
+                    position
+                    for position, entry in enumerate(self._entries)
+                    if should_merge_company_alias(name, entry.name)
+                ),
+                None,
+            )
+
+        shared: Dict[int, int] = {}
+        for bigram in query.bigrams:
+            for position in self._postings.get(bigram, ()):
+                shared[position] = shared.get(position, 0) + 1
+        candidates = set(shared)
+        candidates.update(self._irregular)
+        exact = self._exact.get(query.compact)
+        if exact is not None:
+            candidates.add(exact)
+
+        for position in sorted(candidates):
+            entry = self._entries[position]
+            if entry.regular:
+                matched = _indexed_should_merge(query, entry, shared.get(position, 0))
+            else:
+                matched = should_merge_company_alias(name, entry.name)
+            if matched:
+                return position
+        return None
+
+
 def build_company_alias_map(
     groups: Sequence[Dict[str, Any]],
 ) -> Tuple[Dict[str, Dict[str, str]], Dict[str, int]]:
@@ -143,17 +270,13 @@ def build_company_alias_map(
     )
 
     canonical_groups: list[Dict[str, Any]] = []
+    index = CompanyAliasIndex()
     alias_map: Dict[str, Dict[str, str]] = {}
     for group in sorted_groups:
-        match = next(
-            (
-                canonical
-                for canonical in canonical_groups
-                if should_merge_company_alias(group["company_group_name"], canonical["company_group_name"])
-            ),
-            None,
-        )
+        position = index.find(str(group["company_group_name"]))
+        match = canonical_groups[position] if position is not None else None
         if match is None:
+            index.add(str(group["company_group_name"]))
             canonical_groups.append(group)
             alias_map[group["company_group_key"]] = {
                 "company_group_key": str(group["company_group_key"]),
@@ -8,6 +8,7 @@
     RALPH_CONDITIONS='["조건1", "조건2"]'  (JSON 배열)
     RALPH_VLM_NOVA_MODEL_ID  (기본: us.amazon.nova-pro-v1:0)
     RALPH_VLM_NOVA_REGION    (기본: us-east-1)
+    RALPH_CONDITION_CONTEXT_TOKENS  LLM에 보낼 문서 본문 예산 (기본 6000, 1자 ≈ 1토큰)
 
 출력: JSON (stdout)
     {
@@ -24,13 +25,19 @@ import json
 import os
 import re
 import sys
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from functools import lru_cache
 
+from ralph.context_selector import select_context
 from ralph.utils.korean_text import normalize_date, normalize_text, parse_korean_number
 
 
-_MAX_DOC_CHARS = 8000  # 토큰 절약: 최대 8000자
+# 프롬프트 · 규칙 엔진이 판정 결과를 바꾸는 변경을 하면 올린다 (조건별 결과 캐시 키에 포함)
+PROMPT_VERSION = "2026-10"
+# 토큰 절약: 문서 전체 대신 조건 관련 청크만 이 예산 안에서 보낸다
+_CONTEXT_TOKEN_BUDGET = max(1, int(os.getenv("RALPH_CONDITION_CONTEXT_TOKENS", "6000")))
 _DEFAULT_EVIDENCE = "문서에서 확인 불가"
 _COMPANY_KEYWORDS = ("법인명", "회사명", "기업명", "상호", "상호명")
 _ESTABLISHMENT_KEYWORDS = ("개업연월일", "설립일", "설립연월일", "창업일", "창업연월일", "법인설립일")
@@ -273,29 +280,144 @@ def _coerce_year(value: str | None) -> int | None:
         return None
 
 
-def _extract_company_name_from_text(text: str) -> str | None:
+# ── 사실 추출 엔진 ──
+# 키워드 앵커(회사명/설립일/매출 키워드)를 한 번의 스캔으로 모두 찾고,
+# 값 정규식은 앵커 위치와 앵커가 있는 줄에서만 실행한다. 결과는 키워드별
+# re.search / 전체 splitlines() 순회와 동일하다.
+_ANCHOR_KEYWORDS = tuple(dict.fromkeys(_COMPANY_KEYWORDS + _ESTABLISHMENT_KEYWORDS + _REVENUE_KEYWORDS))
+# 긴 키워드 우선 alternation 한 번으로 스캔한다. 매치가 겹치지 않으므로
+# 다른 키워드 안에 포함된 키워드(상호명⊃상호, 법인설립일⊃설립일 등)는
+# 미리 계산한 (키워드, 오프셋) 목록으로 함께 기록한다. 한 키워드의 접미사가
+# 다른 키워드의 접두사가 되는 조합은 현재 키워드 목록에 없다.
+_ANCHOR_SCAN = re.compile("|".join(re.escape(k) for k in sorted(_ANCHOR_KEYWORDS, key=len, reverse=True)))
+_ANCHOR_IMPLIED: dict[str, tuple[tuple[str, int], ...]] = {
+    outer: tuple(
+        (inner, offset)
+        for offset in range(len(outer))
+        for inner in _ANCHOR_KEYWORDS
+        if outer.startswith(inner, offset)
+    )
+    for outer in _ANCHOR_KEYWORDS
+}
+# str.splitlines()와 같은 줄 경계. '\n' 외의 경계가 없으면 str.find로 줄을 자른다.
+_LINE_BREAK = re.compile("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+_OTHER_LINE_BREAK = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_COMPANY_VALUE = re.compile(r"\s*[:：]?\s*([^\n()]+)")
+_COMPANY_VALUE_SPLIT = re.compile(r"\s{2,}|[|/]")
+_LEGAL_FORM_PATTERN = re.compile(
+    r"((?:주식회사|유한회사)\s*[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40}|"
+    r"[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40}\s*(?:주식회사|유한회사)|"
+    r"(?:㈜|\(\s*주\s*\)|（\s*주\s*）)\s*[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40})"
+)
+_LEGAL_FORM_MAX_LINES = 20
+_ESTABLISHMENT_VALUE = re.compile(
+    r"\s*[:：]?\s*"
+    r"([0-9]{4}\s*년\s*[0-9]{1,2}\s*월\s*[0-9]{1,2}\s*일?|"
+    r"[0-9]{4}[.\-/][0-9]{1,2}[.\-/][0-9]{1,2})"
+)
+_REVENUE_AMOUNT = re.compile(rf"([0-9][0-9,]*(?:\.\d+)?)\s*({'|'.join(_AMOUNT_UNITS)})?")
+_REVENUE_YEAR = re.compile(r"(20\d{2})")
+_MAX_REVENUE_CANDIDATES = 8
+
+
+class _FactText:
+    """정규화된 문서 텍스트 + 키워드별 앵커 위치 + (필요할 때 계산하는) 줄 경계."""
+
+    __slots__ = ("text", "anchors", "_simple_breaks", "_break_starts", "_break_ends")
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        anchors: dict[str, list[int]] = {keyword: [] for keyword in _ANCHOR_KEYWORDS}
+        for match in _ANCHOR_SCAN.finditer(text):
+            pos = match.start()
+            for keyword, offset in _ANCHOR_IMPLIED[match.group()]:
+                anchors[keyword].append(pos + offset)
+        for positions in anchors.values():
+            positions.sort()
+        self.anchors = anchors
+        self._simple_breaks: bool | None = None
+        self._break_starts: list[int] = []
+        self._break_ends: list[int] = []
+
+    def first_value(self, keyword: str, value_pattern: re.Pattern) -> re.Match | None:
+        """re.search(keyword + value_pattern) 과 같은 첫 매치 (값 그룹만 포함)."""
+        for pos in self.anchors[keyword]:
+            match = value_pattern.match(self.text, pos + len(keyword))
+            if match:
+                return match
+        return None
+
+    def lines_with(self, keywords: tuple[str, ...]) -> list[str]:
+        """키워드가 하나라도 들어 있는 줄 (splitlines() 기준, 문서 순서)."""
+        positions = sorted({pos for keyword in keywords for pos in self.anchors[keyword]})
+        if not positions:
+            return []
+        text = self.text
+        if self._simple_breaks is None:
+            self._simple_breaks = _OTHER_LINE_BREAK.search(text) is None
+            if not self._simple_breaks:
+                for match in _LINE_BREAK.finditer(text):
+                    self._break_starts.append(match.start())
+                    self._break_ends.append(match.end())
+
+        lines: list[str] = []
+        if self._simple_breaks:
+            line_end = -1
+            for pos in positions:
+                if pos < line_end:
+                    continue
+                line_start = text.rfind("\n", 0, pos) + 1
+                line_end = text.find("\n", pos)
+                if line_end < 0:
+                    line_end = len(text)
+                lines.append(text[line_start:line_end])
+            return lines
+
+        starts, ends = self._break_starts, self._break_ends
+        last_index = -1
+        for pos in positions:
+            index = bisect_right(starts, pos)
+            if index == last_index:
+                continue
+            last_index = index
+            line_start = ends[index - 1] if index else 0
+            line_end = starts[index] if index < len(starts) else len(text)
+            lines.append(text[line_start:line_end])
+        return lines
+
+    def head_lines(self, count: int) -> list[str]:
+        """text.splitlines()[:count] — 앞부분만 자른다."""
+        end = len(self.text)
+        for seen, match in enumerate(_LINE_BREAK.finditer(self.text), start=1):
+            if seen == count:
+                end = match.end()
+                break
+        return self.text[:end].splitlines()[:count]
+
+
+def _as_fact_text(text: str | _FactText) -> _FactText:
+    return text if isinstance(text, _FactText) else _FactText(text)
+
+
+def _extract_company_name_from_text(text: str | _FactText) -> str | None:
+    doc = _as_fact_text(text)
     for keyword in _COMPANY_KEYWORDS:
-        pattern = rf"{keyword}\s*[:：]?\s*([^\n()]+)"
-        match = re.search(pattern, text)
+        match = doc.first_value(keyword, _COMPANY_VALUE)
         if not match:
             continue
         candidate = match.group(1).strip()
-        candidate = re.split(r"\s{2,}|[|/]", candidate)[0].strip()
+        candidate = _COMPANY_VALUE_SPLIT.split(candidate)[0].strip()
         candidate = candidate.rstrip(":：")
         candidate = _normalize_company_name(candidate)
         if candidate and len(candidate) <= 80 and _is_plausible_company_name(candidate):
             return candidate
 
-    legal_form_pattern = re.compile(
-        r"((?:주식회사|유한회사)\s*[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40}|"
-        r"[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40}\s*(?:주식회사|유한회사)|"
-        r"(?:㈜|\(\s*주\s*\)|（\s*주\s*）)\s*[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40})"
-    )
-    for line in text.splitlines()[:20]:
+    for line in doc.head_lines(_LEGAL_FORM_MAX_LINES):
         normalized_line = normalize_text(line).strip()
         if not normalized_line:
             continue
-        match = legal_form_pattern.search(normalized_line)
+        match = _LEGAL_FORM_PATTERN.search(normalized_line)
         if not match:
             continue
         candidate = _normalize_company_name(match.group(1))
@@ -304,80 +426,68 @@ def _extract_company_name_from_text(text: str) -> str | None:
     return None
 
 
-def _extract_establishment_date(text: str) -> str | None:
+def _extract_establishment_date(text: str | _FactText) -> str | None:
+    doc = _as_fact_text(text)
     for keyword in _ESTABLISHMENT_KEYWORDS:
-        pattern = (
-            rf"{keyword}\s*[:：]?\s*"
-            r"([0-9]{4}\s*년\s*[0-9]{1,2}\s*월\s*[0-9]{1,2}\s*일?|"
-            r"[0-9]{4}[.\-/][0-9]{1,2}[.\-/][0-9]{1,2})"
-        )
-        match = re.search(pattern, text)
+        match = doc.first_value(keyword, _ESTABLISHMENT_VALUE)
         if match:
             normalized = normalize_date(match.group(1))
             if normalized:
                 return normalized
 
-    for line in text.splitlines():
-        if not any(keyword in line for keyword in _ESTABLISHMENT_KEYWORDS):
-            continue
+    for line in doc.lines_with(_ESTABLISHMENT_KEYWORDS):
         normalized = normalize_date(line)
         if normalized:
             return normalized
     return None
 
 
-def _extract_revenue_candidates(text: str) -> list[dict]:
-    candidates: list[dict] = []
-    amount_pattern = re.compile(
-        rf"([0-9][0-9,]*(?:\.\d+)?)\s*({'|'.join(_AMOUNT_UNITS)})?"
-    )
+def _extract_revenue_candidates(text: str | _FactText) -> list[dict]:
+    doc = _as_fact_text(text)
+    deduped: list[dict] = []
+    seen: set[tuple[int, int | None, str]] = set()
 
-    for line in text.splitlines():
+    for line in doc.lines_with(_REVENUE_KEYWORDS):
         normalized_line = line.strip()
-        if not normalized_line or not any(keyword in normalized_line for keyword in _REVENUE_KEYWORDS):
-            continue
-        year_match = re.search(r"(20\d{2})", normalized_line)
+        year_match = _REVENUE_YEAR.search(normalized_line)
         year = _coerce_year(year_match.group(1) if year_match else None)
-        for match in amount_pattern.finditer(normalized_line):
+        snippet = normalized_line[:160]
+        for match in _REVENUE_AMOUNT.finditer(normalized_line):
             amount = _parse_amount_value(match.group(1), match.group(2))
             if amount is None:
                 continue
-            snippet = normalized_line[:160]
-            candidates.append({
+            key = (amount, year, snippet)
+            if key in seen:
+                continue
+            seen.add(key)
+            deduped.append({
                 "amount": amount,
                 "display": _format_amount_krw(amount),
                 "year": year,
                 "snippet": snippet,
             })
-
-    deduped: list[dict] = []
-    seen: set[tuple[int, int | None, str]] = set()
-    for candidate in candidates:
-        key = (candidate["amount"], candidate.get("year"), candidate["snippet"])
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(candidate)
-    return deduped[:8]
+            if len(deduped) >= _MAX_REVENUE_CANDIDATES:
+                return deduped
+    return deduped
 
 
 def extract_condition_facts(
     text: str,
     reference_date: date | None = None,
 ) -> dict:
-    normalized = normalize_text(text)
+    doc = _FactText(normalize_text(text))
     ref = reference_date or _today_utc()
     facts = {
         "reference_date": ref.isoformat(),
-        "company_name": _extract_company_name_from_text(normalized),
+        "company_name": _extract_company_name_from_text(doc),
         "company_group_name": None,
         "company_group_key": None,
         "establishment_date": None,
         "business_age_years": None,
-        "revenue_candidates": _extract_revenue_candidates(normalized),
+        "revenue_candidates": _extract_revenue_candidates(doc),
     }
 
-    establishment_date = _extract_establishment_date(normalized)
+    establishment_date = _extract_establishment_date(doc)
     if establishment_date:
         facts["establishment_date"] = establishment_date
         try:
@@ -564,7 +674,7 @@ def _normalize_conditions_output(
     return normalized
 
 
-def _parse_model_output(raw: str, requested_conditions: list[str]) -> dict:
+def _extract_json_payload(raw: str) -> dict | None:
     payload = _load_json_object(raw)
     if payload is None:
         fence = re.search(r"```json\s*(.*?)\s*```", raw, re.DOTALL)
@@ -574,37 +684,50 @@ def _parse_model_output(raw: str, requested_conditions: list[str]) -> dict:
         block = re.search(r"\{.*\}", raw, re.DOTALL)
         if block:
             payload = _load_json_object(block.group(0))
+    return payload
+
 
+def _parsed_from_payload(payload: dict, requested_conditions: list[str]) -> dict:
+    company_name = _normalize_company_name(payload.get("company_name"))
     result = {
-        "company_name": None,
-        "conditions": _normalize_conditions_output(requested_conditions, None),
+        "company_name": company_name,
+        "company_group_name": _company_group_name(company_name),
+        "company_group_key": _company_group_key(company_name),
+        "conditions": _normalize_conditions_output(requested_conditions, payload.get("conditions")),
     }
-
-    if payload is None:
-        result["raw_response"] = raw[:500]
-        result["parse_warning"] = "JSON_PARSE_FAILED"
-        return result
-
-    result["company_name"] = _normalize_company_name(payload.get("company_name"))
-    result["company_group_name"] = _company_group_name(result["company_name"])
-    result["company_group_key"] = _company_group_key(result["company_name"])
-    result["conditions"] = _normalize_conditions_output(requested_conditions, payload.get("conditions"))
     if "raw_response" in payload:
         result["raw_response"] = payload["raw_response"]
     return result
 
 
-def check_conditions_nova(
-    text: str,
-    conditions: list[str],
-    model_id: str,
-    region: str,
-    facts: dict | None = None,
-) -> dict:
-    """
-    Nova Pro (텍스트 전용)로 각 조건의 충족 여부를 판단.
-    기업명도 함께 추출.
-    """
+def _parse_model_output(raw: str, requested_conditions: list[str]) -> dict:
+    payload = _extract_json_payload(raw)
+    if payload is None:
+        return {
+            "company_name": None,
+            "conditions": _normalize_conditions_output(requested_conditions, None),
+            "raw_response": raw[:500],
+            "parse_warning": "JSON_PARSE_FAILED",
+        }
+    return _parsed_from_payload(payload, requested_conditions)
+
+
+@dataclass
+class _PreparedCheck:
+    """규칙 엔진 적용 후 LLM에 넘길 준비가 된 단일 문서 검사."""
+    conditions: list[str]
+    rule_results: dict[int, dict]
+    extracted_facts: dict
+    unresolved_pairs: list[tuple[int, str]]
+    doc_text: str
+    context: dict | None = None
+
+    @property
+    def unresolved_conditions(self) -> list[str]:
+        return [condition for _, condition in self.unresolved_pairs]
+
+
+def _prepare_condition_check(text: str, conditions: list[str], facts: dict | None) -> _PreparedCheck:
     conditions = _normalize_requested_conditions(list(conditions))
     if not conditions:
         raise ValueError("conditions 파라미터가 비어 있습니다")
@@ -615,77 +738,103 @@ def check_conditions_nova(
         for index, condition in enumerate(conditions)
         if index not in rule_results
     ]
+    if not unresolved_pairs:
+        return _PreparedCheck(conditions, rule_results, extracted_facts, unresolved_pairs, doc_text="")
 
-    def _attach_usage(result: dict, input_tokens: int, output_tokens: int) -> dict:
-        result["_usage"] = {
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-        }
-        return result
-
-    def _merge_conditions(model_payload: dict | None) -> dict:
-        llm_conditions = []
-        llm_company_name = None
-        parse_warning = None
-        raw_response = None
-        if model_payload:
-            llm_conditions = model_payload.get("conditions") or []
-            llm_company_name = _normalize_company_name(model_payload.get("company_name"))
-            parse_warning = model_payload.get("parse_warning")
-            raw_response = model_payload.get("raw_response")
-
-        merged_conditions: list[dict] = []
-        llm_index = 0
-        for idx, condition in enumerate(conditions):
-            if idx in rule_results:
-                merged_conditions.append(rule_results[idx])
-                continue
-            if llm_index < len(llm_conditions) and isinstance(llm_conditions[llm_index], dict):
-                item = dict(llm_conditions[llm_index])
-            else:
-                item = {
-                    "condition": condition,
-                    "result": False,
-                    "evidence": _DEFAULT_EVIDENCE,
-                }
-            item["condition"] = condition
-            item.setdefault("result", False)
-            item.setdefault("evidence", _DEFAULT_EVIDENCE)
-            item["source"] = "llm"
-            merged_conditions.append(item)
-            llm_index += 1
-
-        summary = {
-            "total": len(conditions),
-            "rule_count": len(rule_results),
-            "llm_count": len(unresolved_pairs),
-            "llm_skipped": len(unresolved_pairs) == 0,
-        }
-        company_name = llm_company_name or extracted_facts.get("company_name")
-        enriched_facts = _apply_company_identity(extracted_facts, company_name)
-        result = {
-            "company_name": enriched_facts.get("company_name"),
-            "company_group_name": enriched_facts.get("company_group_name"),
-            "company_group_key": enriched_facts.get("company_group_key"),
-            "conditions": merged_conditions,
-            "condition_summary": summary,
-            "detected_facts": enriched_facts,
-        }
-        if parse_warning:
-            result["parse_warning"] = parse_warning
-        if raw_response:
-            result["raw_response"] = raw_response
-        return result
+    selection = select_context(
+        text,
+        [condition for _, condition in unresolved_pairs],
+        _CONTEXT_TOKEN_BUDGET,
+        anchors=_fact_anchors(extracted_facts),
+    )
+    return _PreparedCheck(
+        conditions=conditions,
+        rule_results=rule_results,
+        extracted_facts=extracted_facts,
+        unresolved_pairs=unresolved_pairs,
+        doc_text=selection.text,
+        context=selection.summary(),
+    )
 
-    if not unresolved_pairs:
-        return _attach_usage(_merge_conditions(None), 0, 0)
 
-    import boto3
+def _fact_anchors(extracted_facts: dict) -> list[str]:
+    """컨텍스트 선택에 쓸 앵커: 기업명 키워드/후보, 매출 후보 스니펫."""
+    anchors = list(_COMPANY_KEYWORDS)
+    if extracted_facts.get("company_name"):
+        anchors.append(str(extracted_facts["company_name"]))
+    for candidate in extracted_facts.get("revenue_candidates") or []:
+        if isinstance(candidate, dict) and candidate.get("snippet"):
+            anchors.append(str(candidate["snippet"]))
+    return anchors
+
+
+def _attach_usage(result: dict, input_tokens: int, output_tokens: int) -> dict:
+    result["_usage"] = {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+    }
+    return result
+
+
+def _merge_conditions(prepared: _PreparedCheck, model_payload: dict | None) -> dict:
+    """규칙 결과와 LLM 결과를 원래 조건 순서대로 병합."""
+    llm_conditions = []
+    llm_company_name = None
+    parse_warning = None
+    raw_response = None
+    if model_payload:
+        llm_conditions = model_payload.get("conditions") or []
+        llm_company_name = _normalize_company_name(model_payload.get("company_name"))
+        parse_warning = model_payload.get("parse_warning")
+        raw_response = model_payload.get("raw_response")
+
+    merged_conditions: list[dict] = []
+    llm_index = 0
+    for idx, condition in enumerate(prepared.conditions):
+        if idx in prepared.rule_results:
+            merged_conditions.append(prepared.rule_results[idx])
+            continue
+        if llm_index < len(llm_conditions) and isinstance(llm_conditions[llm_index], dict):
+            item = dict(llm_conditions[llm_index])
+        else:
+            item = {
+                "condition": condition,
+                "result": False,
+                "evidence": _DEFAULT_EVIDENCE,
+            }
+        item["condition"] = condition
+        item.setdefault("result", False)
+        item.setdefault("evidence", _DEFAULT_EVIDENCE)
+        item["source"] = "llm"
+        merged_conditions.append(item)
+        llm_index += 1
+
+    summary = {
+        "total": len(prepared.conditions),
+        "rule_count": len(prepared.rule_results),
+        "llm_count": len(prepared.unresolved_pairs),
+        "llm_skipped": len(prepared.unresolved_pairs) == 0,
+    }
+    company_name = llm_company_name or prepared.extracted_facts.get("company_name")
+    enriched_facts = _apply_company_identity(prepared.extracted_facts, company_name)
+    result = {
+        "company_name": enriched_facts.get("company_name"),
+        "company_group_name": enriched_facts.get("company_group_name"),
+        "company_group_key": enriched_facts.get("company_group_key"),
+        "conditions": merged_conditions,
+        "condition_summary": summary,
+        "detected_facts": enriched_facts,
+    }
+    if parse_warning:
+        result["parse_warning"] = parse_warning
+    if raw_response:
+        result["raw_response"] = raw_response
+    if prepared.context is not None:
+        result["context"] = prepared.context
+    return result
 
-    unresolved_conditions = [condition for _, condition in unresolved_pairs]
-    cond_list = "\n".join(f"{i + 1}. {c}" for i, c in enumerate(unresolved_conditions))
-    doc_text = text[:_MAX_DOC_CHARS]
 
+def _facts_block(extracted_facts: dict) -> str:
     facts_lines: list[str] = []
     if extracted_facts.get("company_name"):
         facts_lines.append(f"- 기업명 후보: {extracted_facts['company_name']}")
@@ -702,7 +851,34 @@ def check_conditions_nova(
             year = candidate.get("year")
             prefix = f"{year}년 " if isinstance(year, int) else ""
             facts_lines.append(f"- {prefix}매출 후보: {candidate.get('display')} / {snippet}")
-    facts_block = "\n".join(facts_lines) or "- 별도 구조화 팩트 없음"
+    return "\n".join(facts_lines) or "- 별도 구조화 팩트 없음"
+
+
+def _converse_text(prompt: str, model_id: str, region: str, max_tokens: int) -> tuple[str, int, int]:
+    """텍스트 전용 converse 호출. Returns (raw, input_tokens, output_tokens)."""
+    from ralph.vlm.client_pool import get_bedrock_client
+    from ralph.vlm.rate_limiter import bedrock_call, estimate_tokens
+
+    client = get_bedrock_client(region)
+    with bedrock_call(model_id, estimate_tokens(prompt, max_tokens=max_tokens)) as slot:
+        resp = client.converse(
+            modelId=model_id,
+            messages=[{"role": "user", "content": [{"text": prompt}]}],
+            inferenceConfig={"maxTokens": max_tokens, "temperature": 0},
+        )
+        # Extract token usage from Bedrock response.
+        usage = resp.get("usage", {})
+        slot.record_usage(usage.get("inputTokens", 0), usage.get("outputTokens", 0))
+    raw = resp["output"]["message"]["content"][0]["text"]
+    return raw, usage.get("inputTokens", 0), usage.get("outputTokens", 0)
+
+
+def _check_prepared(prepared: _PreparedCheck, model_id: str, region: str) -> dict:
+    if not prepared.unresolved_pairs:
+        return _attach_usage(_merge_conditions(prepared, None), 0, 0)
+
+    unresolved_conditions = prepared.unresolved_conditions
+    cond_list = "\n".join(f"{i + 1}. {c}" for i, c in enumerate(unresolved_conditions))
 
     prompt = f"""\
 다음 문서 내용을 읽고 각 조건의 충족 여부를 판단하세요.
@@ -711,10 +887,10 @@ def check_conditions_nova(
 {cond_list}
 
 === 구조화 팩트 (참고) ===
-{facts_block}
+{_facts_block(prepared.extracted_facts)}
 
 === 문서 내용 ===
-{doc_text}
+{prepared.doc_text}
 
 === 지시 ===
 - 각 조건에 대해 충족(true) 또는 미충족(false)을 판단하세요
@@ -730,22 +906,226 @@ def check_conditions_nova(
   ]
 }}"""
 
-    client = boto3.client("bedrock-runtime", region_name=region)
-    resp = client.converse(
-        modelId=model_id,
-        messages=[{"role": "user", "content": [{"text": prompt}]}],
-        inferenceConfig={"maxTokens": 2000, "temperature": 0},
+    raw, input_tokens, output_tokens = _converse_text(prompt, model_id, region, max_tokens=2000)
+    parsed = _parse_model_output(raw, unresolved_conditions)
+    return _attach_usage(_merge_conditions(prepared, parsed), input_tokens, output_tokens)
+
+
+def check_conditions_nova(
+    text: str,
+    conditions: list[str],
+    model_id: str,
+    region: str,
+    facts: dict | None = None,
+) -> dict:
+    """
+    Nova Pro (텍스트 전용)로 각 조건의 충족 여부를 판단.
+    기업명도 함께 추출.
+    """
+    return _check_prepared(_prepare_condition_check(text, conditions, facts), model_id, region)
+
+
+# ─────────────────────────────────────────────────────────────
+# 다문서 배치 — 작은 문서 여러 개를 한 프롬프트로
+# ─────────────────────────────────────────────────────────────
+
+BATCH_MAX_DOCS = 8
+BATCH_TOKEN_BUDGET = 12000   # 배치 프롬프트의 문서 본문 예산 (추정 토큰)
+BATCH_DOC_MAX_CHARS = 2000   # 이보다 긴 문서는 단독 호출
+_BATCH_MAX_OUTPUT_TOKENS = 5000
+
+
+def _estimate_tokens(text: str) -> int:
+    # 한글은 대략 1자 ≈ 1토큰 — 보수적으로 글자 수를 그대로 사용
+    return len(text)
+
+
+def _batch_doc_section(doc_id: str, prepared: _PreparedCheck, cond_numbers: dict[str, int]) -> str:
+    targets = ", ".join(str(cond_numbers[c]) for c in prepared.unresolved_conditions)
+    return f"""\
+=== 문서 {doc_id} ===
+판단할 조건 번호: {targets}
+구조화 팩트 (참고):
+{_facts_block(prepared.extracted_facts)}
+내용:
+{prepared.doc_text}"""
+
+
+def _pack_batches(
+    prepared: list[_PreparedCheck],
+    *,
+    max_docs: int,
+    token_budget: int,
+    max_doc_chars: int,
+) -> tuple[list[list[int]], list[int]]:
+    """LLM 판단이 필요한 문서를 배치로 묶는다. Returns (batches, singles) — 입력 인덱스."""
+    batches: list[list[int]] = []
+    singles: list[int] = []
+    current: list[int] = []
+    current_tokens = 0
+    for idx, item in enumerate(prepared):
+        if not item.unresolved_pairs:
+            continue
+        if len(item.doc_text) > max_doc_chars:
+            singles.append(idx)
+            continue
+        cost = _estimate_tokens(item.doc_text)
+        if current and (len(current) >= max_docs or current_tokens + cost > token_budget):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(idx)
+        current_tokens += cost
+    if current:
+        batches.append(current)
+    # 1개짜리 배치는 기존 단일 프롬프트가 더 정확하고 짧다
+    singles.extend(batch[0] for batch in batches if len(batch) == 1)
+    return [batch for batch in batches if len(batch) > 1], sorted(singles)
+
+
+def _split_usage(total: int, weights: list[int]) -> list[int]:
+    """배치 토큰 사용량을 문서 길이 비례로 나눈다 (합계 보존)."""
+    weights = [max(w, 1) for w in weights]
+    weight_sum = sum(weights)
+    shares = [total * w // weight_sum for w in weights]
+    for i in range(total - sum(shares)):
+        shares[i] += 1
+    return shares
+
+
+def _check_batch(
+    prepared: list[_PreparedCheck],
+    model_id: str,
+    region: str,
+) -> list[dict]:
+    """
+    여러 문서를 한 번의 호출로 판단. 응답에서 누락된 문서는 ``_usage``만 담긴
+    빈 dict (호출자가 단독 호출로 폴백).
+    """
+    shared_conditions: list[str] = []
+    for item in prepared:
+        for condition in item.unresolved_conditions:
+            if condition not in shared_conditions:
+                shared_conditions.append(condition)
+    cond_numbers = {c: i + 1 for i, c in enumerate(shared_conditions)}
+    cond_list = "\n".join(f"{i + 1}. {c}" for i, c in enumerate(shared_conditions))
+    doc_ids = [f"D{i + 1}" for i in range(len(prepared))]
+    sections = "\n\n".join(
+        _batch_doc_section(doc_id, item, cond_numbers)
+        for doc_id, item in zip(doc_ids, prepared)
     )
-    raw = resp["output"]["message"]["content"][0]["text"]
 
-    # Extract token usage from Bedrock response.
-    usage = resp.get("usage", {})
-    _usage = {
-        "input_tokens": usage.get("inputTokens", 0),
-        "output_tokens": usage.get("outputTokens", 0),
-    }
-    parsed = _parse_model_output(raw, unresolved_conditions)
-    return _attach_usage(_merge_conditions(parsed), _usage["input_tokens"], _usage["output_tokens"])
+    prompt = f"""\
+다음 {len(prepared)}개 문서를 각각 읽고, 문서별로 지정된 조건의 충족 여부를 판단하세요.
+각 문서는 서로 다른 기업의 자료입니다. 다른 문서의 내용을 근거로 쓰지 마세요.
+
+=== 판단 조건 ===
+{cond_list}
+
+{sections}
+
+=== 지시 ===
+- 문서마다 "판단할 조건 번호"에 해당하는 조건만 판단하세요
+- 각 조건에 대해 충족(true) 또는 미충족(false)을 판단하세요
+- 판단 근거가 되는 해당 문서 내 구체적인 내용을 evidence로 인용하세요
+- 문서에서 확인이 불가능한 경우 evidence를 "문서에서 확인 불가"로 표시하고 result는 false로 하세요
+- 문서별 기업명(법인명 또는 상호)을 추출하세요 (없으면 null)
+
+아래 JSON 형식으로만 응답하세요:
+{{
+  "documents": [
+    {{
+      "doc_id": "D1",
+      "company_name": "기업명 또는 null",
+      "conditions": [
+        {{"condition": "조건 원문", "result": true, "evidence": "근거 텍스트"}}
+      ]
+    }}
+  ]
+}}"""
+
+    max_tokens = min(_BATCH_MAX_OUTPUT_TOKENS, 2000 * len(prepared))
+    raw, input_tokens, output_tokens = _converse_text(prompt, model_id, region, max_tokens=max_tokens)
+
+    payload = _extract_json_payload(raw)
+    documents = payload.get("documents") if isinstance(payload, dict) else None
+    by_id: dict[str, dict] = {}
+    if isinstance(documents, list):
+        for doc in documents:
+            if isinstance(doc, dict) and str(doc.get("doc_id") or "").strip():
+                by_id.setdefault(str(doc["doc_id"]).strip().upper(), doc)
+
+    weights = [len(item.doc_text) for item in prepared]
+    in_shares = _split_usage(input_tokens, weights)
+    out_shares = _split_usage(output_tokens, weights)
+
+    results: list[dict] = []
+    for i, (doc_id, item) in enumerate(zip(doc_ids, prepared)):
+        doc = by_id.get(doc_id)
+        if doc is None:
+            # 누락 문서도 배치 호출 비용은 썼으므로 몫을 남겨 두고 폴백 결과에 더한다
+            results.append(_attach_usage({}, in_shares[i], out_shares[i]))
+            continue
+        parsed = _parsed_from_payload(doc, item.unresolved_conditions)
+        results.append(_attach_usage(_merge_conditions(item, parsed), in_shares[i], out_shares[i]))
+    return results
+
+
+def check_conditions_nova_batch(
+    documents: list[tuple[str, dict | None]],
+    conditions: list[str],
+    model_id: str,
+    region: str,
+    *,
+    max_docs: int = BATCH_MAX_DOCS,
+    token_budget: int = BATCH_TOKEN_BUDGET,
+    max_doc_chars: int = BATCH_DOC_MAX_CHARS,
+) -> list[dict]:
+    """
+    여러 문서의 조건 검사를 묶어서 수행.
+
+    규칙 엔진으로 해결되지 않은 조건이 남은 작은 문서들을 토큰 예산 안에서
+    한 프롬프트로 묶어 호출한다. 긴 문서 / 배치 응답에서 누락된 문서는
+    check_conditions_nova와 같은 단독 호출로 처리한다.
+
+    Args:
+        documents: (text, facts) 목록. facts는 extract_condition_facts 결과 또는 None
+        conditions: 모든 문서에 공통인 조건 목록
+
+    Returns:
+        입력 순서대로 check_conditions_nova와 같은 형태의 결과 (_usage 포함).
+        배치 호출의 토큰 사용량은 문서 길이 비례로 나눠 담는다.
+    """
+    prepared = [_prepare_condition_check(text, conditions, facts) for text, facts in documents]
+    results: list[dict | None] = [None] * len(prepared)
+
+    for idx, item in enumerate(prepared):
+        if not item.unresolved_pairs:
+            results[idx] = _attach_usage(_merge_conditions(item, None), 0, 0)
+
+    batches, singles = _pack_batches(
+        prepared,
+        max_docs=max_docs,
+        token_budget=token_budget,
+        max_doc_chars=max_doc_chars,
+    )
+    carried_usage: dict[int, dict] = {}
+    for batch in batches:
+        for idx, result in zip(batch, _check_batch([prepared[i] for i in batch], model_id, region)):
+            if "conditions" in result:
+                results[idx] = result
+            else:
+                singles.append(idx)
+                carried_usage[idx] = result["_usage"]
+
+    for idx in singles:
+        result = _check_prepared(prepared[idx], model_id, region)
+        carried = carried_usage.get(idx)
+        if carried:
+            result["_usage"]["input_tokens"] += carried["input_tokens"]
+            result["_usage"]["output_tokens"] += carried["output_tokens"]
+        results[idx] = result
+
+    return [r for r in results if r is not None]
 
 
 def main() -> None:
@@ -0,0 +1,225 @@
+"""
+조건 검사용 문서 컨텍스트 선택.
+
+긴 문서를 앞에서부터 자르면(text[:8000]) IR 자료 뒤쪽의 근거가 빠지고,
+앞부분 표지/목차가 예산을 차지한다. 대신:
+
+1. 문서를 페이지(extract_text의 "---" 구분) → 문단 단위 청크로 나누고
+2. 미해결 조건 + 구조화 팩트 앵커(기업명, 매출 스니펫 등)로 BM25 점수를 매겨
+3. 점수 높은 청크부터 토큰 예산 안에 담은 뒤 문서 순서로 이어 붙인다.
+
+첫 청크(기업명/표지가 주로 있는 곳)는 항상 포함한다. 보낸 구간은
+ContextSelection.spans(원문 기준 [start, end))로 남긴다.
+"""
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from ralph.utils.korean_text import normalize_text
+
+DEFAULT_CHUNK_CHARS = 1200
+GAP_MARKER = "\n\n[...]\n\n"
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t]*\n")
+_PAGE_SEPARATOR = "---"
+_TOKEN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+
+@dataclass(slots=True)
+class Chunk:
+    start: int
+    end: int
+    page: int
+    text: str
+
+
+@dataclass
+class ContextSelection:
+    text: str
+    spans: list[tuple[int, int]] = field(default_factory=list)
+    pages: list[int] = field(default_factory=list)
+    doc_chars: int = 0
+    selected: bool = False
+
+    def summary(self) -> dict:
+        """결과 JSON에 남길 요약 (보낸 구간/페이지/글자 수)."""
+        return {
+            "doc_chars": self.doc_chars,
+            "sent_chars": len(self.text),
+            "selected": self.selected,
+            "spans": [list(span) for span in self.spans],
+            "pages": self.pages,
+        }
+
+
+def tokenize(text: str) -> list[str]:
+    """한글은 2-gram(조사/어미 변형에 강함), 영문/숫자는 단어 단위."""
+    tokens: list[str] = []
+    for word in _TOKEN.findall(normalize_text(text).lower()):
+        if "가" <= word[0] <= "힣":
+            if len(word) == 1:
+                continue
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def _segments(text: str) -> list[tuple[int, int, int]]:
+    """빈 줄 기준 문단 (start, end, page). 페이지 구분선은 페이지 번호만 올린다."""
+    segments: list[tuple[int, int, int]] = []
+    page = 1
+    pos = 0
+    for match in [*_PARAGRAPH_BREAK.finditer(text), None]:
+        end = match.start() if match else len(text)
+        piece = text[pos:end]
+        if piece.strip() == _PAGE_SEPARATOR:
+            page += 1
+        elif piece.strip():
+            lead = len(piece) - len(piece.lstrip())
+            segments.append((pos + lead, pos + len(piece.rstrip()), page))
+        if match:
+            pos = match.end()
+    return segments
+
+
+def _split_long(start: int, end: int, text: str, chunk_chars: int) -> list[tuple[int, int]]:
+    """chunk_chars보다 긴 문단을 줄 경계(없으면 글자 수)로 자른다."""
+    spans: list[tuple[int, int]] = []
+    while end - start > chunk_chars:
+        cut = text.rfind("\n", start + 1, start + chunk_chars)
+        if cut <= start:
+            cut = start + chunk_chars
+        spans.append((start, cut))
+        start = cut
+        while start < end and text[start] in " \t\n":
+            start += 1
+    if start < end:
+        spans.append((start, end))
+    return spans
+
+
+def chunk_document(text: str, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> list[Chunk]:
+    """같은 페이지의 연속 문단을 chunk_chars 이내로 묶는다."""
+    chunks: list[Chunk] = []
+    cur_start = cur_end = -1
+    cur_page = 0
+    for seg_start, seg_end, page in _segments(text):
+        for start, end in _split_long(seg_start, seg_end, text, chunk_chars):
+            if cur_start >= 0 and page == cur_page and end - cur_start <= chunk_chars:
+                cur_end = end
+                continue
+            if cur_start >= 0:
+                chunks.append(Chunk(cur_start, cur_end, cur_page, text[cur_start:cur_end]))
+            cur_start, cur_end, cur_page = start, end, page
+    if cur_start >= 0:
+        chunks.append(Chunk(cur_start, cur_end, cur_page, text[cur_start:cur_end]))
+    return chunks
+
+
+def score_chunks(chunks: list[Chunk], queries: Sequence[str], anchors: Sequence[str] = ()) -> list[float]:
+    """
+    BM25 점수. 조건 문장은 토큰으로, 앵커는 구절 그대로(정규화 후 부분 문자열)
+    하나의 용어로 센다.
+    """
+    if not chunks:
+        return []
+    query_terms: dict[str, int] = {}
+    for query in queries:
+        for token in tokenize(query):
+            query_terms[token] = query_terms.get(token, 0) + 1
+    anchor_terms = [normalize_text(a).strip().lower() for a in anchors]
+    anchor_terms = list(dict.fromkeys(a for a in anchor_terms if len(a) >= 2))
+
+    chunk_tfs: list[dict[str, int]] = []
+    lengths: list[int] = []
+    for chunk in chunks:
+        tokens = tokenize(chunk.text)
+        tf: dict[str, int] = {}
+        for token in tokens:
+            if token in query_terms:
+                tf[token] = tf.get(token, 0) + 1
+        lowered = normalize_text(chunk.text).lower()
+        for anchor in anchor_terms:
+            count = lowered.count(anchor)
+            if count:
+                tf["\0" + anchor] = count
+        chunk_tfs.append(tf)
+        lengths.append(max(len(tokens), 1))
+
+    n = len(chunks)
+    avg_len = sum(lengths) / n
+    weights = dict(query_terms)
+    weights.update({"\0" + anchor: 1 for anchor in anchor_terms})
+    df: dict[str, int] = {}
+    for tf in chunk_tfs:
+        for term in tf:
+            df[term] = df.get(term, 0) + 1
+
+    scores: list[float] = []
+    for tf, length in zip(chunk_tfs, lengths):
+        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * length / avg_len)
+        score = 0.0
+        for term, freq in tf.items():
+            idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+            score += weights[term] * idf * freq * (_BM25_K1 + 1) / (freq + norm)
+        scores.append(score)
+    return scores
+
+
+def select_context(
+    text: str,
+    queries: Sequence[str],
+    token_budget: int,
+    *,
+    anchors: Sequence[str] = (),
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> ContextSelection:
+    """
+    조건/앵커와 관련된 청크를 token_budget(1자 ≈ 1토큰) 안에서 고른다.
+
+    예산 안에 들어가는 문서는 그대로 보낸다. 어떤 청크도 점수가 없으면
+    기존처럼 앞부분을 예산만큼 자른다.
+    """
+    if len(text) <= token_budget:
+        return ContextSelection(text=text, spans=[(0, len(text))] if text else [], pages=[], doc_chars=len(text))
+
+    chunks = chunk_document(text, min(chunk_chars, max(token_budget, 1)))
+    scores = score_chunks(chunks, queries, anchors)
+    if not chunks or max(scores) <= 0:
+        return ContextSelection(
+            text=text[:token_budget], spans=[(0, token_budget)], pages=[], doc_chars=len(text), selected=True,
+        )
+
+    chosen = {0}
+    used = len(chunks[0].text)
+    ranked = sorted((i for i in range(1, len(chunks)) if scores[i] > 0), key=lambda i: (-scores[i], i))
+    for i in ranked:
+        cost = len(chunks[i].text) + len(GAP_MARKER)
+        if used + cost > token_budget:
+            continue
+        chosen.add(i)
+        used += cost
+
+    parts: list[str] = []
+    spans: list[tuple[int, int]] = []
+    previous = -1
+    for i in sorted(chosen):
+        chunk = chunks[i]
+        if spans and previous == i - 1:
+            # 인접 청크는 하나의 구간으로 (사이 공백은 문단 구분 하나로 줄임)
+            parts.append("\n\n" + chunk.text)
+            spans[-1] = (spans[-1][0], chunk.end)
+        else:
+            if parts:
+                parts.append(GAP_MARKER)
+            parts.append(chunk.text)
+            spans.append((chunk.start, chunk.end))
+        previous = i
+    pages = sorted({chunks[i].page for i in chosen})
+    return ContextSelection(text="".join(parts), spans=spans, pages=pages, doc_chars=len(text), selected=True)
@@ -0,0 +1,222 @@
+"""
+CPU 바운드 PDF 작업용 프로세스 풀.
+
+PyMuPDF 텍스트 추출, LayoutAnalyzer.analyze, 추출기의 find_tables()는
+GIL을 잡고 도는 순수 CPU 작업이라 워커 스레드를 늘려도 코어 하나만 쓴다.
+이 단계들을 별도 프로세스에서 실행한다.
+
+- 자식 프로세스는 시작 시 fitz / 레이아웃 분석기 / 추출기 레지스트리를 미리 import
+- max_tasks_per_child로 자식을 주기적으로 교체해 메모리 증가를 제한
+- 결과는 LayoutResult 객체 그래프 대신 dict/tuple 같은 원시 타입으로만 반환
+- 풀이 꺼져 있으면(workers=0) 현재 스레드에서 실행
+- 자식이 죽으면(BrokenProcessPool) 풀을 새로 만들어 한 번만 재시도하고, 또 죽으면 예외를 전달.
+  자식을 죽인 입력을 워커 프로세스에서 다시 돌리지 않도록 인라인으로 대신 실행하지 않는다.
+
+환경변수:
+    RALPH_CPU_POOL_WORKERS               자식 프로세스 수 (기본 0 = 풀 없이 인라인)
+    RALPH_CPU_POOL_MAX_TASKS_PER_CHILD   자식 하나가 처리할 최대 작업 수 (기본 50)
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_TASKS_PER_CHILD = 50
+
+_pool: ProcessPoolExecutor | None = None
+_pool_workers: int | None = None
+_lock = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, "")))
+    except ValueError:
+        return default
+
+
+def _max_tasks_per_child() -> int:
+    return _env_int("RALPH_CPU_POOL_MAX_TASKS_PER_CHILD", _DEFAULT_MAX_TASKS_PER_CHILD) or _DEFAULT_MAX_TASKS_PER_CHILD
+
+
+def _warm_child() -> None:
+    """자식 프로세스 초기화: 무거운 import를 첫 작업 전에 끝낸다."""
+    import fitz  # noqa: F401
+
+    import ralph.extraction.registry  # noqa: F401
+    import ralph.layout.analyzer  # noqa: F401
+    import ralph.playground_parser  # noqa: F401
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def configure(workers: int | None = None) -> int:
+    """
+    풀 크기 설정. 기존 풀이 있으면 닫고 다음 사용 시 새로 만든다.
+
+    Args:
+        workers: 자식 프로세스 수. None이면 RALPH_CPU_POOL_WORKERS, 0이면 비활성.
+
+    Returns:
+        적용된 자식 프로세스 수
+    """
+    global _pool, _pool_workers
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        _pool_workers = max(0, workers) if workers is not None else None
+        return _workers()
+
+
+def _workers() -> int:
+    if _pool_workers is not None:
+        return _pool_workers
+    return _env_int("RALPH_CPU_POOL_WORKERS", 0)
+
+
+def enabled() -> bool:
+    return _workers() > 0
+
+
+def _get_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    workers = _workers()
+    if workers <= 0:
+        return None
+    if _pool is not None:
+        return _pool
+    with _lock:
+        if _pool is None:
+            # fork는 워커 스레드의 락/boto3 상태를 복제하므로 spawn으로 깨끗하게 시작
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_child,
+                max_tasks_per_child=_max_tasks_per_child(),
+            )
+    return _pool
+
+
+def warm() -> int:
+    """모든 자식 프로세스를 미리 띄우고 초기화를 기다린다. 띄운 프로세스 수 반환."""
+    pool = _get_pool()
+    if pool is None:
+        return 0
+    futures = [pool.submit(_ping) for _ in range(_workers())]
+    return len({f.result() for f in futures})
+
+
+def _reset_broken(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def submit(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    fn(*args)를 풀에 제출. 풀이 비활성이면 현재 스레드에서 실행한 완료 Future를 반환.
+
+    이미 손상된 풀이면 새 풀에 한 번 다시 제출한다 (그래도 실패하면 BrokenProcessPool).
+    fn과 인자/반환값은 pickle 가능해야 한다 (모듈 최상위 함수).
+    """
+    pool = _get_pool()
+    if pool is None:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:  # noqa: BLE001 — Future로 그대로 전달
+            future.set_exception(e)
+        return future
+    try:
+        return pool.submit(fn, *args)
+    except BrokenProcessPool:
+        logger.warning("CPU 풀 손상 — 재생성 후 재제출: %s", getattr(fn, "__name__", fn))
+        _reset_broken(pool)
+    pool = _get_pool()
+    try:
+        return pool.submit(fn, *args)
+    except BrokenProcessPool:
+        _reset_broken(pool)
+        raise
+
+
+def run(fn: Callable[..., Any], *args: Any) -> Any:
+    """fn(*args)를 풀에서 실행하고 결과를 기다린다. 자식이 죽으면 새 풀에서 한 번만 재시도."""
+    pool = _get_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        logger.warning("CPU 풀 손상 (자식 종료) — 새 풀에서 재시도: %s", getattr(fn, "__name__", fn))
+        _reset_broken(pool)
+    pool = _get_pool()
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        logger.error("CPU 풀 재시도에서도 자식 종료 — 작업 실패 처리: %s", getattr(fn, "__name__", fn))
+        _reset_broken(pool)
+        raise
+
+
+# ─────────────────────────────────────────────────────────────
+# 풀에서 실행되는 작업 (원시 타입만 주고받음)
+# ─────────────────────────────────────────────────────────────
+
+def parse_document_compact(pdf_path: str, doc_type: str) -> dict:
+    """parse_document()를 실행하고 layout 없이 ParseResult 필드만 dict로 반환."""
+    from ralph.pipeline import parse_document
+
+    result = parse_document(pdf_path, doc_type)
+    return {
+        "success": result.success,
+        "doc_type": result.doc_type,
+        "source_file": result.source_file,
+        "data": result.data,
+        "natural_language": result.natural_language,
+        "confidence": result.confidence,
+        "elapsed_seconds": result.elapsed_seconds,
+        "api_calls": result.api_calls,
+        "errors": list(result.errors),
+    }
+
+
+def parse_document(pdf_path: str | os.PathLike, doc_type: str):
+    """
+    parse_document()의 풀 버전. 풀에서 실행하면 layout은 None.
+
+    풀이 꺼져 있으면 현재 스레드에서 ralph.pipeline.parse_document를 그대로 호출한다.
+    """
+    from ralph.pipeline import ParseResult
+    from ralph.pipeline import parse_document as parse_inline
+
+    if not enabled():
+        return parse_inline(pdf_path, doc_type)
+    fields = run(parse_document_compact, os.fspath(pdf_path), doc_type)
+    return ParseResult(**fields)
+
+
+def extract_text_profile(pdf_path: str) -> tuple[str, int, bool, bool]:
+    """
+    전체 텍스트 추출 + 품질 판정.
+
+    Returns:
+        (text, page_count, is_poor, is_fragmented) — 블록 목록은 판정에만 쓰고 버린다.
+    """
+    from ralph.playground_parser import assess_text_quality, extract_text
+
+    text, pages, blocks = extract_text(pdf_path)
+    _, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
+    return text, pages, is_poor, is_fragmented
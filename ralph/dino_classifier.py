@@ -4,25 +4,33 @@ DINOv2 시각 문서 분류기.
 PyMuPDF로 첫 페이지 렌더링 → DINOv2(facebook/dinov2-base) 임베딩 →
 레퍼런스 임베딩과 cosine similarity 비교 → 문서 타입 반환.
 
-레퍼런스 임베딩은 JSON 파일로 저장/로드.
-없으면 컴파일 시 companyData 폴더에서 자동 빌드.
+레퍼런스는 float32 행렬 하나(`dino_refs.npy`, 행 = L2 정규화 임베딩)와
+라벨/원본 경로 JSON(`dino_refs.labels.json`)으로 저장한다.
+행렬은 mmap으로 열어 워커 RSS를 늘리지 않고, 분류는 matmul 1회 +
+argpartition top-k로 처리한다. 다건은 classify_many()로 미니배치 임베딩.
 """
 from __future__ import annotations
 
+import io
 import json
 import logging
 import os
 import pickle
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Sequence
 
 import numpy as np
 
+from ralph.pdf_context import PdfSource, pdf_context
+
 logger = logging.getLogger(__name__)
 
 _MODEL_NAME = "facebook/dinov2-base"
-_DEFAULT_REFS_PATH = Path(__file__).parent / "dino_refs.pkl"
+_DEFAULT_REFS_PATH = Path(__file__).parent / "dino_refs.npy"
+
+# 한 번의 forward pass에 넣을 페이지 수 (렌더링 이미지도 배치 단위로만 메모리에 유지)
+DINO_BATCH_SIZE = int(os.getenv("RALPH_DINO_BATCH_SIZE", "16"))
 
 # companyData 파일명 → doc_type 매핑 (레퍼런스 빌드용).
 # 실제 운영 시 해당 프로젝트의 레퍼런스 문서 파일명과 doc_type을 매핑하세요.
@@ -50,6 +58,68 @@ class DinoRef:
     embedding: np.ndarray
 
 
+def _labels_path(refs_path: Path) -> Path:
+    """레퍼런스 행렬 옆에 두는 라벨/원본 경로 JSON."""
+    return refs_path.with_suffix(".labels.json")
+
+
+def stack_refs(refs: Sequence[DinoRef]) -> tuple[np.ndarray, list[str]]:
+    """DinoRef 목록 → (N, D) float32 연속 행렬 + 라벨 목록."""
+    if not refs:
+        return np.zeros((0, 0), dtype=np.float32), []
+    matrix = np.ascontiguousarray(np.stack([ref.embedding for ref in refs]), dtype=np.float32)
+    return matrix, [ref.doc_type for ref in refs]
+
+
+def score_embeddings(
+    embeddings: np.ndarray,
+    matrix: np.ndarray,
+    labels: Sequence[str],
+    threshold: float = 0.55,
+    top_k: int = 3,
+) -> list[tuple[str, float]]:
+    """
+    (B, D) 쿼리 임베딩을 (N, D) 레퍼런스 행렬로 한 번에 분류.
+
+    임베딩이 L2 정규화되어 있으므로 내적 = cosine similarity.
+    matmul 1회로 (B, N) similarity를 구하고 argpartition으로 행별 top-k만 추린 뒤
+    similarity 가중 투표. 최고 similarity가 threshold 미만이면 "unknown".
+
+    Returns:
+        쿼리 순서대로 (doc_type, confidence)
+    """
+    n_queries = len(embeddings)
+    if n_queries == 0:
+        return []
+    if matrix.shape[0] == 0:
+        return [("unknown", 0.0)] * n_queries
+
+    sims = np.asarray(embeddings, dtype=np.float32) @ matrix.T
+    n_refs = sims.shape[1]
+    k = max(1, min(top_k, n_refs))
+    if k < n_refs:
+        top_idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+    else:
+        top_idx = np.broadcast_to(np.arange(n_refs), sims.shape)
+
+    results: list[tuple[str, float]] = []
+    for row, idx in zip(sims, top_idx):
+        # similarity 내림차순, 동점은 레퍼런스 순서
+        order = sorted(idx.tolist(), key=lambda j: (-row[j], j))
+        best_sim = float(row[order[0]])
+        if best_sim < threshold:
+            results.append(("unknown", best_sim))
+            continue
+
+        # 상위 k개 투표 (similarity 가중)
+        votes: dict[str, float] = {}
+        for j in order:
+            votes[labels[j]] = votes.get(labels[j], 0.0) + float(row[j])
+        winner = max(votes, key=lambda t: votes[t])
+        results.append((winner, best_sim))
+    return results
+
+
 class DinoClassifier:
     """
     DINOv2 기반 시각 문서 분류기.
@@ -58,15 +128,23 @@ class DinoClassifier:
         clf = DinoClassifier()
         clf.build_refs(companydata_dir, refs_path)  # 최초 1회
         doc_type, conf = clf.classify(pdf_path)
+        results = clf.classify_many(pdf_paths)      # 다건 (미니배치)
     """
 
-    def __init__(self, refs_path: str | Path | None = None):
+    def __init__(self, refs_path: str | Path | None = None, batch_size: int | None = None):
         self._refs_path = Path(refs_path) if refs_path else _DEFAULT_REFS_PATH
-        self._refs: list[DinoRef] = []
+        self._batch_size = max(1, batch_size or DINO_BATCH_SIZE)
+        self._ref_matrix: np.ndarray | None = None   # (N, D) float32, 보통 np.memmap
+        self._ref_labels: list[str] = []
+        self._ref_sources: list[str] = []
         self._model = None
         self._processor = None
         self._device = None
 
+    @property
+    def ref_count(self) -> int:
+        return len(self._ref_labels)
+
     # ------------------------------------------------------------------ #
     # 모델 로드 (지연 초기화)
     # ------------------------------------------------------------------ #
@@ -88,34 +166,85 @@ class DinoClassifier:
     # 임베딩 추출
     # ------------------------------------------------------------------ #
 
-    def _embed_pdf(self, pdf_path: str, page_idx: int = 0, dpi: int = 150) -> np.ndarray:
-        """PDF 한 페이지 → DINOv2 CLS 토큰 임베딩 (L2 정규화)."""
-        import torch
-        import fitz
+    def _render(self, pdf_path: PdfSource, page_idx: int = 0, dpi: int = 150):
+        """PDF 한 페이지 → RGB PIL 이미지."""
         from PIL import Image
-        import io
 
-        self._load_model()
+        with pdf_context(pdf_path) as pdf:
+            img_bytes = pdf.render(min(page_idx, pdf.page_count - 1), dpi, "png")
+        return Image.open(io.BytesIO(img_bytes)).convert("RGB")
 
-        doc = fitz.open(pdf_path)
-        try:
-            page = doc[min(page_idx, doc.page_count - 1)]
-            mat = fitz.Matrix(dpi / 72, dpi / 72)
-            img_bytes = page.get_pixmap(matrix=mat).tobytes("png")
-        finally:
-            doc.close()
-
-        img = Image.open(io.BytesIO(img_bytes)).convert("RGB")
-        inputs = self._processor(images=img, return_tensors="pt")
+    def _embed_images(self, images: list) -> np.ndarray:
+        """이미지 배치 → (B, D) float32 CLS 토큰 임베딩 (행별 L2 정규화). forward 1회."""
+        import torch
+
+        self._load_model()
+        inputs = self._processor(images=images, return_tensors="pt")
         inputs = {k: v.to(self._device) for k, v in inputs.items()}
 
         with torch.no_grad():
             outputs = self._model(**inputs)
-            emb = outputs.last_hidden_state[:, 0, :].squeeze(0).cpu().numpy()
+            embs = outputs.last_hidden_state[:, 0, :].cpu().numpy().astype(np.float32, copy=False)
 
         # L2 정규화
-        norm = np.linalg.norm(emb)
-        return emb / (norm + 1e-8)
+        norms = np.linalg.norm(embs, axis=1, keepdims=True)
+        return embs / (norms + 1e-8)
+
+    def _embed_pdf(self, pdf_path: PdfSource, page_idx: int = 0, dpi: int = 150) -> np.ndarray:
+        """PDF 한 페이지 → DINOv2 CLS 토큰 임베딩 (L2 정규화)."""
+        return self._embed_images([self._render(pdf_path, page_idx, dpi)])[0]
+
+    def _iter_embedded_batches(
+        self,
+        pdf_paths: Sequence[PdfSource],
+        page_idx: int = 0,
+        dpi: int = 150,
+    ):
+        """
+        batch_size 단위로 렌더링 → 임베딩.
+
+        Yields:
+            (positions, embeddings): 성공한 문서의 입력 인덱스와 (len(positions), D) 임베딩.
+            렌더링/임베딩에 실패한 문서는 빠진다.
+        """
+        for start in range(0, len(pdf_paths), self._batch_size):
+            positions: list[int] = []
+            images = []
+            for pos in range(start, min(start + self._batch_size, len(pdf_paths))):
+                try:
+                    images.append(self._render(pdf_paths[pos], page_idx, dpi))
+                    positions.append(pos)
+                except Exception as e:
+                    logger.error(f"DINOv2 임베딩 실패: {e}")
+            if not images:
+                continue
+            try:
+                embs = self._embed_images(images)
+            except Exception as e:
+                logger.error(f"DINOv2 임베딩 실패 (배치 {len(images)}건): {e}")
+                continue
+            yield positions, embs
+
+    def embed_many(
+        self,
+        pdf_paths: Sequence[PdfSource],
+        page_idx: int = 0,
+        dpi: int = 150,
+    ) -> tuple[np.ndarray, list[int]]:
+        """
+        다건 PDF 임베딩 (미니배치).
+
+        Returns:
+            (embeddings, positions): 성공한 문서만 쌓은 (M, D) 행렬과 각 행의 입력 인덱스
+        """
+        chunks: list[np.ndarray] = []
+        positions: list[int] = []
+        for batch_positions, embs in self._iter_embedded_batches(pdf_paths, page_idx, dpi):
+            chunks.append(embs)
+            positions.extend(batch_positions)
+        if not chunks:
+            return np.zeros((0, 0), dtype=np.float32), []
+        return np.concatenate(chunks), positions
 
     # ------------------------------------------------------------------ #
     # 레퍼런스 빌드 & 저장/로드
@@ -140,7 +269,7 @@ class DinoClassifier:
         """
         companydata_dir = Path(companydata_dir)
         exclude_set = set(exclude_files or [])
-        refs = []
+        entries: list[tuple[str, Path, str]] = []
 
         for fname, doc_type in _COMPANY_DATA_LABELS.items():
             if fname in exclude_set:
@@ -149,38 +278,89 @@ class DinoClassifier:
             if not fpath.exists():
                 logger.warning(f"레퍼런스 파일 없음: {fpath}")
                 continue
-            try:
-                emb = self._embed_pdf(str(fpath))
-                refs.append(DinoRef(doc_type=doc_type, source_path=str(fpath), embedding=emb))
-                logger.info(f"  ✓ {fname} → {doc_type}")
-            except Exception as e:
-                logger.error(f"  ✗ {fname}: {e}")
+            entries.append((fname, fpath, doc_type))
 
-        self._refs = refs
+        embs, positions = self.embed_many([str(fpath) for _, fpath, _ in entries])
+        built = set(positions)
+        for pos, (fname, _, doc_type) in enumerate(entries):
+            if pos in built:
+                logger.info(f"  ✓ {fname} → {doc_type}")
+            else:
+                logger.error(f"  ✗ {fname}")
+
+        self._ref_matrix = np.ascontiguousarray(embs, dtype=np.float32)
+        self._ref_labels = [entries[pos][2] for pos in positions]
+        self._ref_sources = [str(entries[pos][1]) for pos in positions]
+        save_to = self.save_refs(save_path)
+        logger.info(f"레퍼런스 {self.ref_count}개 저장 → {save_to}")
+        return self.ref_count
+
+    def save_refs(self, save_path: str | Path | None = None) -> Path:
+        """현재 레퍼런스를 `.npy` 행렬 + `.labels.json`으로 저장."""
         save_to = Path(save_path) if save_path else self._refs_path
         save_to.parent.mkdir(parents=True, exist_ok=True)
+        matrix = self._ref_matrix if self._ref_matrix is not None else np.zeros((0, 0), dtype=np.float32)
         with open(save_to, "wb") as f:
-            pickle.dump(refs, f)
-        logger.info(f"레퍼런스 {len(refs)}개 저장 → {save_to}")
-        return len(refs)
+            np.save(f, np.ascontiguousarray(matrix, dtype=np.float32))
+        _labels_path(save_to).write_text(
+            json.dumps(
+                {"model": _MODEL_NAME, "labels": self._ref_labels, "sources": self._ref_sources},
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+        return save_to
 
     def load_refs(self, refs_path: str | Path | None = None) -> int:
-        """저장된 레퍼런스 임베딩 로드."""
+        """
+        저장된 레퍼런스 로드. 행렬은 mmap(read-only)으로 열어 페이지 캐시를 공유한다.
+
+        예전 형식(DinoRef 리스트 pickle)도 읽는다 — 메모리에 올리므로 save_refs()로 변환 권장.
+        """
         path = Path(refs_path) if refs_path else self._refs_path
-        if not path.exists():
+        labels_path = _labels_path(path)
+        if path.suffix == ".pkl" or not (path.exists() and labels_path.exists()):
+            legacy = path if path.suffix == ".pkl" else path.with_suffix(".pkl")
+            return self._load_legacy_refs(legacy) if legacy.exists() else 0
+
+        meta = json.loads(labels_path.read_text(encoding="utf-8"))
+        labels = [str(label) for label in meta.get("labels") or []]
+        if not labels:
             return 0
+        matrix = np.load(path, mmap_mode="r")
+        if matrix.ndim != 2 or matrix.shape[0] != len(labels):
+            logger.warning(f"레퍼런스 행렬/라벨 불일치: {matrix.shape} vs {len(labels)} ← {path}")
+            return 0
+
+        self._ref_matrix = matrix
+        self._ref_labels = labels
+        self._ref_sources = [str(source) for source in meta.get("sources") or []]
+        logger.debug(f"레퍼런스 {len(labels)}개 로드 (mmap) ← {path}")
+        return len(labels)
+
+    def _load_legacy_refs(self, path: Path) -> int:
         with open(path, "rb") as f:
-            self._refs = pickle.load(f)
-        logger.debug(f"레퍼런스 {len(self._refs)}개 로드 ← {path}")
-        return len(self._refs)
+            refs: list[DinoRef] = pickle.load(f)
+        self._ref_matrix, self._ref_labels = stack_refs(refs)
+        self._ref_sources = [ref.source_path for ref in refs]
+        logger.debug(f"레퍼런스 {len(refs)}개 로드 (pickle) ← {path}")
+        return len(refs)
 
     # ------------------------------------------------------------------ #
     # 분류
     # ------------------------------------------------------------------ #
 
+    def _ensure_refs(self) -> bool:
+        if self._ref_matrix is None or not self._ref_labels:
+            if not self.load_refs():
+                logger.warning("DINOv2 레퍼런스 없음 — 분류 불가")
+                return False
+        return True
+
     def classify(
         self,
-        pdf_path: str,
+        pdf_path: PdfSource,
         threshold: float = 0.55,
         top_k: int = 3,
     ) -> tuple[str, float]:
@@ -188,47 +368,40 @@ class DinoClassifier:
         DINOv2 임베딩으로 문서 타입 분류.
 
         Args:
-            pdf_path: 분류할 PDF 경로
+            pdf_path: 분류할 PDF 경로 (또는 PdfContext)
             threshold: 최소 cosine similarity (미달 시 "unknown" 반환)
             top_k: 투표에 사용할 최근접 이웃 수
 
         Returns:
             (doc_type, confidence): "unknown" 반환 가능
         """
-        if not self._refs:
-            loaded = self.load_refs()
-            if not loaded:
-                logger.warning("DINOv2 레퍼런스 없음 — 분류 불가")
-                return "unknown", 0.0
-
-        try:
-            emb = self._embed_pdf(pdf_path)
-        except Exception as e:
-            logger.error(f"DINOv2 임베딩 실패: {e}")
-            return "unknown", 0.0
-
-        # cosine similarity (임베딩이 L2 정규화되어 있으므로 내적 = cos_sim)
-        sims = [(ref.doc_type, float(np.dot(emb, ref.embedding))) for ref in self._refs]
-        sims.sort(key=lambda x: x[1], reverse=True)
+        return self.classify_many([pdf_path], threshold=threshold, top_k=top_k)[0]
 
-        top = sims[:top_k]
-        best_sim = top[0][1]
-
-        if best_sim < threshold:
-            return "unknown", best_sim
+    def classify_many(
+        self,
+        pdf_paths: Sequence[PdfSource],
+        threshold: float = 0.55,
+        top_k: int = 3,
+    ) -> list[tuple[str, float]]:
+        """
+        다건 분류. batch_size 단위로 렌더링 + forward 1회 + matmul 1회.
 
-        # 상위 k개 투표 (similarity 가중)
-        votes: dict[str, float] = {}
-        for dtype, sim in top:
-            votes[dtype] = votes.get(dtype, 0.0) + sim
-        winner = max(votes, key=lambda k: votes[k])
-        confidence = best_sim
+        Returns:
+            입력 순서대로 (doc_type, confidence). 임베딩 실패 문서는 ("unknown", 0.0)
+        """
+        results: list[tuple[str, float]] = [("unknown", 0.0)] * len(pdf_paths)
+        if not pdf_paths or not self._ensure_refs():
+            return results
 
-        return winner, confidence
+        for positions, embs in self._iter_embedded_batches(pdf_paths):
+            scored = score_embeddings(embs, self._ref_matrix, self._ref_labels, threshold, top_k)
+            for pos, result in zip(positions, scored):
+                results[pos] = result
+        return results
 
     def classify_with_refs(
         self,
-        pdf_path: str,
+        pdf_path: PdfSource,
         refs: list[DinoRef],
         threshold: float = 0.55,
         top_k: int = 3,
@@ -244,19 +417,8 @@ class DinoClassifier:
             logger.error(f"DINOv2 임베딩 실패: {e}")
             return "unknown", 0.0
 
-        sims = [(ref.doc_type, float(np.dot(emb, ref.embedding))) for ref in refs]
-        sims.sort(key=lambda x: x[1], reverse=True)
-        top = sims[:top_k]
-        best_sim = top[0][1]
-
-        if best_sim < threshold:
-            return "unknown", best_sim
-
-        votes: dict[str, float] = {}
-        for dtype, sim in top:
-            votes[dtype] = votes.get(dtype, 0.0) + sim
-        winner = max(votes, key=lambda k: votes[k])
-        return winner, best_sim
+        matrix, labels = stack_refs(refs)
+        return score_embeddings(emb[np.newaxis, :], matrix, labels, threshold, top_k)[0]
 
 
 # 싱글톤 (router에서 재사용)
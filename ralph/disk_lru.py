@@ -0,0 +1,124 @@
+"""
+바이트 예산이 있는 디스크 LRU 저장소.
+
+레이아웃 캐시, Vision 결과 캐시, 워커의 입력 blob 저장소/결과 디스크 캐시가 공유한다.
+
+- 쓰기는 임시 파일 + os.replace로 원자적 (같은 디렉터리를 쓰는 다른 프로세스도 안전)
+- 총 바이트는 첫 쓰기 때 한 번 측정하고 이후에는 증감만 반영
+- 예산을 넘으면 mtime이 가장 오래된 파일부터 예산의 90%까지 삭제
+- 읽기 hit 때 mtime을 갱신해 최근 사용으로 표시 (touch)
+"""
+from __future__ import annotations
+
+import os
+import stat
+import threading
+from pathlib import Path
+from typing import Callable
+
+EVICT_TARGET = 0.9
+_TMP_SUFFIX = ".tmp"
+
+
+class DiskLRU:
+    """root 아래 pattern에 맞는 파일들을 mtime 기준 LRU로 유지."""
+
+    def __init__(self, root: str | os.PathLike, max_bytes: int, pattern: str = "*"):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.pattern = pattern
+        self._lock = threading.Lock()
+        self._bytes: int | None = None  # 첫 쓰기 때 측정
+
+    def read_bytes(self, path: Path) -> bytes | None:
+        """파일 내용 (없거나 읽기 실패면 None). hit이면 최근 사용으로 표시."""
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        self.touch(path)
+        return data
+
+    @staticmethod
+    def touch(path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def discard(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def write_bytes(self, path: Path, data: bytes) -> int:
+        """data를 원자적으로 저장하고 삭제된 파일 수를 반환. 예산보다 큰 항목은 저장하지 않는다."""
+        if len(data) > self.max_bytes:
+            return 0
+        return self.place(path, lambda tmp: tmp.write_bytes(data))
+
+    def place(self, path: Path, fill: Callable[[Path], None], *, keep: bool = False) -> int:
+        """fill(tmp)로 만든 파일을 path로 옮기고 삭제된 파일 수를 반환.
+
+        keep=True면 이번 쓰기로 예산을 넘더라도 방금 놓은 파일은 삭제하지 않는다.
+        OSError는 호출자에게 그대로 전달된다.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}{_TMP_SUFFIX}")
+        try:
+            fill(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            self.discard(tmp)
+            raise
+        return self._account(path.stat().st_size - previous, path if keep else None)
+
+    def files(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) 목록. 쓰는 중인 임시 파일은 제외."""
+        files = []
+        for p in self.root.rglob(self.pattern):
+            if p.name.endswith(_TMP_SUFFIX):
+                continue
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            files.append((st.st_mtime, st.st_size, p))
+        return files
+
+    def _account(self, delta: int, keep: Path | None) -> int:
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = sum(size for _, size, _ in self.files())
+            else:
+                self._bytes += delta
+            if self._bytes <= self.max_bytes:
+                return 0
+            return self._evict(keep)
+
+    def _evict(self, keep: Path | None) -> int:
+        # 다른 프로세스도 같은 디렉터리를 쓰므로 실제 파일 기준으로 다시 센다.
+        files = sorted(self.files())
+        total = sum(size for _, size, _ in files)
+        target = int(self.max_bytes * EVICT_TARGET)
+        evicted = 0
+        for _, size, p in files:
+            if total <= target:
+                break
+            if p == keep:
+                continue
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+        self._bytes = total
+        return evicted
@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
-from ralph.layout.models import LayoutResult
+from ralph.layout.models import LAYOUT_FEATURES, LayoutResult
+from ralph.pdf_context import PdfSource
 
 
 class BaseExtractor(ABC):
@@ -16,15 +17,30 @@ class BaseExtractor(ABC):
         ...
 
     @abstractmethod
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         """
         구조화 데이터 추출.
 
+        Args:
+            layout: 레이아웃 분석 결과
+            pdf: 원문 PDF 컨텍스트 (레이아웃 외 원문 접근이 필요한 추출기용).
+                 None이면 layout.source_path에서 직접 연다.
+
         Returns:
             (raw_dict, confidence): 추출 결과와 신뢰도 (0.0~1.0)
         """
         ...
 
+    @property
+    def layout_features(self) -> frozenset[str]:
+        """extract()가 읽는 페이지 기능 (LayoutAnalyzer.analyze의 features).
+
+        텍스트만 쓰는 추출기는 빈 집합으로 두면 find_tables() 등을 건너뛴다.
+        """
+        return LAYOUT_FEATURES
+
     @property
     def min_confidence(self) -> float:
         """이 이상이면 VLM 폴백 불필요."""
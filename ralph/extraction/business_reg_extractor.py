@@ -8,6 +8,7 @@ from __future__ import annotations
 import re
 
 from ralph.layout.models import LayoutResult, ZoneType
+from ralph.pdf_context import PdfSource
 from ralph.utils.korean_text import (
     normalize_text, normalize_date,
     normalize_business_number, normalize_corp_reg_number,
@@ -22,6 +23,10 @@ class BusinessRegExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "business_reg"
 
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset({"zones"})  # KEY_VALUE/TITLE 존
+
     # 필드별 정규식 패턴 (순서: 우선순위 높은 것부터)
     FIELD_PATTERNS: dict[str, list[re.Pattern]] = {
         "business_number": [
@@ -61,7 +66,9 @@ class BusinessRegExtractor(BaseExtractor):
     BUSINESS_TYPE_PATTERN = re.compile(r"업\s*태")
     BUSINESS_ITEM_PATTERN = re.compile(r"종\s*목")
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         """레이아웃에서 사업자등록증 필드 추출."""
         result: dict = {}
         found_fields = 0
@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 
 from ralph.layout.models import LayoutResult
+from ralph.pdf_context import PdfSource
 from .base import BaseExtractor
 
 
@@ -30,7 +31,13 @@ class CertificateExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "certificate"
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset()  # 페이지 텍스트만 사용
+
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         result: dict = {
             "corp_name": None,
             "certificates": [],
@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 
 from ralph.layout.models import LayoutResult, TableInfo
+from ralph.pdf_context import PdfSource
 from .base import BaseExtractor
 
 
@@ -19,7 +20,13 @@ class EmployeeListExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "employee_list"
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset({"tables"})
+
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         result: dict = {
             "corp_name": None,
             "business_number": None,
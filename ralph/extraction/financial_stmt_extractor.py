@@ -13,6 +13,7 @@ from __future__ import annotations
 import re
 
 from ralph.layout.models import LayoutResult, ZoneType, TableInfo
+from ralph.pdf_context import PdfSource
 from ralph.utils.korean_text import parse_korean_number, normalize_business_number
 from .base import BaseExtractor
 
@@ -31,6 +32,10 @@ class FinancialStmtExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "financial_stmt"
 
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset({"tables"})
+
     # 손익계산서 행 라벨 → 스키마 필드 매핑
     INCOME_STMT_MAP: dict[str, list[str]] = {
         "revenue": ["I.매출액", "Ⅰ.매출액", "매출액"],
@@ -61,7 +66,9 @@ class FinancialStmtExtractor(BaseExtractor):
         "equity": ["부채와자본총계", "부채및자본총계"],
     }
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         """재무제표 필드 추출."""
         result: dict = {
             "corp_name": None,
@@ -10,9 +10,8 @@ from __future__ import annotations
 import re
 from typing import Any
 
-import fitz
-
 from ralph.layout.models import LayoutResult, TableInfo
+from ralph.pdf_context import PdfContext, PdfSource, pdf_context
 from .base import BaseExtractor
 
 
@@ -33,7 +32,13 @@ class InvestmentReviewExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "investment_review"
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset()  # 표/이미지는 PdfContext에서 직접 읽음
+
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         result: dict = {
             "corp_name": None,
             "representative": None,
@@ -53,13 +58,11 @@ class InvestmentReviewExtractor(BaseExtractor):
             "image_count": 0,
         }
 
-        pdf_path = layout.source_path
-        doc = fitz.open(pdf_path)
-        try:
+        with pdf_context(pdf if pdf is not None else layout.source_path) as doc:
             # 이미지 카운트
             total_images = 0
-            for page in doc:
-                total_images += len(page.get_images())
+            for page_idx in range(doc.page_count):
+                total_images += len(doc.page(page_idx).get_images())
             result["image_count"] = total_images
 
             # 1) 표지 + 기업개요 KV 추출
@@ -74,20 +77,17 @@ class InvestmentReviewExtractor(BaseExtractor):
             self._extract_cap_table(doc, result)
             self._extract_financials(doc, result)
             self._extract_projections(doc, result)
-        finally:
-            doc.close()
 
         confidence = self._compute_confidence(result)
         return result, confidence
 
     # ── 표지 추출 ──
 
-    def _extract_cover(self, doc: fitz.Document, result: dict) -> None:
+    def _extract_cover(self, doc: PdfContext, result: dict) -> None:
         """표지(p0) 테이블에서 기본 정보."""
         if doc.page_count < 1:
             return
-        tables = doc[0].find_tables()
-        for tb in tables.tables:
+        for tb in doc.page_tables(0):
             rows = tb.extract()
             for row in rows:
                 cells = [str(c or "").strip() for c in row]
@@ -115,7 +115,7 @@ class InvestmentReviewExtractor(BaseExtractor):
                             result["address"] = c
                             break
 
-    def _extract_company_overview(self, doc: fitz.Document, result: dict) -> None:
+    def _extract_company_overview(self, doc: PdfContext, result: dict) -> None:
         """기업개요 테이블(p1)에서 상세 정보."""
         if doc.page_count < 2:
             return
@@ -141,8 +141,7 @@ class InvestmentReviewExtractor(BaseExtractor):
             "홈페이지": "homepage",
         }
 
-        tables = doc[1].find_tables()
-        for tb in tables.tables:
+        for tb in doc.page_tables(1):
             rows = tb.extract()
             for row in rows:
                 cells = [str(c or "").strip() for c in row]
@@ -161,15 +160,15 @@ class InvestmentReviewExtractor(BaseExtractor):
 
     # ── 섹션 빌드 ──
 
-    def _build_sections(self, doc: fitz.Document) -> list[dict]:
+    def _build_sections(self, doc: PdfContext) -> list[dict]:
         """전체 페이지를 순회하며 섹션 기반 XML 구조 생성."""
         sections: list[dict] = []
         current_section: dict | None = None
 
         for page_idx in range(doc.page_count):
-            page = doc[page_idx]
-            text = page.get_text()
-            page_tables = page.find_tables()
+            page = doc.page(page_idx)
+            text = doc.page_text(page_idx)
+            page_tables = doc.page_tables(page_idx)
             page_images = page.get_images()
 
             lines = text.split("\n")
@@ -213,7 +212,7 @@ class InvestmentReviewExtractor(BaseExtractor):
 
             # 테이블 추가
             if current_section is not None:
-                for tb in page_tables.tables:
+                for tb in page_tables:
                     rows = tb.extract()
                     # None 정리
                     clean_rows = []
@@ -246,15 +245,14 @@ class InvestmentReviewExtractor(BaseExtractor):
 
     # ── 핵심 테이블 추출 ──
 
-    def _extract_cap_table(self, doc: fitz.Document, result: dict) -> None:
+    def _extract_cap_table(self, doc: PdfContext, result: dict) -> None:
         """주주현황 테이블 추출 (보통 p11 부근)."""
         for page_idx in range(doc.page_count):
-            text = doc[page_idx].get_text()
+            text = doc.page_text(page_idx)
             if "주주현황" not in text.replace(" ", "") and "주주명" not in text:
                 continue
 
-            tables = doc[page_idx].find_tables()
-            for tb in tables.tables:
+            for tb in doc.page_tables(page_idx):
                 rows = tb.extract()
                 if len(rows) < 3:
                     continue
@@ -324,12 +322,11 @@ class InvestmentReviewExtractor(BaseExtractor):
 
         # 증자이력
         for page_idx in range(doc.page_count):
-            text = doc[page_idx].get_text()
+            text = doc.page_text(page_idx)
             if "증자" not in text and "자금변동" not in text.replace(" ", ""):
                 continue
 
-            tables = doc[page_idx].find_tables()
-            for tb in tables.tables:
+            for tb in doc.page_tables(page_idx):
                 rows = tb.extract()
                 header_text = " ".join(
                     str(c or "") for row in rows[:3] for c in row
@@ -363,15 +360,14 @@ class InvestmentReviewExtractor(BaseExtractor):
             if result["capital_history"]:
                 break
 
-    def _extract_financials(self, doc: fitz.Document, result: dict) -> None:
+    def _extract_financials(self, doc: PdfContext, result: dict) -> None:
         """재무현황 테이블(B/S + P/L) 추출."""
         for page_idx in range(doc.page_count):
-            text = doc[page_idx].get_text()
+            text = doc.page_text(page_idx)
             if "재무현황" not in text.replace(" ", ""):
                 continue
 
-            tables = doc[page_idx].find_tables()
-            for tb in tables.tables:
+            for tb in doc.page_tables(page_idx):
                 rows = tb.extract()
                 if len(rows) < 3:
                     continue
@@ -433,12 +429,12 @@ class InvestmentReviewExtractor(BaseExtractor):
                 if any(data[y] for y in years):
                     result["historical_financials"][table_type] = data
 
-    def _extract_projections(self, doc: fitz.Document, result: dict) -> None:
+    def _extract_projections(self, doc: PdfContext, result: dict) -> None:
         """손익추정 5개년 테이블 추출."""
         # "손익 추정" 텍스트가 있는 페이지 ~ +2페이지 범위에서 탐색
         target_pages = []
         for page_idx in range(doc.page_count):
-            text = doc[page_idx].get_text()
+            text = doc.page_text(page_idx)
             if "손익추정" in text.replace(" ", "") or "손익 추정" in text:
                 for offset in range(3):  # 해당 페이지 + 다음 2페이지
                     pi = page_idx + offset
@@ -446,12 +442,11 @@ class InvestmentReviewExtractor(BaseExtractor):
                         target_pages.append(pi)
 
         for page_idx in target_pages:
-            page_text = doc[page_idx].get_text()
+            page_text = doc.page_text(page_idx)
             # 페이지 텍스트에서 천원 단위 감지
             page_has_unit = "천 원" in page_text or "천원" in page_text.replace(" ", "")
 
-            tables = doc[page_idx].find_tables()
-            for tb in tables.tables:
+            for tb in doc.page_tables(page_idx):
                 rows = tb.extract()
                 if len(rows) < 3:
                     continue
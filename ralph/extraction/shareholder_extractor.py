@@ -9,6 +9,7 @@ from __future__ import annotations
 import re
 
 from ralph.layout.models import LayoutResult, ZoneType, TableInfo
+from ralph.pdf_context import PdfSource
 from ralph.utils.korean_text import parse_korean_number, normalize_date
 from .base import BaseExtractor
 
@@ -20,6 +21,10 @@ class ShareholderExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "shareholder"
 
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset({"tables"})
+
     # 헤더 키워드 → 필드명 매핑
     HEADER_MAP: dict[str, list[str]] = {
         "name": ["주주명", "성명", "주주"],
@@ -32,7 +37,9 @@ class ShareholderExtractor(BaseExtractor):
     # 합계 행 감지 키워드
     TOTAL_ROW_KEYWORDS = ["합계", "합 계", "총계", "Total", "TOTAL", "소계"]
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         """주주명부 필드 추출."""
         result: dict = {
             "corp_name": None,
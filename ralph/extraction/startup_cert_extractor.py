@@ -8,6 +8,7 @@ from __future__ import annotations
 import re
 
 from ralph.layout.models import LayoutResult
+from ralph.pdf_context import PdfSource
 from ralph.utils.korean_text import normalize_date
 from .base import BaseExtractor
 
@@ -19,7 +20,13 @@ class StartupCertExtractor(BaseExtractor):
     def doc_type(self) -> str:
         return "startup_cert"
 
-    def extract(self, layout: LayoutResult) -> tuple[dict, float]:
+    @property
+    def layout_features(self) -> frozenset[str]:
+        return frozenset()  # 전체 텍스트만 사용
+
+    def extract(
+        self, layout: LayoutResult, pdf: PdfSource | None = None,
+    ) -> tuple[dict, float]:
         result: dict = {
             "corp_name": None,
             "business_number": None,
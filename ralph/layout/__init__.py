@@ -1,11 +1,13 @@
 from .models import (
     BBox, TextSpan, TextLine, DocumentZone, ZoneType,
-    LayoutPage, LayoutResult, Drawing, DrawingType,
+    LayoutPage, LayoutResult, Drawing, DrawingType, LAYOUT_FEATURES,
 )
 from .analyzer import LayoutAnalyzer
+from .cache import LayoutCache, get_layout_cache
+from .spatial import SpatialIndex
 
 __all__ = [
     "BBox", "TextSpan", "TextLine", "DocumentZone", "ZoneType",
-    "LayoutPage", "LayoutResult", "Drawing", "DrawingType",
-    "LayoutAnalyzer",
+    "LayoutPage", "LayoutResult", "Drawing", "DrawingType", "LAYOUT_FEATURES",
+    "LayoutAnalyzer", "LayoutCache", "get_layout_cache", "SpatialIndex",
 ]
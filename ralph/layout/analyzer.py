@@ -3,19 +3,28 @@ RALPH v2 레이아웃 분석기.
 
 PyMuPDF get_text("dict") + get_drawings() + find_tables()를 사용하여
 문서의 레이아웃을 분석하고 의미적 영역(Zone)으로 분류.
+텍스트 블록 외의 페이지 기능(드로잉/이미지/테이블/존)은 필요할 때만 계산.
 """
 from __future__ import annotations
 
 import re
+import sys
 from collections import Counter
+from typing import Iterable
 
 import fitz
 
+from ralph.pdf_context import PdfContext, PdfSource, pdf_context
 from .models import (
     BBox, TextSpan, TextLine, TextBlock, DocumentZone, ZoneType,
     LayoutPage, LayoutResult, FontStats, Drawing, DrawingType,
-    ImageInfo, TableInfo,
+    ImageInfo, TableInfo, LAYOUT_FEATURES,
 )
+from .spatial import SpatialIndex
+
+# 분석 결과(스팬 그룹핑, 존 분류 기준, 모델 필드)가 바뀌면 올린다.
+# 레이아웃 캐시 키에 포함되므로 올리면 이전 캐시 항목은 모두 miss가 된다.
+ANALYZER_VERSION = "2"
 
 
 class LayoutAnalyzer:
@@ -36,14 +45,29 @@ class LayoutAnalyzer:
         r"^(등록번호|상\s*호|법인명|대표자?|개업|소재지|업\s*태|종\s*목|세무서)",
     )
 
-    def analyze(self, pdf_path: str) -> LayoutResult:
-        """전체 문서 레이아웃 분석."""
-        doc = fitz.open(pdf_path)
-        try:
+    def analyze(
+        self, pdf_path: PdfSource, features: Iterable[str] | None = None,
+    ) -> LayoutResult:
+        """전체 문서 레이아웃 분석.
+
+        pdf_path에 PdfContext를 넘기면 이미 열린 문서와 페이지 dict 캐시를 재사용.
+
+        features: 반환 전에 계산해 둘 페이지 기능 (LAYOUT_FEATURES의 부분집합,
+        None이면 전부). 텍스트 블록은 항상 계산한다. 나머지 기능은 넘겨받은
+        PdfContext가 열려 있는 동안 첫 접근 시 페이지별로 계산되고, 경로를 받아
+        분석기가 직접 연 경우에는 빈 리스트가 된다.
+        """
+        wanted = LAYOUT_FEATURES if features is None else frozenset(features)
+        unknown = wanted - LAYOUT_FEATURES
+        if unknown:
+            raise ValueError(f"알 수 없는 레이아웃 기능: {sorted(unknown)}")
+        owns_pdf = not isinstance(pdf_path, PdfContext)
+
+        with pdf_context(pdf_path) as pdf:
             # 1단계: 모든 페이지의 텍스트 스팬 수집 → 전역 폰트 통계
             all_spans_meta = []
-            for page in doc:
-                page_dict = page.get_text("dict")
+            for page_num in range(pdf.page_count):
+                page_dict = pdf.page_dict(page_num)
                 for block in page_dict.get("blocks", []):
                     if block.get("type") != 0:
                         continue
@@ -54,48 +78,53 @@ class LayoutAnalyzer:
                                 all_spans_meta.append(round(span["size"], 1))
 
             font_stats = self._compute_font_stats(all_spans_meta)
+            loader = _PageFeatureLoader(self, pdf, font_stats)
 
-            # 2단계: 페이지별 분석
+            # 2단계: 페이지별 텍스트 레이아웃 + 요청된 기능
             pages = []
-            total_drawings = 0
-            total_images = 0
-            total_tables = 0
-            has_charts = False
-            has_raster_images = False
-
-            for page_num, page in enumerate(doc):
-                layout_page = self._analyze_page(page, page_num, font_stats)
+            for page_num in range(pdf.page_count):
+                layout_page = self._analyze_page(
+                    pdf.page_dict(page_num), page_num, loader,
+                )
+                for feature in wanted:
+                    getattr(layout_page, feature)
                 pages.append(layout_page)
-                total_drawings += len(layout_page.drawings)
-                total_images += len(layout_page.images)
-                total_tables += len(layout_page.tables)
-                if layout_page.images:
-                    has_raster_images = True
 
-            total_text_blocks = sum(len(p.text_blocks) for p in pages)
+            if owns_pdf:
+                for layout_page in pages:
+                    layout_page.detach()
 
             return LayoutResult(
                 pages=pages,
                 font_stats=font_stats,
-                total_text_blocks=total_text_blocks,
-                total_drawings=total_drawings,
-                total_images=total_images,
-                total_tables=total_tables,
-                source_path=pdf_path,
-                has_charts=has_charts,
-                has_raster_images=has_raster_images,
+                total_text_blocks=sum(len(p.text_blocks) for p in pages),
+                source_path=pdf.pdf_path,
+                has_charts=False,
             )
-        finally:
-            doc.close()
+
+    def resume(
+        self, layout: LayoutResult, pdf: PdfContext, features: Iterable[str] | None = None,
+    ) -> LayoutResult:
+        """캐시에서 읽은 layout을 pdf에 연결해 analyze()와 같은 상태로 만든다.
+
+        저장되지 않았던 기능은 pdf로 지연 계산하고, features는 바로 계산해 둔다.
+        """
+        wanted = LAYOUT_FEATURES if features is None else frozenset(features)
+        unknown = wanted - LAYOUT_FEATURES
+        if unknown:
+            raise ValueError(f"알 수 없는 레이아웃 기능: {sorted(unknown)}")
+        loader = _PageFeatureLoader(self, pdf, layout.font_stats)
+        for layout_page in layout.pages:
+            layout_page.attach(loader)
+            for feature in wanted:
+                getattr(layout_page, feature)
+        layout.source_path = pdf.pdf_path
+        return layout
 
     def _analyze_page(
-        self, page: fitz.Page, page_num: int, font_stats: FontStats
+        self, page_dict: dict, page_num: int, loader: _PageFeatureLoader | None = None,
     ) -> LayoutPage:
-        """단일 페이지 레이아웃 분석."""
-        page_dict = page.get_text("dict")
-        page_width = page_dict["width"]
-        page_height = page_dict["height"]
-
+        """단일 페이지 텍스트 레이아웃 분석 (드로잉/이미지/테이블/존은 loader가 지연 계산)."""
         # 1) 텍스트 스팬 추출
         raw_spans = self._extract_spans(page_dict)
 
@@ -105,34 +134,19 @@ class LayoutAnalyzer:
         # 3) 라인 → 블록 그룹핑
         text_blocks = self._group_lines_into_blocks(lines)
 
-        # 4) 드로잉 추출
-        drawings = self._extract_drawings(page)
-
-        # 5) 이미지 추출
-        images = self._extract_images(page, page_num)
-
-        # 6) 테이블 추출
-        tables = self._extract_tables(page, page_num)
-
-        # 7) 존 분류
-        zones = self._classify_zones(
-            text_blocks, drawings, images, tables,
-            page_width, page_height, page_num, font_stats,
-        )
-
         return LayoutPage(
             page_num=page_num,
-            width=page_width,
-            height=page_height,
+            width=page_dict["width"],
+            height=page_dict["height"],
             text_blocks=text_blocks,
-            zones=zones,
-            drawings=drawings,
-            images=images,
-            tables=tables,
+            loader=loader,
         )
 
     def _extract_spans(self, page_dict: dict) -> list[TextSpan]:
-        """get_text("dict") → TextSpan 리스트."""
+        """get_text("dict") → TextSpan 리스트.
+
+        폰트명은 페이지마다 같은 문자열이 새로 만들어지므로 intern해서 공유.
+        """
         spans = []
         for block in page_dict.get("blocks", []):
             if block.get("type") != 0:
@@ -145,7 +159,7 @@ class LayoutAnalyzer:
                     spans.append(TextSpan(
                         text=text,
                         bbox=BBox.from_tuple(span["bbox"]),
-                        font_name=span.get("font", ""),
+                        font_name=sys.intern(span.get("font", "")),
                         font_size=span.get("size", 0.0),
                         font_flags=span.get("flags", 0),
                         color=span.get("color", 0),
@@ -233,12 +247,12 @@ class LayoutAnalyzer:
         drawings = []
         for d in page.get_drawings():
             bbox = BBox.from_tuple(d["rect"])
-            items = d.get("items", [])
+            ops = tuple(item[0] for item in d.get("items", []))
 
             # 유형 분류
             dtype = DrawingType.UNKNOWN
-            if len(items) == 1:
-                op = items[0][0]
+            if len(ops) == 1:
+                op = ops[0]
                 if op == "re":
                     dtype = (DrawingType.RECT_FILLED
                              if d.get("fill") else DrawingType.RECT)
@@ -246,11 +260,11 @@ class LayoutAnalyzer:
                     dtype = DrawingType.LINE
                 elif op == "c":
                     dtype = DrawingType.CURVE
-            elif len(items) > 1:
-                ops = set(item[0] for item in items)
-                if ops == {"l"} or ops <= {"l", "m"}:
+            elif len(ops) > 1:
+                op_set = set(ops)
+                if op_set == {"l"} or op_set <= {"l", "m"}:
                     dtype = DrawingType.LINE
-                elif "c" in ops:
+                elif "c" in op_set:
                     dtype = DrawingType.CURVE
 
             drawings.append(Drawing(
@@ -259,7 +273,7 @@ class LayoutAnalyzer:
                 color=d.get("color"),
                 fill=d.get("fill"),
                 width=d.get("width", 0),
-                items=items,
+                ops=ops,
             ))
         return drawings
 
@@ -284,39 +298,35 @@ class LayoutAnalyzer:
                 continue
         return images
 
-    def _extract_tables(self, page: fitz.Page, page_num: int) -> list[TableInfo]:
-        """find_tables() → TableInfo 리스트."""
-        tables = []
-        try:
-            result = page.find_tables()
-            if result and result.tables:
-                for t in result.tables:
-                    cells = t.extract()
-                    tables.append(TableInfo(
-                        bbox=BBox.from_tuple(t.bbox),
-                        row_count=t.row_count,
-                        col_count=t.col_count,
-                        cells=cells,
-                        page_num=page_num,
-                    ))
-        except Exception:
-            pass
-        return tables
+    def _extract_tables(self, pdf: PdfContext, page_num: int) -> list[TableInfo]:
+        """find_tables() → TableInfo 리스트 (PdfContext 캐시 공유, 선 없는 페이지는 생략)."""
+        return [
+            TableInfo(
+                bbox=BBox.from_tuple(t.bbox),
+                row_count=t.row_count,
+                col_count=t.col_count,
+                cells=t.rows,
+                page_num=page_num,
+            )
+            for t in pdf.page_tables(page_num)
+        ]
 
     def _classify_zones(
         self,
         text_blocks: list[TextBlock],
-        drawings: list[Drawing],
         images: list[ImageInfo],
         tables: list[TableInfo],
         page_width: float,
         page_height: float,
         page_num: int,
         font_stats: FontStats,
+        block_index: SpatialIndex | None = None,
     ) -> list[DocumentZone]:
         """텍스트 블록을 의미적 영역으로 분류."""
         zones: list[DocumentZone] = []
         classified_blocks: set[int] = set()
+        if block_index is None:
+            block_index = SpatialIndex(text_blocks)
 
         header_y = page_height * self.HEADER_RATIO
         footer_y = page_height * (1 - self.FOOTER_RATIO)
@@ -336,9 +346,7 @@ class LayoutAnalyzer:
             zones.append(table_zone)
 
             # 테이블 영역 내 텍스트 블록은 분류에서 제외
-            for i, block in enumerate(text_blocks):
-                if table.bbox.contains(block.bbox, tolerance=5.0):
-                    classified_blocks.add(i)
+            classified_blocks.update(block_index.contained_in(table.bbox, tolerance=5.0))
 
         # 2) 이미지 영역 존 등록
         for img in images:
@@ -462,3 +470,29 @@ class LayoutAnalyzer:
             footnote_threshold=body_size * self.FOOTNOTE_SIZE_MULTIPLIER,
             size_distribution=dict(counter),
         )
+
+
+class _PageFeatureLoader:
+    """LayoutPage의 지연 기능을 계산 (분석 중인 PdfContext에 묶임)."""
+    __slots__ = ("analyzer", "pdf", "font_stats")
+
+    def __init__(self, analyzer: LayoutAnalyzer, pdf: PdfContext, font_stats: FontStats):
+        self.analyzer = analyzer
+        self.pdf = pdf
+        self.font_stats = font_stats
+
+    def drawings(self, page: LayoutPage) -> list[Drawing]:
+        return self.analyzer._extract_drawings(self.pdf.page(page.page_num))
+
+    def images(self, page: LayoutPage) -> list[ImageInfo]:
+        return self.analyzer._extract_images(self.pdf.page(page.page_num), page.page_num)
+
+    def tables(self, page: LayoutPage) -> list[TableInfo]:
+        return self.analyzer._extract_tables(self.pdf, page.page_num)
+
+    def zones(self, page: LayoutPage) -> list[DocumentZone]:
+        return self.analyzer._classify_zones(
+            page.text_blocks, page.images, page.tables,
+            page.width, page.height, page.page_num, self.font_stats,
+            block_index=page.block_index,
+        )
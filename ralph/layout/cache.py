@@ -0,0 +1,327 @@
+"""
+LayoutResult 영속 캐시.
+
+같은 PDF가 여러 번 들어오면(재시도, 팬아웃 재처리, 다른 doc_type으로 재분류)
+매번 LayoutAnalyzer.analyze를 다시 돌리게 된다. 분석 결과를 파일 내용 digest +
+ANALYZER_VERSION을 키로 로컬 디스크(선택적으로 S3)에 보관해 재사용한다.
+
+- 직렬화: 구조/문자열은 JSON 메타, 좌표는 array('d')로 모아 zlib 압축한 바이너리
+- 폰트명은 문자열 테이블 인덱스로, 존의 블록은 페이지 text_blocks 인덱스로 저장
+- 계산되지 않은(지연 상태) 기능은 저장하지 않고, 읽을 때 loader가 다시 계산
+- 디스크: ralph.disk_lru.DiskLRU (바이트 예산을 넘으면 가장 오래 안 쓴 파일부터 삭제)
+- S3: 디스크 miss 때만 조회, 실패는 모두 miss로 취급 (best-effort)
+
+환경변수:
+    RALPH_LAYOUT_CACHE_DIR       캐시 디렉터리 (기본 "" = 디스크 캐시 끔)
+    RALPH_LAYOUT_CACHE_MAX_MB    디스크 캐시 최대 크기 (기본 512)
+    RALPH_LAYOUT_CACHE_S3_BUCKET S3 공유 계층 버킷 (기본 "" = 끔)
+    RALPH_LAYOUT_CACHE_S3_PREFIX S3 키 접두어 (기본 "layout-cache/")
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any
+
+from ralph.disk_lru import DiskLRU
+from ralph.pdf_context import PdfContext
+from .analyzer import ANALYZER_VERSION
+from .models import (
+    BBox, TextSpan, TextLine, TextBlock, DocumentZone, ZoneType,
+    LayoutPage, LayoutResult, FontStats, Drawing, DrawingType,
+    ImageInfo, TableInfo,
+)
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"RLC1"
+_SUFFIX = ".rlc"
+
+_cache: LayoutCache | None = None
+_cache_loaded = False
+_lock = threading.Lock()
+
+
+def file_digest(source: str | os.PathLike | PdfContext) -> str:
+    """PDF 파일 내용의 sha256 (1MB 단위로 읽음)."""
+    h = hashlib.sha256()
+    with open(os.fspath(source), "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def layout_state(layout: LayoutResult) -> list[frozenset[str]]:
+    """페이지별로 이미 계산된 기능 집합 (저장 후 새로 계산된 기능이 있는지 비교용)."""
+    return [p.materialized() for p in layout.pages]
+
+
+# ── 직렬화 ──
+
+def _bbox(coords: array, b: BBox) -> None:
+    coords.extend((b.x0, b.y0, b.x1, b.y1))
+
+
+def _opt(value):
+    return None if value is None else list(value)
+
+
+def dumps_layout(layout: LayoutResult) -> bytes:
+    """LayoutResult → 압축 바이너리 (계산된 기능만 포함)."""
+    coords = array("d")
+    fonts: dict[str, int] = {}
+    pages = []
+    for page in layout.pages:
+        block_ids = {id(b): i for i, b in enumerate(page.text_blocks)}
+        blocks = []
+        for block in page.text_blocks:
+            _bbox(coords, block.bbox)
+            lines = []
+            for line in block.lines:
+                _bbox(coords, line.bbox)
+                spans = []
+                for s in line.spans:
+                    _bbox(coords, s.bbox)
+                    font = fonts.setdefault(s.font_name, len(fonts))
+                    spans.append([s.text, font, s.font_size, s.font_flags, s.color])
+                lines.append(spans)
+            blocks.append([block.block_num, lines])
+
+        done = page.materialized()
+        entry: dict[str, Any] = {"n": page.page_num, "w": page.width, "h": page.height, "blocks": blocks}
+        if "tables" in done:
+            entry["tables"] = []
+            for t in page.tables:
+                _bbox(coords, t.bbox)
+                entry["tables"].append([t.row_count, t.col_count, t.cells, t.header_row, t.page_num])
+        if "images" in done:
+            entry["images"] = []
+            for im in page.images:
+                _bbox(coords, im.bbox)
+                entry["images"].append([im.xref, im.width, im.height, im.colorspace, im.page_num])
+        if "drawings" in done:
+            entry["drawings"] = []
+            for d in page.drawings:
+                _bbox(coords, d.bbox)
+                entry["drawings"].append([d.drawing_type.value, _opt(d.color), _opt(d.fill), d.width, list(d.ops)])
+        if "zones" in done:
+            entry["zones"] = []
+            for z in page.zones:
+                _bbox(coords, z.bbox)
+                entry["zones"].append([
+                    z.zone_type.value, z.page_num,
+                    [block_ids[id(b)] for b in z.blocks], z.confidence, z.metadata,
+                ])
+        pages.append(entry)
+
+    fs = layout.font_stats
+    meta = json.dumps({
+        "version": ANALYZER_VERSION,
+        "fonts": list(fonts),
+        "font_stats": [
+            fs.body_size, fs.heading_threshold, fs.footnote_threshold,
+            list(fs.size_distribution.items()),
+        ],
+        "total_text_blocks": layout.total_text_blocks,
+        "has_charts": layout.has_charts,
+        "pages": pages,
+    }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _MAGIC + zlib.compress(struct.pack("<I", len(meta)) + meta + coords.tobytes(), 6)
+
+
+def loads_layout(data: bytes, source_path: str = "") -> LayoutResult:
+    """dumps_layout의 역. 저장되지 않은 기능은 None(지연)으로 남긴다."""
+    if data[:4] != _MAGIC:
+        raise ValueError("레이아웃 캐시 형식이 아님")
+    raw = zlib.decompress(data[4:])
+    (meta_len,) = struct.unpack_from("<I", raw)
+    meta = json.loads(raw[4:4 + meta_len].decode("utf-8"))
+    if meta.get("version") != ANALYZER_VERSION:
+        raise ValueError(f"분석기 버전 불일치: {meta.get('version')}")
+    coords = array("d")
+    coords.frombytes(raw[4 + meta_len:])
+    pos = 0
+
+    def bbox() -> BBox:
+        nonlocal pos
+        b = BBox(coords[pos], coords[pos + 1], coords[pos + 2], coords[pos + 3])
+        pos += 4
+        return b
+
+    fonts = meta["fonts"]
+    pages = []
+    for entry in meta["pages"]:
+        text_blocks = []
+        for block_num, lines in entry["blocks"]:
+            block_bbox = bbox()
+            text_lines = []
+            for spans in lines:
+                line_bbox = bbox()
+                text_lines.append(TextLine(
+                    [TextSpan(text, bbox(), fonts[font], size, flags, color)
+                     for text, font, size, flags, color in spans],
+                    line_bbox,
+                ))
+            text_blocks.append(TextBlock(text_lines, block_bbox, block_num))
+
+        tables = images = drawings = zones = None
+        if "tables" in entry:
+            tables = [
+                TableInfo(bbox(), rows, cols, cells, header_row, page_num)
+                for rows, cols, cells, header_row, page_num in entry["tables"]
+            ]
+        if "images" in entry:
+            images = [
+                ImageInfo(bbox(), xref, w, h, colorspace, page_num)
+                for xref, w, h, colorspace, page_num in entry["images"]
+            ]
+        if "drawings" in entry:
+            drawings = [
+                Drawing(
+                    DrawingType(kind), bbox(),
+                    tuple(color) if color is not None else None,
+                    tuple(fill) if fill is not None else None,
+                    width, tuple(ops),
+                )
+                for kind, color, fill, width, ops in entry["drawings"]
+            ]
+        if "zones" in entry:
+            zones = [
+                DocumentZone(ZoneType(kind), bbox(), page_num,
+                             [text_blocks[i] for i in block_ids], confidence, metadata)
+                for kind, page_num, block_ids, confidence, metadata in entry["zones"]
+            ]
+        pages.append(LayoutPage(
+            entry["n"], entry["w"], entry["h"], text_blocks,
+            zones=zones, drawings=drawings, images=images, tables=tables,
+        ))
+
+    body, heading, footnote, dist = meta["font_stats"]
+    return LayoutResult(
+        pages=pages,
+        font_stats=FontStats(body, heading, footnote, {size: count for size, count in dist}),
+        total_text_blocks=meta["total_text_blocks"],
+        source_path=source_path,
+        has_charts=meta["has_charts"],
+    )
+
+
+# ── 저장소 ──
+
+class LayoutCache:
+    """digest → 직렬화된 LayoutResult. 로컬 디스크(LRU, 바이트 예산) + 선택적 S3."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike | None,
+        max_bytes: int = 512 * 1024 * 1024,
+        s3_bucket: str = "",
+        s3_prefix: str = "layout-cache/",
+        s3_client=None,
+    ):
+        self.root = Path(root) if root else None
+        self.max_bytes = max_bytes
+        self.s3_bucket = s3_bucket
+        self.s3_prefix = s3_prefix
+        self._s3 = s3_client
+        self._lock = threading.Lock()
+        self._disk = DiskLRU(self.root, max_bytes, pattern=f"*{_SUFFIX}") if self.root else None
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.{ANALYZER_VERSION}{_SUFFIX}"
+
+    def _s3_key(self, digest: str) -> str:
+        return f"{self.s3_prefix}{ANALYZER_VERSION}/{digest}{_SUFFIX}"
+
+    def _s3_client(self):
+        if self._s3 is None:
+            with self._lock:
+                if self._s3 is None:
+                    import boto3
+                    self._s3 = boto3.client("s3")
+        return self._s3
+
+    def get(self, digest: str, source_path: str = "") -> LayoutResult | None:
+        data = self._read_disk(digest)
+        from_s3 = False
+        if data is None and self.s3_bucket:
+            data = self._read_s3(digest)
+            from_s3 = data is not None
+        if data is None:
+            return None
+        try:
+            layout = loads_layout(data, source_path)
+        except Exception as e:
+            logger.warning("레이아웃 캐시 항목 손상 (%s): %s", digest[:12], e)
+            if self.root is not None and not from_s3:
+                self._path(digest).unlink(missing_ok=True)
+            return None
+        if from_s3:
+            self._write_disk(digest, data)
+        return layout
+
+    def put(self, digest: str, layout: LayoutResult) -> None:
+        data = dumps_layout(layout)
+        self._write_disk(digest, data)
+        if self.s3_bucket:
+            try:
+                self._s3_client().put_object(
+                    Bucket=self.s3_bucket, Key=self._s3_key(digest), Body=data,
+                )
+            except Exception as e:
+                logger.warning("레이아웃 캐시 S3 저장 실패 (%s): %s", digest[:12], e)
+
+    def _read_disk(self, digest: str) -> bytes | None:
+        if self._disk is None:
+            return None
+        return self._disk.read_bytes(self._path(digest))
+
+    def _read_s3(self, digest: str) -> bytes | None:
+        try:
+            obj = self._s3_client().get_object(Bucket=self.s3_bucket, Key=self._s3_key(digest))
+            return obj["Body"].read()
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code", "")
+            if code not in ("NoSuchKey", "404"):
+                logger.warning("레이아웃 캐시 S3 조회 실패 (%s): %s", digest[:12], e)
+            return None
+
+    def _write_disk(self, digest: str, data: bytes) -> None:
+        if self._disk is None:
+            return
+        try:
+            self._disk.write_bytes(self._path(digest), data)
+        except OSError as e:
+            logger.warning("레이아웃 캐시 디스크 저장 실패 (%s): %s", digest[:12], e)
+
+
+def get_layout_cache() -> LayoutCache | None:
+    """환경변수로 설정된 프로세스 공용 캐시 (둘 다 꺼져 있으면 None)."""
+    global _cache, _cache_loaded
+    if _cache_loaded:
+        return _cache
+    with _lock:
+        if not _cache_loaded:
+            root = os.getenv("RALPH_LAYOUT_CACHE_DIR", "")
+            bucket = os.getenv("RALPH_LAYOUT_CACHE_S3_BUCKET", "")
+            try:
+                max_mb = int(os.getenv("RALPH_LAYOUT_CACHE_MAX_MB", "512"))
+            except ValueError:
+                max_mb = 512
+            if (root and max_mb > 0) or bucket:
+                _cache = LayoutCache(
+                    root if max_mb > 0 else None,
+                    max_bytes=max_mb * 1024 * 1024,
+                    s3_bucket=bucket,
+                    s3_prefix=os.getenv("RALPH_LAYOUT_CACHE_S3_PREFIX", "layout-cache/"),
+                )
+            _cache_loaded = True
+    return _cache
+
@@ -2,6 +2,8 @@
 RALPH v2 레이아웃 분석 데이터 모델.
 
 PyMuPDF get_text("dict") 출력을 구조화된 레이아웃 객체로 변환.
+스팬/라인/블록은 문서당 수십만 개가 만들어지므로 모두 __slots__ 데이터클래스로
+두어 인스턴스 dict 비용을 없앤다 (속성 API는 그대로).
 """
 from __future__ import annotations
 
@@ -35,7 +37,7 @@ class DrawingType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class BBox:
     """바운딩 박스 (PDF 좌표계, 72 DPI)."""
     x0: float
@@ -110,7 +112,7 @@ class BBox:
         return (self.x0, self.y0, self.x1, self.y1)
 
 
-@dataclass
+@dataclass(slots=True)
 class TextSpan:
     """개별 텍스트 스팬 (폰트/좌표 메타데이터 포함)."""
     text: str
@@ -133,7 +135,7 @@ class TextSpan:
         return not self.text.strip()
 
 
-@dataclass
+@dataclass(slots=True)
 class TextLine:
     """텍스트 라인 (여러 스팬으로 구성)."""
     spans: list[TextSpan]
@@ -166,7 +168,7 @@ class TextLine:
         return bold_len > total_len / 2 if total_len > 0 else False
 
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
     """텍스트 블록 (여러 라인으로 구성)."""
     lines: list[TextLine]
@@ -193,7 +195,7 @@ class TextBlock:
         return len(self.lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentZone:
     """문서 내 의미적 영역."""
     zone_type: ZoneType
@@ -212,18 +214,22 @@ class DocumentZone:
         return [line for b in self.blocks for line in b.lines]
 
 
-@dataclass
+@dataclass(slots=True)
 class Drawing:
-    """벡터 드로잉 요소."""
+    """벡터 드로잉 요소.
+
+    원본 path item(Point/Rect 객체 리스트)은 보관하지 않고 연산자 코드만 남긴다
+    ("l", "c", "re", "qu" 등). 유형 분류와 표 테두리 판단에는 이것으로 충분.
+    """
     drawing_type: DrawingType
     bbox: BBox
     color: tuple[float, ...] | None = None
     fill: tuple[float, ...] | None = None
     width: float = 0.0
-    items: list = field(default_factory=list)
+    ops: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """래스터 이미지 정보."""
     bbox: BBox
@@ -234,7 +240,7 @@ class ImageInfo:
     page_num: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """PyMuPDF find_tables() 결과를 래핑."""
     bbox: BBox
@@ -245,17 +251,97 @@ class TableInfo:
     page_num: int = 0
 
 
-@dataclass
+# LayoutAnalyzer.analyze(features=...)에 넘길 수 있는 페이지 기능.
+# zones는 tables/images 결과를 사용하므로 요청하면 그 둘도 계산된다.
+LAYOUT_FEATURES = frozenset({"tables", "drawings", "images", "zones"})
+
+
 class LayoutPage:
-    """단일 페이지의 레이아웃 분석 결과."""
-    page_num: int
-    width: float
-    height: float
-    text_blocks: list[TextBlock]
-    zones: list[DocumentZone]
-    drawings: list[Drawing]
-    images: list[ImageInfo]
-    tables: list[TableInfo]
+    """단일 페이지의 레이아웃 분석 결과.
+
+    텍스트 블록은 항상 채워져 있고, zones/drawings/images/tables는 생성 시
+    주어지지 않으면 loader로 첫 접근 때 계산해 보관한다. loader가 없으면 빈 리스트.
+    """
+    __slots__ = (
+        "page_num", "width", "height", "text_blocks",
+        "_zones", "_drawings", "_images", "_tables", "_loader", "_block_index",
+    )
+
+    def __init__(
+        self,
+        page_num: int,
+        width: float,
+        height: float,
+        text_blocks: list[TextBlock],
+        zones: list[DocumentZone] | None = None,
+        drawings: list[Drawing] | None = None,
+        images: list[ImageInfo] | None = None,
+        tables: list[TableInfo] | None = None,
+        loader=None,
+    ):
+        self.page_num = page_num
+        self.width = width
+        self.height = height
+        self.text_blocks = text_blocks
+        self._zones = zones
+        self._drawings = drawings
+        self._images = images
+        self._tables = tables
+        self._loader = loader
+        self._block_index = None
+
+    def __repr__(self) -> str:
+        return f"LayoutPage(page_num={self.page_num}, blocks={len(self.text_blocks)})"
+
+    @property
+    def zones(self) -> list[DocumentZone]:
+        if self._zones is None:
+            self._zones = self._loader.zones(self) if self._loader else []
+        return self._zones
+
+    @property
+    def drawings(self) -> list[Drawing]:
+        if self._drawings is None:
+            self._drawings = self._loader.drawings(self) if self._loader else []
+        return self._drawings
+
+    @property
+    def images(self) -> list[ImageInfo]:
+        if self._images is None:
+            self._images = self._loader.images(self) if self._loader else []
+        return self._images
+
+    @property
+    def tables(self) -> list[TableInfo]:
+        if self._tables is None:
+            self._tables = self._loader.tables(self) if self._loader else []
+        return self._tables
+
+    @property
+    def block_index(self):
+        """text_blocks에 대한 SpatialIndex (첫 접근 시 생성, 존 분류와 추출기가 공유)."""
+        if self._block_index is None:
+            from .spatial import SpatialIndex
+            self._block_index = SpatialIndex(self.text_blocks)
+        return self._block_index
+
+    def detach(self) -> None:
+        """아직 계산되지 않은 기능을 빈 리스트로 고정 (원본 PDF가 닫힐 때)."""
+        self._loader = None
+
+    def attach(self, loader) -> None:
+        """아직 계산되지 않은 기능을 loader로 계산하도록 연결 (캐시에서 읽은 페이지)."""
+        self._loader = loader
+
+    def materialized(self) -> frozenset[str]:
+        """이미 계산된(또는 생성 시 주어진) 기능 이름."""
+        return frozenset(
+            name for name, value in (
+                ("zones", self._zones), ("drawings", self._drawings),
+                ("images", self._images), ("tables", self._tables),
+            )
+            if value is not None
+        )
 
     @property
     def full_text(self) -> str:
@@ -265,7 +351,7 @@ class LayoutPage:
         return [z for z in self.zones if z.zone_type == zone_type]
 
 
-@dataclass
+@dataclass(slots=True)
 class FontStats:
     """페이지/문서 전체의 폰트 통계."""
     body_size: float            # 가장 빈번한 폰트 크기 (본문)
@@ -274,18 +360,31 @@ class FontStats:
     size_distribution: dict[float, int]  # {크기: 스팬 수}
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutResult:
     """전체 문서의 레이아웃 분석 결과."""
     pages: list[LayoutPage]
     font_stats: FontStats
     total_text_blocks: int
-    total_drawings: int
-    total_images: int
-    total_tables: int
     source_path: str = ""
     has_charts: bool = False
-    has_raster_images: bool = False
+
+    # 아래 집계는 페이지 기능을 읽으므로, 지연 상태인 기능은 여기서 계산된다.
+    @property
+    def total_drawings(self) -> int:
+        return sum(len(p.drawings) for p in self.pages)
+
+    @property
+    def total_images(self) -> int:
+        return sum(len(p.images) for p in self.pages)
+
+    @property
+    def total_tables(self) -> int:
+        return sum(len(p.tables) for p in self.pages)
+
+    @property
+    def has_raster_images(self) -> bool:
+        return any(p.images for p in self.pages)
 
     @property
     def full_text(self) -> str:
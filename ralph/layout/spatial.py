@@ -0,0 +1,128 @@
+"""
+페이지 단위 공간 인덱스 (균일 그리드).
+
+블록/스팬/테이블 bbox를 한 변 `cell` pt짜리 격자 칸에 등록해 두고,
+질의 영역이 걸치는 칸의 후보만 정확히 비교한다. 블록 × 영역 이중 루프를
+O(질의 영역 안의 후보 수)로 줄이는 용도.
+
+질의 결과는 원래 시퀀스의 인덱스(오름차순)로 돌려주므로 입력 순서에
+의존하던 기존 로직을 그대로 유지할 수 있다.
+"""
+from __future__ import annotations
+
+import math
+from typing import Any, Iterable, Sequence
+
+from .models import BBox
+
+
+def _bbox_of(item: Any) -> BBox:
+    return item if isinstance(item, BBox) else item.bbox
+
+
+class SpatialIndex:
+    """bbox(또는 .bbox를 가진 객체) 시퀀스에 대한 contains/overlaps/nearest 질의."""
+    __slots__ = ("items", "cell", "_boxes", "_grid")
+
+    def __init__(self, items: Sequence[Any], cell: float = 48.0):
+        self.items = items
+        self.cell = cell
+        self._boxes: list[BBox] = [_bbox_of(it) for it in items]
+        self._grid: dict[tuple[int, int], list[int]] = {}
+        for i, b in enumerate(self._boxes):
+            for key in self._cells(b.x0, b.y0, b.x1, b.y1):
+                bucket = self._grid.get(key)
+                if bucket is None:
+                    self._grid[key] = [i]
+                else:
+                    bucket.append(i)
+
+    def __len__(self) -> int:
+        return len(self._boxes)
+
+    def _cells(self, x0: float, y0: float, x1: float, y1: float) -> Iterable[tuple[int, int]]:
+        c = self.cell
+        gx0, gx1 = math.floor(min(x0, x1) / c), math.floor(max(x0, x1) / c)
+        gy0, gy1 = math.floor(min(y0, y1) / c), math.floor(max(y0, y1) / c)
+        for gx in range(gx0, gx1 + 1):
+            for gy in range(gy0, gy1 + 1):
+                yield gx, gy
+
+    def _candidates(self, x0: float, y0: float, x1: float, y1: float) -> set[int]:
+        found: set[int] = set()
+        grid = self._grid
+        c = self.cell
+        # 질의 영역이 격자 전체보다 넓으면 칸 순회 대신 전체를 후보로.
+        if (x1 - x0) * (y1 - y0) > len(grid) * c * c:
+            return set(range(len(self._boxes)))
+        for key in self._cells(x0, y0, x1, y1):
+            bucket = grid.get(key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def overlapping(self, bbox: BBox, tolerance: float = 0.0) -> list[int]:
+        """bbox(±tolerance)와 면적이 겹치는 항목 (BBox.overlap 기준)."""
+        q = bbox.expand(tolerance) if tolerance else bbox
+        boxes = self._boxes
+        return sorted(
+            i for i in self._candidates(q.x0, q.y0, q.x1, q.y1)
+            if boxes[i].overlap(q) is not None
+        )
+
+    def contained_in(self, bbox: BBox, tolerance: float = 2.0) -> list[int]:
+        """bbox 안에 들어가는 항목 (BBox.contains(item, tolerance) 기준)."""
+        boxes = self._boxes
+        return sorted(
+            i for i in self._candidates(
+                bbox.x0 - tolerance, bbox.y0 - tolerance,
+                bbox.x1 + tolerance, bbox.y1 + tolerance,
+            )
+            if bbox.contains(boxes[i], tolerance)
+        )
+
+    def containing(self, bbox: BBox, tolerance: float = 2.0) -> list[int]:
+        """bbox를 포함하는 항목 (item.contains(bbox, tolerance) 기준)."""
+        boxes = self._boxes
+        return sorted(
+            i for i in self._candidates(
+                bbox.x0 - tolerance, bbox.y0 - tolerance,
+                bbox.x1 + tolerance, bbox.y1 + tolerance,
+            )
+            if boxes[i].contains(bbox, tolerance)
+        )
+
+    def in_y_range(self, y0: float, y1: float) -> list[int]:
+        """세로 범위 [y0, y1]에 걸치는 항목 (가로는 전체)."""
+        if not self._grid:
+            return []
+        gxs = [gx for gx, _ in self._grid]
+        c = self.cell
+        x0, x1 = min(gxs) * c, (max(gxs) + 1) * c
+        boxes = self._boxes
+        return sorted(
+            i for i in self._candidates(x0, y0, x1, y1)
+            if boxes[i].y0 <= y1 and boxes[i].y1 >= y0
+        )
+
+    def nearest(self, bbox: BBox, k: int = 1, max_distance: float = math.inf) -> list[int]:
+        """BBox.distance_to 기준 가까운 순 k개 (max_distance 이내)."""
+        if not self._boxes or k <= 0:
+            return []
+        boxes = self._boxes
+        radius = self.cell
+        while True:
+            r = min(radius, max_distance)
+            q = bbox.expand(r)
+            scored = sorted(
+                (bbox.distance_to(boxes[i]), i)
+                for i in self._candidates(q.x0, q.y0, q.x1, q.y1)
+            )
+            # 거리 r 이내 항목은 반드시 expand(r) 창 안에 있으므로 여기서 확정.
+            within = [i for d, i in scored if d <= r]
+            exhausted = len(scored) == len(boxes)
+            if len(within) >= k or r >= max_distance or exhausted:
+                if exhausted:
+                    within = [i for d, i in scored if d <= max_distance]
+                return within[:k]
+            radius *= 2
@@ -0,0 +1,195 @@
+"""
+PDF 문서 컨텍스트 — 태스크당 1회 open.
+
+하나의 태스크 안에서 parser / classifier / layout analyzer / extractor가
+같은 PDF를 각자 fitz.open() 하던 것을 하나의 핸들로 공유한다.
+페이지별 text / dict / blocks / 테이블 / 렌더링 결과는 첫 요청 시 계산 후 캐시.
+
+사용:
+    with pdf_context(pdf_path) as pdf:
+        text, pages, blocks = extract_text(pdf)
+        img = render_first_page(pdf)
+
+pdf_context()는 경로와 PdfContext를 모두 받는다. 이미 열린 컨텍스트를
+넘기면 그대로 재사용하고 닫지 않는다 (소유권은 최초 생성자에게).
+
+PdfContext는 os.PathLike라 기존 경로 기반 API(os.path.exists, Path(...))에도
+그대로 넘길 수 있다. fitz.Document는 thread-safe가 아니므로
+한 컨텍스트는 한 스레드(태스크)에서만 사용할 것.
+"""
+from __future__ import annotations
+
+import os
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+import fitz
+
+
+# 표 테두리가 될 수 있는 벡터 연산자 (선, 사각형, 사변형).
+_RULING_OPS = frozenset({"l", "re", "qu"})
+
+
+class PageTable:
+    """find_tables() 결과 1개 — fitz Table의 bbox/row_count/col_count/extract() 호환.
+
+    셀 텍스트는 한 번만 추출해 보관하므로 같은 페이지를 여러 추출기가 봐도
+    find_tables()/extract()는 1회.
+    """
+    __slots__ = ("bbox", "row_count", "col_count", "rows")
+
+    def __init__(self, bbox: tuple, row_count: int, col_count: int, rows: list):
+        self.bbox = bbox
+        self.row_count = row_count
+        self.col_count = col_count
+        self.rows = rows
+
+    def extract(self) -> list[list[str | None]]:
+        return self.rows
+
+
+class PdfContext:
+    """지연 open + 페이지 단위 캐시를 가진 PDF 핸들."""
+
+    def __init__(self, pdf_path: str | os.PathLike):
+        self.pdf_path = os.fspath(pdf_path)
+        self._doc: fitz.Document | None = None
+        self._text: dict[int, str] = {}
+        self._dict: dict[int, dict] = {}
+        self._blocks: dict[int, list] = {}
+        self._rulings: dict[int, bool] = {}
+        self._tables: dict[int, list[PageTable]] = {}
+        self._pixmaps: dict[tuple[int, int, str], bytes] = {}
+
+    # ── 경로 호환 ──
+
+    def __fspath__(self) -> str:
+        return self.pdf_path
+
+    def __str__(self) -> str:
+        return self.pdf_path
+
+    def __repr__(self) -> str:
+        state = "open" if self._doc is not None else "closed"
+        return f"PdfContext({self.pdf_path!r}, {state})"
+
+    # ── 문서 핸들 ──
+
+    @property
+    def doc(self) -> fitz.Document:
+        if self._doc is None:
+            self._doc = fitz.open(self.pdf_path)
+        return self._doc
+
+    @property
+    def page_count(self) -> int:
+        return self.doc.page_count
+
+    def page(self, index: int) -> fitz.Page:
+        return self.doc[index]
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        self._text.clear()
+        self._dict.clear()
+        self._blocks.clear()
+        self._rulings.clear()
+        self._tables.clear()
+        self._pixmaps.clear()
+
+    def __enter__(self) -> PdfContext:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ── 페이지 캐시 ──
+
+    def page_text(self, index: int) -> str:
+        """page.get_text() (plain text)."""
+        cached = self._text.get(index)
+        if cached is None:
+            cached = self.doc[index].get_text()
+            self._text[index] = cached
+        return cached
+
+    def page_dict(self, index: int) -> dict:
+        """page.get_text("dict"). 반환값은 공유 캐시이므로 수정하지 말 것.
+
+        이미지 블록(type 1)의 원본 바이트("image")는 태스크 내내 캐시에 남을
+        필요가 없어 버린다. bbox/width/height 등 메타데이터는 그대로.
+        """
+        cached = self._dict.get(index)
+        if cached is None:
+            cached = self.doc[index].get_text("dict")
+            for block in cached.get("blocks", []):
+                if block.get("type") == 1:
+                    block.pop("image", None)
+            self._dict[index] = cached
+        return cached
+
+    def page_blocks(self, index: int) -> list:
+        """page.get_text("blocks")."""
+        cached = self._blocks.get(index)
+        if cached is None:
+            cached = self.doc[index].get_text("blocks")
+            self._blocks[index] = cached
+        return cached
+
+    def page_has_rulings(self, index: int) -> bool:
+        """선/사각형 벡터 그래픽이 있는지 (get_cdrawings 기반, 결과만 캐시).
+
+        find_tables() 기본 전략은 벡터 선으로 셀 경계를 찾으므로, 이게 False인
+        페이지에서는 표가 나올 수 없다.
+        """
+        cached = self._rulings.get(index)
+        if cached is None:
+            cached = any(
+                item[0] in _RULING_OPS
+                for path in self.doc[index].get_cdrawings()
+                for item in path.get("items", ())
+            )
+            self._rulings[index] = cached
+        return cached
+
+    def page_tables(self, index: int) -> list[PageTable]:
+        """page.find_tables() (셀 추출 포함). 선 그래픽이 없는 페이지는 건너뜀."""
+        cached = self._tables.get(index)
+        if cached is None:
+            cached = []
+            if self.page_has_rulings(index):
+                try:
+                    for t in self.doc[index].find_tables().tables:
+                        cached.append(PageTable(tuple(t.bbox), t.row_count, t.col_count, t.extract()))
+                except Exception:
+                    pass  # 표 인식 실패는 그 페이지의 나머지 표 없음으로 취급
+            self._tables[index] = cached
+        return cached
+
+    def render(self, index: int, dpi: int = 150, fmt: str = "png") -> bytes:
+        """페이지 렌더링 결과 (DPI + 포맷별 캐시)."""
+        key = (index, dpi, fmt)
+        cached = self._pixmaps.get(key)
+        if cached is None:
+            mat = fitz.Matrix(dpi / 72, dpi / 72)
+            cached = self.doc[index].get_pixmap(matrix=mat).tobytes(fmt)
+            self._pixmaps[key] = cached
+        return cached
+
+
+PdfSource = Union[str, os.PathLike, PdfContext]
+
+
+@contextmanager
+def pdf_context(source: PdfSource) -> Iterator[PdfContext]:
+    """경로면 새 컨텍스트를 열고 닫는다. PdfContext면 그대로 빌려준다."""
+    if isinstance(source, PdfContext):
+        yield source
+        return
+    ctx = PdfContext(source)
+    try:
+        yield ctx
+    finally:
+        ctx.close()
@@ -6,15 +6,21 @@ VLM은 규칙 기반 추출이 실패할 때만 사용 (미구현, 추후 Phase
 """
 from __future__ import annotations
 
+import logging
+import os
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 
 from ralph.layout.analyzer import LayoutAnalyzer
+from ralph.layout.cache import file_digest, get_layout_cache, layout_state
 from ralph.layout.models import LayoutResult
 from ralph.extraction.registry import get_extractor
 from ralph.schemas import SCHEMA_MAP
 from ralph.nl_converter import convert_to_natural_language
+from ralph.pdf_context import PdfContext, PdfSource, pdf_context
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -33,7 +39,7 @@ class ParseResult:
 
 
 def parse_document(
-    pdf_path: str,
+    pdf_path: PdfSource,
     doc_type: str,
     include_layout: bool = False,
 ) -> ParseResult:
@@ -41,20 +47,49 @@ def parse_document(
     문서 파싱 메인 엔트리포인트.
 
     Args:
-        pdf_path: PDF 파일 경로
+        pdf_path: PDF 파일 경로 또는 PdfContext
         doc_type: 문서 타입 ("business_reg", "financial_stmt" 등)
         include_layout: 결과에 레이아웃 데이터 포함 여부
 
     Returns:
         ParseResult
     """
+    # 레이아웃 분석과 추출기가 같은 문서 핸들을 공유 (태스크당 1회 open)
+    with pdf_context(pdf_path) as pdf:
+        return _parse_with_context(pdf, doc_type, include_layout)
+
+
+def _parse_with_context(
+    pdf: PdfContext,
+    doc_type: str,
+    include_layout: bool,
+) -> ParseResult:
     start_time = time.perf_counter()
     errors: list[str] = []
+    pdf_path = os.fspath(pdf)
 
-    # Stage 0: 레이아웃 분석
+    # Stage 0: 레이아웃 분석 — 추출기가 읽는 기능만 미리 계산.
+    # 레이아웃을 돌려줄 때는 PDF가 닫힌 뒤에도 쓸 수 있게 전부 계산.
+    extractor = get_extractor(doc_type)
+    if include_layout:
+        features = None
+    else:
+        features = extractor.layout_features if extractor else frozenset()
     analyzer = LayoutAnalyzer()
+    # 같은 파일 내용 + 분석기 버전이면 저장된 레이아웃을 재사용
+    cache = get_layout_cache()
+    digest = ""
     try:
-        layout = analyzer.analyze(pdf_path)
+        layout = None
+        if cache is not None:
+            digest = file_digest(pdf)
+            layout = cache.get(digest, pdf_path)
+        if layout is not None:
+            cached_state = layout_state(layout)
+            analyzer.resume(layout, pdf, features=features)
+        else:
+            cached_state = None
+            layout = analyzer.analyze(pdf, features=features)
     except Exception as e:
         elapsed = time.perf_counter() - start_time
         return ParseResult(
@@ -69,7 +104,6 @@ def parse_document(
         )
 
     # Stage 1: 규칙 기반 추출
-    extractor = get_extractor(doc_type)
     if extractor is None:
         elapsed = time.perf_counter() - start_time
         return ParseResult(
@@ -85,8 +119,9 @@ def parse_document(
         )
 
     try:
-        raw_data, confidence = extractor.extract(layout)
+        raw_data, confidence = extractor.extract(layout, pdf=pdf)
     except Exception as e:
+        _store_layout(cache, digest, layout, cached_state)
         elapsed = time.perf_counter() - start_time
         return ParseResult(
             success=False,
@@ -99,6 +134,8 @@ def parse_document(
             layout=layout if include_layout else None,
             errors=[f"추출 실패: {e}"],
         )
+    # 추출기가 지연 계산한 기능까지 포함해 저장 (캐시에 이미 같은 상태면 건너뜀)
+    _store_layout(cache, digest, layout, cached_state)
 
     # 스키마 검증
     schema_cls = SCHEMA_MAP.get(doc_type)
@@ -140,3 +177,12 @@ def parse_document(
         layout=layout if include_layout else None,
         errors=errors,
     )
+
+
+def _store_layout(cache, digest: str, layout: LayoutResult, cached_state) -> None:
+    if cache is None or layout_state(layout) == cached_state:
+        return
+    try:
+        cache.put(digest, layout)
+    except Exception as e:
+        logger.warning("레이아웃 캐시 저장 실패: %s", e)
@@ -24,7 +24,13 @@ import os
 import re
 import sys
 
-import fitz
+if __name__ == "__main__":
+    # CLI 직접 실행 시에도 ralph 패키지를 import할 수 있도록 프로젝트 루트 추가
+    _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if _project_root not in sys.path:
+        sys.path.insert(0, _project_root)
+
+from ralph.pdf_context import PdfContext, PdfSource, pdf_context
 
 logger = logging.getLogger(__name__)
 
@@ -73,60 +79,50 @@ def assess_text_quality(
 # PyMuPDF 추출
 # ─────────────────────────────────────────────────────────────
 
-def extract_text(pdf_path: str) -> tuple[str, int, list[str]]:
+def extract_text(pdf: PdfSource) -> tuple[str, int, list[str]]:
     """전체 페이지 텍스트 추출. Returns (text, page_count, text_blocks)."""
-    doc = fitz.open(pdf_path)
-    page_count = doc.page_count
-    parts: list[str] = []
-    all_blocks: list[str] = []
-
-    for i in range(page_count):
-        page = doc[i]
-        t = page.get_text()
-        if t.strip():
-            parts.append(t)
-        # 블록별 텍스트 수집 (파편화 감지용)
-        for block in page.get_text("blocks"):
-            btext = block[4].strip()
-            if btext and block[6] == 0:  # 0 = 텍스트 블록 (이미지 블록 제외)
-                all_blocks.append(btext)
-
-    doc.close()
+    with pdf_context(pdf) as ctx:
+        page_count = ctx.page_count
+        parts: list[str] = []
+        all_blocks: list[str] = []
+
+        for i in range(page_count):
+            t = ctx.page_text(i)
+            if t.strip():
+                parts.append(t)
+            # 블록별 텍스트 수집 (파편화 감지용)
+            for block in ctx.page_blocks(i):
+                btext = block[4].strip()
+                if btext and block[6] == 0:  # 0 = 텍스트 블록 (이미지 블록 제외)
+                    all_blocks.append(btext)
+
     return "\n\n---\n\n".join(parts), page_count, all_blocks
 
 
-def render_first_page(pdf_path: str, dpi: int = 150) -> bytes:
-    doc = fitz.open(pdf_path)
-    try:
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
-        return doc[0].get_pixmap(matrix=mat).tobytes("png")
-    finally:
-        doc.close()
+def render_first_page(pdf: PdfSource, dpi: int = 150) -> bytes:
+    with pdf_context(pdf) as ctx:
+        return ctx.render(0, dpi=dpi, fmt="png")
 
 
-def render_pages(pdf_path: str, max_pages: int = 10, dpi: int = 100) -> list[bytes]:
+def render_pages(pdf: PdfSource, max_pages: int = 10, dpi: int = 100) -> list[bytes]:
     """여러 페이지를 JPEG로 렌더링. PNG 대비 ~50% 절감, 발표자료 전체 처리용."""
-    doc = fitz.open(pdf_path)
-    try:
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
+    with pdf_context(pdf) as ctx:
         return [
-            doc[i].get_pixmap(matrix=mat).tobytes("jpeg")
-            for i in range(min(doc.page_count, max_pages))
+            ctx.render(i, dpi=dpi, fmt="jpeg")
+            for i in range(min(ctx.page_count, max_pages))
         ]
-    finally:
-        doc.close()
 
 
 # ─────────────────────────────────────────────────────────────
 # 경로2: 페이지별 위치 기반 텍스트 추출 + 차트 슬라이드 감지
 # ─────────────────────────────────────────────────────────────
 
-def _page_text_sorted(page) -> str:
+def _page_text_sorted(page_dict: dict) -> str:
     """
     get_text("dict")로 텍스트 블록을 y→x 좌표 순으로 정렬.
     슬라이드 읽기 순서(상→하, 좌→우)로 복원.
     """
-    blocks = page.get_text("dict")["blocks"]
+    blocks = page_dict["blocks"]
     items: list[tuple[float, float, str]] = []
     for block in blocks:
         if block.get("type") != 0:
@@ -143,39 +139,35 @@ def _page_text_sorted(page) -> str:
     return "\n".join(t[2] for t in items)
 
 
-def _is_chart_heavy(page, threshold: float = _CHART_IMAGE_AREA_RATIO) -> bool:
+def _is_chart_heavy(page_dict: dict, threshold: float = _CHART_IMAGE_AREA_RATIO) -> bool:
     """이미지 면적 비율 > threshold → 차트/도표 중심 슬라이드."""
-    rect = page.rect
-    page_area = rect.width * rect.height
+    page_area = page_dict["width"] * page_dict["height"]
     if page_area <= 0:
         return False
     image_area = sum(
         (b["bbox"][2] - b["bbox"][0]) * (b["bbox"][3] - b["bbox"][1])
-        for b in page.get_text("dict")["blocks"]
+        for b in page_dict["blocks"]
         if b.get("type") == 1
     )
     return (image_area / page_area) > threshold
 
 
-def analyze_pages(pdf_path: str, max_pages: int = 10) -> list[dict]:
+def analyze_pages(pdf: PdfSource, max_pages: int = 10) -> list[dict]:
     """
     페이지별 분석:
       - text: y→x 위치 기반 정렬된 텍스트
       - is_chart: 차트/도표 중심 여부
     """
-    doc = fitz.open(pdf_path)
-    try:
+    with pdf_context(pdf) as ctx:
         result = []
-        for i in range(min(doc.page_count, max_pages)):
-            page = doc[i]
+        for i in range(min(ctx.page_count, max_pages)):
+            page_dict = ctx.page_dict(i)
             result.append({
                 "page": i + 1,
-                "text": _page_text_sorted(page),
-                "is_chart": _is_chart_heavy(page),
+                "text": _page_text_sorted(page_dict),
+                "is_chart": _is_chart_heavy(page_dict),
             })
         return result
-    finally:
-        doc.close()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -251,7 +243,8 @@ def call_nova_visual(
     prompt: str,
     max_tokens: int = 1200,
 ) -> dict:
-    import boto3
+    from ralph.vlm.client_pool import get_bedrock_client
+    from ralph.vlm.rate_limiter import bedrock_call, estimate_tokens
 
     if isinstance(images, bytes):
         images = [images]
@@ -265,16 +258,18 @@ def call_nova_visual(
     ]
     content.append({"text": prompt})
 
-    client = boto3.client("bedrock-runtime", region_name=region)
-    resp = client.converse(
-        modelId=model_id,
-        messages=[{"role": "user", "content": content}],
-        inferenceConfig={"maxTokens": max_tokens, "temperature": 0},
-    )
+    client = get_bedrock_client(region)
+    with bedrock_call(model_id, estimate_tokens(prompt, len(images), max_tokens)) as slot:
+        resp = client.converse(
+            modelId=model_id,
+            messages=[{"role": "user", "content": content}],
+            inferenceConfig={"maxTokens": max_tokens, "temperature": 0},
+        )
+        _resp_usage = resp.get("usage", {})
+        slot.record_usage(_resp_usage.get("inputTokens", 0), _resp_usage.get("outputTokens", 0))
     raw = resp["output"]["message"]["content"][0]["text"]
 
     # Extract token usage from Bedrock response.
-    _resp_usage = resp.get("usage", {})
     _bedrock_usage = {
         "input_tokens": _resp_usage.get("inputTokens", 0),
         "output_tokens": _resp_usage.get("outputTokens", 0),
@@ -365,7 +360,7 @@ def call_nova_visual(
 # 문서 분류 (파일명 + 텍스트만, VLM 없음)
 # ─────────────────────────────────────────────────────────────
 
-def classify_no_vlm(pdf_path: str, filename: str) -> dict:
+def classify_no_vlm(pdf_path: PdfSource, filename: str) -> dict:
     """라우터 1~2단계만 실행 (Nova 없음)."""
     try:
         from ralph.router import detect_type
@@ -396,6 +391,8 @@ def main() -> None:
         sys.exit(1)
 
     pdf_path = sys.argv[1]
+    # 텍스트 추출 · 분류 · 렌더링이 같은 문서 핸들을 공유
+    pdf = PdfContext(pdf_path)
     # 발표자료(차트/다이어그램) → Nova Pro 필요, 스캔 OCR → Nova Lite로 충분
     model_pro  = os.getenv("RALPH_VLM_NOVA_MODEL_ID",      "us.amazon.nova-pro-v1:0")
     model_lite = os.getenv("RALPH_VLM_NOVA_LITE_MODEL_ID", "us.amazon.nova-lite-v1:0")
@@ -405,12 +402,12 @@ def main() -> None:
 
     try:
         # ── 1. PyMuPDF 텍스트 + 블록 추출
-        text, pages, blocks = extract_text(pdf_path)
+        text, pages, blocks = extract_text(pdf)
         quality, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
 
         # ── 2. 분류 (Nova 없이)
         filename = os.path.basename(pdf_path)
-        clf = classify_no_vlm(pdf_path, filename)
+        clf = classify_no_vlm(pdf, filename)
 
         # ── 3. 3-way 품질 게이트
         method = "pymupdf"
@@ -421,7 +418,7 @@ def main() -> None:
             # 사용자 수동 요청: nova_hybrid와 동일 방식(1페이지, DPI=150) + Pro 모델
             # → 다중 이미지 + 단일 이미지 프롬프트 조합은 할루시네이션 유발
             try:
-                img_bytes = render_first_page(pdf_path, dpi=150)
+                img_bytes = render_first_page(pdf, dpi=150)
                 visual_description = call_nova_visual(img_bytes, model_pro, region, _PROMPT_OCR)
                 method = "nova_pro"
                 text_structure = "image"
@@ -433,7 +430,7 @@ def main() -> None:
         elif is_poor and use_vlm:
             # 스캔/이미지 PDF → Nova Lite OCR (텍스트 추출, Pro 불필요)
             try:
-                img_bytes = render_first_page(pdf_path)
+                img_bytes = render_first_page(pdf)
                 visual_description = call_nova_visual(img_bytes, model_lite, region, _PROMPT_OCR)
                 method = "nova_hybrid"
                 text_structure = "image"
@@ -445,8 +442,8 @@ def main() -> None:
         elif is_fragmented and use_vlm:
             # 슬라이드/발표자료 → Nova 구조화 (경로1+2: 위치 기반 + 차트 감지)
             try:
-                page_images = render_pages(pdf_path, max_pages=10, dpi=100)
-                pages_info = analyze_pages(pdf_path, max_pages=10)
+                page_images = render_pages(pdf, max_pages=10, dpi=100)
+                pages_info = analyze_pages(pdf, max_pages=10)
                 prompt = build_presentation_prompt(pages_info)
                 visual_description = call_nova_visual(
                     page_images, model_pro, region, prompt,
@@ -480,11 +477,9 @@ def main() -> None:
     except Exception as e:
         print(json.dumps({"ok": False, "error": str(e)}))
         sys.exit(1)
+    finally:
+        pdf.close()
 
 
 if __name__ == "__main__":
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-
     main()
@@ -23,6 +23,7 @@ from dataclasses import dataclass, field
 
 from ralph.classifier import classify_document
 from ralph.extraction.registry import list_supported_types
+from ralph.pdf_context import PdfSource
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +84,7 @@ def detect_type_from_filename(filename: str) -> tuple[str | None, float]:
 def detect_type(
     file_id: str,
     filename: str,
-    pdf_path: str | None = None,
+    pdf_path: PdfSource | None = None,
     use_vlm: bool = True,
     use_dino: bool = False,          # 벤치마크 결과 공문서 간 구별력 낮아 기본 off
 ) -> DetectionResult:
@@ -93,7 +94,7 @@ def detect_type(
     Args:
         file_id:  파일 고유 ID
         filename: 원본 파일명
-        pdf_path: 로컬 PDF 경로 (2~4단계에 필요)
+        pdf_path: 로컬 PDF 경로 또는 PdfContext (2~4단계에 필요)
         use_vlm:  VLM OCR 폴백 사용 여부 (기본 True)
         use_dino: DINOv2 시각 분류 폴백 (기본 False, 공문서 간 성능 낮음)
 
@@ -194,14 +195,47 @@ def detect_types_batch(
     use_vlm: bool = True,
     use_dino: bool = False,
 ) -> list[DetectionResult]:
-    """다건 파일 문서 타입 일괄 감지."""
-    return [
+    """
+    다건 파일 문서 타입 일괄 감지.
+
+    1~3단계는 파일별로 처리하고, DINOv2 폴백이 필요한 파일은 모아서
+    classify_many()로 한 번에 분류한다 (미니배치 임베딩 + 행렬 검색).
+    """
+    results = [
         detect_type(
             file_id=fi.file_id,
             filename=fi.filename,
             pdf_path=fi.pdf_path,
             use_vlm=use_vlm,
-            use_dino=use_dino,
+            use_dino=False,
         )
         for fi in file_infos
     ]
+    if not use_dino:
+        return results
+
+    # detect_type이 4단계까지 내려갔을 경우와 같은 조건: 앞 단계 미분류 + PDF 존재
+    pending = [
+        i for i, (fi, result) in enumerate(zip(file_infos, results))
+        if result.method == "none" and fi.pdf_path and os.path.exists(fi.pdf_path)
+    ]
+    if not pending:
+        return results
+
+    try:
+        from ralph.dino_classifier import get_dino_classifier
+        clf = get_dino_classifier()
+        classified = clf.classify_many([file_infos[i].pdf_path for i in pending])
+    except Exception as e:
+        logger.warning(f"DINOv2 분류 실패: {e}")
+        return results
+
+    for i, (doc_type, conf) in zip(pending, classified):
+        if doc_type != "unknown" and conf > 0.0:
+            fi = file_infos[i]
+            results[i] = DetectionResult(
+                file_id=fi.file_id, filename=fi.filename,
+                detected_type=doc_type, method="dino",
+                confidence=conf, supported_types=results[i].supported_types,
+            )
+    return results
@@ -13,6 +13,7 @@ from typing import List, Optional, Tuple
 import fitz  # PyMuPDF
 
 from dolphin_service.classifier import ClassificationResult, classify_document
+from ralph.pdf_context import pdf_context
 
 logger = logging.getLogger(__name__)
 
@@ -166,31 +167,29 @@ def extract_stage1(pdf_path: str) -> Stage1Result:
     )
 
     # 2) Extract text + tables per page
-    doc = fitz.open(pdf_path)
+    # page_tables()는 선 그래픽이 없는 페이지에서 find_tables()를 건너뛴다.
     pages: List[PageMarkdown] = []
 
-    try:
-        for page_num in range(len(doc)):
-            page = doc[page_num]
+    with pdf_context(pdf_path) as doc:
+        for page_num in range(doc.page_count):
+            page = doc.page(page_num)
 
             # Text
-            text = page.get_text("text")
+            text = doc.page_text(page_num)
 
             # Tables with category classification + bbox
             table_infos: List[ClassifiedTable] = []
             try:
-                tables = page.find_tables()
-                if tables and tables.tables:
-                    for tbl in tables.tables:
-                        md = _table_to_markdown(tbl)
-                        if md:
-                            category = _classify_table(md)
-                            table_infos.append(ClassifiedTable(
-                                markdown=md,
-                                category=category,
-                                bbox=tbl.bbox,
-                                page_num=page_num,
-                            ))
+                for tbl in doc.page_tables(page_num):
+                    md = _table_to_markdown(tbl)
+                    if md:
+                        category = _classify_table(md)
+                        table_infos.append(ClassifiedTable(
+                            markdown=md,
+                            category=category,
+                            bbox=tbl.bbox,
+                            page_num=page_num,
+                        ))
             except Exception as e:
                 logger.debug(f"Page {page_num} 테이블 추출 실패: {e}")
 
@@ -205,8 +204,6 @@ def extract_stage1(pdf_path: str) -> Stage1Result:
                 page_num=page_num, text=text,
                 tables=table_infos, images=page_images,
             ))
-    finally:
-        doc.close()
 
     # 3) Combine into full markdown
     full_md = "\n\n---\n\n".join(p.to_markdown() for p in pages)
@@ -9,6 +9,8 @@ from __future__ import annotations
 import os
 
 from .base import BaseVLMCaller, VLMResult
+from .client_pool import clear_bedrock_clients, get_bedrock_client
+from .rate_limiter import bedrock_call, get_rate_limiter
 
 
 def get_vlm_caller(backend: str | None = None) -> BaseVLMCaller:
@@ -35,4 +37,13 @@ def get_vlm_caller(backend: str | None = None) -> BaseVLMCaller:
     raise ValueError(f"Unknown VLM backend: {backend}")
 
 
-__all__ = ["BaseVLMCaller", "VLMResult", "get_vlm_caller", "NovaLiteHybridCaller"]
+__all__ = [
+    "BaseVLMCaller",
+    "VLMResult",
+    "get_vlm_caller",
+    "get_bedrock_client",
+    "clear_bedrock_clients",
+    "bedrock_call",
+    "get_rate_limiter",
+    "NovaLiteHybridCaller",
+]
@@ -13,6 +13,8 @@ import os
 import re
 
 from .base import BaseVLMCaller, VLMResult
+from .client_pool import get_bedrock_client
+from .rate_limiter import bedrock_call, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -185,17 +187,13 @@ class BedrockClaudeVLMCaller(BaseVLMCaller):
         prompt: str,
     ) -> tuple[str, dict[str, int]]:
         """Bedrock Anthropic Messages API 호출."""
-        import boto3
-        from botocore.config import Config
-
-        client = boto3.client(
-            "bedrock-runtime",
-            region_name=self._region,
-            config=Config(
-                connect_timeout=30,
-                read_timeout=120,
-                retries={"max_attempts": 3},
-            ),
+        client = get_bedrock_client(
+            self._region,
+            config={
+                "connect_timeout": 30,
+                "read_timeout": 120,
+                "retries": {"max_attempts": 3},
+            },
         )
 
         # content blocks 구성
@@ -224,13 +222,16 @@ class BedrockClaudeVLMCaller(BaseVLMCaller):
             "messages": [{"role": "user", "content": content}],
         }
 
-        resp = client.invoke_model(
-            modelId=self._model_id,
-            contentType="application/json",
-            accept="application/json",
-            body=json.dumps(payload).encode("utf-8"),
-        )
-        parsed = json.loads(resp["body"].read())
+        with bedrock_call(self._model_id, estimate_tokens(prompt, len(images_b64), payload["max_tokens"])) as slot:
+            resp = client.invoke_model(
+                modelId=self._model_id,
+                contentType="application/json",
+                accept="application/json",
+                body=json.dumps(payload).encode("utf-8"),
+            )
+            parsed = json.loads(resp["body"].read())
+            usage_raw = parsed.get("usage", {})
+            slot.record_usage(usage_raw.get("input_tokens", 0), usage_raw.get("output_tokens", 0))
 
         # 텍스트 추출
         text = ""
@@ -239,7 +240,6 @@ class BedrockClaudeVLMCaller(BaseVLMCaller):
                 text += block.get("text", "")
 
         # usage 추출
-        usage_raw = parsed.get("usage", {})
         usage = {}
         if isinstance(usage_raw.get("input_tokens"), int):
             usage["input_tokens"] = usage_raw["input_tokens"]
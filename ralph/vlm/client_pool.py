@@ -0,0 +1,66 @@
+"""
+Bedrock runtime 클라이언트 풀.
+
+boto3 클라이언트 생성은 엔드포인트/자격증명 해석 때문에 수십 ms가 걸리고
+호출마다 새 HTTP 커넥션 풀을 만든다. 프로세스 전역으로 리전(+설정)별
+클라이언트 하나를 재사용한다. boto3 클라이언트 자체는 thread-safe이므로
+여러 스레드가 같은 클라이언트로 동시에 converse()를 호출해도 된다.
+생성 과정(기본 세션 접근)은 thread-safe가 아니므로 락으로 보호한다.
+
+환경변수:
+    RALPH_BEDROCK_MAX_POOL_CONNECTIONS  클라이언트당 HTTP 커넥션 수 (기본 32)
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from typing import Any
+
+_DEFAULT_MAX_POOL_CONNECTIONS = 32
+
+_clients: dict[tuple[str, str], Any] = {}
+_lock = threading.Lock()
+
+
+def _max_pool_connections() -> int:
+    try:
+        return max(1, int(os.getenv("RALPH_BEDROCK_MAX_POOL_CONNECTIONS", "")))
+    except ValueError:
+        return _DEFAULT_MAX_POOL_CONNECTIONS
+
+
+def get_bedrock_client(region: str, config: dict | None = None) -> Any:
+    """
+    리전별 공유 bedrock-runtime 클라이언트.
+
+    Args:
+        region: AWS 리전
+        config: botocore Config 키워드 (예: {"read_timeout": 120}).
+                설정이 다르면 별도 클라이언트로 캐시된다.
+    """
+    key = (region, json.dumps(config or {}, sort_keys=True))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+
+            options = {"max_pool_connections": _max_pool_connections(), **(config or {})}
+            client = boto3.client(
+                "bedrock-runtime",
+                region_name=region,
+                config=Config(**options),
+            )
+            _clients[key] = client
+    return client
+
+
+def clear_bedrock_clients() -> None:
+    """캐시된 클라이언트 제거 (테스트 / 자격증명 교체용)."""
+    with _lock:
+        _clients.clear()
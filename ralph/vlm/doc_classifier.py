@@ -19,7 +19,10 @@ import os
 import re
 import unicodedata
 
-import fitz
+from ralph.pdf_context import PdfSource, pdf_context
+
+from .client_pool import get_bedrock_client
+from .rate_limiter import bedrock_call, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +86,7 @@ class VLMDocClassifier:
 
     def classify(
         self,
-        pdf_path: str,
+        pdf_path: PdfSource,
         confidence_threshold: float = 0.30,
     ) -> tuple[str, float, str | None]:
         """
@@ -123,28 +126,26 @@ class VLMDocClassifier:
     # 내부 메서드
     # ---------------------------------------------------------------- #
 
-    def _render_first_page(self, pdf_path: str) -> bytes:
-        doc = fitz.open(pdf_path)
-        try:
-            mat = fitz.Matrix(self._dpi / 72, self._dpi / 72)
-            return doc[0].get_pixmap(matrix=mat).tobytes("png")
-        finally:
-            doc.close()
+    def _render_first_page(self, pdf_path: PdfSource) -> bytes:
+        with pdf_context(pdf_path) as pdf:
+            return pdf.render(0, dpi=self._dpi, fmt="png")
 
     def _call_nova(self, img_bytes: bytes, prompt: str, max_tokens: int = 100) -> str:
-        import boto3
-        client = boto3.client("bedrock-runtime", region_name=self._region)
-        resp = client.converse(
-            modelId=self._model_id,
-            messages=[{
-                "role": "user",
-                "content": [
-                    {"image": {"format": "png", "source": {"bytes": img_bytes}}},
-                    {"text": prompt},
-                ],
-            }],
-            inferenceConfig={"maxTokens": max_tokens, "temperature": 0},
-        )
+        client = get_bedrock_client(self._region)
+        with bedrock_call(self._model_id, estimate_tokens(prompt, 1, max_tokens)) as slot:
+            resp = client.converse(
+                modelId=self._model_id,
+                messages=[{
+                    "role": "user",
+                    "content": [
+                        {"image": {"format": "png", "source": {"bytes": img_bytes}}},
+                        {"text": prompt},
+                    ],
+                }],
+                inferenceConfig={"maxTokens": max_tokens, "temperature": 0},
+            )
+            usage = resp.get("usage", {})
+            slot.record_usage(usage.get("inputTokens", 0), usage.get("outputTokens", 0))
         return resp["output"]["message"]["content"][0]["text"]
 
     def _extract_title(self, img_bytes: bytes) -> str:
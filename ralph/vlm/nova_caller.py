@@ -17,10 +17,13 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-import fitz  # PyMuPDF
+from ralph.pdf_context import PdfSource, pdf_context
 
 from .base import BaseVLMCaller, VLMResult
+from .client_pool import get_bedrock_client
+from .rate_limiter import bedrock_call, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,8 @@ class NovaLiteHybridCaller(BaseVLMCaller):
     PyMuPDF(텍스트) + Nova Lite(시각) 하이브리드 caller.
 
     Nova Lite는 시각 요소 묘사만 담당 → 환각 범위를 텍스트 재현에서 제거.
+    페이지별 converse 호출은 최대 ``max_concurrency``개까지 동시에 보내고,
+    결과는 페이지 순서대로 모은다.
     """
 
     def __init__(
@@ -61,6 +66,7 @@ class NovaLiteHybridCaller(BaseVLMCaller):
         model_id: str | None = None,
         region: str | None = None,
         dpi: int = 150,
+        max_concurrency: int | None = None,
     ):
         self._model_id = (
             model_id
@@ -69,6 +75,12 @@ class NovaLiteHybridCaller(BaseVLMCaller):
         )
         self._region = region or os.getenv("RALPH_VLM_NOVA_REGION", "us-east-1")
         self._dpi = dpi
+        self._max_concurrency = max(
+            1,
+            max_concurrency
+            if max_concurrency is not None
+            else int(os.getenv("RALPH_VLM_PAGE_CONCURRENCY", "4")),
+        )
 
     @property
     def backend_name(self) -> str:
@@ -76,30 +88,34 @@ class NovaLiteHybridCaller(BaseVLMCaller):
 
     def extract(
         self,
-        pdf_path: str,
+        pdf_path: PdfSource,
         doc_type: str,
         max_pages: int = 5,
     ) -> VLMResult:
         try:
-            import boto3
-
-            client = boto3.client("bedrock-runtime", region_name=self._region)
-            doc = fitz.open(pdf_path)
-            pages_to_process = min(doc.page_count, max_pages)
+            client = get_bedrock_client(self._region)
+
+            # 렌더링은 fitz 핸들을 쓰므로 현재 스레드에서 먼저 끝낸다
+            # (fitz.Document는 thread-safe가 아님). 네트워크 호출만 병렬화.
+            with pdf_context(pdf_path) as pdf:
+                pages_to_process = min(pdf.page_count, max_pages)
+                page_inputs = [
+                    (
+                        i + 1,
+                        pdf.page_text(i).strip(),
+                        pdf.render(i, dpi=self._dpi, fmt="png"),
+                    )
+                    for i in range(pages_to_process)
+                ]
+
+            page_results = self._describe_pages(client, page_inputs)
 
-            page_results = []
             total_input_tokens = 0
             total_output_tokens = 0
-
-            for i in range(pages_to_process):
-                page = doc[i]
-                page_result = self._process_page(client, page, i + 1)
-                page_results.append(page_result)
+            for page_result in page_results:
                 total_input_tokens += page_result.pop("_input_tokens", 0)
                 total_output_tokens += page_result.pop("_output_tokens", 0)
 
-            doc.close()
-
             data = {
                 "doc_type": doc_type,
                 "pages": page_results,
@@ -133,36 +149,43 @@ class NovaLiteHybridCaller(BaseVLMCaller):
                 error=str(e),
             )
 
-    def _process_page(self, client, page, page_num: int) -> dict:
+    def _describe_pages(
+        self,
+        client,
+        page_inputs: list[tuple[int, str, bytes]],
+    ) -> list[dict]:
+        """페이지별 시각 묘사를 병렬 호출. 반환 순서 = 입력 순서."""
+        workers = min(self._max_concurrency, len(page_inputs))
+        if workers <= 1:
+            return [self._describe_page(client, *item) for item in page_inputs]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="nova-page") as pool:
+            return list(pool.map(lambda item: self._describe_page(client, *item), page_inputs))
+
+    def _describe_page(self, client, page_num: int, text: str, img_bytes: bytes) -> dict:
         """단일 페이지: PyMuPDF 텍스트 + Nova Lite 시각 묘사."""
-        # 1. 텍스트: PyMuPDF
-        text = page.get_text().strip()
-
-        # 2. 이미지: Nova Lite (시각 전용)
-        mat = fitz.Matrix(self._dpi / 72, self._dpi / 72)
-        img_bytes = page.get_pixmap(matrix=mat).tobytes("png")
-
         visuals = []
         layout_summary = ""
         input_tokens = 0
         output_tokens = 0
 
         try:
-            resp = client.converse(
-                modelId=self._model_id,
-                messages=[{
-                    "role": "user",
-                    "content": [
-                        {"image": {"format": "png", "source": {"bytes": img_bytes}}},
-                        {"text": _VISUAL_ONLY_PROMPT},
-                    ],
-                }],
-                inferenceConfig={"maxTokens": 600, "temperature": 0},
-            )
+            with bedrock_call(self._model_id, estimate_tokens(_VISUAL_ONLY_PROMPT, 1, 600)) as slot:
+                resp = client.converse(
+                    modelId=self._model_id,
+                    messages=[{
+                        "role": "user",
+                        "content": [
+                            {"image": {"format": "png", "source": {"bytes": img_bytes}}},
+                            {"text": _VISUAL_ONLY_PROMPT},
+                        ],
+                    }],
+                    inferenceConfig={"maxTokens": 600, "temperature": 0},
+                )
+                usage = resp.get("usage", {})
+                input_tokens = usage.get("inputTokens", 0)
+                output_tokens = usage.get("outputTokens", 0)
+                slot.record_usage(input_tokens, output_tokens)
             raw = resp["output"]["message"]["content"][0]["text"]
-            usage = resp.get("usage", {})
-            input_tokens = usage.get("inputTokens", 0)
-            output_tokens = usage.get("outputTokens", 0)
 
             parsed = self._parse_json(raw)
             if parsed:
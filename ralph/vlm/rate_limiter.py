@@ -0,0 +1,481 @@
+"""
+Bedrock 호출 속도 제한기.
+
+모든 Bedrock 호출(call_nova_visual, check_conditions_nova, NovaLiteHybridCaller,
+BedrockClaudeVLMCaller, VLMDocClassifier, dolphin의 _invoke_bedrock_anthropic_messages)은
+``bedrock_call(model_id, estimated_tokens)`` 컨텍스트 안에서 요청을 보낸다.
+
+- 예산: 모델별 RPM/TPM 토큰 버킷. 버킷 상태는 백엔드에 있으므로 dynamodb 백엔드를
+  쓰면 여러 컨테이너가 같은 예산을 나눠 쓴다. 호출이 끝나면 실제 토큰 사용량으로
+  TPM 버킷을 정산한다 (예외로 끝난 호출은 사용량 0으로 정산).
+- 동시성: 프로세스 내 모델별 동시 호출 한도를 AIMD로 조절한다. 성공하면 조금씩
+  (+1/한도) 늘리고, 스로틀을 받으면 절반으로 줄이며 공유 버킷도 비워 다른
+  레플리카도 잠시 멈추게 한다. 재시도도 같은 문을 지나므로 스로틀 폭주 때
+  재시도가 트래픽을 키우지 않는다.
+
+백엔드가 실패하면 제한 없이 호출한다 (fail-open).
+
+환경변수:
+    RALPH_BEDROCK_RATE_LIMIT        false면 비활성화 (기본 true)
+    RALPH_BEDROCK_RPM               모든 모델의 기본 분당 요청 수 (기본 0 = 제한 없음)
+    RALPH_BEDROCK_TPM               모든 모델의 기본 분당 토큰 수 (기본 0 = 제한 없음)
+    RALPH_BEDROCK_LIMITS            모델별 한도 JSON (예: {"us.amazon.nova-pro-v1:0": {"rpm": 100, "tpm": 200000}})
+    RALPH_BEDROCK_CONCURRENCY       모델별 초기 동시 호출 수 (기본 16)
+    RALPH_BEDROCK_MAX_CONCURRENCY   AIMD 상한 (기본 64)
+    RALPH_BEDROCK_MAX_WAIT_S        예산 대기 상한. 넘으면 그대로 호출 (기본 120)
+    RALPH_RATE_LIMIT_BACKEND        memory | dynamodb (기본 memory)
+    RALPH_RATE_LIMIT_TABLE          dynamodb 백엔드 테이블 (기본 MERRY_DDB_TABLE, pk/sk 스키마)
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Iterator, Protocol
+
+logger = logging.getLogger(__name__)
+
+# 이미지 한 장의 입력 토큰 추정치 (Nova/Claude 모두 1페이지 렌더링 기준 ~1.6k)
+IMAGE_TOKENS = 1600
+_THROTTLE_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceQuotaExceededException",
+    "ModelNotReadyException",
+}
+_THROTTLE_KEYWORDS = ("throttl", "too many requests", "rate exceeded", "model is overloaded")
+_DECREASE_COOLDOWN_S = 1.0
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """토큰 버킷: 최대 ``capacity``개, 초당 ``refill_per_s``개 충전."""
+    capacity: float
+    refill_per_s: float
+
+    @classmethod
+    def per_minute(cls, amount: float) -> "BucketSpec":
+        return cls(capacity=float(amount), refill_per_s=float(amount) / 60.0)
+
+
+Demands = dict[str, tuple[float, BucketSpec]]
+
+
+class RateLimitBackend(Protocol):
+    """버킷 상태 저장소. ``key``는 모델 ID, 버킷 이름은 "rpm" / "tpm"."""
+
+    def try_acquire(self, key: str, demands: Demands) -> float:
+        """모든 버킷에서 한꺼번에 차감. 성공하면 0, 부족하면 기다릴 초."""
+
+    def adjust(self, key: str, bucket: str, delta: float, spec: BucketSpec) -> None:
+        """사후 정산 (양수 = 환불, 음수 = 추가 차감)."""
+
+    def drain(self, key: str, specs: dict[str, BucketSpec]) -> None:
+        """스로틀 신호: 버킷을 비워 모든 사용자가 충전을 기다리게 한다."""
+
+
+def _shortfall_wait(tokens: float, amount: float, spec: BucketSpec) -> float:
+    if tokens + 1e-6 >= amount:  # 충전 계산의 부동소수점 오차는 허용
+        return 0.0
+    if spec.refill_per_s <= 0:
+        return float("inf")
+    return (amount - tokens) / spec.refill_per_s
+
+
+class InMemoryRateBackend:
+    """프로세스 내 버킷 (테스트 · 단일 컨테이너용)."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple[str, str], list[float]] = {}  # [tokens, updated_at]
+
+    def _refilled(self, key: str, name: str, spec: BucketSpec, now: float) -> list[float]:
+        state = self._buckets.get((key, name))
+        if state is None:
+            state = [spec.capacity, now]
+            self._buckets[(key, name)] = state
+        state[0] = min(spec.capacity, state[0] + (now - state[1]) * spec.refill_per_s)
+        state[1] = now
+        return state
+
+    def try_acquire(self, key: str, demands: Demands) -> float:
+        with self._lock:
+            now = self._clock()
+            states = {name: self._refilled(key, name, spec, now) for name, (_, spec) in demands.items()}
+            wait = max(
+                (_shortfall_wait(states[name][0], amount, spec) for name, (amount, spec) in demands.items()),
+                default=0.0,
+            )
+            if wait > 0:
+                return wait
+            for name, (amount, _) in demands.items():
+                states[name][0] -= amount
+            return 0.0
+
+    def adjust(self, key: str, bucket: str, delta: float, spec: BucketSpec) -> None:
+        with self._lock:
+            state = self._refilled(key, bucket, spec, self._clock())
+            state[0] = min(spec.capacity, state[0] + delta)
+
+    def drain(self, key: str, specs: dict[str, BucketSpec]) -> None:
+        with self._lock:
+            now = self._clock()
+            for name, spec in specs.items():
+                self._refilled(key, name, spec, now)[0] = 0.0
+
+
+class DynamoDbRateBackend:
+    """
+    DynamoDB 한 행(pk=RATELIMIT, sk=BUCKET#<model>)에 모델의 버킷들을 둔다.
+
+    차감은 읽기 → 충전 계산 → ``version`` 조건부 쓰기로 원자적으로 처리하고,
+    경합으로 조건이 깨지면 다시 읽는다. 레플리카 간 시계는 벽시계를 쓴다.
+    """
+
+    _PK = "RATELIMIT"
+    _MAX_CAS_ATTEMPTS = 5
+
+    def __init__(self, table: Any, clock: Callable[[], float] = time.time) -> None:
+        self._table = table
+        self._clock = clock
+
+    @classmethod
+    def from_env(cls) -> "DynamoDbRateBackend":
+        import boto3
+
+        table_name = os.getenv("RALPH_RATE_LIMIT_TABLE") or os.getenv("MERRY_DDB_TABLE", "")
+        if not table_name:
+            raise RuntimeError("RALPH_RATE_LIMIT_TABLE 또는 MERRY_DDB_TABLE이 필요합니다")
+        region = os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+        return cls(boto3.resource("dynamodb", region_name=region).Table(table_name))
+
+    def _key(self, key: str) -> dict[str, str]:
+        return {"pk": self._PK, "sk": f"BUCKET#{key}"}
+
+    def try_acquire(self, key: str, demands: Demands) -> float:
+        conditional_failed = self._table.meta.client.exceptions.ConditionalCheckFailedException
+        for _ in range(self._MAX_CAS_ATTEMPTS):
+            item = self._table.get_item(Key=self._key(key), ConsistentRead=True).get("Item") or {}
+            now = self._clock()
+            updated_at = float(item.get("updated_at", now))
+            tokens: dict[str, float] = {}
+            wait = 0.0
+            for name, (amount, spec) in demands.items():
+                stored = item.get(f"b_{name}")
+                current = spec.capacity if stored is None else float(stored) + (now - updated_at) * spec.refill_per_s
+                tokens[name] = min(spec.capacity, current)
+                wait = max(wait, _shortfall_wait(tokens[name], amount, spec))
+            if wait > 0:
+                return wait
+
+            names = {f"#b{i}": f"b_{name}" for i, name in enumerate(demands)}
+            names["#ver"] = "version"  # 예약어
+            values: dict[str, Any] = {
+                f":b{i}": Decimal(str(round(tokens[name] - amount, 3)))
+                for i, (name, (amount, _)) in enumerate(demands.items())
+            }
+            values[":now"] = Decimal(str(round(now, 3)))
+            values[":one"] = 1
+            assignments = ", ".join(f"#b{i} = :b{i}" for i in range(len(demands)))
+            if "version" in item:
+                condition = "#ver = :v"
+                values[":v"] = item["version"]
+            else:
+                condition = "attribute_not_exists(pk)"
+            try:
+                self._table.update_item(
+                    Key=self._key(key),
+                    UpdateExpression=f"SET {assignments}, updated_at = :now ADD #ver :one",
+                    ConditionExpression=condition,
+                    ExpressionAttributeNames=names,
+                    ExpressionAttributeValues=values,
+                )
+                return 0.0
+            except conditional_failed:
+                continue
+        return 0.05  # 경합이 심하면 잠깐 물러났다 다시 시도
+
+    def adjust(self, key: str, bucket: str, delta: float, spec: BucketSpec) -> None:
+        conditional_failed = self._table.meta.client.exceptions.ConditionalCheckFailedException
+        try:
+            self._table.update_item(
+                Key=self._key(key),
+                UpdateExpression="ADD #b :d, #ver :one",
+                ConditionExpression="attribute_exists(pk)",
+                ExpressionAttributeNames={"#b": f"b_{bucket}", "#ver": "version"},
+                ExpressionAttributeValues={":d": Decimal(str(round(delta, 3))), ":one": 1},
+            )
+        except conditional_failed:
+            pass  # 아직 버킷이 없으면 정산할 것도 없다
+
+    def drain(self, key: str, specs: dict[str, BucketSpec]) -> None:
+        if not specs:
+            return
+        names = {f"#b{i}": f"b_{name}" for i, name in enumerate(specs)}
+        names["#ver"] = "version"
+        assignments = ", ".join(f"#b{i} = :zero" for i in range(len(specs)))
+        self._table.update_item(
+            Key=self._key(key),
+            UpdateExpression=f"SET {assignments}, updated_at = :now ADD #ver :one",
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues={":zero": 0, ":now": Decimal(str(round(self._clock(), 3))), ":one": 1},
+        )
+
+
+def is_throttle(exc: BaseException) -> bool:
+    """Bedrock 스로틀 / 용량 부족 예외인지."""
+    response = getattr(exc, "response", None)
+    if isinstance(response, dict):
+        error = response.get("Error") or {}
+        if error.get("Code") in _THROTTLE_CODES:
+            return True
+        if (response.get("ResponseMetadata") or {}).get("HTTPStatusCode") == 429:
+            return True
+    if type(exc).__name__ in _THROTTLE_CODES:
+        return True
+    message = str(exc).lower()
+    return any(k in message for k in _THROTTLE_KEYWORDS)
+
+
+def estimate_tokens(text: str = "", images: int = 0, max_tokens: int = 0) -> int:
+    """TPM 사전 차감용 추정치. 한글 기준 1자 ≈ 1토큰으로 넉넉하게 잡는다."""
+    return len(text) + images * IMAGE_TOKENS + max_tokens
+
+
+class CallSlot:
+    """``bedrock_call`` 안에서 응답의 실제 토큰 사용량을 알려 정산에 쓴다."""
+
+    __slots__ = ("estimated_tokens", "used_tokens")
+
+    def __init__(self, estimated_tokens: int) -> None:
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens: int | None = None
+
+    def record_usage(self, input_tokens: int = 0, output_tokens: int = 0) -> None:
+        self.used_tokens = int(input_tokens or 0) + int(output_tokens or 0)
+
+
+class _Concurrency:
+    """모델 하나의 AIMD 동시성 한도."""
+
+    def __init__(self, initial: int, maximum: int) -> None:
+        self.limit = float(max(1, min(initial, maximum)))
+        self.maximum = float(maximum)
+        self.active = 0
+        self.last_decrease = float("-inf")
+        self.cond = threading.Condition()
+
+
+class BedrockRateLimiter:
+    """모델별 RPM/TPM 버킷(공유 백엔드) + 프로세스 내 AIMD 동시성 한도."""
+
+    def __init__(
+        self,
+        backend: RateLimitBackend | None = None,
+        *,
+        limits: dict[str, dict[str, float]] | None = None,
+        default_rpm: float = 0,
+        default_tpm: float = 0,
+        initial_concurrency: int = 16,
+        max_concurrency: int = 64,
+        max_wait_s: float = 120.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._backend = backend or InMemoryRateBackend(clock)
+        self._limits = limits or {}
+        self._default = {"rpm": default_rpm, "tpm": default_tpm}
+        self._initial_concurrency = initial_concurrency
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_wait_s = max_wait_s
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._models: dict[str, _Concurrency] = {}
+        self._stats: dict[str, int] = {"calls": 0, "throttles": 0, "budget_waits": 0, "backend_errors": 0}
+
+    @classmethod
+    def from_env(cls) -> "BedrockRateLimiter":
+        try:
+            limits = json.loads(os.getenv("RALPH_BEDROCK_LIMITS", "") or "{}")
+        except ValueError:
+            logger.warning("RALPH_BEDROCK_LIMITS JSON 파싱 실패 — 기본 한도 사용")
+            limits = {}
+        backend: RateLimitBackend | None = None
+        if os.getenv("RALPH_RATE_LIMIT_BACKEND", "memory").lower() == "dynamodb":
+            backend = DynamoDbRateBackend.from_env()
+        return cls(
+            backend,
+            limits=limits if isinstance(limits, dict) else {},
+            default_rpm=float(os.getenv("RALPH_BEDROCK_RPM", "0") or 0),
+            default_tpm=float(os.getenv("RALPH_BEDROCK_TPM", "0") or 0),
+            initial_concurrency=int(os.getenv("RALPH_BEDROCK_CONCURRENCY", "16")),
+            max_concurrency=int(os.getenv("RALPH_BEDROCK_MAX_CONCURRENCY", "64")),
+            max_wait_s=float(os.getenv("RALPH_BEDROCK_MAX_WAIT_S", "120")),
+        )
+
+    def bucket_specs(self, model_id: str) -> dict[str, BucketSpec]:
+        configured = self._limits.get(model_id) or {}
+        specs: dict[str, BucketSpec] = {}
+        for name in ("rpm", "tpm"):
+            amount = float(configured.get(name, self._default[name]) or 0)
+            if amount > 0:
+                specs[name] = BucketSpec.per_minute(amount)
+        return specs
+
+    def concurrency_limit(self, model_id: str) -> int:
+        return int(self._concurrency(model_id).limit)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out: dict[str, Any] = dict(self._stats)
+            out["concurrency"] = {model: int(state.limit) for model, state in self._models.items()}
+        return out
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _concurrency(self, model_id: str) -> _Concurrency:
+        with self._lock:
+            state = self._models.get(model_id)
+            if state is None:
+                state = _Concurrency(self._initial_concurrency, self._max_concurrency)
+                self._models[model_id] = state
+            return state
+
+    def _wait_for_budget(self, model_id: str, demands: Demands, deadline: float) -> None:
+        while True:
+            try:
+                wait = self._backend.try_acquire(model_id, demands)
+            except Exception as e:
+                self._count("backend_errors")
+                logger.warning("Bedrock rate limit backend 오류 — 제한 없이 호출: %s", e)
+                return
+            if wait <= 0:
+                return
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                logger.warning("Bedrock 예산 대기 %.0fs 초과 (%s) — 그대로 호출", self._max_wait_s, model_id)
+                return
+            self._count("budget_waits")
+            self._sleep(min(wait, remaining, 1.0))
+
+    def _enter(self, state: _Concurrency, deadline: float) -> None:
+        with state.cond:
+            while state.active >= int(state.limit):
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    break
+                state.cond.wait(min(remaining, 1.0))
+            state.active += 1
+
+    def _on_success(self, state: _Concurrency) -> None:
+        with state.cond:
+            state.limit = min(state.maximum, state.limit + 1.0 / state.limit)
+            state.cond.notify()
+
+    def _on_throttle(self, model_id: str, state: _Concurrency, specs: dict[str, BucketSpec]) -> None:
+        self._count("throttles")
+        with state.cond:
+            now = self._clock()
+            if now - state.last_decrease < _DECREASE_COOLDOWN_S:
+                return  # 같은 스로틀 폭주에서 여러 번 반으로 줄이지 않는다
+            state.last_decrease = now
+            state.limit = max(1.0, state.limit / 2)
+        logger.info("Bedrock 스로틀 (%s): 동시성 한도 → %d", model_id, int(state.limit))
+        try:
+            self._backend.drain(model_id, specs)
+        except Exception as e:
+            self._count("backend_errors")
+            logger.debug("Bedrock rate limit drain 실패: %s", e)
+
+    def _settle(self, model_id: str, slot: CallSlot, specs: dict[str, BucketSpec]) -> None:
+        if "tpm" not in specs or slot.used_tokens is None:
+            return
+        delta = slot.estimated_tokens - slot.used_tokens
+        if delta == 0:
+            return
+        try:
+            self._backend.adjust(model_id, "tpm", delta, specs["tpm"])
+        except Exception as e:
+            self._count("backend_errors")
+            logger.debug("Bedrock rate limit 정산 실패: %s", e)
+
+    @contextmanager
+    def call(self, model_id: str, estimated_tokens: int = 0) -> Iterator[CallSlot]:
+        """예산과 동시성 슬롯을 잡고 Bedrock 요청 하나를 감싼다."""
+        self._count("calls")
+        specs = self.bucket_specs(model_id)
+        deadline = self._clock() + self._max_wait_s
+        demands: Demands = {}
+        if "rpm" in specs:
+            demands["rpm"] = (1.0, specs["rpm"])
+        if "tpm" in specs:
+            demands["tpm"] = (float(min(estimated_tokens, specs["tpm"].capacity)), specs["tpm"])
+        if demands:
+            self._wait_for_budget(model_id, demands, deadline)
+
+        state = self._concurrency(model_id)
+        self._enter(state, deadline)
+        slot = CallSlot(estimated_tokens)
+        try:
+            yield slot
+        except BaseException as e:
+            # 실패한 호출(스로틀 포함)은 응답이 없으므로 사용량 0으로 정산해 선차감분을 돌려준다.
+            # 스로틀 신호의 drain은 그 뒤에 적용되어 버킷을 비운다.
+            if slot.used_tokens is None:
+                slot.used_tokens = 0
+            self._settle(model_id, slot, specs)
+            if is_throttle(e):
+                self._on_throttle(model_id, state, specs)
+            raise
+        else:
+            self._on_success(state)
+            self._settle(model_id, slot, specs)
+        finally:
+            with state.cond:
+                state.active -= 1
+                state.cond.notify()
+
+
+class _DisabledLimiter:
+    @contextmanager
+    def call(self, model_id: str, estimated_tokens: int = 0) -> Iterator[CallSlot]:
+        yield CallSlot(estimated_tokens)
+
+
+_limiter: BedrockRateLimiter | _DisabledLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> BedrockRateLimiter | _DisabledLimiter:
+    """프로세스 전역 limiter (환경변수로 한 번 구성)."""
+    global _limiter
+    if _limiter is not None:
+        return _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            if os.getenv("RALPH_BEDROCK_RATE_LIMIT", "true").lower() == "false":
+                _limiter = _DisabledLimiter()
+            else:
+                _limiter = BedrockRateLimiter.from_env()
+    return _limiter
+
+
+def set_rate_limiter(limiter: BedrockRateLimiter | None) -> None:
+    """전역 limiter 교체 (테스트용). None이면 다음 호출 때 환경변수로 다시 구성."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = limiter
+
+
+def bedrock_call(model_id: str, estimated_tokens: int = 0):
+    """``with bedrock_call(model_id, tokens) as slot:`` — 모든 Bedrock 호출 지점의 관문."""
+    return get_rate_limiter().call(model_id, estimated_tokens)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for condition_checker.extract_condition_facts.
+
+Compares the anchored single-pass engine against the previous implementation
+(one re.search per keyword + full splitlines() scans) on the text fixtures in
+tests/test_condition_checker.py. Each fixture is also embedded in a long
+synthetic document, since real uploads are tens of pages of extracted text.
+
+Usage:
+    python scripts/bench_condition_facts.py
+    python scripts/bench_condition_facts.py --pad-lines 5000 --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+for path in (PROJECT_ROOT, PROJECT_ROOT / "tests"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from ralph import condition_checker as cc  # noqa: E402
+from _condition_facts_reference import (  # noqa: E402
+    FIXTURE_FILE,
+    legacy_extract_condition_facts,
+    load_fixture_texts,
+    pad_fixture,
+)
+
+REFERENCE_DATE = date(2026, 3, 7)
+
+
+def _time(fn: Callable[[str, date], dict], docs: List[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc, REFERENCE_DATE)
+    return (time.perf_counter() - started) / (repeat * len(docs))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pad-lines", type=int, default=2000, help="filler lines around each fixture")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    fixtures = load_fixture_texts()
+    suites = {
+        "fixtures": fixtures,
+        f"padded x{args.pad_lines}": [pad_fixture(text, args.pad_lines) for text in fixtures],
+    }
+
+    print(f"{len(fixtures)} fixtures from {FIXTURE_FILE.relative_to(PROJECT_ROOT)}")
+    print(f"{'suite':<18} {'legacy ms':>10} {'anchored ms':>12} {'speedup':>8}")
+    for name, docs in suites.items():
+        mismatched = [
+            doc[:40] for doc in docs
+            if legacy_extract_condition_facts(doc, REFERENCE_DATE) != cc.extract_condition_facts(doc, REFERENCE_DATE)
+        ]
+        if mismatched:
+            print(f"output mismatch in {name}: {mismatched}", file=sys.stderr)
+            return 1
+        legacy = _time(legacy_extract_condition_facts, docs, args.repeat)
+        anchored = _time(cc.extract_condition_facts, docs, args.repeat)
+        print(f"{name:<18} {legacy * 1000:>10.3f} {anchored * 1000:>12.3f} {legacy / anchored:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
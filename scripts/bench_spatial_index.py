@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ralph.layout.spatial.SpatialIndex.
+
+Builds synthetic dense pages (default: 1,000 text blocks and 50 small tables,
+the shape of a financial-statement page) and compares the grid index against
+the nested BBox loops it replaced:
+
+- table containment: which blocks fall inside each table (zone classification)
+- overlap window: blocks overlapping a random query rectangle
+- nearest: closest block to a random point
+
+Every query is checked against the brute-force answer before timing.
+
+Usage:
+    python scripts/bench_spatial_index.py
+    python scripts/bench_spatial_index.py --blocks 5000 --tables 200 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ralph.layout.models import BBox  # noqa: E402
+from ralph.layout.spatial import SpatialIndex  # noqa: E402
+
+PAGE_W, PAGE_H = 595.0, 842.0
+
+
+def synthetic_page(blocks: int, tables: int, seed: int = 7) -> tuple[List[BBox], List[BBox]]:
+    """Small text boxes scattered over an A4 page plus small table regions."""
+    rng = random.Random(seed)
+    block_boxes = []
+    for _ in range(blocks):
+        x0, y0 = rng.uniform(20, PAGE_W - 80), rng.uniform(20, PAGE_H - 20)
+        block_boxes.append(BBox(x0, y0, x0 + rng.uniform(10, 70), y0 + rng.uniform(6, 14)))
+    table_boxes = []
+    for _ in range(tables):
+        x0, y0 = rng.uniform(20, PAGE_W - 160), rng.uniform(20, PAGE_H - 90)
+        table_boxes.append(BBox(x0, y0, x0 + rng.uniform(60, 140), y0 + rng.uniform(30, 70)))
+    return block_boxes, table_boxes
+
+
+def brute_contained(blocks: List[BBox], tables: List[BBox]) -> List[List[int]]:
+    return [[i for i, b in enumerate(blocks) if t.contains(b, tolerance=5.0)] for t in tables]
+
+
+def index_contained(index: SpatialIndex, tables: List[BBox]) -> List[List[int]]:
+    return [index.contained_in(t, tolerance=5.0) for t in tables]
+
+
+def brute_overlapping(blocks: List[BBox], queries: List[BBox]) -> List[List[int]]:
+    return [[i for i, b in enumerate(blocks) if b.overlap(q) is not None] for q in queries]
+
+
+def brute_nearest(blocks: List[BBox], queries: List[BBox]) -> List[float]:
+    return [min(q.distance_to(b) for b in blocks) for q in queries]
+
+
+def _time(fn: Callable[[], object], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - started) / repeat
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--blocks", type=int, default=1000)
+    parser.add_argument("--tables", type=int, default=50)
+    parser.add_argument("--queries", type=int, default=200, help="overlap/nearest queries per run")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    blocks, tables = synthetic_page(args.blocks, args.tables)
+    rng = random.Random(11)
+    windows = []
+    points = []
+    for _ in range(args.queries):
+        x0, y0 = rng.uniform(0, PAGE_W - 100), rng.uniform(0, PAGE_H - 60)
+        windows.append(BBox(x0, y0, x0 + 100, y0 + 60))
+        px, py = rng.uniform(0, PAGE_W), rng.uniform(0, PAGE_H)
+        points.append(BBox(px, py, px, py))
+
+    index = SpatialIndex(blocks)
+    if index_contained(index, tables) != brute_contained(blocks, tables):
+        print("containment mismatch", file=sys.stderr)
+        return 1
+    if [index.overlapping(q) for q in windows] != brute_overlapping(blocks, windows):
+        print("overlap mismatch", file=sys.stderr)
+        return 1
+    nearest = [q.distance_to(blocks[index.nearest(q)[0]]) for q in points]
+    if any(not math.isclose(a, b) for a, b in zip(nearest, brute_nearest(blocks, points))):
+        print("nearest mismatch", file=sys.stderr)
+        return 1
+
+    rows = [
+        ("build index", None, lambda: SpatialIndex(blocks)),
+        (f"contains x{args.tables}", lambda: brute_contained(blocks, tables),
+         lambda: index_contained(SpatialIndex(blocks), tables)),
+        (f"overlaps x{args.queries}", lambda: brute_overlapping(blocks, windows),
+         lambda: [index.overlapping(q) for q in windows]),
+        (f"nearest x{args.queries}", lambda: brute_nearest(blocks, points),
+         lambda: [index.nearest(q) for q in points]),
+    ]
+
+    print(f"synthetic page: {args.blocks} blocks, {args.tables} tables")
+    print(f"{'query':<16} {'nested ms':>10} {'index ms':>10} {'speedup':>8}")
+    for name, brute, indexed in rows:
+        index_ms = _time(indexed, args.repeat) * 1000
+        if brute is None:
+            print(f"{name:<16} {'':>10} {index_ms:>10.3f}")
+            continue
+        brute_ms = _time(brute, args.repeat) * 1000
+        print(f"{name:<16} {brute_ms:>10.3f} {index_ms:>10.3f} {brute_ms / index_ms:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+"""
+Nova 페이지 병렬 호출 벤치마크 (stub 클라이언트, AWS 호출 없음).
+
+실행:
+    python scripts/benchmark_nova_pages.py [--pages 5] [--latency-ms 800] [--concurrency 1 4 8]
+
+동작:
+  1. N페이지 합성 PDF 생성 (temp/benchmark_nova/)
+  2. converse()가 고정 지연 후 응답하는 stub 클라이언트를 풀에 주입
+  3. 동시성별로 NovaLiteHybridCaller.extract() 시간 측정
+  4. 페이지 순서 / 토큰 합계가 동시성과 무관하게 동일한지 검증
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import fitz
+
+from ralph.vlm.client_pool import clear_bedrock_clients
+from ralph.vlm.nova_caller import NovaLiteHybridCaller
+
+TEMP_DIR = PROJECT_ROOT / "temp" / "benchmark_nova"
+
+
+class _StubBedrock:
+    """고정 지연 converse() + 동시 호출 수 관측."""
+
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+
+    def converse(self, **kwargs):
+        with self._lock:
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        try:
+            time.sleep(self._latency_s)
+        finally:
+            with self._lock:
+                self._active -= 1
+        body = {"visuals": [{"type": "chart", "description": "stub", "key_values": []}],
+                "layout_summary": "stub"}
+        return {
+            "output": {"message": {"content": [{"text": json.dumps(body)}]}},
+            "usage": {"inputTokens": 100, "outputTokens": 20},
+        }
+
+
+def _make_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Benchmark slide {i + 1}", fontsize=24)
+    doc.save(path)
+    doc.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--latency-ms", type=int, default=800)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    pdf_path = TEMP_DIR / f"slides_{args.pages}p.pdf"
+    _make_pdf(pdf_path, args.pages)
+
+    baseline: dict | None = None
+    print(f"{'concurrency':>11}  {'elapsed_s':>9}  {'peak':>4}  {'speedup':>7}")
+    for concurrency in args.concurrency:
+        stub = _StubBedrock(args.latency_ms / 1000)
+        clear_bedrock_clients()
+        with patch("boto3.client", return_value=stub):
+            caller = NovaLiteHybridCaller(region="bench", max_concurrency=concurrency)
+            t0 = time.perf_counter()
+            result = caller.extract(str(pdf_path), "investment_review", max_pages=args.pages)
+            elapsed = time.perf_counter() - t0
+        clear_bedrock_clients()
+
+        if not result.success:
+            raise SystemExit(f"extract failed: {result.error}")
+        pages = [p["page"] for p in result.data["pages"]]
+        if pages != list(range(1, args.pages + 1)):
+            raise SystemExit(f"page order mismatch: {pages}")
+        if baseline is None:
+            baseline = {"elapsed": elapsed, "usage": result.usage}
+        elif result.usage != baseline["usage"]:
+            raise SystemExit(f"usage mismatch: {result.usage} != {baseline['usage']}")
+
+        speedup = baseline["elapsed"] / elapsed if elapsed > 0 else 0.0
+        print(f"{concurrency:>11}  {elapsed:>9.2f}  {stub.peak:>4}  {speedup:>6.1f}x")
+
+    print(f"usage: {baseline['usage'] if baseline else {}}")
+
+
+if __name__ == "__main__":
+    main()
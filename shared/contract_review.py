@@ -13,9 +13,14 @@ import base64
 import io
 import json
 import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from collections import Counter
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 from shared.logging_config import get_logger
 
@@ -182,6 +187,18 @@ OCR_FAST_LANG = "kor+eng"
 OCR_MIN_CHARS_PER_PAGE = 200
 OCR_SINGLE_HANGUL_RATIO_THRESHOLD = 0.35
 OCR_SYMBOL_RATIO_THRESHOLD = 0.02
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, "")))
+    except ValueError:
+        return default
+
+
+# 로컬 tesseract는 페이지별 프로세스 풀, Claude OCR/정제는 스레드 풀에서 동시 실행 (1 = 순차)
+OCR_LOCAL_WORKERS = _env_int("CONTRACT_OCR_LOCAL_WORKERS", min(4, os.cpu_count() or 1))
+OCR_CLAUDE_CONCURRENCY = _env_int("CONTRACT_OCR_CLAUDE_CONCURRENCY", 4)
 OCR_PROMPT = (
     "You are a precise OCR engine. Extract all visible text from the image. "
     "Preserve reading order. Output plain text only with line breaks. "
@@ -854,6 +871,59 @@ def _local_ocr_from_png(png_bytes: bytes, lang: str) -> str:
         return pytesseract.image_to_string(img, lang=lang, config="--oem 1 --psm 6")
 
 
+def _init_local_ocr_worker() -> None:
+    # 페이지 단위로 프로세스를 나눴으므로 tesseract 내부 OpenMP 스레드는 1개로 제한 (과다 구독 방지)
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+def _local_ocr_pdf_page(path: str, page_index: int, dpi: int, lang: str) -> str:
+    """프로세스 풀 작업: 자식에서 페이지를 직접 렌더링해 이미지 바이트를 주고받지 않는다."""
+    with fitz.open(path) as doc:
+        png_bytes = _render_pdf_page_to_png(doc, page_index, dpi)
+    return _local_ocr_from_png(png_bytes, lang=lang)
+
+
+_local_ocr_pool: Optional[ProcessPoolExecutor] = None
+_local_ocr_pool_lock = threading.Lock()
+
+
+def _local_ocr_executor() -> ProcessPoolExecutor:
+    """프로세스 공용 OCR 풀 (OCR_LOCAL_WORKERS개). 문서마다 spawn 비용을 내지 않고,
+    동시에 처리되는 여러 문서의 tesseract 프로세스 총수도 이 크기로 제한된다."""
+    global _local_ocr_pool
+    with _local_ocr_pool_lock:
+        if _local_ocr_pool is None:
+            # fork는 호출 스레드의 락/클라이언트 상태를 복제하므로 spawn으로 깨끗하게 시작
+            _local_ocr_pool = ProcessPoolExecutor(
+                max_workers=OCR_LOCAL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_local_ocr_worker,
+            )
+        return _local_ocr_pool
+
+
+def _reset_local_ocr_executor(pool: ProcessPoolExecutor) -> None:
+    global _local_ocr_pool
+    with _local_ocr_pool_lock:
+        if _local_ocr_pool is pool:
+            _local_ocr_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _collect_in_order(
+    futures: Dict[Future, int],
+    results: List[Optional[str]],
+    progress_callback: Optional[Callable[[int, int, str], None]],
+    message: str,
+) -> None:
+    """완료된 future 결과를 원래 위치에 채우고 완료 개수로 진행 상황을 알린다."""
+    for future in wait(futures, return_when=FIRST_COMPLETED).done:
+        pos = futures.pop(future)
+        results[pos] = future.result()
+        if progress_callback:
+            progress_callback(len(results) - results.count(None), len(results), message)
+
+
 def _ocr_pdf_fast_local(
     path: Path,
     dpi: int = OCR_FAST_DPI,
@@ -866,18 +936,41 @@ def _ocr_pdf_fast_local(
     if not Image or not pytesseract:
         raise ImportError("로컬 OCR 라이브러리가 필요합니다.")
 
-    segments: List[Dict[str, str]] = []
     with fitz.open(path) as doc:
         pages = page_indices or list(range(doc.page_count))
-        if progress_callback:
-            progress_callback(0, len(pages), "로컬 OCR 시작")
-        for idx, page_index in enumerate(pages, start=1):
-            png_bytes = _render_pdf_page_to_png(doc, page_index, dpi)
-            text = _local_ocr_from_png(png_bytes, lang=lang)
-            segments.append({"source": f"p{page_index + 1}", "text": text})
-            if progress_callback:
-                progress_callback(idx, len(pages), "로컬 OCR 진행 중")
-    return segments
+    if progress_callback:
+        progress_callback(0, len(pages), "로컬 OCR 시작")
+
+    texts: List[Optional[str]] = [None] * len(pages)
+    if OCR_LOCAL_WORKERS > 1 and len(pages) > 1:
+        executor = _local_ocr_executor()
+        futures: Dict[Future, int] = {}
+        try:
+            for pos, page_index in enumerate(pages):
+                futures[executor.submit(_local_ocr_pdf_page, str(path), page_index, dpi, lang)] = pos
+            while futures:
+                _collect_in_order(futures, texts, progress_callback, "로컬 OCR 진행 중")
+        except BrokenProcessPool as exc:
+            logger.warning("로컬 OCR 프로세스 풀 손상 — 풀 재생성, 남은 페이지 순차 처리: %s", exc)
+            _reset_local_ocr_executor(executor)
+        finally:
+            # 공용 풀이므로 종료하지 않고 이 문서의 남은 작업만 취소
+            for future in futures:
+                future.cancel()
+
+    remaining = [pos for pos, text in enumerate(texts) if text is None]
+    if remaining:
+        with fitz.open(path) as doc:
+            for pos in remaining:
+                png_bytes = _render_pdf_page_to_png(doc, pages[pos], dpi)
+                texts[pos] = _local_ocr_from_png(png_bytes, lang=lang)
+                if progress_callback:
+                    progress_callback(len(pages) - texts.count(None), len(pages), "로컬 OCR 진행 중")
+
+    return [
+        {"source": f"p{page_index + 1}", "text": text}
+        for page_index, text in zip(pages, texts)
+    ]
 
 
 def _extract_claude_text(response: object) -> str:
@@ -889,17 +982,21 @@ def _extract_claude_text(response: object) -> str:
     return "\n".join(parts).strip()
 
 
-def _refine_ocr_text_with_claude(
-    text: str,
-    api_key: str,
-    model: str = OCR_DEFAULT_MODEL,
-) -> str:
+def _claude_client(api_key: str) -> "Anthropic":
     if not Anthropic:
         raise ImportError("anthropic SDK가 필요합니다.")
     if not api_key:
         raise ValueError("Claude API 키가 필요합니다.")
+    return Anthropic(api_key=api_key)
 
-    client = Anthropic(api_key=api_key)
+
+def _refine_ocr_text_with_claude(
+    text: str,
+    api_key: str,
+    model: str = OCR_DEFAULT_MODEL,
+    client: Optional["Anthropic"] = None,
+) -> str:
+    client = client or _claude_client(api_key)
     response = client.messages.create(
         model=model,
         max_tokens=2000,
@@ -914,6 +1011,64 @@ def _refine_ocr_text_with_claude(
     return _extract_claude_text(response)
 
 
+def _refine_ocr_segments_with_claude(
+    segments: Sequence[Dict[str, str]],
+    api_key: str,
+    model: str = OCR_DEFAULT_MODEL,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+    client: Optional["Anthropic"] = None,
+    concurrency: Optional[int] = None,
+) -> tuple[List[Dict[str, str]], str]:
+    """세그먼트별 정제를 동시에 실행. 실패한 세그먼트는 원문을 유지하고 마지막 오류를 반환."""
+    try:
+        client = client or _claude_client(api_key)
+    except Exception as exc:
+        return list(segments), str(exc)
+    workers = max(1, min(OCR_CLAUDE_CONCURRENCY if concurrency is None else concurrency, len(segments)))
+    errors: List[str] = []
+
+    def _refine(seg: Dict[str, str]) -> Dict[str, str]:
+        try:
+            text = _refine_ocr_text_with_claude(seg.get("text", ""), api_key=api_key, model=model, client=client)
+        except Exception as exc:
+            errors.append(str(exc))
+            return seg
+        return {"source": seg.get("source"), "text": text}
+
+    refined: List[Optional[Dict[str, str]]] = [None] * len(segments)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-refine") as executor:
+        futures = {executor.submit(_refine, seg): pos for pos, seg in enumerate(segments)}
+        while futures:
+            _collect_in_order(futures, refined, progress_callback, "Claude 정제 중")
+    return list(refined), errors[-1] if errors else ""
+
+
+def _claude_ocr_png(client: "Anthropic", png_bytes: bytes, model: str) -> str:
+    encoded = base64.b64encode(png_bytes).decode("ascii")
+    response = client.messages.create(
+        model=model,
+        max_tokens=4000,
+        temperature=0,
+        messages=[
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": OCR_PROMPT},
+                    {
+                        "type": "image",
+                        "source": {
+                            "type": "base64",
+                            "media_type": "image/png",
+                            "data": encoded,
+                        },
+                    },
+                ],
+            }
+        ],
+    )
+    return _extract_claude_text(response)
+
+
 def _ocr_pdf_with_claude(
     path: Path,
     api_key: str,
@@ -921,49 +1076,39 @@ def _ocr_pdf_with_claude(
     dpi: int = OCR_DEFAULT_DPI,
     progress_callback: Optional[Callable[[int, int, str], None]] = None,
     page_indices: Optional[List[int]] = None,
+    client: Optional["Anthropic"] = None,
+    concurrency: Optional[int] = None,
 ) -> List[Dict[str, str]]:
     if not fitz:
         raise ImportError("PyMuPDF(fitz)가 필요합니다.")
-    if not Anthropic:
-        raise ImportError("anthropic SDK가 필요합니다.")
-    if not api_key:
-        raise ValueError("Claude API 키가 필요합니다.")
+    client = client or _claude_client(api_key)
 
-    client = Anthropic(api_key=api_key)
-    segments: List[Dict[str, str]] = []
     with fitz.open(path) as doc:
         pages = page_indices or list(range(doc.page_count))
+        workers = max(1, min(OCR_CLAUDE_CONCURRENCY if concurrency is None else concurrency, len(pages)))
         if progress_callback:
             progress_callback(0, len(pages), "OCR 시작")
-        for idx, page_index in enumerate(pages, start=1):
-            png_bytes = _render_pdf_page_to_png(doc, page_index, dpi)
-            encoded = base64.b64encode(png_bytes).decode("ascii")
-            response = client.messages.create(
-                model=model,
-                max_tokens=4000,
-                temperature=0,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {"type": "text", "text": OCR_PROMPT},
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": "image/png",
-                                    "data": encoded,
-                                },
-                            },
-                        ],
-                    }
-                ],
-            )
-            text = _extract_claude_text(response)
-            segments.append({"source": f"p{page_index + 1}", "text": text})
-            if progress_callback:
-                progress_callback(idx, len(pages), "OCR 진행 중")
-    return segments
+
+        # 렌더링은 이 스레드에서 순서대로 (PyMuPDF는 스레드 안전하지 않음), 요청은 workers개까지 동시에.
+        # 처리 중인 요청이 꽉 차면 다음 페이지 렌더링을 미뤄 메모리에 있는 PNG 수를 제한한다.
+        texts: List[Optional[str]] = [None] * len(pages)
+        futures: Dict[Future, int] = {}
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-claude")
+        try:
+            for pos, page_index in enumerate(pages):
+                if len(futures) >= workers:
+                    _collect_in_order(futures, texts, progress_callback, "OCR 진행 중")
+                png_bytes = _render_pdf_page_to_png(doc, page_index, dpi)
+                futures[executor.submit(_claude_ocr_png, client, png_bytes, model)] = pos
+            while futures:
+                _collect_in_order(futures, texts, progress_callback, "OCR 진행 중")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return [
+        {"source": f"p{page_index + 1}", "text": text}
+        for page_index, text in zip(pages, texts)
+    ]
 
 
 def load_document(
@@ -1008,21 +1153,12 @@ def load_document(
                             )
                             ocr_engine = "local"
                             if ocr_refine:
-                                refined_segments = []
-                                for idx, seg in enumerate(ocr_segments, start=1):
-                                    if progress_callback:
-                                        progress_callback(idx, len(ocr_segments), "Claude 정제 중")
-                                    try:
-                                        refined_text = _refine_ocr_text_with_claude(
-                                            seg.get("text", ""),
-                                            api_key=api_key,
-                                            model=ocr_refine_model,
-                                        )
-                                        refined_segments.append({"source": seg.get("source"), "text": refined_text})
-                                    except Exception as exc:
-                                        ocr_refine_error = str(exc)
-                                        refined_segments.append(seg)
-                                ocr_segments = refined_segments
+                                ocr_segments, ocr_refine_error = _refine_ocr_segments_with_claude(
+                                    ocr_segments,
+                                    api_key=api_key,
+                                    model=ocr_refine_model,
+                                    progress_callback=progress_callback,
+                                )
                                 ocr_refined = True
                                 ocr_engine = "local+claude"
                         else:
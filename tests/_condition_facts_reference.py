@@ -0,0 +1,154 @@
+"""
+Reference implementation for condition_checker.extract_condition_facts.
+
+The previous fact extractor (one re.search per keyword + full splitlines()
+scans), kept verbatim so the anchored single-pass engine can be checked for
+identical output. Shared by tests/test_condition_checker.py and
+scripts/bench_condition_facts.py.
+"""
+
+from __future__ import annotations
+
+import ast
+import re
+from datetime import date
+from pathlib import Path
+from typing import List, Optional
+
+from ralph import condition_checker as cc
+from ralph.utils.korean_text import normalize_date, normalize_text
+
+FIXTURE_FILE = Path(__file__).resolve().parent / "test_condition_checker.py"
+FILLER_LINE = "본 사업은 지역 기반 제조 혁신을 목표로 하며 2023년 기준 고용 인원은 12명입니다."
+
+
+# ── previous implementation (kept verbatim as the equivalence reference) ──
+
+def _legacy_company_name(text: str) -> Optional[str]:
+    for keyword in cc._COMPANY_KEYWORDS:
+        pattern = rf"{keyword}\s*[:：]?\s*([^\n()]+)"
+        match = re.search(pattern, text)
+        if not match:
+            continue
+        candidate = match.group(1).strip()
+        candidate = re.split(r"\s{2,}|[|/]", candidate)[0].strip()
+        candidate = candidate.rstrip(":：")
+        candidate = cc._normalize_company_name(candidate)
+        if candidate and len(candidate) <= 80 and cc._is_plausible_company_name(candidate):
+            return candidate
+
+    legal_form_pattern = re.compile(
+        r"((?:주식회사|유한회사)\s*[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40}|"
+        r"[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40}\s*(?:주식회사|유한회사)|"
+        r"(?:㈜|\(\s*주\s*\)|（\s*주\s*）)\s*[A-Za-z0-9가-힣][A-Za-z0-9가-힣&.,·ㆍ\-\s]{1,40})"
+    )
+    for line in text.splitlines()[:20]:
+        normalized_line = normalize_text(line).strip()
+        if not normalized_line:
+            continue
+        match = legal_form_pattern.search(normalized_line)
+        if not match:
+            continue
+        candidate = cc._normalize_company_name(match.group(1))
+        if candidate and cc._is_plausible_company_name(candidate) and cc._company_group_key(candidate):
+            return candidate
+    return None
+
+
+def _legacy_establishment_date(text: str) -> Optional[str]:
+    for keyword in cc._ESTABLISHMENT_KEYWORDS:
+        pattern = (
+            rf"{keyword}\s*[:：]?\s*"
+            r"([0-9]{4}\s*년\s*[0-9]{1,2}\s*월\s*[0-9]{1,2}\s*일?|"
+            r"[0-9]{4}[.\-/][0-9]{1,2}[.\-/][0-9]{1,2})"
+        )
+        match = re.search(pattern, text)
+        if match:
+            normalized = normalize_date(match.group(1))
+            if normalized:
+                return normalized
+
+    for line in text.splitlines():
+        if not any(keyword in line for keyword in cc._ESTABLISHMENT_KEYWORDS):
+            continue
+        normalized = normalize_date(line)
+        if normalized:
+            return normalized
+    return None
+
+
+def _legacy_revenue_candidates(text: str) -> List[dict]:
+    candidates: List[dict] = []
+    amount_pattern = re.compile(
+        rf"([0-9][0-9,]*(?:\.\d+)?)\s*({'|'.join(cc._AMOUNT_UNITS)})?"
+    )
+
+    for line in text.splitlines():
+        normalized_line = line.strip()
+        if not normalized_line or not any(keyword in normalized_line for keyword in cc._REVENUE_KEYWORDS):
+            continue
+        year_match = re.search(r"(20\d{2})", normalized_line)
+        year = cc._coerce_year(year_match.group(1) if year_match else None)
+        for match in amount_pattern.finditer(normalized_line):
+            amount = cc._parse_amount_value(match.group(1), match.group(2))
+            if amount is None:
+                continue
+            candidates.append({
+                "amount": amount,
+                "display": cc._format_amount_krw(amount),
+                "year": year,
+                "snippet": normalized_line[:160],
+            })
+
+    deduped: List[dict] = []
+    seen: set = set()
+    for candidate in candidates:
+        key = (candidate["amount"], candidate.get("year"), candidate["snippet"])
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(candidate)
+    return deduped[:8]
+
+
+def legacy_extract_condition_facts(text: str, reference_date: Optional[date] = None) -> dict:
+    normalized = normalize_text(text)
+    ref = reference_date or cc._today_utc()
+    facts = {
+        "reference_date": ref.isoformat(),
+        "company_name": _legacy_company_name(normalized),
+        "company_group_name": None,
+        "company_group_key": None,
+        "establishment_date": None,
+        "business_age_years": None,
+        "revenue_candidates": _legacy_revenue_candidates(normalized),
+    }
+    establishment_date = _legacy_establishment_date(normalized)
+    if establishment_date:
+        facts["establishment_date"] = establishment_date
+        try:
+            start = date.fromisoformat(establishment_date)
+            facts["business_age_years"] = round(max((ref - start).days, 0) / 365.2425, 2)
+        except ValueError:
+            facts["establishment_date"] = None
+            facts["business_age_years"] = None
+    return cc._apply_company_identity(facts)
+
+
+# ── fixtures ──
+
+def load_fixture_texts(path: Path = FIXTURE_FILE) -> List[str]:
+    """String literals in the test module that contain at least one fact keyword."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    texts: List[str] = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if any(keyword in node.value for keyword in cc._ANCHOR_KEYWORDS) and node.value not in texts:
+                texts.append(node.value)
+    return texts
+
+
+def pad_fixture(text: str, pad_lines: int) -> str:
+    """Bury the fixture in the middle of a long document body."""
+    half = "\n".join([FILLER_LINE] * (pad_lines // 2))
+    return f"{half}\n{text}\n{half}"
@@ -0,0 +1,19 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_input_store(tmp_path_factory, monkeypatch):
+    """워커 테스트가 공용 입력 저장소(시스템 임시 디렉터리)에 blob을 남기지 않도록 격리."""
+    wm = sys.modules.get("worker.main")
+    if wm is None:
+        yield
+        return
+    monkeypatch.setattr(wm, "INPUT_STORE_DIR", str(tmp_path_factory.mktemp("input-store")))
+    monkeypatch.setattr(wm, "_input_stores", {})
+    yield
@@ -0,0 +1,82 @@
+"""Tests for the append-only local session log behind agent.memory.ChatMemory."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from agent import memory as mem
+
+
+@pytest.fixture
+def chat(tmp_path: Path, monkeypatch) -> mem.ChatMemory:
+    monkeypatch.setattr(mem, "SUPABASE_AVAILABLE", False)
+    monkeypatch.setattr(mem, "COMPACT_EVERY_MESSAGES", 5)
+    return mem.ChatMemory(storage_dir=str(tmp_path), custom_session_id="s1", user_id="u1")
+
+
+def test_messages_are_appended_without_rewriting_header(chat: mem.ChatMemory) -> None:
+    header = chat.current_session_file
+    log = header.with_name("session_s1.messages.jsonl")
+
+    chat.add_message("user", "첫 질문")
+    header_mtime = header.stat().st_mtime_ns
+    sizes = []
+    for i in range(3):
+        chat.add_message("assistant", f"답변 {i}", {"tool": "x" * 100})
+        sizes.append(log.stat().st_size)
+
+    assert header.stat().st_mtime_ns == header_mtime  # 헤더는 그대로
+    assert sizes[1] - sizes[0] == sizes[2] - sizes[1]  # 메시지당 한 줄만 추가
+    assert "messages" not in json.loads(header.read_text(encoding="utf-8"))
+
+    listed = chat.get_recent_sessions()
+    assert listed[0]["session_id"] == "s1" and listed[0]["message_count"] == 4
+
+
+def test_periodic_compaction_syncs_header_counts(chat: mem.ChatMemory) -> None:
+    for i in range(6):
+        chat.add_message("user", f"m{i}")
+    chat.add_file_analysis("data/a.xlsx")
+
+    header = json.loads(chat.current_session_file.read_text(encoding="utf-8"))
+    assert header["message_count"] == 6 and header["analyzed_files"] == ["data/a.xlsx"]
+    assert header["log_bytes"] == chat.current_session_file.with_name("session_s1.messages.jsonl").stat().st_size
+
+
+def test_load_and_export_read_log_and_legacy_files(chat: mem.ChatMemory, tmp_path: Path) -> None:
+    chat.add_message("user", "안녕")
+    chat.add_message("assistant", "반갑습니다")
+    chat.add_generated_file("out/report.md")
+    # 쓰기가 중간에 끊긴 마지막 줄은 무시된다
+    with open(chat.current_session_file.with_name("session_s1.messages.jsonl"), "a", encoding="utf-8") as f:
+        f.write('{"role": "user", "cont')
+
+    loaded = chat.load_session("s1")
+    assert [m["content"] for m in loaded["messages"]] == ["안녕", "반갑습니다"]
+    assert loaded["generated_files"] == ["out/report.md"]
+    assert "반갑습니다" in Path(chat.export_session("s1")).read_text(encoding="utf-8")
+
+    legacy = {"session_id": "old", "start_time": "2024-01-01", "messages": [{"role": "user", "content": "옛날"}],
+              "analyzed_files": [], "generated_files": [], "user_info": {}}
+    (chat.storage_dir / "session_old.json").write_text(json.dumps(legacy, ensure_ascii=False), encoding="utf-8")
+    assert chat.load_session("old")["messages"] == legacy["messages"]
+    counts = {s["session_id"]: s["message_count"] for s in chat.get_recent_sessions(limit=10)}
+    assert counts == {"s1": 2, "old": 1}
+
+
+def test_rename_on_user_info_moves_log_and_new_session_starts_empty(chat: mem.ChatMemory) -> None:
+    chat.add_message("user", "hello")
+    chat.set_user_info(nickname="kim", company="acme")
+    chat.add_message("assistant", "hi")
+
+    assert not list(chat.storage_dir.glob("session_s1*"))
+    assert [m["content"] for m in chat.load_session(chat.session_id)["messages"]] == ["hello", "hi"]
+
+    renamed = chat.session_id
+    chat.start_new_session(custom_session_id="s2")
+    chat.add_message("user", "new")
+    assert [m["content"] for m in chat.load_session("s2")["messages"]] == ["new"]
+    assert len(chat.load_session(renamed)["messages"]) == 2
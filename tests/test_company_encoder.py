@@ -29,3 +29,79 @@ def test_build_company_alias_map_prefers_larger_canonical_group() -> None:
     assert alias_map["스트레스솔루션"]["company_group_key"] == "스트레스솔루션"
     assert alias_map["메리"]["company_group_key"] == "메리"
     assert stats["merged_group_count"] == 1
+
+
+def _linear_alias_map(groups):
+    """Reference: the original O(n²) canonicalization loop."""
+    from ralph.company_encoder import _normalize_group_label
+
+    candidates = [
+        {
+            "company_group_key": str(g["company_group_key"]).strip().lower(),
+            "company_group_name": _normalize_group_label(g["company_group_name"]),
+            "file_count": int(g["file_count"]),
+        }
+        for g in groups
+    ]
+    candidates = [c for c in candidates if c["company_group_key"] and c["company_group_name"]]
+    ordered = sorted(
+        candidates,
+        key=lambda c: (-c["file_count"], -len(c["company_group_name"]), c["company_group_name"]),
+    )
+    canonical = []
+    alias_map = {}
+    for group in ordered:
+        match = next(
+            (c for c in canonical if should_merge_company_alias(group["company_group_name"], c["company_group_name"])),
+            None,
+        )
+        if match is None:
+            canonical.append(group)
+            match = group
+        alias_map[group["company_group_key"]] = {
+            "company_group_key": match["company_group_key"],
+            "company_group_name": match["company_group_name"],
+        }
+    return alias_map
+
+
+def test_indexed_alias_map_matches_linear_scan() -> None:
+    import random
+
+    rng = random.Random(20260316)
+    syllables = list("가나다라마바사아자차카타파하테크스트레솔루션바이오메리랩") + ["AI", "X", "1"]
+    bases = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 8))) for _ in range(40)]
+    names = set()
+    for base in bases:
+        names.add(base)
+        names.add(base[: max(1, len(base) - rng.randint(1, 3))])  # 잘린 이름
+        typo = list(base)
+        typo[rng.randrange(len(typo))] = rng.choice(syllables)
+        names.add("".join(typo))  # 오탈자
+        names.add(f"주식회사 {base}")
+        names.add(f"({rng.choice(['주', '유'])}){base}")
+    names.update(["주식회사 주식회사 스트레", "협동조합협동조합메리", "㈜", "A", "가"])
+
+    groups = [
+        {"company_group_key": name.lower(), "company_group_name": name, "file_count": rng.randint(1, 20)}
+        for name in sorted(names)
+    ]
+
+    alias_map, stats = build_company_alias_map(groups)
+
+    assert alias_map == _linear_alias_map(groups)
+    assert stats["merged_group_count"] > 0
+
+
+def test_company_alias_index_returns_first_matching_canonical() -> None:
+    from ralph.company_encoder import CompanyAliasIndex
+
+    index = CompanyAliasIndex()
+    assert index.add("스트레스솔루션") == 0
+    assert index.add("메리") == 1
+    assert index.add("스트레스솔루션즈") == 2
+
+    assert index.find("스트레") == 0
+    assert index.find("메리") == 1
+    assert index.find("전혀다른회사") is None
+    assert index.find("") is None
@@ -0,0 +1,177 @@
+"""Tests for multi-document condition-check batching (checker + worker coalescer)."""
+import json
+import os
+import re
+import sys
+import threading
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ralph.condition_checker import check_conditions_nova, check_conditions_nova_batch  # noqa: E402
+
+# 규칙 엔진으로 풀리지 않는 조건 → 항상 LLM 판단 필요
+CONDITIONS = ["매출 성장률 10% 이상", "수출 실적 보유"]
+
+
+def _response(payload: dict, input_tokens: int = 100, output_tokens: int = 40) -> dict:
+    return {
+        "output": {"message": {"content": [{"text": json.dumps(payload, ensure_ascii=False)}]}},
+        "usage": {"inputTokens": input_tokens, "outputTokens": output_tokens},
+    }
+
+
+class _FakeBedrock:
+    """배치 프롬프트면 문서별 응답, 단일 프롬프트면 단일 응답을 돌려준다."""
+
+    def __init__(self, drop_doc_ids: tuple[str, ...] = ()) -> None:
+        self.prompts: list[str] = []
+        self._drop = drop_doc_ids
+        self._lock = threading.Lock()
+
+    def converse(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"][0]["text"]
+        with self._lock:
+            self.prompts.append(prompt)
+        doc_ids = re.findall(r"=== 문서 (D\d+) ===", prompt)
+        if doc_ids:
+            return _response({
+                "documents": [
+                    {
+                        "doc_id": doc_id,
+                        "company_name": f"{doc_id} 기업",
+                        "conditions": [
+                            {"condition": c, "result": doc_id == "D1", "evidence": f"{doc_id} 근거"}
+                            for c in CONDITIONS
+                        ],
+                    }
+                    for doc_id in doc_ids if doc_id not in self._drop
+                ]
+            })
+        return _response({
+            "company_name": "단독 기업",
+            "conditions": [{"condition": c, "result": False, "evidence": "단독 근거"} for c in CONDITIONS],
+        }, input_tokens=70, output_tokens=30)
+
+
+def test_small_documents_share_one_request_with_same_output_shape():
+    fake = _FakeBedrock()
+    docs = [("회사 소개 A " * 10, None), ("회사 소개 B " * 30, None), ("회사 소개 C " * 5, None)]
+
+    with patch("boto3.client", return_value=fake):
+        results = check_conditions_nova_batch(docs, CONDITIONS, "model", "batch-region")
+        single = check_conditions_nova(docs[0][0], CONDITIONS, "model", "batch-region-single")
+
+    assert len(fake.prompts) == 2  # 배치 1회 + 비교용 단독 1회
+    assert len(results) == 3
+    assert set(results[0]) == set(single)
+    assert results[0]["company_name"] == "D1 기업"
+    assert [c["result"] for c in results[0]["conditions"]] == [True, True]
+    assert [c["result"] for c in results[1]["conditions"]] == [False, False]
+    assert all(c["source"] == "llm" for r in results for c in r["conditions"])
+    assert results[2]["conditions"][0]["evidence"] == "D3 근거"
+    # 배치 사용량은 문서 길이 비례로 나뉘고 합계는 보존
+    assert sum(r["_usage"]["input_tokens"] for r in results) == 100
+    assert sum(r["_usage"]["output_tokens"] for r in results) == 40
+    assert results[1]["_usage"]["input_tokens"] > results[0]["_usage"]["input_tokens"]
+
+
+def test_missing_document_in_batch_response_falls_back_to_single_call():
+    fake = _FakeBedrock(drop_doc_ids=("D2",))
+    docs = [("문서 하나", None), ("문서 둘", None)]
+
+    with patch("boto3.client", return_value=fake):
+        results = check_conditions_nova_batch(docs, CONDITIONS, "model", "batch-region-missing")
+
+    assert len(fake.prompts) == 2
+    assert results[0]["company_name"] == "D1 기업"
+    assert results[1]["company_name"] == "단독 기업"
+    # 배치 호출에서 소비된 몫 + 단독 호출 사용량 모두 집계
+    assert sum(r["_usage"]["input_tokens"] for r in results) == 100 + 70
+    assert sum(r["_usage"]["output_tokens"] for r in results) == 40 + 30
+
+
+def test_large_and_rule_only_documents_are_not_batched():
+    fake = _FakeBedrock()
+    rule_only_text = "법인명: 규칙 주식회사\n개업연월일: 2024년 03월 01일\n"
+    docs = [("긴 문서 " * 1000, None), ("작은 문서", None), (rule_only_text, None)]
+
+    with patch("boto3.client", return_value=fake):
+        results = check_conditions_nova_batch(
+            docs[:2], CONDITIONS, "model", "batch-region-large",
+        )
+        rule_only = check_conditions_nova_batch(
+            [(rule_only_text, None)], ["창업 7년 미만"], "model", "batch-region-large",
+        )
+
+    # 긴 문서, 작은 문서 모두 단독 호출 (1개짜리 배치는 만들지 않음)
+    assert len(fake.prompts) == 2
+    assert not any("=== 문서 D" in p for p in fake.prompts)
+    assert results[0]["company_name"] == "단독 기업"
+    assert rule_only[0]["condition_summary"]["llm_skipped"] is True
+    assert rule_only[0]["_usage"] == {"input_tokens": 0, "output_tokens": 0}
+
+
+def test_worker_batcher_coalesces_concurrent_tasks_of_one_job():
+    from worker.main import _ConditionCheckBatcher
+
+    fake = _FakeBedrock()
+    batcher = _ConditionCheckBatcher(window_s=2.0)
+    results: dict[int, dict] = {}
+    start = threading.Barrier(3)
+
+    def _task(i: int) -> None:
+        start.wait()
+        results[i] = batcher.check(
+            ("team", "job"), f"작은 문서 {i}", CONDITIONS, "model", "batch-region-worker", None,
+        )
+
+    with patch("boto3.client", return_value=fake), \
+         patch("ralph.condition_checker.BATCH_MAX_DOCS", 3):
+        threads = [threading.Thread(target=_task, args=(i,)) for i in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+    assert len(fake.prompts) == 1
+    assert len(results) == 3
+    assert sorted(r["company_name"] for r in results.values()) == ["D1 기업", "D2 기업", "D3 기업"]
+    assert sum(r["_usage"]["input_tokens"] for r in results.values()) == 100
+
+
+def test_worker_batcher_holds_one_bedrock_gate_slot_per_request():
+    import worker.main as wm
+
+    class _GateCheckingBedrock(_FakeBedrock):
+        def converse(self, **kwargs):
+            assert not wm._io_gates["bedrock"].acquire(blocking=False)  # 호출 중에는 게이트 점유
+            return super().converse(**kwargs)
+
+    fake = _GateCheckingBedrock()
+    batcher = wm._ConditionCheckBatcher(window_s=2.0)
+    results: dict[int, dict] = {}
+    start = threading.Barrier(3)
+
+    def _task(i: int) -> None:
+        start.wait()
+        results[i] = wm._call_with_backoff(
+            batcher.check, ("team", "job"), f"작은 문서 {i}", CONDITIONS, "model", "batch-region-gate", None,
+        )
+
+    saved = dict(wm._io_gates)
+    wm._configure_io_gates({"bedrock": 1})
+    try:
+        with patch("boto3.client", return_value=fake), \
+             patch("ralph.condition_checker.BATCH_MAX_DOCS", 3):
+            threads = [threading.Thread(target=_task, args=(i,)) for i in range(3)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=10)
+    finally:
+        wm._io_gates.clear()
+        wm._io_gates.update(saved)
+
+    # 게이트가 1칸이어도 대기 중인 스레드는 칸을 잡지 않으므로 한 요청으로 묶인다
+    assert len(fake.prompts) == 1 and len(results) == 3
@@ -218,3 +218,36 @@ def test_check_conditions_nova_merges_rule_and_llm_results_in_original_order():
     assert result["condition_summary"]["llm_count"] == 1
     assert result["_usage"]["input_tokens"] == 123
     assert result["_usage"]["output_tokens"] == 45
+
+
+def test_anchored_fact_extraction_matches_legacy_scan():
+    import random
+
+    from ralph.condition_checker import _ANCHOR_KEYWORDS
+    from _condition_facts_reference import legacy_extract_condition_facts, load_fixture_texts, pad_fixture
+
+    # 한 키워드의 접미사가 다른 키워드의 접두사가 되면 alternation 스캔이 앵커를 놓친다
+    for left in _ANCHOR_KEYWORDS:
+        for right in _ANCHOR_KEYWORDS:
+            assert not any(left.endswith(right[:n]) for n in range(1, len(right)) if n < len(left))
+
+    ref = date(2026, 3, 7)
+    docs = load_fixture_texts()
+    docs += [pad_fixture(text, 40) for text in docs]
+    docs += [
+        "",
+        "법인설립일: 2019.05.01\r\n상호명 ㈜가나다\r\n매출 3억원",
+        "설립일 미기재 설립일 2020-01-02\x0b법인명: (주)라마바 | 대표 홍길동",
+        "\n".join(f"{2015 + i}년 매출액 {i + 1}억원, 매출 {i * 3}천만원" for i in range(12)),
+        "상호: ③종\n상호명: 메리테크 주식회사\n창업연월일 2021년 7월 9일",
+    ]
+    pieces = [
+        "법인명:", "상호", "상호명", "회사명 ", "기업명", "주식회사 알파", "㈜베타", "개업연월일", "법인설립일",
+        "설립연월일 ", "창업일", "2022.03.04", "2021년 2월 3일", "매출", "매출액", "12억원", "3,500만원",
+        "2024년", "\n", "\r\n", "\r", " ", "  ", "|", "(", ")", ":", "본문 텍스트",
+    ]
+    rng = random.Random(11)
+    docs += ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 60))) for _ in range(400)]
+
+    for doc in docs:
+        assert extract_condition_facts(doc, reference_date=ref) == legacy_extract_condition_facts(doc, ref), doc
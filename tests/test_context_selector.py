@@ -0,0 +1,89 @@
+"""Tests for condition-aware context selection (BM25 chunk ranking)."""
+import json
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ralph import condition_checker as cc  # noqa: E402
+from ralph.context_selector import GAP_MARKER, chunk_document, select_context  # noqa: E402
+
+FILLER = "본 페이지는 회사의 비전과 팀 문화, 향후 로드맵을 소개합니다. 고객 만족을 최우선으로 합니다."
+
+
+def _deck(pages: int = 20, evidence_page: int = 14) -> str:
+    parts = []
+    for page in range(1, pages + 1):
+        body = [f"{page}페이지 개요", "\n".join([FILLER] * 12)]
+        if page == 1:
+            body.insert(0, "법인명: 메리테크 주식회사")
+        if page == evidence_page:
+            body.append("해외 수출 실적: 2024년 미국 수출 계약 3건, 수출액 30억원 달성")
+        parts.append("\n\n".join(body))
+    return "\n\n---\n\n".join(parts)
+
+
+def test_chunks_follow_pages_and_cover_source_offsets() -> None:
+    text = _deck(pages=3, evidence_page=2)
+    chunks = chunk_document(text, chunk_chars=400)
+
+    assert {c.page for c in chunks} == {1, 2, 3}
+    assert all(len(c.text) <= 400 for c in chunks)
+    assert all(text[c.start:c.end] == c.text for c in chunks)
+    assert all(a.end <= b.start for a, b in zip(chunks, chunks[1:]))
+    assert not any(c.text.strip() == "---" for c in chunks)
+
+
+def test_select_context_finds_evidence_past_old_truncation_point() -> None:
+    text = _deck()
+    evidence_at = text.index("해외 수출 실적")
+    assert evidence_at > 8000
+
+    selection = select_context(text, ["해외 수출 실적 보유"], token_budget=2000, anchors=["법인명"])
+
+    assert selection.selected is True
+    assert len(selection.text) <= 2000
+    assert "해외 수출 실적" in selection.text
+    assert "법인명: 메리테크 주식회사" in selection.text  # 첫 청크는 항상 포함
+    assert 14 in selection.pages and 1 in selection.pages
+    assert any(start <= evidence_at < end for start, end in selection.spans)
+    assert GAP_MARKER in selection.text
+
+
+def test_select_context_passes_short_docs_through_and_falls_back_to_prefix() -> None:
+    short = "법인명: 메리\n매출 10억"
+    whole = select_context(short, ["수출"], token_budget=100)
+    assert whole.text == short and whole.selected is False and whole.spans == [(0, len(short))]
+
+    long_text = _deck(pages=5, evidence_page=0)
+    fallback = select_context(long_text, ["zzz"], token_budget=500)
+    assert fallback.text == long_text[:500]
+    assert fallback.spans == [(0, 500)]
+
+
+def test_check_conditions_sends_selected_context_and_records_spans(monkeypatch) -> None:
+    text = _deck()
+    prompts = []
+
+    def _fake_converse(prompt: str, model_id: str, region: str, max_tokens: int):
+        prompts.append(prompt)
+        payload = {
+            "company_name": "메리테크 주식회사",
+            "conditions": [{"condition": "해외 수출 실적 보유", "result": True, "evidence": "수출액 30억원"}],
+        }
+        return json.dumps(payload, ensure_ascii=False), 100, 20
+
+    monkeypatch.setattr(cc, "_CONTEXT_TOKEN_BUDGET", 3000)
+    with patch.object(cc, "_converse_text", side_effect=_fake_converse):
+        result = cc.check_conditions_nova(text, ["해외 수출 실적 보유"], "model", "region")
+
+    (prompt,) = prompts
+    assert "수출액 30억원 달성" in prompt
+    assert len(prompt) < 3000 + 1500
+    context = result["context"]
+    assert context["selected"] is True
+    assert context["doc_chars"] == len(text)
+    assert context["sent_chars"] <= 3000
+    assert 14 in context["pages"]
+    assert result["conditions"][0]["result"] is True
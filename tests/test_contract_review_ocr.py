@@ -0,0 +1,154 @@
+"""Tests for the concurrent OCR / refine path in shared.contract_review.load_document."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+from shared import contract_review as cr
+
+
+def _make_scanned_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page(width=200, height=200)  # 텍스트 레이어 없음 → OCR 대상
+    doc.save(path)
+    doc.close()
+
+
+class _FakeAnthropic:
+    """messages.create 호출을 기록하고 동시 실행 수를 잰다."""
+
+    instances: list["_FakeAnthropic"] = []
+
+    def __init__(self, api_key: str) -> None:
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+        _FakeAnthropic.instances.append(self)
+
+    def _create(self, model, max_tokens, temperature, messages):
+        content = messages[0]["content"]
+        if isinstance(content, str):
+            label = "refined:" + content.rsplit("\n", 1)[-1]
+        else:
+            label = f"image:{len(content[1]['source']['data']) > 0}"
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(label)
+            seq = len(self.calls)
+        # 뒤 페이지가 먼저 끝나도록 해서 순서 보존을 확인
+        time.sleep(0.05 if seq == 1 else 0.01)
+        with self._lock:
+            self.active -= 1
+        if "OCR TEXT" in str(content):
+            if "fail" in label:
+                raise RuntimeError("refine failed")
+            return SimpleNamespace(content=[SimpleNamespace(text=label)])
+        return SimpleNamespace(content=[SimpleNamespace(text=f"page-{seq}")])
+
+
+@pytest.fixture
+def fake_claude(monkeypatch):
+    _FakeAnthropic.instances = []
+    monkeypatch.setattr(cr, "Anthropic", _FakeAnthropic)
+    monkeypatch.setattr(cr, "OCR_CLAUDE_CONCURRENCY", 3)
+    return _FakeAnthropic.instances
+
+
+@pytest.fixture
+def fake_tesseract(monkeypatch):
+    """프로세스 풀 대신 스레드 풀, tesseract 대신 페이지 번호를 돌려주는 가짜 OCR."""
+    monkeypatch.setattr(cr, "Image", object())
+    monkeypatch.setattr(cr, "pytesseract", object())
+    monkeypatch.setattr(cr, "local_ocr_available", lambda: True)
+    pool = ThreadPoolExecutor(4)
+    monkeypatch.setattr(cr, "_local_ocr_executor", lambda: pool)
+    monkeypatch.setattr(cr, "OCR_LOCAL_WORKERS", 4)
+
+    def _page(path, page_index, dpi, lang):
+        time.sleep(0.03 if page_index == 0 else 0.0)
+        if page_index == 3:
+            return "fail"
+        return f"ocr {page_index + 1}"
+
+    monkeypatch.setattr(cr, "_local_ocr_pdf_page", _page)
+    yield pool
+    pool.shutdown()
+
+
+def test_claude_page_ocr_is_concurrent_with_one_client_and_keeps_order(tmp_path: Path, fake_claude) -> None:
+    pdf = tmp_path / "scan.pdf"
+    _make_scanned_pdf(pdf, pages=6)
+    progress: list[tuple[int, int, str]] = []
+
+    segments = cr._ocr_pdf_with_claude(pdf, api_key="k", progress_callback=lambda *a: progress.append(a))
+
+    assert [s["source"] for s in segments] == [f"p{i}" for i in range(1, 7)]
+    assert segments[0]["text"] == "page-1"  # 가장 늦게 끝난 첫 페이지도 제자리
+    (client,) = fake_claude
+    assert 1 < client.peak <= 3
+    assert progress[0] == (0, 6, "OCR 시작")
+    assert [done for done, _, _ in progress[1:]] == [1, 2, 3, 4, 5, 6]
+
+
+def test_local_ocr_then_parallel_refine_in_load_document(tmp_path: Path, fake_claude, fake_tesseract) -> None:
+    pdf = tmp_path / "scan.pdf"
+    _make_scanned_pdf(pdf, pages=5)
+    progress: list[tuple[int, int, str]] = []
+
+    loaded = cr.load_document(
+        pdf, ocr_mode="force", api_key="k", ocr_strategy="uniform",
+        progress_callback=lambda *a: progress.append(a),
+    )
+
+    assert loaded["ocr_used"] and loaded["ocr_engine"] == "local+claude"
+    texts = [s["text"] for s in loaded["segments"]]
+    assert texts == ["refined:ocr 1", "refined:ocr 2", "refined:ocr 3", "fail", "refined:ocr 5"]
+    assert loaded["ocr_refine_error"] == "refine failed"
+    assert len(fake_claude) == 1 and fake_claude[0].peak > 1
+
+    local = [done for done, _, msg in progress if msg == "로컬 OCR 진행 중"]
+    refine = [done for done, _, msg in progress if msg == "Claude 정제 중"]
+    assert local == [1, 2, 3, 4, 5] and refine == [1, 2, 3, 4, 5]
+
+
+def test_missing_sdk_keeps_local_ocr_text(tmp_path: Path, fake_tesseract, monkeypatch) -> None:
+    monkeypatch.setattr(cr, "Anthropic", None)
+    pdf = tmp_path / "scan.pdf"
+    _make_scanned_pdf(pdf, pages=2)
+
+    loaded = cr.load_document(pdf, ocr_mode="force", api_key="k", ocr_strategy="uniform")
+
+    assert [s["text"] for s in loaded["segments"]] == ["ocr 1", "ocr 2"]
+    assert "anthropic" in loaded["ocr_refine_error"] and loaded["ocr_error"] == ""
+
+
+def test_local_ocr_pool_is_shared_across_documents(tmp_path: Path, fake_tesseract) -> None:
+    pdf = tmp_path / "scan.pdf"
+    _make_scanned_pdf(pdf, pages=3)
+
+    first = cr._ocr_pdf_fast_local(pdf)
+    second = cr._ocr_pdf_fast_local(pdf)
+
+    assert first == second and [s["text"] for s in first] == ["ocr 1", "ocr 2", "ocr 3"]
+    assert fake_tesseract.submit(lambda: "alive").result() == "alive"  # 문서 처리 후에도 풀 유지
+
+
+def test_local_ocr_executor_is_created_once(monkeypatch) -> None:
+    monkeypatch.setattr(cr, "_local_ocr_pool", None)
+    pool = cr._local_ocr_executor()
+    try:
+        assert cr._local_ocr_executor() is pool
+    finally:
+        cr._reset_local_ocr_executor(pool)
+    assert cr._local_ocr_pool is None
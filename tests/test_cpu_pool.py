@@ -0,0 +1,141 @@
+"""Tests for the CPU-bound stage process pool."""
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+import fitz
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ralph import cpu_pool  # noqa: E402
+
+
+def _make_pdf(path: Path, pages: int = 3) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(
+            fitz.Rect(72, 72, 520, 760),
+            f"Page {i + 1}: revenue and employee figures for the pool test document. " * 4,
+            fontsize=11,
+        )
+    doc.save(path)
+    doc.close()
+
+
+@pytest.fixture
+def inline_pool():
+    cpu_pool.configure(0)
+    yield
+    cpu_pool.configure(None)
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    cpu_pool.configure(1)
+    assert cpu_pool.warm() == 1
+    yield
+    cpu_pool.configure(None)
+
+
+def test_disabled_pool_runs_inline(inline_pool, tmp_path: Path) -> None:
+    assert cpu_pool.enabled() is False
+    future = cpu_pool.submit(os.getpid)
+    assert future.done() and future.result() == os.getpid()
+
+    failing = cpu_pool.submit(int, "x")
+    with pytest.raises(ValueError):
+        failing.result()
+
+    pdf_path = tmp_path / "a.pdf"
+    _make_pdf(pdf_path)
+    # 인라인 경로는 기존 parse_document 결과(layout 포함 가능)를 그대로 돌려준다
+    result = cpu_pool.parse_document(pdf_path, "no_such_type")
+    assert result.success is False
+    assert any("지원하지 않는 문서 타입" in e for e in result.errors)
+
+
+def test_pool_runs_in_child_and_returns_primitives(process_pool, tmp_path: Path) -> None:
+    from ralph.playground_parser import assess_text_quality, extract_text
+
+    pdf_path = tmp_path / "b.pdf"
+    _make_pdf(pdf_path)
+
+    assert cpu_pool.run(os.getpid) != os.getpid()
+
+    text, pages, is_poor, is_fragmented = cpu_pool.run(cpu_pool.extract_text_profile, str(pdf_path))
+    expected_text, expected_pages, blocks = extract_text(str(pdf_path))
+    assert (text, pages) == (expected_text, expected_pages)
+    assert (is_poor, is_fragmented) == assess_text_quality(expected_text, blocks, page_count=expected_pages)[1:]
+
+    result = cpu_pool.parse_document(pdf_path, "no_such_type")
+    assert result.layout is None
+    assert result.success is False
+    assert result.source_file == str(pdf_path)
+
+
+def test_pooled_xlsx_matches_inline(process_pool, tmp_path: Path) -> None:
+    from openpyxl import load_workbook
+
+    import worker.main as wm
+
+    conditions = ["매출 10억 이상"]
+    rows = [
+        {
+            "filename": f"doc_{i}.pdf",
+            "company_name": name,
+            "company_group_key": name.lower(),
+            "company_group_name": name,
+            "conditions": [{"condition": conditions[0], "result": i % 2 == 0, "evidence": f"근거 {i}"}],
+        }
+        for i, name in enumerate(["스트레스솔루션", "스트레", "메리"])
+    ]
+
+    def _build(out: Path):
+        spool = wm._TaskRowSpool(out / "rows.jsonl")
+        raw_groups: dict = {}
+        widths = wm._ConditionXlsxWidths(conditions)
+        for row in rows:
+            spool.append(row)
+            wm._collect_company_group(raw_groups, row)
+            widths.observe(row)
+        spool.seal()
+        return wm._stream_condition_check_artifacts(out, spool, conditions, raw_groups, widths)
+
+    (tmp_path / "pooled").mkdir()
+    pooled = _build(tmp_path / "pooled")
+    cpu_pool.configure(0)
+    try:
+        (tmp_path / "inline").mkdir()
+        inline = _build(tmp_path / "inline")
+    finally:
+        cpu_pool.configure(1)
+
+    assert pooled[2] is not None and pooled[2].exists()
+    assert pooled[4] == inline[4]
+    assert json.loads(pooled[1].read_text(encoding="utf-8")) == json.loads(inline[1].read_text(encoding="utf-8"))
+
+    def _cells(path: Path):
+        wb = load_workbook(io.BytesIO(path.read_bytes()))
+        return {
+            ws.title: [[c.value for c in row] for row in ws.iter_rows()]
+            for ws in wb.worksheets
+        }
+
+    assert _cells(pooled[2]) == _cells(inline[2])
+
+
+def test_crashing_task_fails_instead_of_running_inline() -> None:
+    from concurrent.futures.process import BrokenProcessPool
+
+    cpu_pool.configure(1)
+    try:
+        # 자식을 죽이는 작업은 새 풀에서 한 번 재시도된 뒤 실패하고, 호출 프로세스에서는 실행되지 않는다
+        with pytest.raises(BrokenProcessPool):
+            cpu_pool.run(os._exit, 1)
+        assert cpu_pool.run(os.getpid) != os.getpid()
+    finally:
+        cpu_pool.configure(None)
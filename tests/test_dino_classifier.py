@@ -0,0 +1,157 @@
+"""Tests for the batched DINOv2 classifier and its matrix reference index (no model needed)."""
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from ralph.dino_classifier import DinoClassifier, DinoRef, score_embeddings, stack_refs  # noqa: E402
+
+
+def _unit(rng: np.random.Generator, n: int, dim: int = 16) -> np.ndarray:
+    v = rng.standard_normal((n, dim)).astype(np.float32)
+    return v / np.linalg.norm(v, axis=1, keepdims=True)
+
+
+def _reference_classify(emb, refs, threshold, top_k):
+    """기존 구현: 레퍼런스별 np.dot + 정렬."""
+    sims = [(ref.doc_type, float(np.dot(emb, ref.embedding))) for ref in refs]
+    sims.sort(key=lambda x: x[1], reverse=True)
+    top = sims[:top_k]
+    if top[0][1] < threshold:
+        return "unknown", top[0][1]
+    votes: dict[str, float] = {}
+    for dtype, sim in top:
+        votes[dtype] = votes.get(dtype, 0.0) + sim
+    return max(votes, key=lambda k: votes[k]), top[0][1]
+
+
+class _StubClassifier(DinoClassifier):
+    """렌더링/모델 대신 경로 → 고정 벡터 매핑을 쓰는 분류기."""
+
+    def __init__(self, vectors: dict, **kw) -> None:
+        super().__init__(**kw)
+        self.vectors = vectors
+        self.batches: list[int] = []
+
+    def _render(self, pdf_path, page_idx=0, dpi=150):
+        if str(pdf_path) not in self.vectors:
+            raise FileNotFoundError(pdf_path)
+        return str(pdf_path)
+
+    def _embed_images(self, images):
+        self.batches.append(len(images))
+        return np.stack([self.vectors[key] for key in images])
+
+
+def test_score_embeddings_matches_per_reference_scan() -> None:
+    rng = np.random.default_rng(7)
+    refs = [
+        DinoRef(doc_type=f"type_{i % 4}", source_path=f"ref{i}.pdf", embedding=e)
+        for i, e in enumerate(_unit(rng, 30))
+    ]
+    queries = _unit(rng, 50)
+    matrix, labels = stack_refs(refs)
+
+    for top_k in (1, 3, 5, 40):
+        got = score_embeddings(queries, matrix, labels, threshold=0.1, top_k=top_k)
+        for query, (doc_type, conf) in zip(queries, got):
+            expected_type, expected_conf = _reference_classify(query, refs, 0.1, top_k)
+            assert doc_type == expected_type
+            assert conf == pytest.approx(expected_conf, abs=1e-5)
+
+
+def test_refs_round_trip_as_memory_mapped_matrix(tmp_path: Path) -> None:
+    rng = np.random.default_rng(1)
+    vectors = {"a.pdf": _unit(rng, 1)[0], "b.pdf": _unit(rng, 1)[0]}
+    clf = _StubClassifier(vectors, refs_path=tmp_path / "refs.npy")
+    clf._ref_matrix, clf._ref_labels = stack_refs([
+        DinoRef("shareholder", "a.pdf", vectors["a.pdf"]),
+        DinoRef("articles", "b.pdf", vectors["b.pdf"]),
+    ])
+    clf.save_refs()
+    assert (tmp_path / "refs.labels.json").exists()
+
+    loaded = _StubClassifier(vectors, refs_path=tmp_path / "refs.npy")
+    assert loaded.load_refs() == 2
+    assert isinstance(loaded._ref_matrix, np.memmap)
+    assert loaded._ref_matrix.dtype == np.float32
+    assert loaded.classify("b.pdf", threshold=0.5, top_k=1) == ("articles", pytest.approx(1.0, abs=1e-5))
+
+
+def test_legacy_pickle_refs_still_load(tmp_path: Path) -> None:
+    vec = np.ones(4, dtype=np.float32) / 2
+    with open(tmp_path / "refs.pkl", "wb") as f:
+        pickle.dump([DinoRef("business_reg", "x.pdf", vec)], f)
+
+    clf = _StubClassifier({"q.pdf": vec}, refs_path=tmp_path / "refs.npy")
+    assert clf.load_refs() == 1
+    assert clf.classify("q.pdf")[0] == "business_reg"
+
+
+def test_classify_many_embeds_in_mini_batches_and_keeps_order(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    refs = _unit(rng, 3)
+    vectors = {f"doc{i}.pdf": refs[i % 3] for i in range(5)}
+    clf = _StubClassifier(vectors, refs_path=tmp_path / "refs.npy", batch_size=2)
+    clf._ref_matrix = refs
+    clf._ref_labels = ["a", "b", "c"]
+
+    paths = ["doc0.pdf", "doc1.pdf", "missing.pdf", "doc2.pdf", "doc3.pdf", "doc4.pdf"]
+    results = clf.classify_many(paths, threshold=0.9, top_k=1)
+
+    assert clf.batches == [2, 1, 2]  # 렌더링 실패 문서는 배치에서 빠짐
+    assert [doc_type for doc_type, _ in results] == ["a", "b", "unknown", "c", "a", "b"]
+    assert results[2] == ("unknown", 0.0)
+
+
+def test_classify_without_refs_is_unknown(tmp_path: Path) -> None:
+    clf = _StubClassifier({"a.pdf": np.ones(4, dtype=np.float32)}, refs_path=tmp_path / "none.npy")
+    assert clf.classify_many(["a.pdf"]) == [("unknown", 0.0)]
+    assert clf.batches == []
+
+
+def test_router_batch_uses_one_classify_many_call(tmp_path: Path, monkeypatch) -> None:
+    import ralph.dino_classifier as dino_mod
+    import ralph.router as router
+
+    pdf_a = tmp_path / "a.pdf"
+    pdf_b = tmp_path / "b.pdf"
+    pdf_a.write_bytes(b"%PDF")
+    pdf_b.write_bytes(b"%PDF")
+
+    def _fake_detect(file_id, filename, pdf_path=None, use_vlm=True, use_dino=False):
+        assert use_dino is False
+        return router.DetectionResult(
+            file_id=file_id, filename=filename, detected_type=None,
+            method="none", confidence=0.0, supported_types=[],
+        )
+
+    calls = []
+
+    class _FakeDino:
+        def classify_many(self, paths):
+            calls.append(list(paths))
+            return [("shareholder", 0.8), ("unknown", 0.3)]
+
+    monkeypatch.setattr(router, "detect_type", _fake_detect)
+    monkeypatch.setattr(dino_mod, "get_dino_classifier", lambda: _FakeDino())
+
+    results = router.detect_types_batch(
+        [
+            router.FileInfo("1", "a.pdf", str(pdf_a)),
+            router.FileInfo("2", "no_pdf.pdf", None),
+            router.FileInfo("3", "b.pdf", str(pdf_b)),
+        ],
+        use_vlm=False,
+        use_dino=True,
+    )
+
+    assert calls == [[str(pdf_a), str(pdf_b)]]
+    assert [(r.detected_type, r.method) for r in results] == [
+        ("shareholder", "dino"), (None, "none"), (None, "none"),
+    ]
@@ -0,0 +1,40 @@
+"""Tests for ralph.disk_lru, the byte-budgeted disk store behind the local caches."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from ralph.disk_lru import DiskLRU
+
+
+def _age(paths: list[Path]) -> None:
+    for i, p in enumerate(paths):
+        os.utime(p, (1000 + i, 1000 + i))
+
+
+def test_evicts_least_recently_used_down_to_target(tmp_path: Path) -> None:
+    lru = DiskLRU(tmp_path, max_bytes=300)
+    paths = [tmp_path / "a" / f"{i}.bin" for i in range(3)]
+    for p in paths:
+        assert lru.write_bytes(p, b"x" * 100) == 0
+    _age(paths)
+    assert lru.read_bytes(paths[0]) == b"x" * 100  # 0을 최근 사용으로
+
+    assert lru.write_bytes(tmp_path / "a" / "3.bin", b"y" * 100) == 2
+    assert sorted(p.name for _, _, p in lru.files()) == ["0.bin", "3.bin"]
+
+
+def test_keep_protects_new_file_and_tmp_files_are_ignored(tmp_path: Path) -> None:
+    lru = DiskLRU(tmp_path, max_bytes=150)
+    (tmp_path / "partial.123.tmp").write_bytes(b"z" * 1000)
+    old = tmp_path / "old"
+    lru.write_bytes(old, b"o" * 100)
+    _age([old])
+
+    big = tmp_path / "big"
+    evicted = lru.place(big, lambda tmp: tmp.write_bytes(b"b" * 200), keep=True)
+
+    assert evicted == 1 and big.exists() and not old.exists()
+    assert lru.write_bytes(tmp_path / "huge", b"h" * 151) == 0
+    assert not (tmp_path / "huge").exists()
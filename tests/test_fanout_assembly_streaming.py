@@ -0,0 +1,188 @@
+"""Tests for streaming fan-out assembly (paged task query → JSONL spool → artifacts)."""
+import csv
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import worker.main as wm  # noqa: E402
+from worker.main import _JsonStreamWriter, _TaskRowSpool, _write_json  # noqa: E402
+
+CONDITIONS = ["매출 10억 이상", "직원 50인 이상"]
+
+
+class _ConditionalCheckFailed(Exception):
+    pass
+
+
+class _FakeMeta:
+    class client:
+        class exceptions:
+            ConditionalCheckFailedException = _ConditionalCheckFailed
+
+
+class PagedTable:
+    """TASK 조회를 page_size 단위로 끊어 돌려주는 최소 DDB 테이블."""
+
+    meta = _FakeMeta()
+
+    def __init__(self, tasks: List[Dict[str, Any]], page_size: int) -> None:
+        self.tasks = tasks
+        self.page_size = page_size
+        self.query_calls: List[Dict[str, Any]] = []
+        self.updates: List[Dict[str, Any]] = []
+
+    def query(self, **kw: Any) -> Dict[str, Any]:
+        self.query_calls.append(kw)
+        start = int(kw.get("ExclusiveStartKey", {}).get("offset", 0))
+        page = self.tasks[start:start + self.page_size]
+        resp: Dict[str, Any] = {"Items": [dict(t) for t in page]}
+        if start + self.page_size < len(self.tasks):
+            resp["LastEvaluatedKey"] = {"offset": start + self.page_size}
+        return resp
+
+    def get_item(self, Key: Dict[str, Any], **kw: Any) -> Dict[str, Any]:
+        return {}
+
+    def update_item(self, **kw: Any) -> None:
+        self.updates.append(kw)
+
+
+class FakeS3:
+    def __init__(self) -> None:
+        self.objects: Dict[str, bytes] = {}
+
+    def upload_file(self, filename: str, bucket: str, key: str, ExtraArgs: Any = None) -> None:
+        self.objects[key] = Path(filename).read_bytes()
+
+
+class FakeCtx:
+    def __init__(self, table: PagedTable) -> None:
+        self.bucket = "bucket"
+        self.delete_inputs = False
+        self.ddb = table
+        self.s3 = FakeS3()
+
+
+def _task(i: int, result: Any) -> Dict[str, Any]:
+    item = {"pk": "TEAM#t", "sk": f"TASK#j#{i:03d}", "file_id": f"f{i}"}
+    if result is not None:
+        item["result"] = json.dumps(result, ensure_ascii=False) if isinstance(result, dict) else result
+    return item
+
+
+def _row(i: int, company: str) -> Dict[str, Any]:
+    return {
+        "filename": f"doc_{i}.pdf",
+        "company_name": company,
+        "conditions": [
+            {"condition": CONDITIONS[0], "result": i % 2 == 0, "evidence": f"근거 {i}"},
+            {"condition": CONDITIONS[1], "result": False, "evidence": ""},
+        ],
+        "token_usage": {"input_tokens": 10, "output_tokens": 2},
+        "condition_summary": {"rule_count": 1, "llm_count": 1},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _temp_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(wm, "TEMP_ROOT", tmp_path / "temp")
+    monkeypatch.setattr(wm, "WEBHOOK_URL", "")
+
+
+def test_json_stream_writer_matches_write_json(tmp_path: Path) -> None:
+    items = [{"a": 1, "b": ["x", {"c": "줄\n바꿈"}]}, {}, [], "s"]
+    streamed = _JsonStreamWriter(tmp_path / "s.json", "results", {"conditions": ["가", "나"]})
+    for item in items:
+        streamed.append(item)
+    streamed.close({"total": len(items), "groups": [{"k": "v"}]})
+    _write_json(tmp_path / "w.json", {
+        "conditions": ["가", "나"], "results": items, "total": len(items), "groups": [{"k": "v"}],
+    })
+    assert (tmp_path / "s.json").read_text(encoding="utf-8") == (tmp_path / "w.json").read_text(encoding="utf-8")
+
+    empty = _JsonStreamWriter(tmp_path / "e.json", "results")
+    empty.close({"total": 0})
+    assert json.loads((tmp_path / "e.json").read_text(encoding="utf-8")) == {"results": [], "total": 0}
+
+
+def test_spool_round_trips_rows(tmp_path: Path) -> None:
+    spool = _TaskRowSpool(tmp_path / "rows.jsonl")
+    spool.seal()
+    assert list(spool) == []
+
+    spool = _TaskRowSpool(tmp_path / "rows.jsonl")
+    spool.append({"a": "가"})
+    spool.append({"b": [1, 2]})
+    spool.seal()
+    assert spool.count == 2
+    assert list(spool) == [{"a": "가"}, {"b": [1, 2]}]
+    assert list(spool) == [{"a": "가"}, {"b": [1, 2]}]  # 여러 번 다시 읽을 수 있음
+
+
+def test_condition_check_assembly_streams_all_pages() -> None:
+    companies = ["스트레스솔루션", "스트레", "메리", "스트레스솔루션", "메리"]
+    tasks = [_task(i, _row(i, name)) for i, name in enumerate(companies)]
+    tasks.append(_task(5, "not json"))
+    tasks.append(_task(6, None))
+    table = PagedTable(tasks, page_size=2)
+    ctx = FakeCtx(table)
+    job = {"type": "condition_check", "params": {"conditions": CONDITIONS}, "title": "t"}
+
+    wm._assemble_fanout_results(ctx, "t", "j", job)
+
+    assert len(table.query_calls) == 4
+    assert [c.get("ExclusiveStartKey") for c in table.query_calls][1:] == [
+        {"offset": 2}, {"offset": 4}, {"offset": 6},
+    ]
+
+    csv_bytes = ctx.s3.objects["artifacts/t/j/condition_check_csv.csv"]
+    csv_rows = list(csv.DictReader(io.StringIO(csv_bytes.decode("utf-8-sig"))))
+    assert [r["filename"] for r in csv_rows] == [f"doc_{i}.pdf" for i in range(5)] + ["f5", "f6"]
+    # 잘린 회사명은 대표 그룹으로 정규화
+    assert csv_rows[1]["company_group"] == "스트레스솔루션"
+    assert csv_rows[5]["error"] == "not json"
+
+    data = json.loads(ctx.s3.objects["artifacts/t/j/condition_check_json.json"].decode("utf-8"))
+    assert data["total"] == 7
+    assert data["conditions"] == CONDITIONS
+    assert len(data["results"]) == 7
+    assert data["results"][1]["company_group_alias_from"] == "스트레"
+    groups = {g["company_group_key"]: g["file_count"] for g in data["company_groups"]}
+    assert groups == {"스트레스솔루션": 3, "메리": 2}
+
+    from openpyxl import load_workbook
+
+    xlsx = ctx.s3.objects["artifacts/t/j/condition_check_xlsx.xlsx"]
+    wb = load_workbook(io.BytesIO(xlsx))
+    ws = wb["조건 검사 결과"]
+    assert ws.max_row == 8
+    assert ws.cell(row=3, column=3).value == "스트레스솔루션"
+    assert ws.freeze_panes == "A2"
+    assert wb["요약"].cell(row=1, column=2).value == 7
+
+    (job_update,) = [u for u in table.updates if "#metrics" in u.get("ExpressionAttributeNames", {})]
+    metrics = job_update["ExpressionAttributeValues"][":metrics"]
+    assert metrics["total"] == 7
+    assert metrics["success_count"] == 5
+    assert metrics["company_group_count"] == 2
+    assert metrics["company_alias_merge_count"] == 1
+    assert metrics["company_alias_merged_files"] == 1
+    assert metrics["token_usage"]["input_tokens"] == 50
+    assert metrics["rule_condition_count"] == 5
+
+
+def test_generic_assembly_writes_streamed_json() -> None:
+    tasks = [_task(i, {"filename": f"d{i}.pdf", "value": i}) for i in range(3)]
+    ctx = FakeCtx(PagedTable(tasks, page_size=1))
+
+    wm._assemble_fanout_results(ctx, "t", "j", {"type": "document_extraction", "params": {}})
+
+    data = json.loads(ctx.s3.objects["artifacts/t/j/document_extraction_json.json"].decode("utf-8"))
+    assert data == {"total": 3, "results": [{"filename": f"d{i}.pdf", "value": i} for i in range(3)]}
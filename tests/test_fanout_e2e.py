@@ -693,6 +693,46 @@ class TestFanoutResultCacheReuse:
         cleanup(team, "job_d")
 
 
+class TestFanoutConditionCacheReuse:
+    """Adding a condition to a resubmitted job should only send the new condition to the LLM."""
+
+    def test_only_new_conditions_are_checked(self):
+        team = "t_condition_cache"
+        ctx = FakeCtx()
+        pdf_text = "개업연월일 2024년 03월 01일\n2025년 매출액 8억원\n"
+        checked: List[List[str]] = []
+
+        def _recording_check(text, conditions, model_id, region, facts=None):
+            checked.append(list(conditions))
+            return _mock_check_nova(text, conditions, model_id, region, facts)
+
+        setup_fanout_job(
+            ctx, team, "job_e", ["file_e"], ["창업 3년 미만"],
+            pdf_texts={"file_e": pdf_text},
+        )
+        setup_fanout_job(
+            ctx, team, "job_f", ["file_f"], ["매출 10억 미만", "창업 3년 미만"],
+            pdf_texts={"file_f": pdf_text},
+        )
+        ctx.s3.objects[(ctx.bucket, f"uploads/{team}/file_f.pdf")] = ctx.s3.objects[(ctx.bucket, f"uploads/{team}/file_e.pdf")]
+
+        with patch("ralph.condition_checker.check_conditions_nova", _recording_check):
+            process_fanout_task(ctx, team, "job_e", "000", "file_e")
+            process_fanout_task(ctx, team, "job_f", "000", "file_f")
+
+        assert checked == [["창업 3년 미만"], ["매출 10억 미만"]]
+        result = get_task_result(ctx, team, "job_f", "000")
+        assert [c["condition"] for c in result["conditions"]] == ["매출 10억 미만", "창업 3년 미만"]
+        assert result["conditions"][1]["evidence"] == "mock: 창업 3년 미만"
+        assert result["cache"]["result_hit"] is False
+        assert result["cache"]["condition_hits"] == 1
+        assert result["cache"]["saved_input_tokens"] == 500
+        assert result["condition_summary"]["cached_count"] == 1
+
+        cleanup(team, "job_e")
+        cleanup(team, "job_f")
+
+
 class TestFanoutRuleSummaryMetrics:
     """Rule-engine summaries should aggregate into job metrics and artifacts."""
 
@@ -0,0 +1,122 @@
+"""Tests for the worker's content-addressed input store (fake S3/DDB)."""
+import hashlib
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import worker.main as wm  # noqa: E402
+
+
+class FakeS3:
+    def __init__(self) -> None:
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+        self.downloads: List[str] = []
+        self.heads: List[str] = []
+
+    def put(self, key: str, data: bytes) -> None:
+        self.objects[("bucket", key)] = data
+
+    def head_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        self.heads.append(Key)
+        data = self.objects[(Bucket, Key)]
+        return {"ETag": f'"{hashlib.md5(data).hexdigest()}"', "ContentLength": len(data)}
+
+    def download_file(self, bucket: str, key: str, filename: str) -> None:
+        self.downloads.append(key)
+        Path(filename).write_bytes(self.objects[(bucket, key)])
+
+
+class FakeTable:
+    def __init__(self) -> None:
+        self.updates: List[Dict[str, Any]] = []
+
+    def update_item(self, **kw: Any) -> None:
+        self.updates.append(kw)
+
+
+class FakeCtx:
+    def __init__(self) -> None:
+        self.s3 = FakeS3()
+        self.ddb = FakeTable()
+
+
+@pytest.fixture
+def store_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(wm, "INPUT_STORE_DIR", str(tmp_path / "blobs"))
+    monkeypatch.setattr(wm, "INPUT_STORE_MAX_BYTES", 1024 * 1024)
+    monkeypatch.setattr(wm, "_input_stores", {})
+    return tmp_path / "blobs"
+
+
+def test_same_bytes_are_downloaded_and_hashed_once(store_root: Path, tmp_path: Path) -> None:
+    ctx = FakeCtx()
+    data = b"%PDF-1.4 identical upload"
+    ctx.s3.put("uploads/t1/a.pdf", data)
+    ctx.s3.put("uploads/t2/b.pdf", data)
+    sha = hashlib.sha256(data).hexdigest()
+
+    first = tmp_path / "task1" / "f1.pdf"
+    assert wm.fetch_task_input(ctx, "t1", "f1", {}, "bucket", "uploads/t1/a.pdf", first) == sha
+    assert ctx.s3.downloads == ["uploads/t1/a.pdf"]
+    (update,) = ctx.ddb.updates
+    assert update["Key"] == {"pk": "TEAM#t1", "sk": "FILE#f1"}
+    assert update["ExpressionAttributeValues"][":sha"] == sha
+    assert update["ExpressionAttributeValues"][":size"] == len(data)
+
+    # 다른 팀이 같은 PDF를 올린 경우: ETag/크기로 찾아 다운로드 없이 하드링크
+    second = tmp_path / "task2" / "f2.pdf"
+    assert wm.fetch_task_input(ctx, "t2", "f2", {}, "bucket", "uploads/t2/b.pdf", second) == sha
+    assert ctx.s3.downloads == ["uploads/t1/a.pdf"]
+    assert second.read_bytes() == data
+    assert os.stat(second).st_ino == os.stat(store_root / "sha256" / sha[:2] / sha).st_ino
+    assert len(ctx.ddb.updates) == 2
+
+    # 이미 digest가 기록된 FILE은 HEAD도, 기록 갱신도 없음
+    third = tmp_path / "task3" / "f1.pdf"
+    assert wm.fetch_task_input(
+        ctx, "t1", "f1", {"content_sha256": sha}, "bucket", "uploads/t1/a.pdf", third,
+    ) == sha
+    assert ctx.s3.heads == ["uploads/t1/a.pdf", "uploads/t2/b.pdf"]
+    assert len(ctx.ddb.updates) == 2
+    assert wm._file_digest(third, sha) == wm._file_digest(third)
+
+
+def test_store_disabled_falls_back_to_plain_download(store_root: Path, tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(wm, "INPUT_STORE_MAX_BYTES", 0)
+    ctx = FakeCtx()
+    ctx.s3.put("k.pdf", b"data")
+    dest = tmp_path / "t" / "k.pdf"
+    dest.parent.mkdir()
+    assert wm.fetch_task_input(ctx, "t", "f", {}, "bucket", "k.pdf", dest) == ""
+    assert dest.read_bytes() == b"data"
+    assert ctx.s3.heads == [] and ctx.ddb.updates == []
+    assert not store_root.exists()
+
+
+def test_lru_eviction_keeps_recently_used_blobs(tmp_path: Path) -> None:
+    store = wm._InputBlobStore(tmp_path / "store", max_bytes=250)
+    paths = []
+    for i in range(3):
+        p = tmp_path / f"in{i}"
+        p.write_bytes(bytes([i]) * 100)
+        paths.append(p)
+
+    sha0, _ = store.add(paths[0])
+    sha1, _ = store.add(paths[1])
+    os.utime(store._blob_path(sha0), (1, 1))
+    os.utime(store._blob_path(sha1), (2, 2))
+    store.link_into(sha0, tmp_path / "task" / "reuse")  # sha0을 최근 사용으로 갱신
+
+    sha2, evicted = store.add(paths[2], etag="e2", size=100)
+    assert evicted == 1
+    assert store.lookup(sha256=sha1) is None
+    assert store.lookup(sha256=sha0) == sha0
+    assert store.lookup(etag="e2", size=100) == sha2
+    assert store.lookup(etag="e2", size=101) is None
+    # 축출돼도 이미 링크된 태스크 파일은 그대로
+    assert (tmp_path / "task" / "reuse").read_bytes() == bytes([0]) * 100
@@ -0,0 +1,314 @@
+"""Tests for the layout analyzer and its compact layout model."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import fitz
+import pytest
+
+from ralph.layout import BBox, LayoutAnalyzer
+from ralph.layout.models import Drawing, DrawingType, TextBlock, TextLine, TextSpan
+from ralph.pdf_context import PdfContext
+
+
+def _make_pdf(path: Path, pages: int = 2) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 60), f"Investment Review {i + 1}", fontsize=18)
+        page.insert_text((72, 120), "상호 : 테스트 주식회사", fontname="korea", fontsize=11)
+        page.insert_text((72, 140), "Revenue grew steadily across the period.", fontsize=11)
+        page.draw_rect(fitz.Rect(72, 200, 300, 260), color=(0, 0, 0))
+        page.draw_line(fitz.Point(72, 300), fitz.Point(500, 300))
+        pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 8, 8), False)
+        pix.clear_with(200)
+        page.insert_image(fitz.Rect(350, 400, 450, 500), pixmap=pix)
+    doc.save(path)
+    doc.close()
+
+
+def test_layout_objects_are_slotted() -> None:
+    span = TextSpan("a", BBox(0, 0, 1, 1), "Helv", 11.0, 16, 0)
+    line = TextLine([span], BBox(0, 0, 1, 1))
+    block = TextBlock([line], BBox(0, 0, 1, 1))
+
+    for obj in (span.bbox, span, line, block):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        span.extra = 1
+    assert span.is_bold and line.is_bold and block.text == "a"
+
+
+def test_analyze_keeps_attribute_api_and_drops_raw_drawing_items(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "layout.pdf"
+    _make_pdf(pdf_path)
+
+    result = LayoutAnalyzer().analyze(pdf_path)
+
+    assert result.page_count == 2
+    page = result.pages[0]
+    assert "Investment Review 1" in page.full_text
+    assert "테스트 주식회사" in result.full_text
+    spans = [s for b in page.text_blocks for line in b.lines for s in line.spans]
+    assert all(s.bbox.width > 0 for s in spans)
+    # 같은 폰트명은 하나의 문자열 객체를 공유
+    helv = [s.font_name for s in spans if s.font_name == spans[0].font_name]
+    assert all(name is helv[0] for name in helv)
+
+    kinds = {d.drawing_type for d in page.drawings}
+    assert {DrawingType.RECT, DrawingType.LINE} <= kinds
+    assert all(isinstance(d, Drawing) and isinstance(d.ops, tuple) for d in page.drawings)
+    assert result.has_raster_images and page.images[0].bbox.x0 == pytest.approx(350)
+
+
+def test_page_dict_drops_image_bytes_but_keeps_image_blocks(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "layout.pdf"
+    _make_pdf(pdf_path, pages=1)
+
+    with PdfContext(pdf_path) as pdf:
+        image_blocks = [b for b in pdf.page_dict(0)["blocks"] if b.get("type") == 1]
+
+    assert image_blocks
+    assert all("image" not in b and len(b["bbox"]) == 4 for b in image_blocks)
+
+
+def _make_table_pdf(path: Path) -> None:
+    doc = fitz.open()
+    page = doc.new_page()  # 0: 표 있음
+    for i in range(4):
+        page.draw_line(fitz.Point(72, 100 + 20 * i), fitz.Point(372, 100 + 20 * i))
+    for x in (72, 222, 372):
+        page.draw_line(fitz.Point(x, 100), fitz.Point(x, 160))
+    for i, label in enumerate(("주주명", "홍길동", "김철수")):
+        page.insert_text((80, 115 + 20 * i), label, fontname="korea", fontsize=10)
+    text_only = doc.new_page()  # 1: 텍스트만
+    text_only.insert_text((72, 72), "No rulings on this page.", fontsize=11)
+    doc.save(path)
+    doc.close()
+
+
+def _count_find_tables(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    real = fitz.Page.find_tables
+
+    def _spy(page, *args, **kwargs):
+        calls.append(page.number)
+        return real(page, *args, **kwargs)
+
+    monkeypatch.setattr(fitz.Page, "find_tables", _spy)
+    return calls
+
+
+def test_features_are_computed_lazily_and_memoized_per_page(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "tables.pdf"
+    _make_table_pdf(pdf_path)
+    calls = _count_find_tables(monkeypatch)
+
+    with PdfContext(pdf_path) as pdf:
+        layout = LayoutAnalyzer().analyze(pdf, features=())
+        assert calls == []
+
+        tables = layout.pages[0].tables
+        assert len(tables) == 1 and tables[0].cells[0][0] == "주주명"
+        assert layout.pages[1].tables == []
+        layout.all_tables()
+        # 선이 없는 1페이지는 find_tables 자체를 건너뛰고, 0페이지는 한 번만
+        assert calls == [0]
+
+        # 추출기가 같은 컨텍스트로 표를 다시 읽어도 재계산하지 않는다
+        assert pdf.page_tables(0)[0].extract() == tables[0].cells
+        assert calls == [0]
+
+
+def test_owned_pdf_leaves_undeclared_features_empty(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "tables.pdf"
+    _make_table_pdf(pdf_path)
+    calls = _count_find_tables(monkeypatch)
+
+    text_only = LayoutAnalyzer().analyze(pdf_path, features=())
+    assert calls == [] and text_only.total_tables == 0
+    assert "홍길동" in text_only.full_text
+
+    with_zones = LayoutAnalyzer().analyze(pdf_path, features={"zones"})
+    assert with_zones.total_tables == 1
+    assert [z.zone_type.value for z in with_zones.pages[0].zones][:1] == ["table"]
+
+    with pytest.raises(ValueError):
+        LayoutAnalyzer().analyze(pdf_path, features={"charts"})
+
+
+def test_parse_document_skips_table_detection_for_text_only_extractors(tmp_path: Path, monkeypatch) -> None:
+    from ralph.pipeline import parse_document
+
+    pdf_path = tmp_path / "tables.pdf"
+    _make_table_pdf(pdf_path)
+    calls = _count_find_tables(monkeypatch)
+
+    parse_document(pdf_path, "certificate")
+    assert calls == []
+
+    parse_document(pdf_path, "shareholder")
+    assert calls == [0]
+
+
+def test_spatial_index_matches_brute_force_queries() -> None:
+    import random
+
+    from ralph.layout import SpatialIndex
+
+    rng = random.Random(3)
+    boxes = []
+    for _ in range(300):
+        x0, y0 = rng.uniform(0, 500), rng.uniform(0, 800)
+        boxes.append(BBox(x0, y0, x0 + rng.uniform(0, 80), y0 + rng.uniform(0, 15)))
+    index = SpatialIndex(boxes, cell=40)
+
+    for _ in range(50):
+        x0, y0 = rng.uniform(0, 450), rng.uniform(0, 700)
+        q = BBox(x0, y0, x0 + rng.uniform(5, 150), y0 + rng.uniform(5, 120))
+        assert index.contained_in(q, 5.0) == [i for i, b in enumerate(boxes) if q.contains(b, 5.0)]
+        assert index.overlapping(q) == [i for i, b in enumerate(boxes) if b.overlap(q) is not None]
+        assert index.containing(q, 2.0) == [i for i, b in enumerate(boxes) if b.contains(q, 2.0)]
+        assert index.in_y_range(q.y0, q.y1) == [i for i, b in enumerate(boxes) if b.y0 <= q.y1 and b.y1 >= q.y0]
+        nearest = index.nearest(q, k=3)
+        expected = sorted(range(len(boxes)), key=lambda i: (q.distance_to(boxes[i]), i))[:3]
+        assert [q.distance_to(boxes[i]) for i in nearest] == pytest.approx([q.distance_to(boxes[i]) for i in expected])
+
+    far = BBox(5000, 5000, 5001, 5001)
+    assert index.nearest(far, max_distance=10) == []
+    assert len(index.nearest(far)) == 1
+
+
+def test_spatial_index_containing_honours_tolerance_across_cells() -> None:
+    from ralph.layout import SpatialIndex
+
+    # 항목은 첫 칸(0~48)에만 등록되고, 질의는 tolerance 안쪽이지만 다음 칸에 있다
+    box = BBox(0, 0, 47.5, 47.5)
+    query = BBox(48.5, 10, 49, 11)
+    assert box.contains(query, 2.0)
+    assert SpatialIndex([box]).containing(query, 2.0) == [0]
+    assert SpatialIndex([box]).containing(query, 0.5) == []
+
+
+def test_table_blocks_are_excluded_from_text_zones(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "tables.pdf"
+    _make_table_pdf(pdf_path)
+
+    with PdfContext(pdf_path) as pdf:
+        page = LayoutAnalyzer().analyze(pdf).pages[0]
+        in_table = page.block_index.contained_in(page.tables[0].bbox, tolerance=5.0)
+        text_zone_blocks = [b for z in page.zones for b in z.blocks]
+
+    assert in_table
+    assert all(page.text_blocks[i] not in text_zone_blocks for i in in_table)
+
+
+def _layout_snapshot(layout) -> list:
+    return [
+        (
+            p.page_num, p.width, p.height,
+            [(b.block_num, b.bbox, [(ln.bbox, ln.spans) for ln in b.lines]) for b in p.text_blocks],
+            p.tables, p.images, p.drawings,
+            [(z.zone_type, z.bbox, z.text, z.confidence, z.metadata) for z in p.zones],
+        )
+        for p in layout.pages
+    ]
+
+
+def test_layout_cache_round_trips_compact_binary(tmp_path: Path) -> None:
+    from ralph.layout.cache import dumps_layout, loads_layout
+
+    pdf_path = tmp_path / "layout.pdf"
+    _make_pdf(pdf_path)
+    _make_table_pdf(tmp_path / "tables.pdf")
+
+    for path in (pdf_path, tmp_path / "tables.pdf"):
+        layout = LayoutAnalyzer().analyze(path)
+        data = dumps_layout(layout)
+        restored = loads_layout(data, str(path))
+
+        assert data[:4] == b"RLC1"
+        assert _layout_snapshot(restored) == _layout_snapshot(layout)
+        assert restored.font_stats == layout.font_stats
+        assert restored.total_text_blocks == layout.total_text_blocks
+
+
+def test_layout_cache_keeps_lazy_features_lazy(tmp_path: Path, monkeypatch) -> None:
+    from ralph.layout.cache import dumps_layout, loads_layout
+
+    pdf_path = tmp_path / "tables.pdf"
+    _make_table_pdf(pdf_path)
+    calls = _count_find_tables(monkeypatch)
+
+    with PdfContext(pdf_path) as pdf:
+        text_only = LayoutAnalyzer().analyze(pdf, features=())
+        restored = loads_layout(dumps_layout(text_only))
+        assert all(p.materialized() == frozenset() for p in restored.pages)
+
+        LayoutAnalyzer().resume(restored, pdf, features={"tables"})
+        assert calls == [0] and restored.total_tables == 1
+        assert restored.pages[0].materialized() == {"tables"}
+        assert restored.source_path == pdf.pdf_path
+
+
+def test_parse_document_reuses_cached_layout(tmp_path: Path, monkeypatch) -> None:
+    from ralph.layout import cache as layout_cache
+    from ralph.pipeline import parse_document
+
+    monkeypatch.setenv("RALPH_LAYOUT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.delenv("RALPH_LAYOUT_CACHE_S3_BUCKET", raising=False)
+    monkeypatch.setattr(layout_cache, "_cache", None)
+    monkeypatch.setattr(layout_cache, "_cache_loaded", False)
+    pdf_path = tmp_path / "tables.pdf"
+    _make_table_pdf(pdf_path)
+    calls = _count_find_tables(monkeypatch)
+    analyzed: list[str] = []
+    real_analyze = LayoutAnalyzer.analyze
+    monkeypatch.setattr(
+        LayoutAnalyzer, "analyze",
+        lambda self, *a, **kw: analyzed.append("x") or real_analyze(self, *a, **kw),
+    )
+
+    first = parse_document(pdf_path, "shareholder")
+    second = parse_document(pdf_path, "shareholder")
+    third = parse_document(pdf_path, "shareholder", include_layout=True)
+
+    assert analyzed == ["x"] and calls == [0]
+    assert second.data == first.data and second.confidence == first.confidence
+    assert third.layout.total_tables == 1 and third.layout.all_zones()
+    assert list((tmp_path / "cache").rglob("*.rlc"))
+
+
+def test_layout_cache_evicts_least_recently_used_by_bytes(tmp_path: Path) -> None:
+    import os
+
+    from ralph.layout.cache import LayoutCache, dumps_layout
+
+    pdf_path = tmp_path / "layout.pdf"
+    _make_pdf(pdf_path)
+    layout = LayoutAnalyzer().analyze(pdf_path)
+    size = len(dumps_layout(layout))
+    cache = LayoutCache(tmp_path / "cache", max_bytes=int(size * 2.5))
+
+    cache.put("aa" * 32, layout)
+    cache.put("bb" * 32, layout)
+    for i, path in enumerate(sorted((tmp_path / "cache").rglob("*.rlc"))):
+        os.utime(path, (1000 + i, 1000 + i))
+    assert cache.get("aa" * 32) is not None  # aa를 최근 사용으로 갱신
+    cache.put("cc" * 32, layout)
+
+    assert cache.get("bb" * 32) is None
+    assert cache.get("aa" * 32) is not None and cache.get("cc" * 32) is not None
+
+
+def test_layout_cache_misses_on_analyzer_version_change(tmp_path: Path, monkeypatch) -> None:
+    from ralph.layout import cache as layout_cache
+
+    pdf_path = tmp_path / "layout.pdf"
+    _make_pdf(pdf_path, pages=1)
+    cache = layout_cache.LayoutCache(tmp_path / "cache")
+    cache.put("dd" * 32, LayoutAnalyzer().analyze(pdf_path))
+
+    monkeypatch.setattr(layout_cache, "ANALYZER_VERSION", "next")
+    assert cache.get("dd" * 32) is None
@@ -0,0 +1,117 @@
+"""Tests for parallel page dispatch in NovaLiteHybridCaller and the Bedrock client pool."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz
+import pytest
+
+from ralph.vlm.client_pool import clear_bedrock_clients, get_bedrock_client
+from ralph.vlm.nova_caller import NovaLiteHybridCaller
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool():
+    clear_bedrock_clients()
+    yield
+    clear_bedrock_clients()
+
+
+def _make_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"slide {i + 1}", fontsize=20)
+    doc.save(path)
+    doc.close()
+
+
+class _FakeBedrock:
+    def __init__(self, delays: dict[int, float] | None = None):
+        self._delays = delays or {}
+        self._lock = threading.Lock()
+        self._active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def converse(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+            call_no = self.calls
+            self._active += 1
+            self.peak = max(self.peak, self._active)
+        try:
+            time.sleep(self._delays.get(call_no, 0.05))
+        finally:
+            with self._lock:
+                self._active -= 1
+        body = {"visuals": [{"type": "chart", "description": f"call {call_no}"}], "layout_summary": "s"}
+        return {
+            "output": {"message": {"content": [{"text": json.dumps(body)}]}},
+            "usage": {"inputTokens": 10, "outputTokens": 3},
+        }
+
+
+def test_extract_keeps_page_order_and_sums_usage(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "deck.pdf"
+    _make_pdf(pdf_path, 5)
+    # 첫 호출이 가장 늦게 끝나도 결과는 페이지 순서를 유지해야 함
+    fake = _FakeBedrock(delays={1: 0.2})
+
+    with patch("boto3.client", return_value=fake):
+        result = NovaLiteHybridCaller(region="test", max_concurrency=3).extract(
+            str(pdf_path), "investment_review", max_pages=5,
+        )
+
+    assert result.success, result.error
+    pages = result.data["pages"]
+    assert [p["page"] for p in pages] == [1, 2, 3, 4, 5]
+    assert [p["text"] for p in pages] == [f"slide {i}" for i in range(1, 6)]
+    assert all("_input_tokens" not in p for p in pages)
+    assert result.usage == {"input_tokens": 50, "output_tokens": 15}
+    assert result.confidence == 1.0
+    assert 1 < fake.peak <= 3
+
+
+def test_failed_page_does_not_fail_document(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "deck.pdf"
+    _make_pdf(pdf_path, 2)
+
+    class _Flaky(_FakeBedrock):
+        def converse(self, **kwargs):
+            img = kwargs["messages"][0]["content"][0]["image"]["source"]["bytes"]
+            if img == first_page_png:
+                raise RuntimeError("throttled")
+            return super().converse(**kwargs)
+
+    with fitz.open(pdf_path) as doc:
+        first_page_png = doc[0].get_pixmap(matrix=fitz.Matrix(150 / 72, 150 / 72)).tobytes("png")
+
+    with patch("boto3.client", return_value=_Flaky()):
+        result = NovaLiteHybridCaller(region="test", max_concurrency=2).extract(
+            str(pdf_path), "investment_review",
+        )
+
+    assert result.success
+    assert result.data["pages"][0]["visuals"] == []
+    assert result.data["pages"][1]["visuals"]
+    assert result.usage == {"input_tokens": 10, "output_tokens": 3}
+    assert result.confidence == 0.5
+
+
+def test_client_pool_reuses_clients_per_region_and_config() -> None:
+    with patch("boto3.client", side_effect=lambda *a, **kw: object()) as factory:
+        a1 = get_bedrock_client("us-east-1")
+        a2 = get_bedrock_client("us-east-1")
+        b = get_bedrock_client("ap-northeast-2")
+        c = get_bedrock_client("us-east-1", config={"read_timeout": 120})
+
+    assert a1 is a2
+    assert a1 is not b
+    assert a1 is not c
+    assert factory.call_count == 3
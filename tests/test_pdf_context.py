@@ -0,0 +1,87 @@
+"""Tests for the shared single-open PdfContext."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz
+
+from ralph.pdf_context import PdfContext, pdf_context
+
+
+def _make_pdf(path: Path, pages: int = 2) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(
+            fitz.Rect(72, 72, 520, 760),
+            f"Page {i + 1} of the shared context test document. " * 3,
+            fontsize=12,
+        )
+    doc.save(path)
+    doc.close()
+
+
+def test_parser_helpers_share_one_open(tmp_path: Path) -> None:
+    from ralph.playground_parser import analyze_pages, extract_text, render_first_page, render_pages
+
+    pdf_path = tmp_path / "shared.pdf"
+    _make_pdf(pdf_path)
+
+    real_open = fitz.open
+    with patch("ralph.pdf_context.fitz.open", side_effect=real_open) as opened:
+        with pdf_context(pdf_path) as pdf:
+            text, pages, blocks = extract_text(pdf)
+            png = render_first_page(pdf)
+            jpegs = render_pages(pdf, max_pages=10, dpi=100)
+            info = analyze_pages(pdf, max_pages=10)
+
+    assert opened.call_count == 1
+    assert pages == 2
+    assert "shared context" in text
+    assert blocks
+    assert png[:4] == b"\x89PNG"
+    assert len(jpegs) == 2 and all(j[:2] == b"\xff\xd8" for j in jpegs)
+    assert [p["page"] for p in info] == [1, 2]
+    assert "Page 1" in info[0]["text"]
+
+
+def test_page_results_are_cached(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "cached.pdf"
+    _make_pdf(pdf_path, pages=1)
+
+    with PdfContext(pdf_path) as pdf:
+        assert pdf.page_dict(0) is pdf.page_dict(0)
+        assert pdf.render(0, dpi=72) is pdf.render(0, dpi=72)
+        assert pdf.render(0, dpi=72) is not pdf.render(0, dpi=72, fmt="jpeg")
+
+
+def test_borrowed_context_is_not_closed(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "borrowed.pdf"
+    _make_pdf(pdf_path, pages=1)
+
+    owner = PdfContext(pdf_path)
+    try:
+        with pdf_context(owner) as borrowed:
+            assert borrowed is owner
+            borrowed.page_text(0)
+        # 빌려준 쪽은 닫지 않음 — 소유자가 계속 사용 가능
+        assert owner._doc is not None
+        assert owner.page_count == 1
+    finally:
+        owner.close()
+    assert owner._doc is None
+
+
+def test_context_is_path_like(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "pathlike.pdf"
+    _make_pdf(pdf_path, pages=1)
+
+    pdf = PdfContext(pdf_path)
+    assert os.fspath(pdf) == str(pdf_path)
+    assert Path(pdf).stem == "pathlike"
+    assert os.path.exists(pdf)
+    # 경로 호환 접근만으로는 문서를 열지 않는다
+    assert pdf._doc is None
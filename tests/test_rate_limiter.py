@@ -0,0 +1,231 @@
+"""Tests for the shared Bedrock rate limiter (token buckets + AIMD concurrency)."""
+
+from __future__ import annotations
+
+import re
+import threading
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from ralph.vlm.rate_limiter import (
+    BedrockRateLimiter,
+    BucketSpec,
+    DynamoDbRateBackend,
+    InMemoryRateBackend,
+    is_throttle,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class _Throttled(Exception):
+    def __init__(self) -> None:
+        super().__init__("ThrottlingException")
+        self.response = {"Error": {"Code": "ThrottlingException"}}
+
+
+def _limiter(clock: _Clock, backend=None, **kw: Any) -> BedrockRateLimiter:
+    return BedrockRateLimiter(backend or InMemoryRateBackend(clock), clock=clock, sleep=clock.sleep, **kw)
+
+
+def test_rpm_bucket_delays_requests_over_budget() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, default_rpm=60)  # 초당 1개 충전, 최대 60개
+
+    for _ in range(61):
+        with limiter.call("nova"):
+            pass
+
+    assert sum(clock.sleeps) == pytest.approx(1.0)
+    assert limiter.stats()["budget_waits"] == 1
+
+
+def test_replicas_share_one_backend_budget() -> None:
+    clock = _Clock()
+    backend = InMemoryRateBackend(clock)
+    a = _limiter(clock, backend, limits={"nova": {"rpm": 2}})
+    b = _limiter(clock, backend, limits={"nova": {"rpm": 2}})
+
+    with a.call("nova"):
+        pass
+    with b.call("nova"):
+        pass
+    with b.call("nova"):  # a와 b가 같은 예산을 쓰므로 세 번째는 기다린다
+        pass
+
+    assert sum(clock.sleeps) == pytest.approx(30.0)
+    with b.call("other-model"):  # 한도가 없는 모델은 영향 없음
+        pass
+    assert sum(clock.sleeps) == pytest.approx(30.0)
+
+
+def test_tpm_is_settled_with_actual_usage() -> None:
+    clock = _Clock()
+    backend = InMemoryRateBackend(clock)
+    limiter = _limiter(clock, backend, default_tpm=1000)
+
+    with limiter.call("nova", estimated_tokens=900) as slot:
+        slot.record_usage(input_tokens=80, output_tokens=20)
+
+    # 900 선차감 후 100만 썼으므로 800 환불 → 900 여유
+    assert backend.try_acquire("nova", {"tpm": (900, BucketSpec.per_minute(1000))}) == 0.0
+
+
+def test_failed_calls_refund_estimated_tpm() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, default_tpm=1000)
+
+    for _ in range(5):
+        with pytest.raises(ValueError):
+            with limiter.call("nova", estimated_tokens=900):
+                raise ValueError("bad request")
+    # 같은 스로틀 폭주 안(drain 쿨다운 중)의 스로틀도 선차감분을 돌려받는다
+    limiter._concurrency("nova").last_decrease = clock.now
+    for _ in range(5):
+        with pytest.raises(_Throttled):
+            with limiter.call("nova", estimated_tokens=900):
+                raise _Throttled()
+
+    assert clock.sleeps == []  # 토큰을 쓰지 않은 호출이 TPM 예산을 깎지 않는다
+
+
+def test_throttle_halves_concurrency_once_per_storm_and_success_regrows() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, initial_concurrency=8, max_concurrency=16)
+
+    for _ in range(3):
+        with pytest.raises(_Throttled):
+            with limiter.call("nova"):
+                raise _Throttled()
+    assert limiter.concurrency_limit("nova") == 4
+
+    clock.now += 2
+    with pytest.raises(_Throttled):
+        with limiter.call("nova"):
+            raise _Throttled()
+    assert limiter.concurrency_limit("nova") == 2
+
+    for _ in range(10):
+        with limiter.call("nova"):
+            pass
+    assert limiter.concurrency_limit("nova") > 2
+    assert limiter.stats()["throttles"] == 4
+
+
+def test_non_throttle_errors_do_not_shrink_concurrency() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, initial_concurrency=4)
+
+    with pytest.raises(ValueError):
+        with limiter.call("nova"):
+            raise ValueError("bad request")
+    assert limiter.concurrency_limit("nova") == 4
+
+
+def test_concurrency_slots_bound_parallel_calls() -> None:
+    limiter = BedrockRateLimiter(initial_concurrency=2, max_concurrency=2)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+    release = threading.Event()
+
+    def _call() -> None:
+        nonlocal active, peak
+        with limiter.call("nova"):
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            release.wait(0.05)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=_call) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak == 2
+
+
+def test_is_throttle_classification() -> None:
+    assert is_throttle(_Throttled())
+    assert is_throttle(RuntimeError("Too many requests, please wait"))
+    assert not is_throttle(RuntimeError("ValidationException: bad input"))
+
+
+class _ConditionalCheckFailed(Exception):
+    pass
+
+
+class _FakeRateTable:
+    """update_item의 SET/ADD와 조건식 몇 가지만 이해하는 DDB 테이블."""
+
+    class meta:
+        class client:
+            class exceptions:
+                ConditionalCheckFailedException = _ConditionalCheckFailed
+
+    def __init__(self) -> None:
+        self.items: dict[tuple[str, str], dict[str, Any]] = {}
+        self.conflicts = 0
+
+    def get_item(self, Key: dict[str, str], **kw: Any) -> dict[str, Any]:
+        item = self.items.get((Key["pk"], Key["sk"]))
+        return {"Item": dict(item)} if item else {}
+
+    def update_item(self, *, Key, UpdateExpression, ExpressionAttributeValues, ExpressionAttributeNames=None, ConditionExpression=""):
+        if self.conflicts:
+            self.conflicts -= 1
+            current = self.items.setdefault((Key["pk"], Key["sk"]), dict(Key))
+            current["version"] = current.get("version", 0) + 1
+        names = ExpressionAttributeNames or {}
+        values = ExpressionAttributeValues
+        item = self.items.get((Key["pk"], Key["sk"]))
+        if ConditionExpression == "attribute_not_exists(pk)" and item is not None:
+            raise _ConditionalCheckFailed()
+        if ConditionExpression == "attribute_exists(pk)" and item is None:
+            raise _ConditionalCheckFailed()
+        if ConditionExpression == "#ver = :v" and (item or {}).get("version") != values[":v"]:
+            raise _ConditionalCheckFailed()
+        item = dict(item or Key)
+        set_part, _, add_part = UpdateExpression.partition("ADD ")
+        for name, value in re.findall(r"(\S+) = (:\w+)", set_part):
+            item[names.get(name, name)] = values[value]
+        for name, value in re.findall(r"(\S+) (:\w+)", add_part):
+            field = names.get(name, name)
+            item[field] = item.get(field, 0) + values[value]
+        self.items[(Key["pk"], Key["sk"])] = item
+
+
+def test_dynamodb_backend_acquires_refills_and_retries_on_conflict() -> None:
+    clock = _Clock()
+    table = _FakeRateTable()
+    backend = DynamoDbRateBackend(table, clock=clock)
+    spec = BucketSpec.per_minute(2)
+
+    assert backend.try_acquire("nova", {"rpm": (1, spec)}) == 0.0
+    table.conflicts = 1  # 다른 레플리카가 먼저 썼다 → 다시 읽고 성공
+    assert backend.try_acquire("nova", {"rpm": (1, spec)}) == 0.0
+    assert backend.try_acquire("nova", {"rpm": (1, spec)}) == pytest.approx(30.0)
+
+    clock.now += 30
+    assert backend.try_acquire("nova", {"rpm": (1, spec)}) == 0.0
+
+    backend.adjust("nova", "rpm", 1, spec)
+    item = table.items[("RATELIMIT", "BUCKET#nova")]
+    assert item["b_rpm"] == Decimal("1")
+    backend.drain("nova", {"rpm": spec})
+    assert table.items[("RATELIMIT", "BUCKET#nova")]["b_rpm"] == 0
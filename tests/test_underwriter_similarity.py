@@ -0,0 +1,153 @@
+"""Tests for the persisted sparse TF-IDF index behind underwriter similarity search."""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from agent.tools import underwriter_tools as uw
+
+_SECTIONS = [
+    ("시장 규모", "국내 반도체 장비 시장 규모는 연평균 12% 성장이 전망됩니다."),
+    ("비교회사 선정", "유사 사업을 영위하는 비교회사 3개사를 선정하였습니다."),
+    ("수요예측", "기관투자자 수요예측 결과 공모가격을 확정하였습니다."),
+    ("시장 전망", "글로벌 바이오 시장은 2030년까지 빠르게 성장할 것으로 예상됩니다."),
+    ("위험 요소", "환율 변동과 원재료 가격 상승은 수익성에 불확실성을 줍니다."),
+]
+
+
+def _write_jsonl(path: Path, sections, mode: str = "w", start: int = 0) -> None:
+    with open(path, mode, encoding="utf-8") as f:
+        for i, (title, text) in enumerate(sections, start=start):
+            f.write(json.dumps({
+                "corp_name": f"회사{i}", "section_title": title,
+                "section_text": text, "section_length": len(text),
+            }, ensure_ascii=False) + "\n")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory_cache(monkeypatch):
+    monkeypatch.setattr(uw, "_UNDERWRITER_TFIDF_CACHE", dict.fromkeys(uw._UNDERWRITER_TFIDF_CACHE))
+
+
+def _reference_scores(texts: list[str], query: str) -> list[float]:
+    """해시 없이 n-gram 문자열 그대로 계산한 코사인 유사도."""
+    counts = [uw._char_ngram_counts(t) for t in texts]
+    df: dict[str, int] = {}
+    for c in counts:
+        for term in c:
+            df[term] = df.get(term, 0) + 1
+    idf = {t: math.log((1 + len(texts)) / (1 + f)) + 1 for t, f in df.items()}
+
+    def vec(c):
+        v = {t: (1 + math.log(tf)) * idf[t] for t, tf in c.items() if t in idf}
+        return v, math.sqrt(sum(w * w for w in v.values()))
+
+    q, qn = vec(uw._char_ngram_counts(query))
+    scores = []
+    for c in counts:
+        d, dn = vec(c)
+        dot = sum(w * d.get(t, 0.0) for t, w in q.items())
+        scores.append(dot / (qn * dn) if qn and dn else 0.0)
+    return scores
+
+
+def _count_tokenized(monkeypatch) -> list[str]:
+    seen: list[str] = []
+    real = uw._ngram_bucket_weights
+
+    def _spy(text, *args, **kwargs):
+        seen.append(text)
+        return real(text, *args, **kwargs)
+
+    monkeypatch.setattr(uw, "_ngram_bucket_weights", _spy)
+    return seen
+
+
+def test_sparse_scores_match_exact_cosine(tmp_path: Path) -> None:
+    path = tmp_path / "underwriter_opinion.jsonl"
+    _write_jsonl(path, _SECTIONS)
+    cache, error = uw._get_underwriter_tfidf_index(str(path))
+    assert error is None
+
+    texts = [uw._underwriter_similarity_text(e, 2000) for e in cache["entries"]]
+    query = uw._normalize_similarity_text("반도체 시장 규모 성장 전망")
+    scores = uw._score_tfidf_query(cache["index"], query)
+
+    assert scores.tolist() == pytest.approx(_reference_scores(texts, query), abs=1e-9)
+    assert int(np.argmax(scores)) == 0
+
+
+def test_index_is_persisted_and_extended_on_append(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "underwriter_opinion.jsonl"
+    _write_jsonl(path, _SECTIONS[:3])
+    uw._get_underwriter_tfidf_index(str(path))
+    assert (tmp_path / "underwriter_opinion.jsonl.tfidf.npz").exists()
+
+    # 새 프로세스: 저장된 인덱스를 읽고 토큰화하지 않는다
+    monkeypatch.setattr(uw, "_UNDERWRITER_TFIDF_CACHE", dict.fromkeys(uw._UNDERWRITER_TFIDF_CACHE))
+    tokenized = _count_tokenized(monkeypatch)
+    cache, _ = uw._get_underwriter_tfidf_index(str(path))
+    assert tokenized == [] and cache["index"]["doc_count"] == 3
+
+    # 공시 추가: 새 줄만 토큰화하고 전체 재구축과 같은 인덱스
+    _write_jsonl(path, _SECTIONS[3:], mode="a", start=3)
+    appended, _ = uw._get_underwriter_tfidf_index(str(path))
+    assert len(tokenized) == 2
+    incremental = appended["index"]
+
+    (tmp_path / "underwriter_opinion.jsonl.tfidf.npz").unlink()
+    monkeypatch.setattr(uw, "_UNDERWRITER_TFIDF_CACHE", dict.fromkeys(uw._UNDERWRITER_TFIDF_CACHE))
+    rebuilt = uw._get_underwriter_tfidf_index(str(path))[0]["index"]
+    for a, b in zip(incremental["postings"], rebuilt["postings"]):
+        assert np.array_equal(a, b)
+    assert np.allclose(incremental["post_weights"], rebuilt["post_weights"])
+
+
+def test_rewritten_jsonl_triggers_full_rebuild(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "underwriter_opinion.jsonl"
+    _write_jsonl(path, _SECTIONS)
+    uw._get_underwriter_tfidf_index(str(path))
+
+    _write_jsonl(path, list(reversed(_SECTIONS)))
+    monkeypatch.setattr(uw, "_UNDERWRITER_TFIDF_CACHE", dict.fromkeys(uw._UNDERWRITER_TFIDF_CACHE))
+    tokenized = _count_tokenized(monkeypatch)
+    cache, _ = uw._get_underwriter_tfidf_index(str(path))
+
+    assert len(tokenized) == len(_SECTIONS)
+    assert cache["entries"][0]["section_title"] == _SECTIONS[-1][0]
+
+
+def test_similar_search_applies_filters_after_top_k_selection(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "underwriter_opinion.jsonl"
+    _write_jsonl(path, _SECTIONS)
+    monkeypatch.setattr(uw, "_validate_file_path", lambda *a, **kw: (True, None))
+
+    result = uw.execute_search_underwriter_opinion_similar(
+        "시장 규모 성장 전망", jsonl_path=str(path), top_k=2, min_score=0.0,
+    )
+    assert result["success"]
+    scores = [r["score"] for r in result["results"]]
+    assert len(scores) == 2 and scores == sorted(scores, reverse=True)
+    assert result["results"][0]["corp_name"] == "회사0"
+
+    filtered = uw.execute_search_underwriter_opinion_similar(
+        "시장 규모 성장 전망", jsonl_path=str(path), corp_name="회사3", min_score=0.0,
+    )
+    assert [r["corp_name"] for r in filtered["results"]] == ["회사3"]
+
+
+def test_unicode_line_separators_inside_records_do_not_drop_entries(tmp_path: Path) -> None:
+    path = tmp_path / "underwriter_opinion.jsonl"
+    sections = [(title, text.replace(" ", "\x85", 1).replace("다.", "다.\u2028", 1)) for title, text in _SECTIONS]
+    _write_jsonl(path, sections)
+
+    cache, error = uw._get_underwriter_tfidf_index(str(path))
+
+    assert error is None
+    assert len(cache["entries"]) == len(uw._parse_underwriter_jsonl(str(path))) == len(_SECTIONS)
+    assert [e["section_text"] for e in cache["entries"]] == [text for _, text in sections]
@@ -0,0 +1,167 @@
+"""Tests for the content-addressed vision result cache in dolphin_service."""
+
+from __future__ import annotations
+
+import shutil
+from pathlib import Path
+
+import fitz
+import pytest
+
+from dolphin_service import cache as result_cache
+from dolphin_service import processor as proc
+from dolphin_service.classifier import ClassificationResult, DocType
+from dolphin_service.config import DOLPHIN_CONFIG
+
+
+def _make_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=200, height=200)
+        page.insert_text((20, 40), f"Page {i + 1}", fontsize=12)
+    doc.save(path)
+    doc.close()
+
+
+@pytest.fixture
+def vision(tmp_path: Path, monkeypatch):
+    """분류는 MIXED_RICH(8페이지 청크)로 고정하고 Vision 호출은 기록만 한다."""
+    monkeypatch.setitem(DOLPHIN_CONFIG, "cache_enabled", True)
+    monkeypatch.setitem(DOLPHIN_CONFIG, "cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setitem(DOLPHIN_CONFIG, "cache_max_mb", 64)
+    monkeypatch.setattr(result_cache, "_cache", None)
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+
+    def _classify(pdf_path):
+        with fitz.open(pdf_path) as doc:
+            pages = len(doc)
+        return ClassificationResult(
+            DocType.MIXED_RICH, pages, 0, [], 0, 0, 0, 0.0, 0.0, 0.0, 1.0,
+        )
+
+    calls: list[tuple[int, int]] = []
+
+    def _claude(self, images, output_mode, progress_callback=None, page_offset=0, **kw):
+        calls.append((page_offset, page_offset + len(images)))
+        pages = [{"page_num": page_offset + i + 1} for i in range(len(images))]
+        return {
+            "content": f"p{page_offset}-{page_offset + len(images)}",
+            "structured_content": {"pages": pages},
+            "usage": {"input_tokens": 100, "output_tokens": 10},
+        }
+
+    monkeypatch.setattr(proc.doc_classifier, "classify_document", _classify)
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_process_with_claude", _claude)
+    return calls
+
+
+def test_same_content_under_another_path_hits_document_cache(tmp_path: Path, vision) -> None:
+    first = tmp_path / "upload-1.pdf"
+    _make_pdf(first, pages=3)
+    second = tmp_path / "other" / "upload-2.pdf"
+    second.parent.mkdir()
+    shutil.copy(first, second)
+
+    a = proc.ClaudeVisionProcessor().process_pdf(str(first))
+    b = proc.ClaudeVisionProcessor().process_pdf(str(second))
+
+    assert vision == [(0, 3)]
+    assert a["cache_hit"] is False and b["cache_hit"] is True
+    assert b["file_path"] == str(second) and b["content"] == a["content"]
+
+
+def test_overlapping_request_reuses_analyzed_chunks(tmp_path: Path, vision) -> None:
+    pdf = tmp_path / "deck.pdf"
+    _make_pdf(pdf, pages=20)
+
+    full = proc.ClaudeVisionProcessor().process_pdf(str(pdf), max_pages=16)
+    assert vision == [(0, 8), (8, 16)] and full["cached_chunks"] == 0
+
+    vision.clear()
+    head = proc.ClaudeVisionProcessor().process_pdf(str(pdf), max_pages=8)
+    assert vision == [] and head["cached_chunks"] == 1
+    assert head["content"] == "p0-8" and head["usage"] == {}
+
+    longer = proc.ClaudeVisionProcessor().process_pdf(str(pdf), max_pages=20)
+    assert vision == [(16, 20)] and longer["cached_chunks"] == 2
+
+
+def test_failed_chunks_are_not_cached(tmp_path: Path, vision, monkeypatch) -> None:
+    pdf = tmp_path / "deck.pdf"
+    _make_pdf(pdf, pages=16)
+    succeed = proc.ClaudeVisionProcessor._process_with_claude
+
+    def _flaky(self, images, output_mode, progress_callback=None, page_offset=0, **kw):
+        if page_offset == 8:
+            vision.append((page_offset, page_offset + len(images)))
+            return {"success": False, "error": "API 호출 한도에 도달했습니다."}
+        return succeed(self, images, output_mode, progress_callback, page_offset=page_offset, **kw)
+
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_process_with_claude", _flaky)
+    partial = proc.ClaudeVisionProcessor().process_pdf(str(pdf))
+    assert partial["content"] == "p0-8" and partial["cache_hit"] is False
+
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_process_with_claude", succeed)
+    vision.clear()
+    retried = proc.ClaudeVisionProcessor().process_pdf(str(pdf))
+
+    # 문서 결과도, 실패한 청크도 저장되지 않아 실패한 청크만 다시 호출된다
+    assert retried["cache_hit"] is False and retried["cached_chunks"] == 1
+    assert vision == [(8, 16)]
+
+
+def test_prompt_change_invalidates_chunk_cache(vision, monkeypatch) -> None:
+    from dolphin_service.strategy import get_strategy
+
+    strategy = get_strategy(DocType.MIXED_RICH)
+    processor = proc.ClaudeVisionProcessor()
+    processor._process_chunk_cached(["img"], "structured", strategy=strategy, digest="d" * 64)
+    hit = processor._process_chunk_cached(["img"], "structured", strategy=strategy, digest="d" * 64)
+    assert hit["cache_hit"] and "usage" not in hit
+
+    real = proc.prompt_registry.get_prompts
+    monkeypatch.setattr(
+        proc.prompt_registry, "get_prompts",
+        lambda *a, **kw: (real(*a, **kw)[0] + " v2", real(*a, **kw)[1]),
+    )
+    processor._process_chunk_cached(["img"], "structured", strategy=strategy, digest="d" * 64)
+
+    assert vision == [(0, 1), (0, 1)]
+
+
+def test_cache_is_compressed_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    import os
+
+    cache = result_cache.VisionResultCache(tmp_path, max_bytes=5_000)
+    value = {"content": "재무제표 " * 2000, "pages": list(range(50))}
+    cache.put({"k": 1}, value)
+    (entry,) = tmp_path.rglob("*.json.z")
+    assert entry.stat().st_size < 2_000  # 압축 저장
+    assert cache.get({"k": 1}) == value
+
+    noise = {"content": os.urandom(3000).hex()}  # 압축이 잘 안 되는 항목
+    cache.put({"k": 2}, noise)
+    for i, p in enumerate(sorted(tmp_path.rglob("*.json.z"), key=lambda p: p.stat().st_mtime)):
+        os.utime(p, (1000 + i, 1000 + i))
+    assert cache.get({"k": 1}) is not None  # k1을 최근 사용으로
+    cache.put({"k": 3}, noise)
+
+    assert cache.get({"k": 2}) is None
+    assert cache.get({"k": 1}) == value and cache.get({"k": 3}) == noise
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_ttl_counts_from_write_not_last_read(tmp_path: Path, monkeypatch) -> None:
+    now = [1_000_000.0]
+    monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+    cache = result_cache.VisionResultCache(tmp_path, max_bytes=1_000_000, ttl_seconds=100)
+    cache.put({"k": 1}, {"content": "x"})
+
+    for _ in range(2):
+        now[0] += 40
+        hit = cache.get({"k": 1})  # 읽기마다 mtime이 갱신되어도
+    assert hit == {"content": "x"}
+
+    now[0] += 40
+    assert cache.get({"k": 1}) is None  # 저장 후 120초: 만료
+    assert not list(tmp_path.rglob("*.json.z"))
@@ -0,0 +1,139 @@
+"""Tests for the streaming render → chunk → dispatch path in dolphin_service."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from dolphin_service import cache as result_cache
+from dolphin_service import chunker as chunker_mod
+from dolphin_service import processor as proc
+from dolphin_service.classifier import ClassificationResult, DocType
+from dolphin_service.config import CHUNKING_CONFIG, DOLPHIN_CONFIG
+from dolphin_service.strategy import get_strategy
+
+
+def _make_pdf(path: Path, pages: int) -> None:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page(width=200, height=200).insert_text((20, 40), f"Page {i + 1}")
+    doc.save(path)
+    doc.close()
+
+
+@pytest.fixture
+def streaming(tmp_path: Path, monkeypatch):
+    """렌더링은 페이지당 지연을 두고, Vision 호출 시점과 동시 실행 수를 기록한다."""
+    monkeypatch.setitem(DOLPHIN_CONFIG, "cache_enabled", False)
+    monkeypatch.setattr(result_cache, "_cache", None)
+    monkeypatch.setitem(CHUNKING_CONFIG, "max_workers", 2)
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+
+    monkeypatch.setattr(
+        proc.doc_classifier, "classify_document",
+        lambda p: ClassificationResult(DocType.MIXED_RICH, 24, 0, [], 0, 0, 0, 0.0, 0.0, 0.0, 1.0),
+    )
+
+    state = {"rendered": [], "dispatched": [], "active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def _render(self, pdf_path, max_pages, dpi_override=0):
+        for i in range(min(24, max_pages)):
+            time.sleep(0.01)
+            state["rendered"].append(i)
+            yield f"img{i}"
+
+    def _claude(self, images, output_mode, progress_callback=None, page_offset=0, **kw):
+        with lock:
+            state["dispatched"].append((page_offset, len(state["rendered"])))
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with lock:
+            state["active"] -= 1
+        return {"content": f"p{page_offset}", "usage": {"input_tokens": 1, "output_tokens": 1}}
+
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_iter_base64_images", _render)
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_process_with_claude", _claude)
+    return state
+
+
+def test_iter_chunks_matches_create_chunks() -> None:
+    strategy = get_strategy(DocType.MIXED_RICH)
+    images = ["x" * 200_000] * 5 + ["y" * 10] * 12
+    strategy.max_chunk_mb = 0.5
+
+    streamed = list(chunker_mod.iter_chunks(iter(images), strategy))
+    assert streamed == chunker_mod.create_chunks(images, strategy)
+    assert all(len(c) <= strategy.chunk_pages for c in streamed)
+    assert sum(len(c) for c in streamed) == len(images)
+
+
+def test_first_chunk_is_dispatched_before_rendering_finishes(tmp_path: Path, streaming) -> None:
+    pdf = tmp_path / "deck.pdf"
+    _make_pdf(pdf, pages=1)
+
+    result = proc.ClaudeVisionProcessor().process_pdf(str(pdf), max_pages=24)
+
+    assert result["success"] and result["content"].startswith("p0")
+    offsets = [offset for offset, _ in streaming["dispatched"]]
+    assert sorted(offsets) == [0, 8, 16]
+    first_offset, rendered_at_dispatch = streaming["dispatched"][0]
+    assert first_offset == 0 and rendered_at_dispatch < 24
+    assert streaming["peak"] <= CHUNKING_CONFIG["max_workers"]
+
+
+def test_render_error_falls_back_and_stops_dispatch(tmp_path: Path, streaming, monkeypatch) -> None:
+    def _broken(self, pdf_path, max_pages, dpi_override=0):
+        for i in range(8):
+            yield f"img{i}"
+        raise RuntimeError("render failed")
+
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_iter_base64_images", _broken)
+    pdf = tmp_path / "deck.pdf"
+    _make_pdf(pdf, pages=1)
+
+    result = proc.ClaudeVisionProcessor().process_pdf(str(pdf), max_pages=24)
+
+    assert result["processing_method"] == "pymupdf_fallback"
+    assert "render failed" in result["fallback_reason"]
+    assert [offset for offset, _ in streaming["dispatched"]] in ([], [0])
+
+
+def test_single_chunk_vision_error_falls_back_to_pymupdf(tmp_path: Path, streaming, monkeypatch) -> None:
+    def _failing(self, images, output_mode, progress_callback=None, page_offset=0, **kw):
+        raise RuntimeError("vision down")
+
+    monkeypatch.setattr(proc.ClaudeVisionProcessor, "_process_with_claude", _failing)
+    pdf = tmp_path / "deck.pdf"
+    _make_pdf(pdf, pages=1)
+
+    result = proc.ClaudeVisionProcessor().process_pdf(str(pdf), max_pages=4)
+
+    assert result["processing_method"] == "pymupdf_fallback"
+    assert "vision down" in result["fallback_reason"]
+    assert "Page 1" in result["content"]
+
+
+def test_prefetch_stops_producer_when_consumer_closes() -> None:
+    produced: list[int] = []
+    finished = threading.Event()
+
+    def _pages():
+        try:
+            for i in range(1000):
+                produced.append(i)
+                yield i
+        finally:
+            finished.set()
+
+    pages = proc._prefetch(_pages(), maxsize=2)
+    assert next(pages) == 0
+    pages.close()
+
+    assert finished.wait(2.0)
+    assert len(produced) < 10
@@ -0,0 +1,218 @@
+"""Tests for the asyncio worker mode (fake SQS, no AWS)."""
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import worker.main as wm  # noqa: E402
+
+
+class FakeSqs:
+    """Receive returns queued messages; an empty queue stops the worker once everything is acked."""
+
+    def __init__(self, bodies: List[str], shutdown: threading.Event) -> None:
+        self.queue = [{"ReceiptHandle": f"r{i}", "Body": body} for i, body in enumerate(bodies)]
+        self.expected = {m["ReceiptHandle"] for m in self.queue}
+        self.shutdown = shutdown
+        self.deleted: List[str] = []
+        self.visibility: List[Dict[str, Any]] = []
+        self.batch_sizes: List[int] = []
+        self.delete_batches: List[int] = []
+        self.stale: set = set()
+        self._lock = threading.Lock()
+
+    def receive_message(self, QueueUrl: str, MaxNumberOfMessages: int, **kw: Any) -> Dict[str, Any]:
+        with self._lock:
+            batch, self.queue = self.queue[:MaxNumberOfMessages], self.queue[MaxNumberOfMessages:]
+        if batch:
+            self.batch_sizes.append(len(batch))
+        else:
+            time.sleep(0.01)
+        return {"Messages": batch}
+
+    def delete_message_batch(self, QueueUrl: str, Entries: List[Dict[str, str]]) -> Dict[str, Any]:
+        assert len(Entries) <= 10
+        with self._lock:
+            self.delete_batches.append(len(Entries))
+            self.deleted.extend(e["ReceiptHandle"] for e in Entries)
+            if set(self.deleted) >= self.expected:
+                self.shutdown.set()
+        return {"Successful": [{"Id": e["Id"]} for e in Entries], "Failed": []}
+
+    def change_message_visibility(self, QueueUrl: str, ReceiptHandle: str, VisibilityTimeout: int) -> None:
+        self.visibility.append({"receipt": ReceiptHandle, "timeout": VisibilityTimeout})
+
+    def change_message_visibility_batch(self, QueueUrl: str, Entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        assert len(Entries) <= 10
+        for e in Entries:
+            self.visibility.append({"receipt": e["ReceiptHandle"], "timeout": e["VisibilityTimeout"]})
+        failed = [{"Id": e["Id"], "Code": "ReceiptHandleIsInvalid"} for e in Entries if e["ReceiptHandle"] in self.stale]
+        return {"Failed": failed}
+
+
+class FakeCtx:
+    queue_url = "queue"
+
+    def __init__(self, sqs: FakeSqs) -> None:
+        self.sqs = sqs
+
+
+def _run(worker: "wm._AsyncWorker") -> None:
+    asyncio.run(asyncio.wait_for(worker.run(), timeout=10))
+
+
+def test_async_worker_runs_many_tasks_concurrently_and_acks_each(monkeypatch) -> None:
+    shutdown = threading.Event()
+    sqs = FakeSqs([json.dumps({"version": 2, "teamId": "t", "jobId": "j", "taskId": str(i)}) for i in range(24)], shutdown)
+    running = [0]
+    peak = [0]
+    lock = threading.Lock()
+    processed: List[str] = []
+
+    def _fake_process(ctx: Any, payload: Dict[str, Any]) -> None:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.2)
+        with lock:
+            running[0] -= 1
+            processed.append(payload["taskId"])
+
+    monkeypatch.setattr(wm, "_process_message", _fake_process)
+    worker = wm._AsyncWorker(FakeCtx(sqs), max_in_flight=24, stage_limits={}, shutdown=shutdown)
+
+    started = time.time()
+    _run(worker)
+
+    assert sorted(processed, key=int) == [str(i) for i in range(24)]
+    assert sorted(sqs.deleted, key=lambda r: int(r[1:])) == [f"r{i}" for i in range(24)]
+    assert peak[0] > wm.WORKER_CONCURRENCY
+    assert max(sqs.batch_sizes) <= 10
+    assert time.time() - started < 2.0
+    assert worker.in_flight == {}
+    # 24 acknowledgements go out as a handful of DeleteMessageBatch calls.
+    assert len(sqs.delete_batches) < 24
+    assert len(worker.leases) == 0
+
+
+def test_async_worker_respects_max_in_flight_and_handles_bad_and_legacy_messages(monkeypatch) -> None:
+    shutdown = threading.Event()
+    bodies = ["not json", json.dumps({"teamId": "t", "jobId": "legacy"})]
+    bodies += [json.dumps({"version": 2, "teamId": "t", "jobId": "j", "taskId": str(i)}) for i in range(6)]
+    sqs = FakeSqs(bodies, shutdown)
+    running = [0]
+    peak = [0]
+    lock = threading.Lock()
+
+    def _fake_process(ctx: Any, payload: Dict[str, Any]) -> None:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        if payload.get("taskId") == "3":
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(wm, "_process_message", _fake_process)
+    worker = wm._AsyncWorker(FakeCtx(sqs), max_in_flight=2, stage_limits={}, shutdown=shutdown)
+    _run(worker)
+
+    assert peak[0] <= 2
+    assert max(sqs.batch_sizes) <= 2
+    # 잘못된 JSON은 바로 삭제, 실패한 태스크도 기존 루프처럼 삭제
+    assert set(sqs.deleted) == {f"r{i}" for i in range(8)}
+    assert sqs.visibility == [{"receipt": "r1", "timeout": wm.LEGACY_VISIBILITY_TIMEOUT}]
+
+
+def test_io_stage_gate_bounds_concurrent_calls() -> None:
+    running = [0]
+    peak = [0]
+    lock = threading.Lock()
+
+    def _call() -> str:
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.02)
+        with lock:
+            running[0] -= 1
+        return "ok"
+
+    wm._configure_io_gates({"bedrock": 2, "s3": 0})
+    try:
+        assert "s3" not in wm._io_gates
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: wm._call_with_backoff(_call, stage="bedrock"), range(16)))
+    finally:
+        wm._configure_io_gates({})
+
+    assert results == ["ok"] * 16
+    assert peak[0] == 2
+    assert wm._io_gates == {}
+
+
+def test_visibility_heartbeat_extends_only_receipts_near_expiry(monkeypatch) -> None:
+    sqs = FakeSqs([], threading.Event())
+    sqs.stale = {"gone"}
+    leases = wm._SqsLeases()
+    leases.add("old", wm.VISIBILITY_HEARTBEAT_MARGIN - 1)
+    leases.add("gone", 1)
+    leases.add("fresh", wm.FANOUT_VISIBILITY_TIMEOUT)
+    leases.add("legacy", wm.LEGACY_VISIBILITY_TIMEOUT)
+    recorded: List[Any] = []
+    monkeypatch.setattr(wm._metrics, "record_sqs", lambda event, count=1: recorded.append((event, count)))
+
+    assert wm._visibility_heartbeat(FakeCtx(sqs), leases) == 1
+
+    assert sorted(v["receipt"] for v in sqs.visibility) == ["gone", "old"]
+    assert all(v["timeout"] == wm.FANOUT_VISIBILITY_TIMEOUT for v in sqs.visibility)
+    assert recorded == [("extended", 1)]
+    # 연장된 receipt는 다음 heartbeat 대상에서 빠지고, 실패한 것만 남는다
+    assert leases.due(wm.VISIBILITY_HEARTBEAT_MARGIN) == ["gone"]
+
+
+def test_visibility_heartbeat_releases_receipts_past_max_lease(monkeypatch) -> None:
+    sqs = FakeSqs([], threading.Event())
+    leases = wm._SqsLeases()
+    leases.add("hung", 1)
+    leases.add("young", 1)
+    leases._received["hung"] -= wm.VISIBILITY_MAX_LEASE + 1
+    recorded: List[Any] = []
+    monkeypatch.setattr(wm._metrics, "record_sqs", lambda event, count=1: recorded.append((event, count)))
+
+    assert wm._visibility_heartbeat(FakeCtx(sqs), leases) == 1
+
+    # max lease를 넘긴 receipt는 더 연장하지 않고 추적에서도 빠진다 (만료 후 재전달)
+    assert [v["receipt"] for v in sqs.visibility] == ["young"]
+    assert recorded == [("lease_expired", 1), ("extended", 1)]
+    assert len(leases) == 1
+    leases.discard("hung")
+
+    monkeypatch.setattr(wm, "VISIBILITY_MAX_LEASE", 0)
+    leases._received["young"] -= 10 ** 6
+    assert leases.release_overdue(wm.VISIBILITY_MAX_LEASE) == []
+
+
+def test_sqs_ack_chunks_batches_and_counts_failures_and_redeliveries(monkeypatch) -> None:
+    class _FailingSqs(FakeSqs):
+        def delete_message_batch(self, QueueUrl: str, Entries: List[Dict[str, str]]) -> Dict[str, Any]:
+            self.delete_batches.append(len(Entries))
+            return {"Failed": [{"Id": Entries[0]["Id"], "Code": "InternalError"}]}
+
+    sqs = _FailingSqs([], threading.Event())
+    recorded: List[Any] = []
+    monkeypatch.setattr(wm._metrics, "record_sqs", lambda event, count=1: recorded.append((event, count)))
+
+    wm._sqs_ack(FakeCtx(sqs), [f"r{i}" for i in range(23)])
+    wm._note_delivery({"Attributes": {"ApproximateReceiveCount": "3"}})
+    wm._note_delivery({"Attributes": {"ApproximateReceiveCount": "1"}})
+
+    assert sqs.delete_batches == [10, 10, 3]
+    assert recorded == [("ack_failed", 3), ("redelivered", 1)]
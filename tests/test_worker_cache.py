@@ -0,0 +1,258 @@
+"""Tests for the worker's tiered result/parse cache (memory LRU → disk → DDB → S3 spill)
+and the fan-out JOB/FILE row caches."""
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import worker.main as wm  # noqa: E402
+from worker.main import (  # noqa: E402
+    _cache_get, _cache_get_many, _cache_put, _cache_put_many, _condition_cache_key, _file_prefetch_for,
+    _job_meta_for, _LruCacheTier, _MetricsAccumulator, _prefetch_fanout_rows, ddb_update_job_index_state,
+)
+
+
+class FakeBatchClient:
+    def __init__(self, table: "FakeTable") -> None:
+        self.table = table
+
+    def batch_get_item(self, RequestItems: Dict[str, Any]) -> Dict[str, Any]:
+        self.table.batch_get_calls += 1
+        (name, request), = RequestItems.items()
+        found = [dict(self.table.items[(k["pk"], k["sk"])]) for k in request["Keys"] if (k["pk"], k["sk"]) in self.table.items]
+        return {"Responses": {name: found}, "UnprocessedKeys": {}}
+
+
+class FakeBatchWriter:
+    def __init__(self, table: "FakeTable") -> None:
+        self.table = table
+
+    def __enter__(self) -> "FakeBatchWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.table.batch_writes += 1
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self.table.items[(Item["pk"], Item["sk"])] = dict(Item)
+
+
+class FakeTable:
+    name = "table"
+
+    def __init__(self) -> None:
+        self.items: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.get_calls = 0
+        self.batch_get_calls = 0
+        self.batch_writes = 0
+        self.meta = type("Meta", (), {"client": FakeBatchClient(self)})()
+
+    def batch_writer(self) -> FakeBatchWriter:
+        return FakeBatchWriter(self)
+
+    def get_item(self, Key: Dict[str, Any]) -> Dict[str, Any]:
+        self.get_calls += 1
+        item = self.items.get((Key["pk"], Key["sk"]))
+        return {"Item": dict(item)} if item else {}
+
+    def put_item(self, Item: Dict[str, Any]) -> None:
+        self.items[(Item["pk"], Item["sk"])] = dict(Item)
+
+
+class FakeS3:
+    def __init__(self) -> None:
+        self.objects: Dict[Tuple[str, str], bytes] = {}
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes, **kw: Any) -> None:
+        self.objects[(Bucket, Key)] = Body
+
+    def get_object(self, *, Bucket: str, Key: str) -> Dict[str, Any]:
+        return {"Body": io.BytesIO(self.objects[(Bucket, Key)])}
+
+
+class FakeCtx:
+    def __init__(self, table: FakeTable | None = None, s3: FakeS3 | None = None) -> None:
+        self.bucket = "bucket"
+        self.ddb = table or FakeTable()
+        self.s3 = s3 or FakeS3()
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    acc = _MetricsAccumulator()
+    monkeypatch.setattr(wm, "_metrics", acc)
+    return acc
+
+
+def test_memory_tier_serves_repeat_lookups_without_ddb(metrics):
+    ctx = FakeCtx()
+    _cache_put(ctx, "team", "k1", {"v": 1}, namespace="RESULT")
+
+    assert _cache_get(ctx, "team", "k1", namespace="RESULT") == {"v": 1}
+    assert _cache_get(ctx, "team", "k1", namespace="RESULT") == {"v": 1}
+    assert ctx.ddb.get_calls == 0
+    assert metrics._cache[("memory", "hit")] == 2
+    assert metrics._cache[("ddb", "write")] == 1
+
+
+def test_ddb_hit_is_promoted_to_memory(metrics):
+    table = FakeTable()
+    _cache_put(FakeCtx(table), "team", "k2", {"v": 2}, namespace="PARSE")
+
+    # 새 프로세스(새 ctx)는 DDB에서 한 번 읽은 뒤 메모리에서 응답
+    ctx = FakeCtx(table)
+    assert _cache_get(ctx, "team", "k2", namespace="PARSE") == {"v": 2}
+    assert _cache_get(ctx, "team", "k2", namespace="PARSE") == {"v": 2}
+    assert table.get_calls == 1
+    assert metrics._cache[("ddb", "hit")] == 1
+    assert metrics._cache[("memory", "miss")] == 1
+
+
+def test_namespaces_and_teams_do_not_collide(metrics):
+    ctx = FakeCtx()
+    _cache_put(ctx, "team_a", "same", {"ns": "result"}, namespace="RESULT")
+
+    assert _cache_get(ctx, "team_a", "same", namespace="PARSE") is None
+    assert _cache_get(ctx, "team_b", "same", namespace="RESULT") is None
+
+
+def test_disk_tier_survives_new_process(tmp_path: Path, monkeypatch, metrics):
+    monkeypatch.setattr(wm, "CACHE_DISK_DIR", str(tmp_path / "cache"))
+    _cache_put(FakeCtx(), "team", "k3", {"v": 3}, namespace="RESULT")
+
+    # DDB가 비어 있어도 로컬 디스크 계층에서 응답
+    ctx = FakeCtx()
+    assert _cache_get(ctx, "team", "k3", namespace="RESULT") == {"v": 3}
+    assert ctx.ddb.get_calls == 0
+    assert metrics._cache[("disk", "hit")] == 1
+
+
+def test_large_payload_spills_to_s3_instead_of_being_dropped(monkeypatch, metrics):
+    monkeypatch.setattr(wm, "CACHE_INLINE_MAX_BYTES", 1000)
+    table, s3 = FakeTable(), FakeS3()
+    payload = {"analysis_text": "가" * 5000}
+    _cache_put(FakeCtx(table, s3), "team", "big", payload, namespace="PARSE")
+
+    (item,) = table.items.values()
+    assert "result" not in item
+    assert item["result_s3_key"].startswith("cache-spill/")
+    assert len(s3.objects) == 1
+
+    assert _cache_get(FakeCtx(table, s3), "team", "big", namespace="PARSE") == payload
+    assert metrics._cache[("s3", "write")] == 1
+    assert metrics._cache[("s3", "hit")] == 1
+
+
+def test_spill_threshold_counts_utf8_bytes_not_characters(monkeypatch, metrics):
+    monkeypatch.setattr(wm, "CACHE_INLINE_MAX_BYTES", 1000)
+    table, s3 = FakeTable(), FakeS3()
+    payload = {"verdict": "충족" * 300}  # 문자 수는 한도 미만, UTF-8 바이트는 초과
+    _cache_put(FakeCtx(table, s3), "team", "kr", payload, namespace="CONDITION")
+
+    (item,) = table.items.values()
+    assert "result" not in item and item["result_bytes"] > 1000
+    assert len(s3.objects) == 1
+
+
+def test_expired_entries_are_misses(metrics):
+    table = FakeTable()
+    _cache_put(FakeCtx(table), "team", "old", {"v": 0}, namespace="RESULT")
+    for item in table.items.values():
+        item["expires_at"] = "2000-01-01T00:00:00Z"
+
+    assert _cache_get(FakeCtx(table), "team", "old", namespace="RESULT") is None
+
+
+def test_batch_put_and_get_use_one_ddb_round_trip(metrics):
+    table = FakeTable()
+    _cache_put_many(FakeCtx(table), "team", {"a": {"v": 1}, "b": {"v": 2}}, namespace="RESULT")
+    assert table.batch_writes == 1
+    assert len(table.items) == 2
+
+    ctx = FakeCtx(table)
+    assert _cache_get(ctx, "team", "a", namespace="RESULT") == {"v": 1}  # a만 메모리에 올라감
+    found = _cache_get_many(ctx, "team", ["a", "b", "missing"], namespace="RESULT")
+    assert found == {"a": {"v": 1}, "b": {"v": 2}}
+    assert table.batch_get_calls == 1
+    assert metrics._cache[("ddb", "miss")] == 1
+
+
+def test_condition_cache_key_ignores_whitespace_and_depends_on_model():
+    base = _condition_cache_key("digest", "매출 10억  미만", "model-a")
+    assert base == _condition_cache_key("digest", " 매출 10억 미만 ", "model-a")
+    assert base != _condition_cache_key("digest", "매출 10억 미만", "model-b")
+    assert base != _condition_cache_key("digest", "매출 20억 미만", "model-a")
+
+
+def test_lru_evicts_least_recently_used_by_bytes():
+    lru = _LruCacheTier(max_bytes=30)
+    lru.put("a", "x" * 10, "")
+    lru.put("b", "y" * 10, "")
+    assert lru.get("a") == "x" * 10  # a가 최근 사용 → b가 먼저 밀려남
+    assert lru.put("c", "z" * 15, "") == 1
+    assert lru.get("b") is None
+    assert lru.get("a") == "x" * 10
+    assert lru.get("c") == "z" * 15
+
+
+def test_lru_budget_counts_utf8_bytes():
+    lru = _LruCacheTier(max_bytes=30)
+    lru.put("a", "가" * 8, "")  # 8자, 24바이트
+    assert lru.put("b", "x" * 8, "") == 1
+    assert lru.get("a") is None and lru.get("b") == "x" * 8
+
+
+def test_flush_emits_per_tier_emf(capsys, metrics):
+    metrics.record_cache("memory", "hit", 3)
+    metrics.record_cache("memory", "evict")
+    metrics.record_cache("ddb", "miss")
+    metrics.flush(in_flight=0)
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    tiers = {line["CacheTier"]: line for line in lines if "CacheTier" in line}
+    assert tiers["memory"]["CacheHits"] == 3
+    assert tiers["memory"]["CacheEvictions"] == 1
+    assert tiers["ddb"]["CacheMisses"] == 1
+    assert metrics._cache == {}
+
+
+def _fanout_msg(file_id: str, job_id: str = "job1") -> Dict[str, Any]:
+    body = {"version": 2, "teamId": "team", "jobId": job_id, "taskId": "000", "fileId": file_id}
+    return {"ReceiptHandle": f"r-{file_id}", "Body": json.dumps(body)}
+
+
+def test_job_meta_is_cached_until_status_changes(metrics):
+    ctx = FakeCtx()
+    ctx.ddb.put_item({"pk": "TEAM#team", "sk": "JOB#job1", "status": "running", "type": "condition_check", "params": {"conditions": ["c"]}})
+
+    assert _job_meta_for(ctx).get(ctx, "team", "job1")["status"] == "running"
+    assert _job_meta_for(ctx).get(ctx, "team", "job1")["params"] == {"conditions": ["c"]}
+    assert ctx.ddb.get_calls == 1
+
+    ctx.ddb.items[("TEAM#team", "JOB#job1")]["status"] = "failed"
+    ddb_update_job_index_state(ctx, "team", "job1", status="failed")
+    assert _job_meta_for(ctx).get(ctx, "team", "job1")["status"] == "failed"
+    assert metrics._cache[("job_meta", "hit")] == 1
+
+
+def test_received_messages_prefetch_file_and_job_rows_in_one_batch(metrics):
+    ctx = FakeCtx()
+    ctx.ddb.put_item({"pk": "TEAM#team", "sk": "JOB#job1", "status": "running", "type": "condition_check"})
+    for fid in ("f1", "f2", "f3"):
+        ctx.ddb.put_item({"pk": "TEAM#team", "sk": f"FILE#{fid}", "s3_key": f"uploads/{fid}.pdf"})
+
+    msgs = [_fanout_msg(fid) for fid in ("f1", "f2", "f3")] + [{"ReceiptHandle": "bad", "Body": "{"}]
+    _prefetch_fanout_rows(ctx, msgs)
+
+    assert ctx.ddb.batch_get_calls == 1
+    prefetch = _file_prefetch_for(ctx)
+    assert prefetch.take("team", "f2") == {"pk": "TEAM#team", "sk": "FILE#f2", "s3_key": "uploads/f2.pdf"}
+    assert prefetch.take("team", "f2") is None  # 한 번만 사용
+    assert _job_meta_for(ctx).get(ctx, "team", "job1")["type"] == "condition_check"
+    assert ctx.ddb.get_calls == 0
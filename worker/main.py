@@ -6,14 +6,17 @@ Responsibilities:
 - Legacy path: {teamId, jobId} → download all files → process entire job
 - Fan-out path: {version:2, teamId, jobId, taskId, fileId} → process single file
 - Concurrent processing via ThreadPoolExecutor with per-thread boto3 sessions
+  (or an asyncio poll loop with per-stage I/O gates, MERRY_WORKER_MODE=async)
 - Atomic progress tracking via DynamoDB counters
 - Automatic CSV assembly when all tasks complete
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import csv
-import gc
+import functools
 import io
 import json
 import logging
@@ -22,14 +25,16 @@ import os
 import random
 import re
 import shutil
+import tempfile
 import threading
 import time
 import traceback
+import weakref
 from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import boto3
 import boto3.session
@@ -101,6 +106,24 @@ WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "5"))
 FANOUT_VISIBILITY_TIMEOUT = 300
 # Legacy (whole-job) messages keep 15 min timeout.
 LEGACY_VISIBILITY_TIMEOUT = 900
+# Execution mode: "threads" (default) or "async".
+# Async mode polls SQS from an asyncio loop and keeps up to ASYNC_MAX_IN_FLIGHT
+# tasks running; DDB/S3/Bedrock calls are bounded per stage instead of per task.
+WORKER_MODE = os.getenv("MERRY_WORKER_MODE", "threads").strip().lower()
+ASYNC_MAX_IN_FLIGHT = int(os.getenv("MERRY_ASYNC_MAX_IN_FLIGHT", "50"))
+# Threads serving SQS receive/delete/visibility calls in async mode.
+ASYNC_SQS_CONCURRENCY = int(os.getenv("MERRY_ASYNC_SQS_CONCURRENCY", "4"))
+# Per-stage concurrent call limits in async mode (0 = ungated).
+ASYNC_STAGE_LIMITS = {
+    "ddb": int(os.getenv("MERRY_ASYNC_DDB_CONCURRENCY", "32")),
+    "s3": int(os.getenv("MERRY_ASYNC_S3_CONCURRENCY", "16")),
+    "bedrock": int(os.getenv("MERRY_ASYNC_BEDROCK_CONCURRENCY", "16")),
+}
+# Fan-out tasks reuse a job's JOB row (type/params/status) for this long;
+# status changes made by this worker invalidate it immediately.
+JOB_META_TTL_S = float(os.getenv("MERRY_JOB_META_TTL_S", "30"))
+# FILE rows batch-prefetched per SQS receive are dropped if unused after this.
+FILE_PREFETCH_TTL_S = 120
 # Stale task claim threshold: re-claimable after 10 minutes.
 STALE_CLAIM_SECONDS = 600
 # When True, DDB Streams + Lambda handles assembly. Worker skips it.
@@ -120,6 +143,27 @@ CW_NAMESPACE = os.getenv("MERRY_CW_NAMESPACE", "Merry/Worker")
 # Bedrock/DDB retry parameters for _call_with_backoff.
 BEDROCK_MAX_RETRIES = int(os.getenv("MERRY_BEDROCK_MAX_RETRIES", "3"))
 BEDROCK_RETRY_DELAY = float(os.getenv("MERRY_BEDROCK_RETRY_DELAY", "1.5"))
+# Housekeeping intervals shared by both poll loops.
+METRICS_FLUSH_INTERVAL = 60
+TEMP_CLEANUP_INTERVAL = 300  # Purge stale temp dirs every 5 minutes.
+TEMP_MAX_AGE = 1800  # Temp dirs older than 30 minutes are stale.
+WATCHDOG_INTERVAL = 120  # Check for timed-out jobs every 2 minutes.
+# Graceful drain: wait for in-flight tasks on shutdown.
+DRAIN_TIMEOUT = int(os.getenv("MERRY_DRAIN_TIMEOUT", "120"))
+# Visibility heartbeat: every VISIBILITY_HEARTBEAT_INTERVAL seconds, in-flight
+# receipts whose visibility expires within VISIBILITY_HEARTBEAT_MARGIN seconds
+# (i.e. fan-out receipts older than FANOUT_VISIBILITY_TIMEOUT - margin) are
+# extended by FANOUT_VISIBILITY_TIMEOUT. Runs during shutdown drain as well.
+VISIBILITY_HEARTBEAT_INTERVAL = float(os.getenv("MERRY_VISIBILITY_HEARTBEAT_S", "30"))
+VISIBILITY_HEARTBEAT_MARGIN = float(os.getenv("MERRY_VISIBILITY_HEARTBEAT_MARGIN_S", "120"))
+# Max lease: a receipt held longer than this (since it was received) is no
+# longer extended, so a hung task lets its message become visible again and be
+# redelivered instead of holding it until SQS's 12h limit. 0 disables the cap.
+VISIBILITY_MAX_LEASE = float(os.getenv("MERRY_VISIBILITY_MAX_LEASE_S", "3600"))
+# SQS *Batch APIs accept at most 10 entries per call.
+SQS_BATCH_MAX = 10
+# Async mode: finished receipts are held this long to fill a DeleteMessageBatch.
+ACK_BATCH_WINDOW = float(os.getenv("MERRY_ACK_BATCH_WINDOW_S", "0.2"))
 
 
 # ── CloudWatch Embedded Metric Format (EMF) ──
@@ -153,6 +197,10 @@ class _MetricsAccumulator:
         self._output_tokens = 0
         self._retries = 0
         self._by_type: Dict[str, _JobTypeStats] = {}
+        # (tier, event) → count. tier: memory|disk|ddb|s3|input, event: hit|miss|evict|write.
+        self._cache: Dict[Tuple[str, str], int] = {}
+        # SQS delivery events: redelivered|duplicate_skipped|ack_failed|extended.
+        self._sqs: Dict[str, int] = {}
 
     def record_task(
         self, succeeded: bool, elapsed_ms: float,
@@ -185,6 +233,15 @@ class _MetricsAccumulator:
         with self._lock:
             self._retries += 1
 
+    def record_cache(self, tier: str, event: str, count: int = 1) -> None:
+        with self._lock:
+            key = (tier, event)
+            self._cache[key] = self._cache.get(key, 0) + count
+
+    def record_sqs(self, event: str, count: int = 1) -> None:
+        with self._lock:
+            self._sqs[event] = self._sqs.get(event, 0) + count
+
     def record_poll(self, empty: bool) -> None:
         with self._lock:
             if empty:
@@ -206,6 +263,10 @@ class _MetricsAccumulator:
             output_tok = self._output_tokens
             retries = self._retries
             by_type = dict(self._by_type)
+            cache = dict(self._cache)
+            self._cache.clear()
+            sqs = dict(self._sqs)
+            self._sqs.clear()
             self._tasks_succeeded = 0
             self._tasks_failed = 0
             self._total_processing_ms = 0.0
@@ -233,6 +294,10 @@ class _MetricsAccumulator:
                         {"Name": "InputTokens", "Unit": "Count"},
                         {"Name": "OutputTokens", "Unit": "Count"},
                         {"Name": "Retries", "Unit": "Count"},
+                        {"Name": "Redeliveries", "Unit": "Count"},
+                        {"Name": "DuplicateTasksSkipped", "Unit": "Count"},
+                        {"Name": "AckFailures", "Unit": "Count"},
+                        {"Name": "VisibilityExtensions", "Unit": "Count"},
                     ],
                 }],
             },
@@ -246,6 +311,10 @@ class _MetricsAccumulator:
             "InputTokens": input_tok,
             "OutputTokens": output_tok,
             "Retries": retries,
+            "Redeliveries": sqs.get("redelivered", 0),
+            "DuplicateTasksSkipped": sqs.get("duplicate_skipped", 0),
+            "AckFailures": sqs.get("ack_failed", 0),
+            "VisibilityExtensions": sqs.get("extended", 0),
         }
         # EMF log must be a single JSON line on stdout.
         print(json.dumps(emf), flush=True)
@@ -280,6 +349,31 @@ class _MetricsAccumulator:
             }
             print(json.dumps(jt_emf), flush=True)
 
+        # Per-cache-tier EMF (memory → disk → ddb, plus s3 spill).
+        for tier in sorted({t for t, _ in cache}):
+            tier_emf = {
+                "_aws": {
+                    "Timestamp": int(time.time() * 1000),
+                    "CloudWatchMetrics": [{
+                        "Namespace": CW_NAMESPACE,
+                        "Dimensions": [["Service", "CacheTier"]],
+                        "Metrics": [
+                            {"Name": "CacheHits", "Unit": "Count"},
+                            {"Name": "CacheMisses", "Unit": "Count"},
+                            {"Name": "CacheEvictions", "Unit": "Count"},
+                            {"Name": "CacheWrites", "Unit": "Count"},
+                        ],
+                    }],
+                },
+                "Service": "merry-worker",
+                "CacheTier": tier,
+                "CacheHits": cache.get((tier, "hit"), 0),
+                "CacheMisses": cache.get((tier, "miss"), 0),
+                "CacheEvictions": cache.get((tier, "evict"), 0),
+                "CacheWrites": cache.get((tier, "write"), 0),
+            }
+            print(json.dumps(tier_emf), flush=True)
+
 
 _metrics = _MetricsAccumulator()
 
@@ -403,10 +497,16 @@ def _ddb_sanitize(value: Any) -> Any:
     return str(value)
 
 
+def _max_in_flight() -> int:
+    """Maximum concurrently running tasks for the configured worker mode."""
+    return ASYNC_MAX_IN_FLIGHT if WORKER_MODE == "async" else WORKER_CONCURRENCY
+
+
 class AwsCtx:
     """Thread-safe AWS context.
 
-    The SQS client is shared (used only by the main polling thread).
+    The SQS client is shared (used only by the main polling thread, or by
+    the SQS executor threads in async mode).
     DynamoDB and S3 clients are created per-thread via threading.local()
     because boto3 clients are NOT thread-safe.
     """
@@ -421,7 +521,7 @@ class AwsCtx:
         # Tune connection pool size for concurrent workers.
         from botocore.config import Config as BotoConfig
         self._boto_config = BotoConfig(
-            max_pool_connections=max(WORKER_CONCURRENCY * 2, 20),
+            max_pool_connections=max(_max_in_flight() * 2, 20),
             retries={"max_attempts": 2, "mode": "adaptive"},
         )
 
@@ -511,7 +611,31 @@ class AwsCtx:
 def ddb_get_item(ctx: AwsCtx, pk: str, sk: str) -> Optional[Dict[str, Any]]:
     def _get():
         return ctx.ddb.get_item(Key={"pk": pk, "sk": sk}).get("Item")
-    return _call_with_backoff(_get, max_retries=2, base_delay=1.0)
+    return _call_with_backoff(_get, max_retries=2, base_delay=1.0, stage="ddb")
+
+
+DDB_BATCH_GET_MAX_KEYS = 100  # BatchGetItem limit per request.
+
+
+def ddb_batch_get_items(ctx: AwsCtx, pk: str, sks: List[str]) -> Dict[str, Dict[str, Any]]:
+    """BatchGetItem for many sort keys under one pk. Returns {sk: item} for items that exist."""
+    client = ctx.ddb.meta.client  # Resource-bound client: native Python types in/out.
+    table_name = ctx.ddb.name
+    found: Dict[str, Dict[str, Any]] = {}
+    unique = list(dict.fromkeys(sks))
+    for start in range(0, len(unique), DDB_BATCH_GET_MAX_KEYS):
+        request = {table_name: {"Keys": [{"pk": pk, "sk": sk} for sk in unique[start:start + DDB_BATCH_GET_MAX_KEYS]]}}
+        for attempt in range(4):
+            resp = _call_with_backoff(client.batch_get_item, RequestItems=request, max_retries=2, base_delay=1.0, stage="ddb")
+            for item in resp.get("Responses", {}).get(table_name, []):
+                found[str(item["sk"])] = item
+            request = resp.get("UnprocessedKeys") or {}
+            if not request:
+                break
+            time.sleep(0.1 * (2 ** attempt))
+        if request:
+            raise RuntimeError(f"BatchGetItem left {len(request[table_name]['Keys'])} keys unprocessed")
+    return found
 
 
 def ddb_update_job(
@@ -564,7 +688,7 @@ def ddb_update_job(
         UpdateExpression="SET " + ", ".join(exprs),
         ExpressionAttributeNames=names,
         ExpressionAttributeValues=values,
-        max_retries=2, base_delay=1.0,
+        max_retries=2, base_delay=1.0, stage="ddb",
     )
     if status is not None:
         ddb_update_job_index_state(ctx, team_id, job_id, status=status)
@@ -586,6 +710,8 @@ def ddb_update_job_index_state(
 ) -> None:
     if status is None and fanout is None and fanout_status is None:
         return
+    if status is not None:
+        _job_meta_for(ctx).invalidate(team_id, job_id)
 
     created_at = _ddb_get_job_created_at(ctx, team_id, job_id)
     if not created_at:
@@ -616,7 +742,7 @@ def ddb_update_job_index_state(
             ExpressionAttributeNames=names,
             ExpressionAttributeValues=_ddb_sanitize(values),
             ConditionExpression="attribute_exists(pk) AND attribute_exists(sk)",
-            max_retries=2, base_delay=1.0,
+            max_retries=2, base_delay=1.0, stage="ddb",
         )
     except ctx.ddb.meta.client.exceptions.ConditionalCheckFailedException:
         return
@@ -632,26 +758,223 @@ def ddb_mark_file_deleted(ctx: AwsCtx, team_id: str, file_id: str) -> None:
         UpdateExpression="SET #status = :deleted, deleted_at = :deleted_at",
         ExpressionAttributeNames={"#status": "status"},
         ExpressionAttributeValues=values,
-        max_retries=2, base_delay=1.0,
+        max_retries=2, base_delay=1.0, stage="ddb",
     )
 
 
 def s3_download(ctx: AwsCtx, bucket: str, key: str, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
-    _call_with_backoff(ctx.s3.download_file, bucket, key, str(dest), max_retries=2, base_delay=1.0)
+    _call_with_backoff(ctx.s3.download_file, bucket, key, str(dest), max_retries=2, base_delay=1.0, stage="s3")
 
 
 def s3_upload(ctx: AwsCtx, bucket: str, key: str, src: Path, content_type: str) -> int:
     _call_with_backoff(
         ctx.s3.upload_file, str(src), bucket, key,
         ExtraArgs={"ContentType": content_type},
-        max_retries=2, base_delay=1.0,
+        max_retries=2, base_delay=1.0, stage="s3",
     )
     return int(src.stat().st_size)
 
 
 def s3_delete(ctx: AwsCtx, bucket: str, key: str) -> None:
-    _call_with_backoff(ctx.s3.delete_object, Bucket=bucket, Key=key, max_retries=2, base_delay=1.0)
+    _call_with_backoff(ctx.s3.delete_object, Bucket=bucket, Key=key, max_retries=2, base_delay=1.0, stage="s3")
+
+
+# ── Content-addressed input store ──
+# Downloaded inputs are kept once per content hash and hard-linked into task
+# dirs. Lookups try the FILE item's recorded sha256, then the S3 ETag + size,
+# so a re-run job or the same PDF uploaded by another team skips both the
+# download and the hashing.
+# Empty = <system tempdir>/merry-input-store. Hard links need the same filesystem
+# as TEMP_ROOT; across filesystems inputs are copied instead.
+INPUT_STORE_DIR = os.getenv("MERRY_INPUT_STORE_DIR", "")
+INPUT_STORE_MAX_BYTES = int(os.getenv("MERRY_INPUT_STORE_MB", "1024")) * 1024 * 1024  # 0 = disabled.
+
+
+def _sha256_file(path: Path) -> str:
+    import hashlib
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(65536)
+            if not chunk:
+                break
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    try:
+        os.link(src, dest)
+    except OSError:
+        if not src.exists():
+            raise
+        shutil.copyfile(src, dest)  # Different filesystem or no hard-link support.
+
+
+class _InputBlobStore:
+    """Input files named by sha256, plus an ETag/size → sha256 index.
+
+    Blobs live in a ralph.disk_lru.DiskLRU (touched on every hit, least recently
+    used evicted past the byte budget). Task dirs hold hard links, so evicting
+    a blob never breaks a task that is still reading it.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        from ralph.disk_lru import DiskLRU
+
+        self._root = root
+        self._blobs = DiskLRU(root / "sha256", max_bytes)
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self._root / "sha256" / sha256[:2] / sha256
+
+    def _etag_path(self, etag: str, size: int) -> Path:
+        import hashlib
+        name = hashlib.sha256(f"{etag}:{size}".encode("utf-8")).hexdigest()
+        return self._root / "etag" / name[:2] / name
+
+    def lookup(self, *, sha256: str = "", etag: str = "", size: int = 0) -> Optional[str]:
+        """Return the sha256 of a stored blob matching either key."""
+        if sha256 and self._blob_path(sha256).exists():
+            return sha256
+        if etag:
+            try:
+                found = self._etag_path(etag, size).read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if found and self._blob_path(found).exists():
+                return found
+        return None
+
+    def link_into(self, sha256: str, dest: Path) -> None:
+        """Materialize a stored blob at dest and mark it recently used."""
+        src = self._blob_path(sha256)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.exists():
+            dest.unlink()
+        _link_or_copy(src, dest)
+        self._blobs.touch(src)
+
+    def add(self, src: Path, *, sha256: str = "", etag: str = "", size: int = 0) -> Tuple[str, int]:
+        """Store src by content (src stays in place). Returns (sha256, evicted blob count).
+
+        ``sha256`` skips hashing when the digest is already known.
+        """
+        sha256 = sha256 or _sha256_file(src)
+        blob = self._blob_path(sha256)
+        evicted = 0
+        if blob.exists():
+            self._blobs.touch(blob)
+        else:
+            evicted = self._blobs.place(blob, lambda tmp: _link_or_copy(src, tmp), keep=True)
+        if etag:
+            index = self._etag_path(etag, size)
+            index.parent.mkdir(parents=True, exist_ok=True)
+            tmp = index.with_name(f"{index.name}.{threading.get_ident()}.tmp")
+            tmp.write_text(sha256, encoding="utf-8")
+            os.replace(tmp, index)
+        return sha256, evicted
+
+
+_input_stores: Dict[Path, _InputBlobStore] = {}
+_input_stores_lock = threading.Lock()
+
+
+def _input_store() -> Optional[_InputBlobStore]:
+    if INPUT_STORE_MAX_BYTES <= 0:
+        return None
+    root = Path(INPUT_STORE_DIR) if INPUT_STORE_DIR else Path(tempfile.gettempdir()) / "merry-input-store"
+    with _input_stores_lock:
+        store = _input_stores.get(root)
+        if store is None:
+            store = _InputBlobStore(root, INPUT_STORE_MAX_BYTES)
+            _input_stores[root] = store
+        return store
+
+
+def _record_file_content(
+    ctx: AwsCtx, team_id: str, file_id: str, sha256: str, etag: str, size: int,
+) -> None:
+    """Best-effort: remember the content digest on the FILE item for later tasks."""
+    names = {"#sha": "content_sha256"}
+    values: Dict[str, Any] = {":sha": sha256}
+    sets = ["#sha = :sha"]
+    if etag:
+        names["#etag"] = "content_etag"
+        names["#size"] = "content_size"
+        values[":etag"] = etag
+        values[":size"] = size
+        sets += ["#etag = :etag", "#size = :size"]
+    try:
+        _call_with_backoff(
+            ctx.ddb.update_item,
+            Key={"pk": _pk_team(team_id), "sk": _sk_file(file_id)},
+            UpdateExpression="SET " + ", ".join(sets),
+            ConditionExpression="attribute_exists(pk)",
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            max_retries=1, base_delay=0.5, stage="ddb",
+        )
+    except Exception as e:
+        log.debug("Failed to record content digest for %s: %s", file_id, e)
+
+
+def fetch_task_input(
+    ctx: AwsCtx,
+    team_id: str,
+    file_id: str,
+    file_row: Dict[str, Any],
+    bucket: str,
+    key: str,
+    dest: Path,
+) -> str:
+    """Materialize a task input file at dest. Returns its sha256 ("" when the store is disabled)."""
+    store = _input_store()
+    if store is None:
+        s3_download(ctx, bucket, key, dest)
+        return ""
+
+    known_sha = str(file_row.get("content_sha256") or "")
+    etag = ""
+    size = 0
+    sha = store.lookup(sha256=known_sha) if known_sha else None
+    if sha is None:
+        try:
+            head = _call_with_backoff(
+                ctx.s3.head_object, Bucket=bucket, Key=key,
+                max_retries=1, base_delay=0.5, stage="s3",
+            )
+            etag = str(head.get("ETag") or "").strip('"')
+            size = int(head.get("ContentLength") or 0)
+            sha = store.lookup(etag=etag, size=size)
+        except Exception as e:
+            log.debug("head_object failed for %s: %s", key, e)
+
+    if sha is not None:
+        try:
+            store.link_into(sha, dest)
+        except OSError:
+            sha = None  # Evicted between lookup and link.
+        else:
+            _metrics.record_cache("input", "hit")
+            if sha != known_sha:
+                _record_file_content(ctx, team_id, file_id, sha, etag, size)
+            return sha
+
+    _metrics.record_cache("input", "miss")
+    s3_download(ctx, bucket, key, dest)
+    try:
+        sha, evicted = store.add(dest, sha256=known_sha, etag=etag, size=size)
+    except OSError as e:
+        log.debug("Input store write failed: %s", e)
+        return known_sha
+    _metrics.record_cache("input", "write")
+    if evicted:
+        _metrics.record_cache("input", "evict", evicted)
+    if sha != known_sha:
+        _record_file_content(ctx, team_id, file_id, sha, etag, size)
+    return sha
 
 
 MAX_PDF_SIZE = 100 * 1024 * 1024  # 100MB
@@ -773,8 +1096,36 @@ def _is_retryable(exc: Exception) -> Tuple[bool, str]:
     return False, ""
 
 
+# Per-stage I/O gates ("ddb", "s3", "bedrock"). Empty in thread mode, where
+# WORKER_CONCURRENCY already bounds every stage; async mode installs them so
+# 50+ in-flight tasks cannot stampede a single backend.
+_io_gates: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def _configure_io_gates(limits: Dict[str, int]) -> None:
+    """Install per-stage concurrency gates. Non-positive limits leave a stage ungated."""
+    _io_gates.clear()
+    for stage, limit in limits.items():
+        if limit > 0:
+            _io_gates[stage] = threading.BoundedSemaphore(limit)
+
+
+@contextlib.contextmanager
+def _io_stage(stage: Optional[str]) -> Iterator[None]:
+    """Hold a slot of the given I/O stage gate for the duration of one call."""
+    gate = _io_gates.get(stage) if stage else None
+    if gate is None:
+        yield
+        return
+    gate.acquire()
+    try:
+        yield
+    finally:
+        gate.release()
+
+
 def _call_with_backoff(
-    fn, *args, max_retries: int = 3, base_delay: float = 2.0, **kwargs
+    fn, *args, max_retries: int = 3, base_delay: float = 2.0, stage: Optional[str] = None, **kwargs
 ) -> Any:
     """Call fn with exponential backoff + jitter for retryable errors.
 
@@ -782,10 +1133,14 @@ def _call_with_backoff(
     - Bedrock/DDB/S3 throttling (rate limiting)
     - Transient network errors (timeouts, connection resets, DNS failures)
     - AWS service errors (5xx, InternalServerError, ServiceUnavailable)
+
+    ``stage`` names the I/O gate held during each attempt (not during the
+    backoff sleep).
     """
     for attempt in range(max_retries + 1):
         try:
-            return fn(*args, **kwargs)
+            with _io_stage(stage):
+                return fn(*args, **kwargs)
         except Exception as exc:
             retryable, category = _is_retryable(exc)
             if not retryable or attempt >= max_retries:
@@ -828,7 +1183,7 @@ def ddb_claim_task(
                 ":now": now,
                 ":wid": worker_id,
             },
-            max_retries=2, base_delay=1.0,
+            max_retries=2, base_delay=1.0, stage="ddb",
         )
         return True
     except ctx.ddb.meta.client.exceptions.ConditionalCheckFailedException:
@@ -855,7 +1210,7 @@ def ddb_claim_task(
                 ":wid": worker_id,
                 ":stale": stale_iso,
             },
-            max_retries=2, base_delay=1.0,
+            max_retries=2, base_delay=1.0, stage="ddb",
         )
         log.info("Reclaimed stale task %s/%s", job_id, task_id)
         return True
@@ -964,7 +1319,7 @@ def ddb_complete_task(
     _call_with_backoff(
         ctx.ddb_client.transact_write_items,
         TransactItems=[task_update, task_index_update, job_counter],
-        max_retries=BEDROCK_MAX_RETRIES, base_delay=BEDROCK_RETRY_DELAY,
+        max_retries=BEDROCK_MAX_RETRIES, base_delay=BEDROCK_RETRY_DELAY, stage="ddb",
     )
 
 
@@ -985,7 +1340,7 @@ def ddb_try_claim_assembly(ctx: AwsCtx, team_id: str, job_id: str) -> bool:
                 ":assembling": "assembling",
                 ":now": _now_iso(),
             },
-            max_retries=2, base_delay=1.0,
+            max_retries=2, base_delay=1.0, stage="ddb",
         )
         ddb_update_job_index_state(ctx, team_id, job_id, fanout=True, fanout_status="assembling")
         return True
@@ -1050,7 +1405,7 @@ def _check_circuit_breaker(ctx: AwsCtx, team_id: str, job_id: str) -> bool:
                 ":error": f"Circuit breaker: {failed}/{processed} tasks failed ({error_rate:.0%})",
                 ":now": _now_iso(),
             },
-            max_retries=2, base_delay=1.0,
+            max_retries=2, base_delay=1.0, stage="ddb",
         )
         ddb_update_job_index_state(ctx, team_id, job_id, status="failed", fanout=True, fanout_status="failed")
         log.info("Job %s cancelled by circuit breaker", job_id)
@@ -1111,7 +1466,7 @@ def _job_timeout_watchdog(ctx: AwsCtx) -> None:
 
             resp = _call_with_backoff(
                 ctx.ddb.scan, **scan_kwargs,
-                max_retries=1, base_delay=1.0,
+                max_retries=1, base_delay=1.0, stage="ddb",
             )
             for item in resp.get("Items") or []:
                 timed_out_jobs.append(item)
@@ -1158,7 +1513,7 @@ def _job_timeout_watchdog(ctx: AwsCtx) -> None:
                         ),
                         ":now": _now_iso(),
                     },
-                    max_retries=2, base_delay=1.0,
+                    max_retries=2, base_delay=1.0, stage="ddb",
                 )
                 ddb_update_job_index_state(ctx, team_id, job_id, status="failed", fanout=True, fanout_status="failed")
                 log.info("Job %s force-failed by timeout watchdog", job_id)
@@ -1178,23 +1533,31 @@ def _job_timeout_watchdog(ctx: AwsCtx) -> None:
         log.warning("Job timeout watchdog error: %s", e)
 
 
-def ddb_query_all_tasks(
+def ddb_iter_task_pages(
     ctx: AwsCtx, team_id: str, job_id: str,
-) -> List[Dict[str, Any]]:
-    """Query all task records for a job using the TASK index."""
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield a job's task records one query page at a time, in sort-key order."""
     pk = _pk_team(team_id)
     sk_prefix = f"TASK#{job_id}#"
-    items: List[Dict[str, Any]] = []
     kwargs: Dict[str, Any] = {
         "KeyConditionExpression": "pk = :pk AND begins_with(sk, :prefix)",
         "ExpressionAttributeValues": {":pk": pk, ":prefix": sk_prefix},
     }
     while True:
-        resp = _call_with_backoff(ctx.ddb.query, max_retries=2, base_delay=1.0, **kwargs)
-        items.extend(resp.get("Items", []))
+        resp = _call_with_backoff(ctx.ddb.query, max_retries=2, base_delay=1.0, stage="ddb", **kwargs)
+        yield resp.get("Items", [])
         if "LastEvaluatedKey" not in resp:
             break
         kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+
+def ddb_query_all_tasks(
+    ctx: AwsCtx, team_id: str, job_id: str,
+) -> List[Dict[str, Any]]:
+    """Query all task records for a job using the TASK index."""
+    items: List[Dict[str, Any]] = []
+    for page in ddb_iter_task_pages(ctx, team_id, job_id):
+        items.extend(page)
     return items
 
 
@@ -1377,6 +1740,8 @@ def _handle_condition_check(
         render_first_page, render_pages, analyze_pages,
         call_nova_visual, build_presentation_prompt, _PROMPT_OCR,
     )
+    from ralph import cpu_pool
+    from ralph.pdf_context import pdf_context
     from ralph.condition_checker import check_conditions_nova
 
     conditions: List[str] = [str(c) for c in (params.get("conditions") or []) if c]
@@ -1394,23 +1759,24 @@ def _handle_condition_check(
         t0 = _time.time()
         entry: Dict[str, Any] = {"filename": pdf_path.name}
         try:
-            text, pages, blocks = extract_text(str(pdf_path))
-            _, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
-
-            extracted = ""
-            method = "pymupdf"
-            if use_vlm and is_poor:
-                img = render_first_page(str(pdf_path))
-                vd = call_nova_visual(img, model_lite, region, _PROMPT_OCR)
-                extracted = vd.get("readable_text") or ""
-                method = "nova_hybrid"
-            elif use_vlm and is_fragmented:
-                imgs = render_pages(str(pdf_path), max_pages=10, dpi=100)
-                info = analyze_pages(str(pdf_path), max_pages=10)
-                prompt = build_presentation_prompt(info)
-                vd = call_nova_visual(imgs, model_id, region, prompt, max_tokens=5000)
-                extracted = vd.get("readable_text") or ""
-                method = "nova_presentation"
+            with pdf_context(pdf_path) as pdf:
+                text, pages, blocks = extract_text(pdf)
+                _, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
+
+                extracted = ""
+                method = "pymupdf"
+                if use_vlm and is_poor:
+                    img = render_first_page(pdf)
+                    vd = call_nova_visual(img, model_lite, region, _PROMPT_OCR)
+                    extracted = vd.get("readable_text") or ""
+                    method = "nova_hybrid"
+                elif use_vlm and is_fragmented:
+                    imgs = render_pages(pdf, max_pages=10, dpi=100)
+                    info = analyze_pages(pdf, max_pages=10)
+                    prompt = build_presentation_prompt(info)
+                    vd = call_nova_visual(imgs, model_id, region, prompt, max_tokens=5000)
+                    extracted = vd.get("readable_text") or ""
+                    method = "nova_presentation"
 
             full_text = "\n\n".join(filter(None, [extracted, text]))
             check = check_conditions_nova(full_text, conditions, model_id, region)
@@ -1428,13 +1794,15 @@ def _handle_condition_check(
             entry.update({"error": str(exc), "elapsed_s": round(_time.time() - t0, 1)})
         rows.append(entry)
 
+    # XLSX styling is CPU-bound; build it in the CPU pool while the CSV is written.
+    xlsx_future = cpu_pool.submit(_build_condition_check_xlsx, input_paths[0].parent, rows, conditions)
     csv_path, json_path = _build_condition_check_csv(input_paths[0].parent, rows, conditions)
 
     artifacts: List[Dict[str, Any]] = []
 
     # Generate XLSX (preferred download format).
     try:
-        xlsx_path = _build_condition_check_xlsx(input_paths[0].parent, rows, conditions)
+        xlsx_path = xlsx_future.result()
         artifacts.append({
             "artifactId": "condition_check_xlsx",
             "label": "조건 검사 결과 (Excel)",
@@ -1642,6 +2010,137 @@ def _generate_worker_id() -> str:
     return f"{host}-{tid}-{int(time.time())}"
 
 
+class _JobMetaCache:
+    """Short-TTL cache of the JOB row fields fan-out tasks need (type, params, status).
+
+    One instance per AwsCtx. Entries are dropped when this process changes the
+    job status (``ddb_update_job_index_state``); changes made elsewhere (other
+    replicas, the web cancel button) are picked up within JOB_META_TTL_S.
+    """
+
+    _FIELDS = ("status", "type", "params")
+
+    def __init__(self, ttl_s: float) -> None:
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._items: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+    def get(self, ctx: AwsCtx, team_id: str, job_id: str) -> Dict[str, Any]:
+        key = (team_id, job_id)
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None and time.monotonic() < entry[0]:
+                _metrics.record_cache("job_meta", "hit")
+                return entry[1]
+        _metrics.record_cache("job_meta", "miss")
+        item = ddb_get_item(ctx, _pk_team(team_id), _sk_job(job_id)) or {}
+        return self.prime(team_id, job_id, item)
+
+    def has(self, team_id: str, job_id: str) -> bool:
+        with self._lock:
+            entry = self._items.get((team_id, job_id))
+            return entry is not None and time.monotonic() < entry[0]
+
+    def prime(self, team_id: str, job_id: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        meta = {k: item[k] for k in self._FIELDS if k in item}
+        if self._ttl_s > 0 and meta:
+            with self._lock:
+                now = time.monotonic()
+                self._items = {k: v for k, v in self._items.items() if v[0] > now}
+                self._items[(team_id, job_id)] = (now + self._ttl_s, meta)
+        return meta
+
+    def invalidate(self, team_id: str, job_id: str) -> None:
+        with self._lock:
+            self._items.pop((team_id, job_id), None)
+
+
+class _FilePrefetch:
+    """FILE rows read ahead with one BatchGetItem per SQS receive; each is used once."""
+
+    def __init__(self, ttl_s: float) -> None:
+        self._ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._rows: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+
+    def put(self, team_id: str, file_id: str, row: Dict[str, Any]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._rows = {k: v for k, v in self._rows.items() if v[0] > now}
+            self._rows[(team_id, file_id)] = (now + self._ttl_s, row)
+
+    def take(self, team_id: str, file_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._rows.pop((team_id, file_id), None)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+
+_job_meta_caches: "weakref.WeakKeyDictionary[Any, _JobMetaCache]" = weakref.WeakKeyDictionary()
+_file_prefetches: "weakref.WeakKeyDictionary[Any, _FilePrefetch]" = weakref.WeakKeyDictionary()
+_fanout_caches_lock = threading.Lock()
+
+
+def _job_meta_for(ctx: AwsCtx) -> _JobMetaCache:
+    with _fanout_caches_lock:
+        cache = _job_meta_caches.get(ctx)
+        if cache is None:
+            cache = _JobMetaCache(JOB_META_TTL_S)
+            _job_meta_caches[ctx] = cache
+        return cache
+
+
+def _file_prefetch_for(ctx: AwsCtx) -> _FilePrefetch:
+    with _fanout_caches_lock:
+        prefetch = _file_prefetches.get(ctx)
+        if prefetch is None:
+            prefetch = _FilePrefetch(FILE_PREFETCH_TTL_S)
+            _file_prefetches[ctx] = prefetch
+        return prefetch
+
+
+def _prefetch_fanout_rows(ctx: AwsCtx, msgs: List[Dict[str, Any]]) -> None:
+    """Read the FILE rows (and uncached JOB rows) of received fan-out messages in one batch per team.
+
+    Best-effort: on any error the tasks fall back to their own GetItem calls.
+    """
+    wanted: Dict[str, Tuple[set, set]] = {}
+    for msg in msgs:
+        try:
+            payload = json.loads(msg.get("Body") or "")
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(payload, dict) or payload.get("version") != 2:
+            continue
+        team_id = str(payload.get("teamId") or "")
+        file_id = str(payload.get("fileId") or "")
+        job_id = str(payload.get("jobId") or "")
+        if team_id and file_id and job_id:
+            file_ids, job_ids = wanted.setdefault(team_id, (set(), set()))
+            file_ids.add(file_id)
+            job_ids.add(job_id)
+
+    job_meta = _job_meta_for(ctx)
+    prefetch = _file_prefetch_for(ctx)
+    for team_id, (file_ids, job_ids) in wanted.items():
+        uncached_jobs = [j for j in sorted(job_ids) if not job_meta.has(team_id, j)]
+        sks = [_sk_file(f) for f in sorted(file_ids)] + [_sk_job(j) for j in uncached_jobs]
+        try:
+            items = ddb_batch_get_items(ctx, _pk_team(team_id), sks)
+        except Exception as e:
+            log.debug("Fan-out prefetch failed: %s", e)
+            continue
+        for file_id in file_ids:
+            row = items.get(_sk_file(file_id))
+            if row:
+                prefetch.put(team_id, file_id, row)
+        for job_id in uncached_jobs:
+            item = items.get(_sk_job(job_id))
+            if item:
+                job_meta.prime(team_id, job_id, item)
+
+
 def process_fanout_task(
     ctx: AwsCtx,
     team_id: str,
@@ -1655,7 +2154,7 @@ def process_fanout_task(
     Steps:
     1. Claim task (conditional write: pending → processing)
     2. Load job params (conditions list)
-    3. Download single PDF from S3
+    3. Fetch single PDF (local content-addressed store, else S3)
     4. Extract text → assess quality → VLM fallback → check conditions
     5. TransactWriteItems: TASK result + JOB counter increment
     6. Check completion → maybe trigger assembly
@@ -1673,12 +2172,13 @@ def process_fanout_task(
     # 1. Claim task.
     if not ddb_claim_task(ctx, team_id, job_id, task_id, worker_id):
         log.info("Task already claimed, skipping: %s/%s", job_id, task_id)
+        _metrics.record_sqs("duplicate_skipped")
         return
 
     t0 = time.time()
     try:
         # 2. Load job params — also check if job is already cancelled/failed.
-        job = ddb_get_item(ctx, _pk_team(team_id), _sk_job(job_id)) or {}
+        job = _job_meta_for(ctx).get(ctx, team_id, job_id)
         job_status = str(job.get("status") or "")
         if job_status == "failed":
             log.info("Job already failed/cancelled, skipping task: %s/%s", job_id, task_id)
@@ -1686,8 +2186,11 @@ def process_fanout_task(
         job_type = str(job.get("type") or "")
         params = job.get("params") if isinstance(job.get("params"), dict) else {}
 
-        # 3. Load file metadata and download.
-        file_row = ddb_get_item(ctx, _pk_team(team_id), _sk_file(file_id))
+        # 3. Load file metadata and fetch the input.
+        file_row = _file_prefetch_for(ctx).take(team_id, file_id)
+        _metrics.record_cache("file_prefetch", "miss" if file_row is None else "hit")
+        if file_row is None:
+            file_row = ddb_get_item(ctx, _pk_team(team_id), _sk_file(file_id))
         if not file_row:
             raise RuntimeError(f"Missing file metadata: {file_id}")
 
@@ -1699,7 +2202,7 @@ def process_fanout_task(
         original_name = str(file_row.get("original_name") or file_id)
         ext = Path(s3_key).suffix or Path(original_name).suffix
         local_path = task_dir / f"{file_id}{ext}"
-        s3_download(ctx, s3_bucket, s3_key, local_path)
+        content_sha256 = fetch_task_input(ctx, team_id, file_id, file_row, s3_bucket, s3_key, local_path)
 
         # 3.5. Validate downloaded file.
         _validate_pdf(local_path, original_name)
@@ -1708,7 +2211,9 @@ def process_fanout_task(
         result: Dict[str, Any] = {"filename": original_name}
 
         if job_type == "condition_check":
-            result = _process_single_condition_check(ctx, local_path, original_name, params)
+            result = _process_single_condition_check(
+                ctx, local_path, original_name, params, content_sha256=content_sha256,
+            )
         elif job_type == "document_extraction":
             result = _process_single_document_extraction(
                 ctx, local_path, file_id, original_name, params,
@@ -1776,32 +2281,365 @@ def process_fanout_task(
 
 CACHE_TTL_DAYS = int(os.getenv("MERRY_CACHE_TTL_DAYS", "7"))
 CACHE_ENABLED = os.getenv("MERRY_RESULT_CACHE", "true").lower() != "false"
-PARSE_CACHE_TEXT_CHARS = int(os.getenv("MERRY_PARSE_CACHE_TEXT_CHARS", "16000"))
+# 0 = store the full analysis text (large payloads spill to S3 instead of being truncated).
+PARSE_CACHE_TEXT_CHARS = int(os.getenv("MERRY_PARSE_CACHE_TEXT_CHARS", "0"))
 _CACHE_VERSION = os.getenv("MERRY_CACHE_VERSION", "v2")
+# Tier 1: in-process LRU, bounded by serialized payload bytes.
+CACHE_MEMORY_MAX_BYTES = int(os.getenv("MERRY_CACHE_MEMORY_MB", "64")) * 1024 * 1024
+# Tier 2: local disk (container ephemeral storage). Empty = disabled.
+CACHE_DISK_DIR = os.getenv("MERRY_CACHE_DISK_DIR", "")
+CACHE_DISK_MAX_BYTES = int(os.getenv("MERRY_CACHE_DISK_MB", "512")) * 1024 * 1024
+# Tier 3: DynamoDB. Payloads above this size are stored in S3 by content hash
+# and the DDB item keeps only a pointer (DDB item limit is 400KB).
+CACHE_INLINE_MAX_BYTES = int(os.getenv("MERRY_CACHE_INLINE_MAX_BYTES", "200000"))
+CACHE_SPILL_PREFIX = os.getenv("MERRY_CACHE_SPILL_PREFIX", "cache-spill")
+
+
+class _LruCacheTier:
+    """Thread-safe LRU of serialized cache payloads, evicted by total byte size."""
+
+    def __init__(self, max_bytes: int) -> None:
+        from collections import OrderedDict
+
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # key -> (result_json, expires, UTF-8 size); Korean payloads are ~3 bytes per character.
+        self._items: "OrderedDict[str, Tuple[str, str, int]]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            result_json, expires, _ = entry
+            if expires and expires < _now_iso():
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return result_json
+
+    def put(self, key: str, result_json: str, expires: str) -> int:
+        """Store and return the number of evicted entries."""
+        size = len(result_json.encode("utf-8"))
+        if size > self._max_bytes:
+            return 0
+        evicted = 0
+        with self._lock:
+            self._remove(key)
+            self._items[key] = (result_json, expires, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes and self._items:
+                old_key = next(iter(self._items))
+                self._remove(old_key)
+                evicted += 1
+        return evicted
+
+    def _remove(self, key: str) -> None:
+        entry = self._items.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+class _DiskCacheTier:
+    """One JSON file per key under CACHE_DISK_DIR, kept in a ralph.disk_lru.DiskLRU."""
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        from ralph.disk_lru import DiskLRU
+
+        self._root = root
+        self._files = DiskLRU(root, max_bytes, pattern="*.json")
+
+    def _path(self, key: str) -> Path:
+        import hashlib
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self._root / name[:2] / f"{name}.json"
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        path = self._path(key)
+        data = self._files.read_bytes(path)
+        if data is None:
+            return None
+        try:
+            payload = json.loads(data)
+        except ValueError:
+            return None
+        expires = str(payload.get("expires_at") or "")
+        if expires and expires < _now_iso():
+            self._files.discard(path)
+            return None
+        return str(payload.get("result") or ""), expires
+
+    def put(self, key: str, result_json: str, expires: str) -> int:
+        """Store and return the number of evicted files."""
+        body = json.dumps({"expires_at": expires, "result": result_json}, ensure_ascii=False)
+        return self._files.write_bytes(self._path(key), body.encode("utf-8"))
+
+
+class _TieredCache:
+    """memory LRU → local disk → DynamoDB (→ S3 spill for large payloads).
+
+    Lower-tier hits are promoted into the upper tiers. One instance per AwsCtx
+    (one per worker process), see ``_tiered_cache_for``.
+    """
+
+    def __init__(self) -> None:
+        self.memory = _LruCacheTier(CACHE_MEMORY_MAX_BYTES)
+        self.disk = _DiskCacheTier(Path(CACHE_DISK_DIR), CACHE_DISK_MAX_BYTES) if CACHE_DISK_DIR else None
+
+    def get(self, ctx: AwsCtx, team_id: str, cache_key: str, namespace: str) -> Optional[Dict[str, Any]]:
+        local_key = f"{team_id}#{namespace}#{cache_key}"
+
+        result_json = self.memory.get(local_key)
+        if result_json is not None:
+            _metrics.record_cache("memory", "hit")
+            return json.loads(result_json)
+        _metrics.record_cache("memory", "miss")
+
+        if self.disk is not None:
+            found = self.disk.get(local_key)
+            if found is not None:
+                _metrics.record_cache("disk", "hit")
+                result_json, expires = found
+                self._promote(local_key, result_json, expires, to_disk=False)
+                return json.loads(result_json)
+            _metrics.record_cache("disk", "miss")
+
+        item = ddb_get_item(ctx, _pk_team(team_id), f"CACHE#{namespace}#{cache_key}")
+        if not item:
+            _metrics.record_cache("ddb", "miss")
+            return None
+        expires = str(item.get("expires_at") or "")
+        if expires and expires < _now_iso():
+            _metrics.record_cache("ddb", "miss")
+            return None  # Expired.
+        _metrics.record_cache("ddb", "hit")
+
+        spill_key = str(item.get("result_s3_key") or "")
+        if spill_key:
+            result_json = _cache_spill_read(ctx, spill_key)
+            if result_json is None:
+                _metrics.record_cache("s3", "miss")
+                return None
+            _metrics.record_cache("s3", "hit")
+        else:
+            result_json = str(item.get("result") or "")
+        if not result_json:
+            return None
+        self._promote(local_key, result_json, expires, to_disk=True)
+        return json.loads(result_json)
+
+    def get_many(
+        self, ctx: AwsCtx, team_id: str, cache_keys: List[str], namespace: str,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Like ``get`` for many keys; local misses go to DDB in BatchGetItem chunks."""
+        found: Dict[str, Dict[str, Any]] = {}
+        remote: List[str] = []
+        for cache_key in dict.fromkeys(cache_keys):
+            local_key = f"{team_id}#{namespace}#{cache_key}"
+            result_json = self.memory.get(local_key)
+            if result_json is not None:
+                _metrics.record_cache("memory", "hit")
+                found[cache_key] = json.loads(result_json)
+                continue
+            _metrics.record_cache("memory", "miss")
+            if self.disk is not None:
+                disk_hit = self.disk.get(local_key)
+                if disk_hit is not None:
+                    _metrics.record_cache("disk", "hit")
+                    self._promote(local_key, disk_hit[0], disk_hit[1], to_disk=False)
+                    found[cache_key] = json.loads(disk_hit[0])
+                    continue
+                _metrics.record_cache("disk", "miss")
+            remote.append(cache_key)
+        if not remote:
+            return found
+
+        try:
+            items = ddb_batch_get_items(ctx, _pk_team(team_id), [f"CACHE#{namespace}#{k}" for k in remote])
+        except Exception as e:
+            log.debug("Cache batch read failed: %s", e)
+            items = {}
+        now = _now_iso()
+        for cache_key in remote:
+            item = items.get(f"CACHE#{namespace}#{cache_key}")
+            expires = str((item or {}).get("expires_at") or "")
+            if not item or (expires and expires < now):
+                _metrics.record_cache("ddb", "miss")
+                continue
+            _metrics.record_cache("ddb", "hit")
+            spill_key = str(item.get("result_s3_key") or "")
+            if spill_key:
+                result_json = _cache_spill_read(ctx, spill_key)
+                _metrics.record_cache("s3", "miss" if result_json is None else "hit")
+            else:
+                result_json = str(item.get("result") or "")
+            if not result_json:
+                continue
+            self._promote(f"{team_id}#{namespace}#{cache_key}", result_json, expires, to_disk=True)
+            found[cache_key] = json.loads(result_json)
+        return found
+
+    def put(
+        self,
+        ctx: AwsCtx,
+        team_id: str,
+        cache_key: str,
+        namespace: str,
+        result_json: str,
+        *,
+        expires: str,
+        ttl: int,
+    ) -> None:
+        local_key = f"{team_id}#{namespace}#{cache_key}"
+        self._promote(local_key, result_json, expires, to_disk=True)
+        _call_with_backoff(
+            ctx.ddb.put_item,
+            Item=self._ddb_item(ctx, team_id, cache_key, namespace, result_json, expires=expires, ttl=ttl),
+            max_retries=1, base_delay=0.5, stage="ddb",
+        )
+        _metrics.record_cache("ddb", "write")
+
+    def put_many(
+        self,
+        ctx: AwsCtx,
+        team_id: str,
+        entries: Dict[str, str],
+        namespace: str,
+        *,
+        expires: str,
+        ttl: int,
+    ) -> None:
+        """Like ``put`` for many keys; the DDB writes go through one batch writer."""
+        items = []
+        for cache_key, result_json in entries.items():
+            self._promote(f"{team_id}#{namespace}#{cache_key}", result_json, expires, to_disk=True)
+            items.append(self._ddb_item(ctx, team_id, cache_key, namespace, result_json, expires=expires, ttl=ttl))
+
+        def _write() -> None:
+            # batch_writer resubmits UnprocessedItems itself.
+            with ctx.ddb.batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+
+        _call_with_backoff(_write, max_retries=1, base_delay=0.5, stage="ddb")
+        _metrics.record_cache("ddb", "write", len(entries))
+
+    @staticmethod
+    def _ddb_item(
+        ctx: AwsCtx,
+        team_id: str,
+        cache_key: str,
+        namespace: str,
+        result_json: str,
+        *,
+        expires: str,
+        ttl: int,
+    ) -> Dict[str, Any]:
+        item: Dict[str, Any] = {
+            "pk": _pk_team(team_id),
+            "sk": f"CACHE#{namespace}#{cache_key}",
+            "entity": "cache",
+            "namespace": namespace.lower(),
+            "created_at": _now_iso(),
+            "expires_at": expires,
+            "ttl": ttl,
+        }
+        # DynamoDB's 400KB limit is on encoded bytes, not characters.
+        result_bytes = len(result_json.encode("utf-8"))
+        if result_bytes > CACHE_INLINE_MAX_BYTES:
+            item["result_s3_key"] = _cache_spill_write(ctx, result_json)
+            item["result_bytes"] = result_bytes
+            _metrics.record_cache("s3", "write")
+        else:
+            item["result"] = result_json
+        return _ddb_sanitize(item)
+
+    def _promote(self, local_key: str, result_json: str, expires: str, *, to_disk: bool) -> None:
+        evicted = self.memory.put(local_key, result_json, expires)
+        _metrics.record_cache("memory", "write")
+        if evicted:
+            _metrics.record_cache("memory", "evict", evicted)
+        if to_disk and self.disk is not None:
+            try:
+                evicted = self.disk.put(local_key, result_json, expires)
+                _metrics.record_cache("disk", "write")
+                if evicted:
+                    _metrics.record_cache("disk", "evict", evicted)
+            except OSError as e:
+                log.debug("Disk cache write failed: %s", e)
+
+
+_tiered_caches: "weakref.WeakKeyDictionary[Any, _TieredCache]" = weakref.WeakKeyDictionary()
+_tiered_caches_lock = threading.Lock()
+
+
+def _tiered_cache_for(ctx: AwsCtx) -> _TieredCache:
+    with _tiered_caches_lock:
+        cache = _tiered_caches.get(ctx)
+        if cache is None:
+            cache = _TieredCache()
+            _tiered_caches[ctx] = cache
+        return cache
+
+
+def _cache_spill_write(ctx: AwsCtx, result_json: str) -> str:
+    """Store a large cache payload in S3 keyed by its content hash. Returns the S3 key."""
+    import gzip
+    import hashlib
+
+    data = result_json.encode("utf-8")
+    key = f"{CACHE_SPILL_PREFIX}/{hashlib.sha256(data).hexdigest()}.json.gz"
+    _call_with_backoff(
+        ctx.s3.put_object,
+        Bucket=ctx.bucket, Key=key, Body=gzip.compress(data),
+        ContentType="application/json", ContentEncoding="gzip",
+        max_retries=1, base_delay=0.5, stage="s3",
+    )
+    return key
+
+
+def _cache_spill_read(ctx: AwsCtx, key: str) -> Optional[str]:
+    import gzip
+
+    try:
+        resp = _call_with_backoff(ctx.s3.get_object, Bucket=ctx.bucket, Key=key, max_retries=1, base_delay=0.5, stage="s3")
+        return gzip.decompress(resp["Body"].read()).decode("utf-8")
+    except Exception as e:
+        log.debug("Cache spill read failed (%s): %s", key, e)
+        return None
+
+
+def _file_digest(pdf_path: Path, sha256: str = "") -> str:
+    """Generate a deterministic file digest for cache lookups (reuses a known sha256)."""
+    return (sha256 or _sha256_file(pdf_path))[:32]
 
 
-def _file_digest(pdf_path: Path) -> str:
-    """Generate a deterministic file digest for cache lookups."""
+def _result_cache_key(file_digest: str, model_id: str) -> str:
+    """Result-cache key for the per-file part of a condition check (company, facts, parse info)."""
     import hashlib
+    from ralph.condition_checker import PROMPT_VERSION
+
     h = hashlib.sha256()
-    with open(pdf_path, "rb") as f:
-        while True:
-            chunk = f.read(65536)
-            if not chunk:
-                break
-            h.update(chunk)
+    h.update(_CACHE_VERSION.encode("utf-8"))
+    h.update(PROMPT_VERSION.encode("utf-8"))
+    h.update(model_id.encode("utf-8"))
+    h.update(file_digest.encode("utf-8"))
     return h.hexdigest()[:32]
 
 
-def _result_cache_key(file_digest: str, conditions: List[str]) -> str:
-    """Generate a result-cache key from file digest + normalized conditions."""
+def _condition_cache_key(file_digest: str, condition: str, model_id: str) -> str:
+    """Result-cache key for one condition verdict: file × normalized condition × model × prompt."""
     import hashlib
+    from ralph.condition_checker import PROMPT_VERSION
 
     h = hashlib.sha256()
     h.update(_CACHE_VERSION.encode("utf-8"))
+    h.update(PROMPT_VERSION.encode("utf-8"))
+    h.update(model_id.encode("utf-8"))
     h.update(file_digest.encode("utf-8"))
-    for c in sorted(str(condition).strip() for condition in conditions if str(condition).strip()):
-        h.update(c.encode("utf-8"))
+    h.update(b"\0")
+    h.update(" ".join(str(condition).split()).lower().encode("utf-8"))
     return h.hexdigest()[:32]
 
 
@@ -1831,25 +2669,38 @@ def _cache_get(
     *,
     namespace: str = "RESULT",
 ) -> Optional[Dict[str, Any]]:
-    """Lookup result cache. Returns cached result or None."""
+    """Lookup result cache (memory → disk → DDB). Returns cached result or None."""
     if not CACHE_ENABLED:
         return None
     try:
-        item = ddb_get_item(ctx, _pk_team(team_id), f"CACHE#{namespace}#{cache_key}")
-        if not item:
-            return None
-        # Check TTL.
-        expires = str(item.get("expires_at") or "")
-        if expires and expires < _now_iso():
-            return None  # Expired.
-        result_json = str(item.get("result") or "")
-        if result_json:
-            return json.loads(result_json)
+        return _tiered_cache_for(ctx).get(ctx, team_id, cache_key, namespace)
     except Exception:
         pass  # Cache miss on any error.
     return None
 
 
+def _cache_get_many(
+    ctx: AwsCtx,
+    team_id: str,
+    cache_keys: List[str],
+    *,
+    namespace: str = "RESULT",
+) -> Dict[str, Dict[str, Any]]:
+    """Batch lookup (memory → disk → one DDB BatchGetItem per 100 keys). Returns hits by key."""
+    if not CACHE_ENABLED or not cache_keys:
+        return {}
+    try:
+        return _tiered_cache_for(ctx).get_many(ctx, team_id, cache_keys, namespace)
+    except Exception:
+        return {}  # Cache miss on any error.
+
+
+def _cache_expiry() -> Tuple[str, int]:
+    from datetime import timedelta
+    expires_at = datetime.now(timezone.utc) + timedelta(days=CACHE_TTL_DAYS)
+    return expires_at.isoformat().replace("+00:00", "Z"), int(expires_at.timestamp())
+
+
 def _cache_put(
     ctx: AwsCtx,
     team_id: str,
@@ -1858,40 +2709,127 @@ def _cache_put(
     *,
     namespace: str = "RESULT",
 ) -> None:
-    """Store result in cache with TTL."""
+    """Store result in all cache tiers with TTL."""
     if not CACHE_ENABLED:
         return
     try:
-        from datetime import timedelta
-        now = datetime.now(timezone.utc)
-        expires = (now + timedelta(days=CACHE_TTL_DAYS)).isoformat().replace("+00:00", "Z")
+        expires, ttl = _cache_expiry()
         result_json = json.dumps(result, ensure_ascii=False, default=str)
-        # Skip caching very large results.
-        if len(result_json) > 200_000:
-            return
-        _call_with_backoff(
-            ctx.ddb.put_item,
-            Item=_ddb_sanitize({
-                "pk": _pk_team(team_id),
-                "sk": f"CACHE#{namespace}#{cache_key}",
-                "entity": "cache",
-                "namespace": namespace.lower(),
-                "result": result_json,
-                "created_at": _now_iso(),
-                "expires_at": expires,
-                "ttl": int((now + timedelta(days=CACHE_TTL_DAYS)).timestamp()),
-            }),
-            max_retries=1, base_delay=0.5,
-        )
+        _tiered_cache_for(ctx).put(ctx, team_id, cache_key, namespace, result_json, expires=expires, ttl=ttl)
     except Exception as e:
         log.debug("Cache put failed: %s", e)  # Best-effort.
 
 
-def _process_single_condition_check(
+def _cache_put_many(
     ctx: AwsCtx,
-    pdf_path: Path,
-    filename: str,
+    team_id: str,
+    results: Dict[str, Dict[str, Any]],
+    *,
+    namespace: str = "RESULT",
+) -> None:
+    """Store many results in all cache tiers with one TTL and one DDB batch writer."""
+    if not CACHE_ENABLED or not results:
+        return
+    try:
+        expires, ttl = _cache_expiry()
+        entries = {k: json.dumps(v, ensure_ascii=False, default=str) for k, v in results.items()}
+        _tiered_cache_for(ctx).put_many(ctx, team_id, entries, namespace, expires=expires, ttl=ttl)
+    except Exception as e:
+        log.debug("Cache batch put failed: %s", e)  # Best-effort.
+
+
+# Multi-document LLM batching: concurrent condition checks of the same job are
+# packed into one Bedrock prompt. 0 = disabled (one request per document).
+CONDITION_BATCH_WINDOW_MS = int(os.getenv("MERRY_CONDITION_BATCH_WINDOW_MS", "0"))
+
+
+class _PendingConditionBatch:
+    __slots__ = ("items", "full", "done", "results", "error")
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: List[Dict[str, Any]] = []
+        self.error: Optional[BaseException] = None
+
+
+class _ConditionCheckBatcher:
+    """Coalesces concurrent condition checks of one job into batched LLM calls.
+
+    The first thread to arrive for a (job, model, conditions) group becomes the
+    leader: it waits up to the batch window (or until the batch is full), then
+    runs check_conditions_nova_batch for everyone and hands each waiting thread
+    its own result. Documents too large to batch skip the queue entirely.
+
+    Only the threads that actually call Bedrock (the leader, or an oversized
+    document) hold a "bedrock" I/O gate slot; followers wait without one, so a
+    batch of N documents costs one slot rather than N.
+    """
+
+    def __init__(self, window_s: float) -> None:
+        self._window_s = window_s
+        self._lock = threading.Lock()
+        self._groups: Dict[Tuple[Any, ...], _PendingConditionBatch] = {}
+
+    def check(
+        self,
+        group_key: Tuple[str, str],
+        text: str,
+        conditions: List[str],
+        model_id: str,
+        region: str,
+        facts: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        from ralph import condition_checker as cc
+
+        if len(text) > cc.BATCH_DOC_MAX_CHARS:
+            with _io_stage("bedrock"):
+                return cc.check_conditions_nova(text, conditions, model_id, region, facts)
+
+        key = (group_key, model_id, region, tuple(conditions))
+        with self._lock:
+            pending = self._groups.get(key)
+            leader = pending is None
+            if leader:
+                pending = _PendingConditionBatch()
+                self._groups[key] = pending
+            slot = len(pending.items)
+            pending.items.append((text, facts))
+            if len(pending.items) >= cc.BATCH_MAX_DOCS:
+                self._groups.pop(key, None)
+                pending.full.set()
+
+        if leader:
+            pending.full.wait(self._window_s)
+            with self._lock:
+                if self._groups.get(key) is pending:
+                    self._groups.pop(key)
+            try:
+                with _io_stage("bedrock"):
+                    pending.results = cc.check_conditions_nova_batch(pending.items, conditions, model_id, region)
+            except BaseException as e:
+                pending.error = e
+            finally:
+                pending.done.set()
+        else:
+            pending.done.wait()
+
+        if pending.error is not None:
+            raise pending.error
+        # Results are shared across threads; hand out a private copy.
+        return json.loads(json.dumps(pending.results[slot], default=str))
+
+
+_condition_batcher = _ConditionCheckBatcher(CONDITION_BATCH_WINDOW_MS / 1000)
+
+
+def _process_single_condition_check(
+    ctx: AwsCtx,
+    pdf_path: Path,
+    filename: str,
     params: Dict[str, Any],
+    content_sha256: str = "",
 ) -> Dict[str, Any]:
     """Process a single PDF for condition checking with backoff."""
     from ralph.playground_parser import (
@@ -1899,6 +2837,8 @@ def _process_single_condition_check(
         render_first_page, render_pages, analyze_pages,
         call_nova_visual, build_presentation_prompt, _PROMPT_OCR,
     )
+    from ralph import cpu_pool
+    from ralph.pdf_context import pdf_context
     from ralph.condition_checker import check_conditions_nova, extract_condition_facts
 
     conditions: List[str] = [str(c) for c in (params.get("conditions") or []) if c]
@@ -1907,14 +2847,16 @@ def _process_single_condition_check(
 
     t0 = time.time()
     team_id = getattr(_log_context, "ctx", {}).get("team_id", "") if hasattr(_log_context, "ctx") and _log_context.ctx else ""
+    job_id = getattr(_log_context, "ctx", {}).get("job_id", "") if hasattr(_log_context, "ctx") and _log_context.ctx else ""
 
     model_id = str(params.get("model_id") or os.getenv("RALPH_VLM_NOVA_MODEL_ID", "us.amazon.nova-pro-v1:0"))
     model_lite = os.getenv("RALPH_VLM_NOVA_LITE_MODEL_ID", "us.amazon.nova-lite-v1:0")
     region = str(params.get("region") or os.getenv("RALPH_VLM_NOVA_REGION", "us-east-1"))
     default_use_vlm = "false" if os.getenv("PYTEST_CURRENT_TEST") else "true"
     use_vlm = os.getenv("RALPH_USE_VLM", default_use_vlm).lower() != "false"
-    file_digest = _file_digest(pdf_path)
-    result_cache_key = _result_cache_key(file_digest, conditions)
+    file_digest = _file_digest(pdf_path, content_sha256)
+    result_cache_key = _result_cache_key(file_digest, model_id)
+    condition_keys = [_condition_cache_key(file_digest, c, model_id) for c in conditions]
     parse_cache_key = _parse_cache_key(
         file_digest,
         use_vlm=use_vlm,
@@ -1924,31 +2866,55 @@ def _process_single_condition_check(
 
     entry: Dict[str, Any] = {"filename": filename}
 
+    # Verdicts are cached per condition, so editing the condition list only
+    # re-checks the conditions that are new. One batch read covers them all.
+    cached_doc: Optional[Dict[str, Any]] = None
+    cached_verdicts: Dict[str, Dict[str, Any]] = {}
     if team_id:
-        cached = _cache_get(ctx, team_id, result_cache_key, namespace="RESULT")
-        if cached:
-            reused = dict(cached)
-            original_elapsed = reused.get("elapsed_s")
-            original_usage = reused.get("token_usage") if isinstance(reused.get("token_usage"), dict) else {}
-            reused["filename"] = filename
-            reused["elapsed_s"] = round(time.time() - t0, 1)
-            reused["cached_elapsed_s"] = original_elapsed
-            reused["cached_token_usage"] = original_usage
-            reused["token_usage"] = {
-                "input_tokens": 0,
-                "output_tokens": 0,
-                "total_tokens": 0,
-            }
-            reused["cache"] = {
-                **(reused.get("cache") if isinstance(reused.get("cache"), dict) else {}),
-                "file_signature": file_digest[:8],
-                "result_hit": True,
-                "parse_hit": False,
-                "saved_input_tokens": int(original_usage.get("input_tokens", 0)),
-                "saved_output_tokens": int(original_usage.get("output_tokens", 0)),
-            }
-            log.info("Result cache hit for %s (key=%s)", filename, result_cache_key[:8])
-            return reused
+        found = _cache_get_many(ctx, team_id, [result_cache_key, *condition_keys], namespace="RESULT")
+        cached_doc = found.pop(result_cache_key, None)
+        if cached_doc:
+            cached_verdicts = found
+    missing_by_key: Dict[str, str] = {}
+    for key, condition in zip(condition_keys, conditions):
+        if key not in cached_verdicts:
+            missing_by_key.setdefault(key, condition)
+    missing = list(missing_by_key.items())
+
+    if cached_doc and not missing:
+        reused = dict(cached_doc)
+        verdicts = [cached_verdicts[key] for key in dict.fromkeys(condition_keys)]
+        original_usage = {
+            name: int((cached_doc.get("parse_token_usage") or {}).get(name, 0))
+            + sum(int(v.get(name, 0)) for v in verdicts)
+            for name in ("input_tokens", "output_tokens")
+        }
+        reused.pop("parse_token_usage", None)
+        reused["conditions"], reused["condition_summary"] = _merge_condition_verdicts(
+            conditions, condition_keys, cached_verdicts, {}, None,
+        )
+        reused["filename"] = filename
+        reused["cached_elapsed_s"] = reused.get("elapsed_s")
+        reused["elapsed_s"] = round(time.time() - t0, 1)
+        reused["cached_token_usage"] = {
+            **original_usage,
+            "total_tokens": original_usage["input_tokens"] + original_usage["output_tokens"],
+        }
+        reused["token_usage"] = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "total_tokens": 0,
+        }
+        reused["cache"] = {
+            "file_signature": file_digest[:8],
+            "result_hit": True,
+            "parse_hit": False,
+            "condition_hits": len(conditions),
+            "saved_input_tokens": original_usage["input_tokens"],
+            "saved_output_tokens": original_usage["output_tokens"],
+        }
+        log.info("Result cache hit for %s (key=%s)", filename, result_cache_key[:8])
+        return reused
 
     total_input_tokens = 0
     total_output_tokens = 0
@@ -1973,34 +2939,40 @@ def _process_single_condition_check(
         parse_cache_hit = True
         log.info("Parse cache hit for %s (key=%s)", filename, parse_cache_key[:8])
     else:
-        text, pages, blocks = _call_with_backoff(extract_text, str(pdf_path))
-        _, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
+        # 텍스트 추출 · 렌더링 · 페이지 분석이 같은 문서 핸들을 공유
+        with pdf_context(pdf_path) as pdf:
+            if cpu_pool.enabled():
+                # 추출 · 품질 판정은 CPU 풀에서. 핸들은 VLM 렌더링이 필요할 때만 열린다.
+                text, pages, is_poor, is_fragmented = cpu_pool.run(cpu_pool.extract_text_profile, str(pdf_path))
+            else:
+                text, pages, blocks = _call_with_backoff(extract_text, pdf)
+                _, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
 
-        extracted = ""
-        method = "pymupdf"
+            extracted = ""
+            method = "pymupdf"
 
-        if use_vlm and is_poor:
-            img = render_first_page(str(pdf_path))
-            vd = _call_with_backoff(call_nova_visual, img, model_lite, region, _PROMPT_OCR)
-            extracted = vd.get("readable_text") or ""
-            method = "nova_hybrid"
-            vlm_usage = vd.pop("_usage", {})
-            total_input_tokens += int(vlm_usage.get("input_tokens", 0))
-            total_output_tokens += int(vlm_usage.get("output_tokens", 0))
-        elif use_vlm and is_fragmented:
-            imgs = render_pages(str(pdf_path), max_pages=10, dpi=100)
-            info = analyze_pages(str(pdf_path), max_pages=10)
-            prompt = build_presentation_prompt(info)
-            vd = _call_with_backoff(call_nova_visual, imgs, model_id, region, prompt, max_tokens=5000)
-            extracted = vd.get("readable_text") or ""
-            method = "nova_presentation"
-            vlm_usage = vd.pop("_usage", {})
-            total_input_tokens += int(vlm_usage.get("input_tokens", 0))
-            total_output_tokens += int(vlm_usage.get("output_tokens", 0))
-
-        full_text = "\n\n".join(filter(None, [extracted, text]))
-        text_chars = len(full_text)
-        detected_facts = extract_condition_facts(full_text)
+            if use_vlm and is_poor:
+                img = render_first_page(pdf)
+                vd = _call_with_backoff(call_nova_visual, img, model_lite, region, _PROMPT_OCR, stage="bedrock")
+                extracted = vd.get("readable_text") or ""
+                method = "nova_hybrid"
+                vlm_usage = vd.pop("_usage", {})
+                total_input_tokens += int(vlm_usage.get("input_tokens", 0))
+                total_output_tokens += int(vlm_usage.get("output_tokens", 0))
+            elif use_vlm and is_fragmented:
+                imgs = render_pages(pdf, max_pages=10, dpi=100)
+                info = analyze_pages(pdf, max_pages=10)
+                prompt = build_presentation_prompt(info)
+                vd = _call_with_backoff(call_nova_visual, imgs, model_id, region, prompt, max_tokens=5000, stage="bedrock")
+                extracted = vd.get("readable_text") or ""
+                method = "nova_presentation"
+                vlm_usage = vd.pop("_usage", {})
+                total_input_tokens += int(vlm_usage.get("input_tokens", 0))
+                total_output_tokens += int(vlm_usage.get("output_tokens", 0))
+
+            full_text = "\n\n".join(filter(None, [extracted, text]))
+            text_chars = len(full_text)
+            detected_facts = extract_condition_facts(full_text)
 
         if team_id:
             _cache_put(
@@ -2008,7 +2980,7 @@ def _process_single_condition_check(
                 team_id,
                 parse_cache_key,
                 {
-                    "analysis_text": full_text[:PARSE_CACHE_TEXT_CHARS],
+                    "analysis_text": full_text[:PARSE_CACHE_TEXT_CHARS] if PARSE_CACHE_TEXT_CHARS > 0 else full_text,
                     "pages": pages,
                     "method": method,
                     "text_chars": text_chars,
@@ -2022,32 +2994,53 @@ def _process_single_condition_check(
                 namespace="PARSE",
             )
 
-    check = _call_with_backoff(check_conditions_nova, full_text, conditions, model_id, region, detected_facts)
+    missing_conditions = [condition for _, condition in missing]
+    if CONDITION_BATCH_WINDOW_MS > 0 and team_id and job_id:
+        # The batcher takes the "bedrock" gate itself around the real call (see its docstring).
+        check = _call_with_backoff(
+            _condition_batcher.check, (team_id, job_id),
+            full_text, missing_conditions, model_id, region, detected_facts,
+        )
+    else:
+        check = _call_with_backoff(check_conditions_nova, full_text, missing_conditions, model_id, region, detected_facts, stage="bedrock")
 
     # Aggregate token usage from condition check call.
     check_usage = check.pop("_usage", {})
-    total_input_tokens += int(check_usage.get("input_tokens", 0))
-    total_output_tokens += int(check_usage.get("output_tokens", 0))
+    check_input_tokens = int(check_usage.get("input_tokens", 0))
+    check_output_tokens = int(check_usage.get("output_tokens", 0))
+    total_input_tokens += check_input_tokens
+    total_output_tokens += check_output_tokens
+
+    fresh_verdicts = _fresh_condition_verdicts(missing, check.get("conditions", []), check_input_tokens, check_output_tokens)
+    merged_conditions, condition_summary = _merge_condition_verdicts(
+        conditions, condition_keys, cached_verdicts, fresh_verdicts, check.get("condition_summary"),
+    )
+    company_source = check
+    if cached_doc and condition_summary.get("llm_skipped") and cached_doc.get("company_name"):
+        company_source = cached_doc  # Keep the LLM-read company name when only rules ran now.
+    saved_verdicts = [cached_verdicts[key] for key in dict.fromkeys(condition_keys) if key in cached_verdicts]
 
     entry.update({
         "method": method,
         "pages": pages,
-        "company_name": check.get("company_name"),
-        "company_group_name": check.get("company_group_name"),
-        "company_group_key": check.get("company_group_key"),
-        "conditions": check.get("conditions", []),
-        "condition_summary": check.get("condition_summary", {}),
+        "company_name": company_source.get("company_name"),
+        "company_group_name": company_source.get("company_group_name"),
+        "company_group_key": company_source.get("company_group_key"),
+        "conditions": merged_conditions,
+        "condition_summary": condition_summary,
         "detected_facts": check.get("detected_facts") if isinstance(check.get("detected_facts"), dict) else detected_facts,
         "parse_warning": check.get("parse_warning"),
         "raw_response": check.get("raw_response"),
+        "context": check.get("context"),
         "text_chars": text_chars,
         "elapsed_s": round(time.time() - t0, 1),
         "cache": {
             "file_signature": file_digest[:8],
             "result_hit": False,
             "parse_hit": parse_cache_hit,
-            "saved_input_tokens": parse_saved_input_tokens,
-            "saved_output_tokens": parse_saved_output_tokens,
+            "condition_hits": sum(1 for key in condition_keys if key in cached_verdicts),
+            "saved_input_tokens": parse_saved_input_tokens + sum(int(v.get("input_tokens", 0)) for v in saved_verdicts),
+            "saved_output_tokens": parse_saved_output_tokens + sum(int(v.get("output_tokens", 0)) for v in saved_verdicts),
         },
         "token_usage": {
             "input_tokens": total_input_tokens,
@@ -2056,13 +3049,76 @@ def _process_single_condition_check(
         },
     })
 
-    # Store in cache for future identical requests.
+    # Store the per-file part and each fresh verdict for future requests.
     if team_id:
-        _cache_put(ctx, team_id, result_cache_key, entry, namespace="RESULT")
+        doc = {k: v for k, v in entry.items() if k not in ("filename", "conditions", "condition_summary", "cache", "token_usage")}
+        doc["parse_token_usage"] = {
+            "input_tokens": total_input_tokens - check_input_tokens + parse_saved_input_tokens,
+            "output_tokens": total_output_tokens - check_output_tokens + parse_saved_output_tokens,
+        }
+        _cache_put_many(ctx, team_id, {result_cache_key: doc, **fresh_verdicts}, namespace="RESULT")
 
     return entry
 
 
+def _fresh_condition_verdicts(
+    missing: List[Tuple[str, str]],
+    checked: List[Dict[str, Any]],
+    input_tokens: int,
+    output_tokens: int,
+) -> Dict[str, Dict[str, Any]]:
+    """Cache entries for freshly checked conditions, keyed by condition cache key.
+
+    The call's token usage is split evenly over the LLM-judged verdicts so a
+    later cache hit can report what it saved.
+    """
+    pairs = [(key, item) for (key, _), item in zip(missing, checked) if isinstance(item, dict)]
+    llm_keys = [key for key, item in pairs if item.get("source", "llm") == "llm"] or [key for key, _ in pairs]
+    verdicts: Dict[str, Dict[str, Any]] = {}
+    for key, item in pairs:
+        verdicts[key] = {"item": item, "input_tokens": 0, "output_tokens": 0}
+    for i, key in enumerate(llm_keys):
+        verdicts[key]["input_tokens"] = input_tokens // len(llm_keys) + (1 if i < input_tokens % len(llm_keys) else 0)
+        verdicts[key]["output_tokens"] = output_tokens // len(llm_keys) + (1 if i < output_tokens % len(llm_keys) else 0)
+    return verdicts
+
+
+def _merge_condition_verdicts(
+    conditions: List[str],
+    condition_keys: List[str],
+    cached: Dict[str, Dict[str, Any]],
+    fresh: Dict[str, Dict[str, Any]],
+    fresh_summary: Optional[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Merge cached and fresh verdicts back into request order and the usual summary shape."""
+    from ralph.condition_checker import _DEFAULT_EVIDENCE
+
+    merged: List[Dict[str, Any]] = []
+    cached_rule = cached_llm = cached_count = 0
+    for condition, key in zip(conditions, condition_keys):
+        verdict = fresh.get(key) or cached.get(key)
+        if verdict is None:
+            item: Dict[str, Any] = {"condition": condition, "result": False, "evidence": _DEFAULT_EVIDENCE}
+        else:
+            item = {**verdict.get("item", {}), "condition": condition}
+        if key not in fresh and key in cached:
+            cached_count += 1
+            if item.get("source") == "rule":
+                cached_rule += 1
+            else:
+                cached_llm += 1
+        merged.append(item)
+
+    summary = dict(fresh_summary) if isinstance(fresh_summary, dict) else {}
+    if cached_count:
+        summary["total"] = len(conditions)
+        summary["rule_count"] = int(summary.get("rule_count", 0)) + cached_rule
+        summary["llm_count"] = int(summary.get("llm_count", 0)) + cached_llm
+        summary["llm_skipped"] = bool(summary.get("llm_skipped", fresh_summary is None))
+        summary["cached_count"] = cached_count
+    return merged, summary
+
+
 def _process_single_document_extraction(
     ctx: AwsCtx,
     pdf_path: Path,
@@ -2235,40 +3291,133 @@ def _check_and_maybe_assemble(
         ddb_update_job_index_state(ctx, team_id, job_id, fanout=True, fanout_status="failed")
 
 
+def _task_result_row(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Decode the stored result of one TASK record into an artifact row."""
+    result_raw = task.get("result")
+    if isinstance(result_raw, str):
+        try:
+            return json.loads(result_raw)
+        except json.JSONDecodeError:
+            return {"filename": str(task.get("file_id", "")), "error": result_raw}
+    if isinstance(result_raw, dict):
+        return result_raw
+    return {
+        "filename": str(task.get("file_id", "")),
+        "error": str(task.get("error", "unknown")),
+    }
+
+
+def _iter_task_rows(ctx: AwsCtx, team_id: str, job_id: str) -> Iterator[Dict[str, Any]]:
+    """Decoded task results in task order, fetched lazily page by page.
+
+    DynamoDB returns a partition's items in sort-key order, so rows come out in
+    task order without collecting and sorting the whole job first.
+    """
+    for page in ddb_iter_task_pages(ctx, team_id, job_id):
+        for task in page:
+            yield _task_result_row(task)
+
+
+class _TaskRowSpool:
+    """Task result rows spooled to a local JSONL file during assembly.
+
+    The first assembly pass streams rows from DynamoDB into the spool; artifact
+    writers then re-read it line by line. Peak memory is one query page plus
+    per-company aggregates, however many files the job has.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.count = 0
+        self._fh: Optional[IO[str]] = None
+
+    def append(self, row: Dict[str, Any]) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("w", encoding="utf-8")
+        self._fh.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._fh.write("\n")
+        self.count += 1
+
+    def seal(self) -> None:
+        """Finish writing. Iteration is only valid after sealing."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        elif not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.touch()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+
+class _FanoutRowStats:
+    """Job-level metric counters, accumulated one result row at a time."""
+
+    def __init__(self) -> None:
+        self.total = 0
+        self.success_count = 0
+        self.warning_count = 0
+        self.result_cache_hits = 0
+        self.parse_cache_hits = 0
+        self.rule_condition_count = 0
+        self.llm_condition_count = 0
+        self.rule_only_files = 0
+        self.saved_input_tokens = 0
+        self.saved_output_tokens = 0
+        self.text_chars = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def add(self, r: Dict[str, Any]) -> None:
+        self.total += 1
+        if "error" not in r:
+            self.success_count += 1
+        if r.get("parse_warning"):
+            self.warning_count += 1
+
+        tu = r.get("token_usage") if isinstance(r.get("token_usage"), dict) else {}
+        self.input_tokens += int(tu.get("input_tokens", 0))
+        self.output_tokens += int(tu.get("output_tokens", 0))
+        cache = r.get("cache") if isinstance(r.get("cache"), dict) else {}
+        if cache.get("result_hit"):
+            self.result_cache_hits += 1
+        if cache.get("parse_hit"):
+            self.parse_cache_hits += 1
+        self.saved_input_tokens += int(cache.get("saved_input_tokens", 0))
+        self.saved_output_tokens += int(cache.get("saved_output_tokens", 0))
+
+        summary = r.get("condition_summary") if isinstance(r.get("condition_summary"), dict) else {}
+        rule_hits = int(summary.get("rule_count", 0))
+        llm_hits = int(summary.get("llm_count", 0))
+        self.rule_condition_count += rule_hits
+        self.llm_condition_count += llm_hits
+        if rule_hits > 0 and llm_hits == 0:
+            self.rule_only_files += 1
+
+        self.text_chars += int(r.get("text_chars", 0))
+
+
 def _assemble_fanout_results(
     ctx: AwsCtx, team_id: str, job_id: str, job: Dict[str, Any],
 ) -> None:
-    """Query all task results, build CSV + JSON, upload to S3, mark job succeeded."""
+    """Stream all task results into CSV + JSON (+ XLSX), upload to S3, mark job succeeded.
+
+    Rows are never held in memory all at once: pass 1 consumes the task query page
+    by page into a JSONL spool while collecting counters and company groups, pass 2
+    writes every artifact incrementally from the spool.
+    """
     job_type = str(job.get("type") or "")
     params = job.get("params") if isinstance(job.get("params"), dict) else {}
     conditions: List[str] = [str(c) for c in (params.get("conditions") or []) if c]
 
-    # Query all tasks.
-    tasks = ddb_query_all_tasks(ctx, team_id, job_id)
-    tasks.sort(key=lambda t: str(t.get("sk", "")))
-
-    # Parse task results.
-    rows: List[Dict[str, Any]] = []
-    for task in tasks:
-        result_raw = task.get("result")
-        if isinstance(result_raw, str):
-            try:
-                result_data = json.loads(result_raw)
-            except json.JSONDecodeError:
-                result_data = {"filename": str(task.get("file_id", "")), "error": result_raw}
-        elif isinstance(result_raw, dict):
-            result_data = result_raw
-        else:
-            result_data = {
-                "filename": str(task.get("file_id", "")),
-                "error": str(task.get("error", "unknown")),
-            }
-        rows.append(result_data)
-
-    # Build CSV (same format as legacy _handle_condition_check).
     job_dir = _job_temp_dir(team_id, job_id)
     try:
-        _assemble_fanout_inner(ctx, team_id, job_id, job, job_type, conditions, rows, job_dir)
+        _assemble_fanout_inner(ctx, team_id, job_id, job, job_type, conditions, job_dir)
     finally:
         if job_dir.exists():
             shutil.rmtree(job_dir, ignore_errors=True)
@@ -2281,33 +3430,49 @@ def _assemble_fanout_inner(
     job: Dict[str, Any],
     job_type: str,
     conditions: List[str],
-    rows: List[Dict[str, Any]],
     job_dir: Path,
 ) -> None:
     assembly_dir = job_dir / "assembly"
     assembly_dir.mkdir(parents=True, exist_ok=True)
 
+    # Pass 1: task pages → JSONL spool, plus everything needed before writing artifacts.
+    is_condition_check = job_type == "condition_check" and bool(conditions)
+    spool = _TaskRowSpool(assembly_dir / "task_results.jsonl")
+    stats = _FanoutRowStats()
+    raw_groups: Dict[str, Dict[str, Any]] = {}
+    xlsx_widths = _ConditionXlsxWidths(conditions)
+    try:
+        for row in _iter_task_rows(ctx, team_id, job_id):
+            spool.append(row)
+            stats.add(row)
+            if is_condition_check:
+                _collect_company_group(raw_groups, row)
+                xlsx_widths.observe(row)
+    finally:
+        spool.seal()
+
+    # Pass 2: artifacts, written row by row from the spool.
     xlsx_path: Optional[Path] = None
     companies: List[Dict[str, Any]] = []
     company_alias_stats = {
         "company_alias_merge_count": 0,
         "company_alias_merged_files": 0,
     }
-    if job_type == "condition_check" and conditions:
-        company_alias_stats = _canonicalize_condition_company_rows(rows)
-        csv_path, json_path, companies = _build_condition_check_csv(assembly_dir, rows, conditions)
-        try:
-            xlsx_path = _build_condition_check_xlsx(assembly_dir, rows, conditions)
-        except Exception as e:
-            log.warning("XLSX generation failed (CSV still available): %s", e)
+    if is_condition_check:
+        csv_path, json_path, xlsx_path, companies, company_alias_stats = _stream_condition_check_artifacts(
+            assembly_dir, spool, conditions, raw_groups, xlsx_widths,
+        )
     elif job_type == "financial_extraction":
         csv_path, json_path, xlsx_path, companies = _build_financial_extraction_artifacts(
-            assembly_dir, rows,
+            assembly_dir, spool,
         )
     else:
         # Generic JSON-only output for other fan-out types.
         json_path = assembly_dir / "results.json"
-        _write_json(json_path, {"total": len(rows), "results": rows})
+        results_writer = _JsonStreamWriter(json_path, "results", {"total": stats.total})
+        for row in spool:
+            results_writer.append(row)
+        results_writer.close()
         csv_path = None
         companies = []
 
@@ -2383,42 +3548,8 @@ def _assemble_fanout_inner(
             except Exception:
                 pass  # Best-effort; lifecycle rule handles leftovers.
 
-    success_count = sum(1 for r in rows if "error" not in r)
-    warning_count = sum(1 for r in rows if r.get("parse_warning"))
-    result_cache_hits = 0
-    parse_cache_hits = 0
-    rule_condition_count = 0
-    llm_condition_count = 0
-    rule_only_files = 0
-    saved_input_tokens = 0
-    saved_output_tokens = 0
-    total_text_chars = 0
-
-    # Aggregate token usage across all tasks.
-    total_input_tokens = 0
-    total_output_tokens = 0
-    for r in rows:
-        tu = r.get("token_usage") if isinstance(r.get("token_usage"), dict) else {}
-        total_input_tokens += int(tu.get("input_tokens", 0))
-        total_output_tokens += int(tu.get("output_tokens", 0))
-        cache = r.get("cache") if isinstance(r.get("cache"), dict) else {}
-        if cache.get("result_hit"):
-            result_cache_hits += 1
-        if cache.get("parse_hit"):
-            parse_cache_hits += 1
-        saved_input_tokens += int(cache.get("saved_input_tokens", 0))
-        saved_output_tokens += int(cache.get("saved_output_tokens", 0))
-
-        summary = r.get("condition_summary") if isinstance(r.get("condition_summary"), dict) else {}
-        rule_hits = int(summary.get("rule_count", 0))
-        llm_hits = int(summary.get("llm_count", 0))
-        rule_condition_count += rule_hits
-        llm_condition_count += llm_hits
-        if rule_hits > 0 and llm_hits == 0:
-            rule_only_files += 1
-
-        total_text_chars += int(r.get("text_chars", 0))
-
+    total = stats.total
+    success_count = stats.success_count
     recognized_company_files = (
         sum(int(company.get("file_count", 0)) for company in companies)
         if job_type == "condition_check"
@@ -2426,33 +3557,33 @@ def _assemble_fanout_inner(
     )
 
     metrics: Dict[str, Any] = {
-        "total": len(rows),
+        "total": total,
         "success_count": success_count,
-        "failed_count": len(rows) - success_count,
-        "warning_count": warning_count,
+        "failed_count": total - success_count,
+        "warning_count": stats.warning_count,
         "company_group_count": len(companies) if job_type == "condition_check" else 0,
         "recognized_company_files": recognized_company_files,
-        "unrecognized_company_files": len(rows) - recognized_company_files if job_type == "condition_check" else 0,
+        "unrecognized_company_files": total - recognized_company_files if job_type == "condition_check" else 0,
         "company_alias_merge_count": company_alias_stats["company_alias_merge_count"] if job_type == "condition_check" else 0,
         "company_alias_merged_files": company_alias_stats["company_alias_merged_files"] if job_type == "condition_check" else 0,
-        "result_cache_hits": result_cache_hits,
-        "parse_cache_hits": parse_cache_hits,
-        "rule_condition_count": rule_condition_count,
-        "llm_condition_count": llm_condition_count,
-        "rule_only_files": rule_only_files,
-        "text_chars": total_text_chars,
-        "saved_input_tokens": saved_input_tokens,
-        "saved_output_tokens": saved_output_tokens,
-        "saved_total_tokens": saved_input_tokens + saved_output_tokens,
+        "result_cache_hits": stats.result_cache_hits,
+        "parse_cache_hits": stats.parse_cache_hits,
+        "rule_condition_count": stats.rule_condition_count,
+        "llm_condition_count": stats.llm_condition_count,
+        "rule_only_files": stats.rule_only_files,
+        "text_chars": stats.text_chars,
+        "saved_input_tokens": stats.saved_input_tokens,
+        "saved_output_tokens": stats.saved_output_tokens,
+        "saved_total_tokens": stats.saved_input_tokens + stats.saved_output_tokens,
         "conditions": conditions,
         "companies": companies,
         "artifacts_bytes": total_bytes,
         "deleted_inputs": deleted_inputs,
         "ended_at": _now_iso(),
         "token_usage": {
-            "input_tokens": total_input_tokens,
-            "output_tokens": total_output_tokens,
-            "total_tokens": total_input_tokens + total_output_tokens,
+            "input_tokens": stats.input_tokens,
+            "output_tokens": stats.output_tokens,
+            "total_tokens": stats.input_tokens + stats.output_tokens,
         },
     }
 
@@ -2476,19 +3607,53 @@ def _assemble_fanout_inner(
 
     log.info(
         "Assembly complete: job=%s artifacts=%d success=%d failed=%d",
-        job_id, len(uploaded), success_count, len(rows) - success_count,
+        job_id, len(uploaded), success_count, total - success_count,
     )
 
     # Webhook notification.
     job_title = str(job.get("title") or job_type)
     _send_webhook(
         job_id, job_title, "succeeded",
-        total=len(rows), success=success_count, failed=len(rows) - success_count,
+        total=total, success=success_count, failed=total - success_count,
     )
 
-    # Release memory after assembly — rows can be large for 700+ files.
-    del rows
-    gc.collect()
+
+class _JsonStreamWriter:
+    """Writes ``{**head, array_key: [items...], **tail}`` one array item at a time.
+
+    The text matches ``_write_json`` (2-space indent) for the same key order, but
+    the array is never held in memory. Keys only known after the last item go in
+    ``tail``.
+    """
+
+    def __init__(self, path: Path, array_key: str, head: Optional[Dict[str, Any]] = None) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._fh = path.open("w", encoding="utf-8")
+        self._fh.write("{\n")
+        for key, value in (head or {}).items():
+            self._fh.write(f"  {self._dump(key)}: {self._dump(value, 1)},\n")
+        self._fh.write(f"  {self._dump(array_key)}: [")
+
+    @staticmethod
+    def _dump(value: Any, level: int = 0) -> str:
+        text = json.dumps(value, ensure_ascii=False, indent=2, default=str)
+        # Encoded strings never contain raw newlines, so this only re-indents structure.
+        return text.replace("\n", "\n" + "  " * level) if level else text
+
+    def append(self, item: Any) -> None:
+        self._fh.write(",\n    " if self.count else "\n    ")
+        self._fh.write(self._dump(item, 2))
+        self.count += 1
+
+    def close(self, tail: Optional[Dict[str, Any]] = None) -> Path:
+        self._fh.write("\n  ]" if self.count else "]")
+        for key, value in (tail or {}).items():
+            self._fh.write(f",\n  {self._dump(key)}: {self._dump(value, 1)}")
+        self._fh.write("\n}")
+        self._fh.close()
+        return self.path
 
 
 def _company_identity_from_row(row: Dict[str, Any]) -> Tuple[str, str, str]:
@@ -2509,59 +3674,170 @@ def _company_identity_from_row(row: Dict[str, Any]) -> Tuple[str, str, str]:
     return company_name, company_group_name, company_group_key
 
 
-def _canonicalize_condition_company_rows(rows: List[Dict[str, Any]]) -> Dict[str, int]:
-    from ralph.company_encoder import build_company_alias_map
+def _collect_company_group(raw_groups: Dict[str, Dict[str, Any]], row: Dict[str, Any]) -> None:
+    """Count one row toward its raw (pre-canonicalization) company group."""
+    company_name, company_group_name, company_group_key = _company_identity_from_row(row)
+    if not company_group_key or not company_group_name:
+        return
+    group = raw_groups.setdefault(company_group_key, {
+        "company_group_key": company_group_key,
+        "company_group_name": company_group_name,
+        "file_count": 0,
+        "representative_company_name": company_name or company_group_name,
+    })
+    group["file_count"] += 1
+    if company_name and len(company_name) > len(str(group.get("representative_company_name") or "")):
+        group["representative_company_name"] = company_name
 
-    raw_groups: Dict[str, Dict[str, Any]] = {}
-    for row in rows:
-        company_name, company_group_name, company_group_key = _company_identity_from_row(row)
-        if not company_group_key or not company_group_name:
-            continue
-        group = raw_groups.setdefault(company_group_key, {
-            "company_group_key": company_group_key,
-            "company_group_name": company_group_name,
-            "file_count": 0,
-            "representative_company_name": company_name or company_group_name,
-        })
-        group["file_count"] += 1
-        if company_name and len(company_name) > len(str(group.get("representative_company_name") or "")):
-            group["representative_company_name"] = company_name
+
+def _apply_company_alias(row: Dict[str, Any], alias_map: Dict[str, Dict[str, str]]) -> bool:
+    """Rewrite a row's company group to its canonical alias. Returns True if it was merged."""
+    company_name, company_group_name, company_group_key = _company_identity_from_row(row)
+    if not company_group_key:
+        return False
+    canonical = alias_map.get(company_group_key)
+    if not canonical:
+        return False
+    if canonical["company_group_key"] == company_group_key:
+        row["company_group_name"] = company_group_name or canonical["company_group_name"]
+        row["company_group_key"] = company_group_key
+        return False
+
+    row["company_group_alias_from"] = company_group_name or company_group_key
+    row["company_group_name"] = canonical["company_group_name"]
+    row["company_group_key"] = canonical["company_group_key"]
+    detected_facts = row.get("detected_facts") if isinstance(row.get("detected_facts"), dict) else None
+    if detected_facts is not None:
+        detected_facts["company_group_name"] = canonical["company_group_name"]
+        detected_facts["company_group_key"] = canonical["company_group_key"]
+    return True
+
+
+def _stream_condition_check_artifacts(
+    output_dir: Path,
+    rows: Iterable[Dict[str, Any]],
+    conditions: List[str],
+    raw_groups: Dict[str, Dict[str, Any]],
+    xlsx_widths: _ConditionXlsxWidths,
+) -> Tuple[Path, Path, Optional[Path], List[Dict[str, Any]], Dict[str, int]]:
+    """Canonicalize company groups and write CSV, JSON and XLSX in one pass over rows.
+
+    ``raw_groups`` and ``xlsx_widths`` must already cover every row (assembly pass 1).
+    With the CPU pool enabled and a spooled input, the XLSX is written by a pool
+    process reading the spool while this thread writes CSV/JSON.
+    """
+    from ralph import cpu_pool
+    from ralph.company_encoder import build_company_alias_map
 
     alias_map, alias_stats = build_company_alias_map(list(raw_groups.values()))
+    # Canonicalization can only swap a group name for another group's name.
+    for group in raw_groups.values():
+        xlsx_widths.observe_value(2, group["company_group_name"])
+    for canonical in alias_map.values():
+        xlsx_widths.observe_value(2, canonical["company_group_name"])
+
+    csv_writer = _ConditionCheckCsvWriter(output_dir, conditions)
+    xlsx_writer: Optional[_ConditionCheckXlsxWriter] = None
+    xlsx_future = None
+    if cpu_pool.enabled() and isinstance(rows, _TaskRowSpool):
+        xlsx_future = cpu_pool.submit(
+            _write_condition_xlsx_from_spool,
+            str(rows.path), str(output_dir), conditions, xlsx_widths.widths(), alias_map,
+        )
+    else:
+        try:
+            xlsx_writer = _ConditionCheckXlsxWriter(output_dir, conditions, xlsx_widths.widths())
+        except Exception as e:
+            log.warning("XLSX generation failed (CSV still available): %s", e)
+
     merged_files = 0
     for row in rows:
-        company_name, company_group_name, company_group_key = _company_identity_from_row(row)
-        if not company_group_key:
-            continue
-        canonical = alias_map.get(company_group_key)
-        if not canonical:
-            continue
-        if canonical["company_group_key"] == company_group_key:
-            row["company_group_name"] = company_group_name or canonical["company_group_name"]
-            row["company_group_key"] = company_group_key
-            continue
+        if _apply_company_alias(row, alias_map):
+            merged_files += 1
+        csv_writer.add(row)
+        if xlsx_writer is not None:
+            try:
+                xlsx_writer.add(row)
+            except Exception as e:
+                log.warning("XLSX generation failed (CSV still available): %s", e)
+                xlsx_writer = None
+    csv_path, json_path, companies = csv_writer.close()
 
-        merged_files += 1
-        row["company_group_alias_from"] = company_group_name or company_group_key
-        row["company_group_name"] = canonical["company_group_name"]
-        row["company_group_key"] = canonical["company_group_key"]
-        detected_facts = row.get("detected_facts") if isinstance(row.get("detected_facts"), dict) else None
-        if detected_facts is not None:
-            detected_facts["company_group_name"] = canonical["company_group_name"]
-            detected_facts["company_group_key"] = canonical["company_group_key"]
+    xlsx_path: Optional[Path] = None
+    if xlsx_writer is not None:
+        try:
+            xlsx_path = xlsx_writer.close()
+        except Exception as e:
+            log.warning("XLSX generation failed (CSV still available): %s", e)
+    elif xlsx_future is not None:
+        try:
+            xlsx_path = Path(xlsx_future.result())
+        except Exception as e:
+            log.warning("XLSX generation failed (CSV still available): %s", e)
 
-    return {
+    return csv_path, json_path, xlsx_path, companies, {
         "company_alias_merge_count": int(alias_stats.get("merged_group_count", 0)),
         "company_alias_merged_files": merged_files,
     }
 
 
-def _build_condition_check_csv(
-    output_dir: Path,
-    rows: List[Dict[str, Any]],
+def _write_condition_xlsx_from_spool(
+    spool_path: str,
+    output_dir: str,
     conditions: List[str],
-) -> Tuple[Path, Path, List[Dict[str, Any]]]:
-    """Build CSV and JSON files from condition check results (same format as legacy)."""
+    widths: Any,
+    alias_map: Dict[str, Dict[str, str]],
+) -> str:
+    """CPU-pool task: write the condition-check XLSX from a sealed row spool."""
+    writer = _ConditionCheckXlsxWriter(Path(output_dir), conditions, widths)
+    with open(spool_path, encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                row = json.loads(line)
+                _apply_company_alias(row, alias_map)
+                writer.add(row)
+    return str(writer.close())
+
+
+_CONDITION_CSV_BASE_FIELDS = [
+    "filename",
+    "company_name",
+    "company_group",
+    "method",
+    "pages",
+    "elapsed_s",
+    "cache",
+    "rule_conditions",
+    "llm_conditions",
+    "warning",
+    "error",
+]
+
+
+class _ConditionCheckCsvWriter:
+    """Streams condition-check rows into the CSV and JSON artifacts (same format as legacy).
+
+    Company groups are aggregated on the way and returned by ``close``.
+    """
+
+    def __init__(self, output_dir: Path, conditions: List[str]) -> None:
+        self.conditions = conditions
+        self.csv_path = output_dir / "condition_check_results.csv"
+        self.json_path = output_dir / "condition_check_results.json"
+        self._shorts = [c[:30].replace(" ", "_") for c in conditions]
+        fieldnames = list(_CONDITION_CSV_BASE_FIELDS)
+        for short in self._shorts:
+            fieldnames += [f"{short}_result", f"{short}_evidence"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self._csv_fh = self.csv_path.open("w", newline="", encoding="utf-8-sig")
+        self._csv = csv.DictWriter(self._csv_fh, fieldnames=fieldnames, extrasaction="ignore")
+        self._csv.writeheader()
+        self._json = _JsonStreamWriter(self.json_path, "results", {"conditions": conditions})
+        self._company_groups: Dict[str, Dict[str, Any]] = {}
+        self._total = 0
+        self._warning_count = 0
+
+    @staticmethod
     def _cache_label(row: Dict[str, Any]) -> str:
         cache = row.get("cache") if isinstance(row.get("cache"), dict) else {}
         if cache.get("result_hit"):
@@ -2570,27 +3846,7 @@ def _build_condition_check_csv(
             return "parse"
         return ""
 
-    buf = io.StringIO()
-    company_groups: Dict[str, Dict[str, Any]] = {}
-    fieldnames = [
-        "filename",
-        "company_name",
-        "company_group",
-        "method",
-        "pages",
-        "elapsed_s",
-        "cache",
-        "rule_conditions",
-        "llm_conditions",
-        "warning",
-        "error",
-    ]
-    for c in conditions:
-        short = c[:30].replace(" ", "_")
-        fieldnames += [f"{short}_result", f"{short}_evidence"]
-    writer = csv.DictWriter(buf, fieldnames=fieldnames, extrasaction="ignore")
-    writer.writeheader()
-    for r in rows:
+    def add(self, r: Dict[str, Any]) -> None:
         company_name, company_group_name, company_group_key = _company_identity_from_row(r)
         row: Dict[str, Any] = {
             "filename": r.get("filename", ""),
@@ -2599,7 +3855,7 @@ def _build_condition_check_csv(
             "method": r.get("method", ""),
             "pages": r.get("pages", ""),
             "elapsed_s": r.get("elapsed_s", ""),
-            "cache": _cache_label(r),
+            "cache": self._cache_label(r),
             "rule_conditions": (r.get("condition_summary") or {}).get("rule_count", 0)
             if isinstance(r.get("condition_summary"), dict)
             else 0,
@@ -2610,8 +3866,7 @@ def _build_condition_check_csv(
             "error": r.get("error", ""),
         }
         cond_results = r.get("conditions") or []
-        for j, c in enumerate(conditions):
-            short = c[:30].replace(" ", "_")
+        for j, short in enumerate(self._shorts):
             if j < len(cond_results):
                 cr = cond_results[j]
                 row[f"{short}_result"] = "✓" if cr.get("result") else "✗"
@@ -2619,10 +3874,14 @@ def _build_condition_check_csv(
             else:
                 row[f"{short}_result"] = ""
                 row[f"{short}_evidence"] = ""
-        writer.writerow(row)
+        self._csv.writerow(row)
+        self._json.append(r)
+        self._total += 1
+        if r.get("parse_warning"):
+            self._warning_count += 1
 
         if company_group_key:
-            group = company_groups.setdefault(company_group_key, {
+            group = self._company_groups.setdefault(company_group_key, {
                 "company_group_key": company_group_key,
                 "company_group_name": company_group_name or company_name,
                 "representative_company_name": company_name or company_group_name,
@@ -2647,272 +3906,332 @@ def _build_condition_check_csv(
             group["rule_condition_count"] += int(summary.get("rule_count", 0))
             group["llm_condition_count"] += int(summary.get("llm_count", 0))
 
-    csv_path = output_dir / "condition_check_results.csv"
-    csv_path.write_text(buf.getvalue(), encoding="utf-8-sig")
-
-    json_path = output_dir / "condition_check_results.json"
-    warning_count = sum(1 for r in rows if r.get("parse_warning"))
-    company_group_rows = sorted(
-        company_groups.values(),
-        key=lambda item: (-int(item["file_count"]), str(item["company_group_name"] or item["company_group_key"])),
-    )
-    _write_json(json_path, {
-        "conditions": conditions,
-        "total": len(rows),
-        "warning_count": warning_count,
-        "company_groups": company_group_rows,
-        "results": rows,
-    })
-    return csv_path, json_path, company_group_rows
+    def close(self) -> Tuple[Path, Path, List[Dict[str, Any]]]:
+        self._csv_fh.close()
+        company_group_rows = sorted(
+            self._company_groups.values(),
+            key=lambda item: (-int(item["file_count"]), str(item["company_group_name"] or item["company_group_key"])),
+        )
+        self._json.close({
+            "total": self._total,
+            "warning_count": self._warning_count,
+            "company_groups": company_group_rows,
+        })
+        return self.csv_path, self.json_path, company_group_rows
 
 
-def _build_condition_check_xlsx(
+def _build_condition_check_csv(
     output_dir: Path,
     rows: List[Dict[str, Any]],
     conditions: List[str],
-) -> Path:
-    """Build a styled XLSX workbook from condition check results.
+) -> Tuple[Path, Path, List[Dict[str, Any]]]:
+    """Build CSV and JSON files from condition check results (same format as legacy)."""
+    writer = _ConditionCheckCsvWriter(output_dir, conditions)
+    for r in rows:
+        writer.add(r)
+    return writer.close()
 
-    - Header row: bold white text on blue background, frozen.
-    - Result cells: green fill for ✓, red fill for ✗.
-    - Auto-adjusted column widths.
-    - Evidence columns word-wrapped.
-    """
-    from openpyxl import Workbook
-    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-    from openpyxl.utils import get_column_letter
 
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "조건 검사 결과"
-
-    # ── Styles ──
-    header_font = Font(name="맑은 고딕", bold=True, color="FFFFFF", size=10)
-    header_fill = PatternFill(start_color="3182F6", end_color="3182F6", fill_type="solid")
-    header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
-    thin_border = Border(
-        left=Side(style="thin", color="D1D6DB"),
-        right=Side(style="thin", color="D1D6DB"),
-        top=Side(style="thin", color="D1D6DB"),
-        bottom=Side(style="thin", color="D1D6DB"),
-    )
-    pass_fill = PatternFill(start_color="D1FAE5", end_color="D1FAE5", fill_type="solid")
-    pass_font = Font(name="맑은 고딕", color="065F46", bold=True, size=10)
-    fail_fill = PatternFill(start_color="FFE4E6", end_color="FFE4E6", fill_type="solid")
-    fail_font = Font(name="맑은 고딕", color="9F1239", bold=True, size=10)
-    body_font = Font(name="맑은 고딕", size=9)
-    body_align = Alignment(vertical="top", wrap_text=False)
-    evidence_align = Alignment(vertical="top", wrap_text=True)
-    warning_font = Font(name="맑은 고딕", color="B45309", size=9)
-    error_font = Font(name="맑은 고딕", color="DC2626", size=9)
-    cache_font = Font(name="맑은 고딕", color="1D4ED8", size=9)
-
-    # ── Headers ──
-    base_headers = ["파일명", "회사명", "그룹명", "추출 방식", "페이지 수", "처리 시간(초)", "캐시", "규칙 판정", "LLM 판정", "경고", "에러"]
-    headers = list(base_headers)
+_CONDITION_XLSX_BASE_HEADERS = ["파일명", "회사명", "그룹명", "추출 방식", "페이지 수", "처리 시간(초)", "캐시", "규칙 판정", "LLM 판정", "경고", "에러"]
+
+
+def _condition_xlsx_headers(conditions: List[str]) -> List[str]:
+    headers = list(_CONDITION_XLSX_BASE_HEADERS)
     for c in conditions:
         short = c[:40]
         headers.append(f"[결과] {short}")
         headers.append(f"[근거] {short}")
+    return headers
+
+
+def _condition_xlsx_base_values(r: Dict[str, Any]) -> List[Any]:
+    return [
+        r.get("filename", ""),
+        r.get("company_name", ""),
+        (
+            r.get("company_group_name")
+            or (
+                (r.get("detected_facts") or {}).get("company_group_name")
+                if isinstance(r.get("detected_facts"), dict)
+                else ""
+            )
+        ),
+        r.get("method", ""),
+        r.get("pages", ""),
+        r.get("elapsed_s", ""),
+        "result" if isinstance(r.get("cache"), dict) and r["cache"].get("result_hit")
+        else "parse" if isinstance(r.get("cache"), dict) and r["cache"].get("parse_hit")
+        else "",
+        (r.get("condition_summary") or {}).get("rule_count", 0)
+        if isinstance(r.get("condition_summary"), dict)
+        else 0,
+        (r.get("condition_summary") or {}).get("llm_count", 0)
+        if isinstance(r.get("condition_summary"), dict)
+        else 0,
+        r.get("parse_warning", ""),
+        r.get("error", ""),
+    ]
 
-    for col_idx, h in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=h)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_align
-        cell.border = thin_border
-
-    ws.freeze_panes = "A2"
-
-    # ── Data rows ──
-    for row_idx, r in enumerate(rows, 2):
-        base_values = [
-            r.get("filename", ""),
-            r.get("company_name", ""),
-            (
-                r.get("company_group_name")
-                or (
-                    (r.get("detected_facts") or {}).get("company_group_name")
-                    if isinstance(r.get("detected_facts"), dict)
-                    else ""
-                )
-            ),
-            r.get("method", ""),
-            r.get("pages", ""),
-            r.get("elapsed_s", ""),
-            "result" if isinstance(r.get("cache"), dict) and r["cache"].get("result_hit")
-            else "parse" if isinstance(r.get("cache"), dict) and r["cache"].get("parse_hit")
-            else "",
-            (r.get("condition_summary") or {}).get("rule_count", 0)
-            if isinstance(r.get("condition_summary"), dict)
-            else 0,
-            (r.get("condition_summary") or {}).get("llm_count", 0)
-            if isinstance(r.get("condition_summary"), dict)
-            else 0,
-            r.get("parse_warning", ""),
-            r.get("error", ""),
-        ]
+
+def _condition_xlsx_summary_group(r: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """(group key, display name) used by the XLSX summary sheet, or None if unrecognized."""
+    facts = r.get("detected_facts") if isinstance(r.get("detected_facts"), dict) else {}
+    group_name = str(r.get("company_group_name") or facts.get("company_group_name") or "").strip()
+    if not group_name:
+        group_name = str(r.get("company_name") or facts.get("company_name") or "").strip()
+        group_name = group_name.replace("㈜", "")
+        group_name = re.sub(r"\(\s*주\s*\)|（\s*주\s*）", "", group_name)
+        group_name = re.sub(r"\(\s*유\s*\)|（\s*유\s*）", "", group_name)
+        group_name = re.sub(r"^(주식회사|유한회사)\s+", "", group_name)
+        group_name = re.sub(r"\s+(주식회사|유한회사)$", "", group_name)
+        group_name = re.sub(r"\s+", " ", group_name).strip(" -_.,:;")
+    group_key = str(r.get("company_group_key") or facts.get("company_group_key") or "").strip().lower()
+    if not group_key and group_name:
+        group_key = re.sub(r"[^0-9A-Za-z가-힣]+", "", group_name).lower()
+    if not group_key:
+        return None
+    return group_key, group_name or str(r.get("company_name") or "")
+
+
+class _ConditionXlsxWidths:
+    """Column widths of the condition-check sheet, measured before a write-only pass.
+
+    Write-only worksheets need column widths before the first row is appended.
+    """
+
+    def __init__(self, conditions: List[str]) -> None:
+        self._headers = _condition_xlsx_headers(conditions)
+        self._max_len = [len(h) for h in self._headers]
+        self._condition_count = len(conditions)
+
+    def observe_value(self, col: int, value: Any) -> None:
+        """Account for ``value`` in 0-based column ``col``."""
+        if value:
+            self._max_len[col] = max(self._max_len[col], min(len(str(value)), 50))
+
+    def observe(self, r: Dict[str, Any]) -> None:
+        base_values = _condition_xlsx_base_values(r)
+        for col, val in enumerate(base_values):
+            self.observe_value(col, str(val) if val else "")
+        cond_results = r.get("conditions") or []
+        for j in range(min(len(cond_results), self._condition_count)):
+            cr = cond_results[j]
+            result_col = len(base_values) + (j * 2)
+            self.observe_value(result_col, "✓ 충족" if cr.get("result") else "✗ 미충족")
+            self.observe_value(result_col + 1, str(cr.get("evidence", "")))
+
+    def widths(self) -> List[int]:
+        base_count = len(_CONDITION_XLSX_BASE_HEADERS)
+        widths: List[int] = []
+        for col_idx, max_len in enumerate(self._max_len, 1):
+            # Evidence columns get wider.
+            is_evidence = col_idx > base_count and (col_idx - base_count) % 2 == 0
+            widths.append(min(max_len + 4, 60) if is_evidence else min(max_len + 3, 30))
+        return widths
+
+
+class _ConditionCheckXlsxWriter:
+    """Styled condition-check workbook written in openpyxl write-only mode.
+
+    - Header row: bold white text on blue background, frozen.
+    - Result cells: green fill for ✓, red fill for ✗.
+    - Column widths fixed up front (see ``_ConditionXlsxWidths``).
+    - Evidence columns word-wrapped.
+
+    Rows are flushed to disk as they are added; only the summary counters stay in memory.
+    """
+
+    def __init__(self, output_dir: Path, conditions: List[str], column_widths: List[int]) -> None:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+        from openpyxl.utils import get_column_letter
+
+        self._cell_cls = WriteOnlyCell
+        self.conditions = conditions
+        self.xlsx_path = output_dir / "condition_check_results.xlsx"
+        self._wb = Workbook(write_only=True)
+        self._ws = self._wb.create_sheet("조건 검사 결과")
+
+        # ── Styles ──
+        self._thin_border = Border(
+            left=Side(style="thin", color="D1D6DB"),
+            right=Side(style="thin", color="D1D6DB"),
+            top=Side(style="thin", color="D1D6DB"),
+            bottom=Side(style="thin", color="D1D6DB"),
+        )
+        self._pass_fill = PatternFill(start_color="D1FAE5", end_color="D1FAE5", fill_type="solid")
+        self._pass_font = Font(name="맑은 고딕", color="065F46", bold=True, size=10)
+        self._fail_fill = PatternFill(start_color="FFE4E6", end_color="FFE4E6", fill_type="solid")
+        self._fail_font = Font(name="맑은 고딕", color="9F1239", bold=True, size=10)
+        self._body_font = Font(name="맑은 고딕", size=9)
+        self._body_align = Alignment(vertical="top", wrap_text=False)
+        self._evidence_align = Alignment(vertical="top", wrap_text=True)
+        self._result_align = Alignment(horizontal="center", vertical="center")
+        self._warning_font = Font(name="맑은 고딕", color="B45309", size=9)
+        self._error_font = Font(name="맑은 고딕", color="DC2626", size=9)
+        self._cache_font = Font(name="맑은 고딕", color="1D4ED8", size=9)
+        self._label_font = Font(bold=True)
+
+        # ── Headers ──
+        for col_idx, width in enumerate(column_widths, 1):
+            self._ws.column_dimensions[get_column_letter(col_idx)].width = width
+        self._ws.freeze_panes = "A2"
+        header_font = Font(name="맑은 고딕", bold=True, color="FFFFFF", size=10)
+        header_fill = PatternFill(start_color="3182F6", end_color="3182F6", fill_type="solid")
+        header_align = Alignment(horizontal="center", vertical="center", wrap_text=True)
+        self._ws.append([
+            self._cell(h, font=header_font, fill=header_fill, alignment=header_align)
+            for h in _condition_xlsx_headers(conditions)
+        ])
+
+        # ── Summary counters ──
+        self._total = 0
+        self._warnings = 0
+        self._errors = 0
+        self._result_cache_hits = 0
+        self._parse_cache_hits = 0
+        self._rule_conditions = 0
+        self._llm_conditions = 0
+        self._company_groups: Dict[str, Dict[str, Any]] = {}
+        self._pass_counts = [0] * len(conditions)
+        self._fail_counts = [0] * len(conditions)
+
+    def _cell(self, value: Any, *, font: Any = None, fill: Any = None, alignment: Any = None) -> Any:
+        cell = self._cell_cls(self._ws, value=value)
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        if alignment is not None:
+            cell.alignment = alignment
+        cell.border = self._thin_border
+        return cell
+
+    def add(self, r: Dict[str, Any]) -> None:
+        base_values = _condition_xlsx_base_values(r)
         cond_results = r.get("conditions") or []
 
+        cells: List[Any] = []
         for col_idx, val in enumerate(base_values, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=str(val) if val else "")
             if col_idx == 7 and val:
-                cell.font = cache_font
+                font = self._cache_font
             elif col_idx == 10 and val:
-                cell.font = warning_font
+                font = self._warning_font
             elif col_idx == 11 and val:
-                cell.font = error_font
+                font = self._error_font
             else:
-                cell.font = body_font
-            cell.alignment = body_align
-            cell.border = thin_border
-
-        for j, _c in enumerate(conditions):
-            result_col = len(base_values) + (j * 2) + 1
-            evidence_col = result_col + 1
+                font = self._body_font
+            cells.append(self._cell(str(val) if val else "", font=font, alignment=self._body_align))
 
+        for j in range(len(self.conditions)):
             if j < len(cond_results):
                 cr = cond_results[j]
                 is_pass = bool(cr.get("result"))
-                result_text = "✓ 충족" if is_pass else "✗ 미충족"
-                evidence_text = str(cr.get("evidence", ""))
-
-                rc = ws.cell(row=row_idx, column=result_col, value=result_text)
-                rc.fill = pass_fill if is_pass else fail_fill
-                rc.font = pass_font if is_pass else fail_font
-                rc.alignment = Alignment(horizontal="center", vertical="center")
-                rc.border = thin_border
-
-                ec = ws.cell(row=row_idx, column=evidence_col, value=evidence_text)
-                ec.font = body_font
-                ec.alignment = evidence_align
-                ec.border = thin_border
+                cells.append(self._cell(
+                    "✓ 충족" if is_pass else "✗ 미충족",
+                    font=self._pass_font if is_pass else self._fail_font,
+                    fill=self._pass_fill if is_pass else self._fail_fill,
+                    alignment=self._result_align,
+                ))
+                cells.append(self._cell(
+                    str(cr.get("evidence", "")), font=self._body_font, alignment=self._evidence_align,
+                ))
+                if is_pass:
+                    self._pass_counts[j] += 1
+                else:
+                    self._fail_counts[j] += 1
             else:
-                for col in (result_col, evidence_col):
-                    cell = ws.cell(row=row_idx, column=col, value="")
-                    cell.border = thin_border
-
-    # ── Auto column widths ──
-    for col_idx in range(1, len(headers) + 1):
-        max_len = len(str(headers[col_idx - 1]))
-        for row_idx in range(2, len(rows) + 2):
-            val = ws.cell(row=row_idx, column=col_idx).value
-            if val:
-                max_len = max(max_len, min(len(str(val)), 50))
-        col_letter = get_column_letter(col_idx)
-        # Evidence columns get wider.
-        is_evidence = col_idx > len(base_headers) and (col_idx - len(base_headers)) % 2 == 0
-        ws.column_dimensions[col_letter].width = min(max_len + 4, 60) if is_evidence else min(max_len + 3, 30)
-
-    # ── Summary sheet ──
-    ws2 = wb.create_sheet("요약")
-    total = len(rows)
-    warnings = sum(1 for r in rows if r.get("parse_warning"))
-    errors = sum(1 for r in rows if r.get("error"))
-    result_cache_hits = sum(
-        1
-        for r in rows
-        if isinstance(r.get("cache"), dict) and r["cache"].get("result_hit")
-    )
-    parse_cache_hits = sum(
-        1
-        for r in rows
-        if isinstance(r.get("cache"), dict) and r["cache"].get("parse_hit")
-    )
-    rule_conditions = sum(
-        int((r.get("condition_summary") or {}).get("rule_count", 0))
-        for r in rows
-        if isinstance(r.get("condition_summary"), dict)
-    )
-    llm_conditions = sum(
-        int((r.get("condition_summary") or {}).get("llm_count", 0))
-        for r in rows
-        if isinstance(r.get("condition_summary"), dict)
-    )
-    company_groups: Dict[str, Dict[str, Any]] = {}
-    for r in rows:
-        facts = r.get("detected_facts") if isinstance(r.get("detected_facts"), dict) else {}
-        group_name = str(r.get("company_group_name") or facts.get("company_group_name") or "").strip()
-        if not group_name:
-            group_name = str(r.get("company_name") or facts.get("company_name") or "").strip()
-            group_name = group_name.replace("㈜", "")
-            group_name = re.sub(r"\(\s*주\s*\)|（\s*주\s*）", "", group_name)
-            group_name = re.sub(r"\(\s*유\s*\)|（\s*유\s*）", "", group_name)
-            group_name = re.sub(r"^(주식회사|유한회사)\s+", "", group_name)
-            group_name = re.sub(r"\s+(주식회사|유한회사)$", "", group_name)
-            group_name = re.sub(r"\s+", " ", group_name).strip(" -_.,:;")
-        group_key = str(r.get("company_group_key") or facts.get("company_group_key") or "").strip().lower()
-        if not group_key and group_name:
-            group_key = re.sub(r"[^0-9A-Za-z가-힣]+", "", group_name).lower()
-        if not group_key:
-            continue
-        group = company_groups.setdefault(group_key, {
-            "name": group_name or str(r.get("company_name") or ""),
-            "file_count": 0,
-        })
-        group["file_count"] += 1
-    ws2.cell(row=1, column=1, value="총 파일 수").font = Font(bold=True)
-    ws2.cell(row=1, column=2, value=total)
-    ws2.cell(row=2, column=1, value="경고 파일 수").font = Font(bold=True)
-    ws2.cell(row=2, column=2, value=warnings)
-    ws2.cell(row=3, column=1, value="에러 파일 수").font = Font(bold=True)
-    ws2.cell(row=3, column=2, value=errors)
-    ws2.cell(row=4, column=1, value="검사 조건 수").font = Font(bold=True)
-    ws2.cell(row=4, column=2, value=len(conditions))
-    ws2.cell(row=5, column=1, value="결과 캐시 적중 파일 수").font = Font(bold=True)
-    ws2.cell(row=5, column=2, value=result_cache_hits)
-    ws2.cell(row=6, column=1, value="파싱 캐시 적중 파일 수").font = Font(bold=True)
-    ws2.cell(row=6, column=2, value=parse_cache_hits)
-    ws2.cell(row=7, column=1, value="규칙 판정 조건 수").font = Font(bold=True)
-    ws2.cell(row=7, column=2, value=rule_conditions)
-    ws2.cell(row=8, column=1, value="LLM 판정 조건 수").font = Font(bold=True)
-    ws2.cell(row=8, column=2, value=llm_conditions)
-    ws2.cell(row=9, column=1, value="인식된 기업 그룹 수").font = Font(bold=True)
-    ws2.cell(row=9, column=2, value=len(company_groups))
-    ws2.cell(row=10, column=1, value="기업명 인식 파일 수").font = Font(bold=True)
-    ws2.cell(row=10, column=2, value=sum(int(group["file_count"]) for group in company_groups.values()))
-
-    condition_summary_start_row = 12
-    if company_groups:
-        start_row = 12
-        ws2.cell(row=start_row, column=1, value="기업 그룹").font = Font(bold=True)
-        ws2.cell(row=start_row, column=2, value="파일 수").font = Font(bold=True)
-        for index, group in enumerate(
-            sorted(company_groups.values(), key=lambda item: (-int(item["file_count"]), str(item["name"]))),
-            start=1,
+                cells.append(self._cell(""))
+                cells.append(self._cell(""))
+        self._ws.append(cells)
+
+        self._total += 1
+        self._warnings += 1 if r.get("parse_warning") else 0
+        self._errors += 1 if r.get("error") else 0
+        cache = r.get("cache") if isinstance(r.get("cache"), dict) else {}
+        self._result_cache_hits += 1 if cache.get("result_hit") else 0
+        self._parse_cache_hits += 1 if cache.get("parse_hit") else 0
+        if isinstance(r.get("condition_summary"), dict):
+            self._rule_conditions += int(r["condition_summary"].get("rule_count", 0))
+            self._llm_conditions += int(r["condition_summary"].get("llm_count", 0))
+        summary_group = _condition_xlsx_summary_group(r)
+        if summary_group is not None:
+            group_key, group_name = summary_group
+            group = self._company_groups.setdefault(group_key, {"name": group_name, "file_count": 0})
+            group["file_count"] += 1
+
+    def close(self) -> Path:
+        # ── Summary sheet ──
+        ws2 = self._wb.create_sheet("요약")
+        ws2.column_dimensions["A"].width = 50
+        ws2.column_dimensions["B"].width = 12
+        ws2.column_dimensions["C"].width = 12
+
+        def label(text: str) -> Any:
+            cell = self._cell_cls(ws2, value=text)
+            cell.font = self._label_font
+            return cell
+
+        for text, value in (
+            ("총 파일 수", self._total),
+            ("경고 파일 수", self._warnings),
+            ("에러 파일 수", self._errors),
+            ("검사 조건 수", len(self.conditions)),
+            ("결과 캐시 적중 파일 수", self._result_cache_hits),
+            ("파싱 캐시 적중 파일 수", self._parse_cache_hits),
+            ("규칙 판정 조건 수", self._rule_conditions),
+            ("LLM 판정 조건 수", self._llm_conditions),
+            ("인식된 기업 그룹 수", len(self._company_groups)),
+            ("기업명 인식 파일 수", sum(int(group["file_count"]) for group in self._company_groups.values())),
         ):
-            ws2.cell(row=start_row + index, column=1, value=group["name"])
-            ws2.cell(row=start_row + index, column=2, value=group["file_count"])
-        condition_summary_start_row = start_row + len(company_groups) + 2
-
-    for i, c in enumerate(conditions):
-        pass_count = 0
-        fail_count = 0
-        for r in rows:
-            cond_results = r.get("conditions") or []
-            if i < len(cond_results):
-                if cond_results[i].get("result"):
-                    pass_count += 1
-                else:
-                    fail_count += 1
-        ws2.cell(row=condition_summary_start_row + i, column=1, value=c[:60]).font = body_font
-        ws2.cell(row=condition_summary_start_row + i, column=2, value=f"✓ {pass_count}").font = pass_font
-        ws2.cell(row=condition_summary_start_row + i, column=3, value=f"✗ {fail_count}").font = fail_font
+            ws2.append([label(text), value])
+        ws2.append([])
+
+        if self._company_groups:
+            ws2.append([label("기업 그룹"), label("파일 수")])
+            for group in sorted(
+                self._company_groups.values(), key=lambda item: (-int(item["file_count"]), str(item["name"])),
+            ):
+                ws2.append([group["name"], group["file_count"]])
+            ws2.append([])
+
+        for i, c in enumerate(self.conditions):
+            name = self._cell_cls(ws2, value=c[:60])
+            name.font = self._body_font
+            passed = self._cell_cls(ws2, value=f"✓ {self._pass_counts[i]}")
+            passed.font = self._pass_font
+            failed = self._cell_cls(ws2, value=f"✗ {self._fail_counts[i]}")
+            failed.font = self._fail_font
+            ws2.append([name, passed, failed])
+
+        self._wb.save(str(self.xlsx_path))
+        return self.xlsx_path
 
-    ws2.column_dimensions["A"].width = 50
-    ws2.column_dimensions["B"].width = 12
-    ws2.column_dimensions["C"].width = 12
 
-    xlsx_path = output_dir / "condition_check_results.xlsx"
-    wb.save(str(xlsx_path))
-    return xlsx_path
+def _build_condition_check_xlsx(
+    output_dir: Path,
+    rows: List[Dict[str, Any]],
+    conditions: List[str],
+) -> Path:
+    """Build a styled XLSX workbook from condition check results (see _ConditionCheckXlsxWriter)."""
+    widths = _ConditionXlsxWidths(conditions)
+    for r in rows:
+        widths.observe(r)
+    writer = _ConditionCheckXlsxWriter(output_dir, conditions, widths.widths())
+    for r in rows:
+        writer.add(r)
+    return writer.close()
 
 
 def _build_financial_extraction_artifacts(
     output_dir: Path,
-    rows: List[Dict[str, Any]],
+    rows: Iterable[Dict[str, Any]],
 ) -> Tuple[Path, Path, Path, List[Dict[str, Any]]]:
-    """Build summary artifacts for financial extraction fan-out jobs."""
+    """Build summary artifacts for financial extraction fan-out jobs.
+
+    ``rows`` is consumed once; full results are streamed straight into the JSON artifact.
+    """
     from openpyxl import Workbook
     from openpyxl.styles import Alignment, Font, PatternFill
     from openpyxl.utils import get_column_letter
@@ -2920,8 +4239,11 @@ def _build_financial_extraction_artifacts(
     financial_rows: List[Dict[str, Any]] = []
     inventory_rows: List[Dict[str, Any]] = []
     companies: Dict[str, Dict[str, Any]] = {}
+    json_path = output_dir / "financial_summary.json"
+    results_writer = _JsonStreamWriter(json_path, "results")
 
     for r in rows:
+        results_writer.append(r)
         company_name = str(r.get("company_name") or Path(str(r.get("filename") or "unknown")).stem)
         filename = str(r.get("filename") or "")
         extracted = r.get("extracted") if isinstance(r.get("extracted"), dict) else {}
@@ -2984,12 +4306,10 @@ def _build_financial_extraction_artifacts(
         writer.writeheader()
         writer.writerows(financial_rows)
 
-    json_path = output_dir / "financial_summary.json"
-    _write_json(json_path, {
-        "total": len(rows),
+    results_writer.close({
+        "total": results_writer.count,
         "companies": company_rows,
         "financials": financial_rows,
-        "results": rows,
     })
 
     wb = Workbook()
@@ -3235,6 +4555,26 @@ def _process_message(ctx: AwsCtx, payload: Dict[str, Any]) -> None:
             _clear_log_context()
 
 
+def _start_cpu_pool() -> None:
+    """Spawn and pre-warm the CPU pool (RALPH_CPU_POOL_WORKERS) before taking work."""
+    from ralph import cpu_pool
+
+    if not cpu_pool.enabled():
+        return
+    t0 = time.time()
+    try:
+        started = cpu_pool.warm()
+        log.info("CPU pool ready: %d processes in %dms", started, round((time.time() - t0) * 1000))
+    except Exception as e:
+        log.warning("CPU pool warmup failed (stages run inline until it recovers): %s", e)
+
+
+def _stop_cpu_pool() -> None:
+    from ralph import cpu_pool
+
+    cpu_pool.configure(0)
+
+
 def worker_loop() -> None:
     ctx = AwsCtx()
     log.info(
@@ -3242,6 +4582,7 @@ def worker_loop() -> None:
         ctx.region, ctx.ddb_table, ctx.bucket, WORKER_CONCURRENCY,
     )
     ctx.warmup()
+    _start_cpu_pool()
 
     executor = ThreadPoolExecutor(
         max_workers=WORKER_CONCURRENCY,
@@ -3249,6 +4590,8 @@ def worker_loop() -> None:
     )
     # Track in-flight futures keyed by SQS receipt handle.
     in_flight: Dict[str, Future] = {}
+    leases = _SqsLeases()
+    heartbeat_stop = threading.Event()
 
     # ── Graceful shutdown via SIGTERM/SIGINT ──
     import signal
@@ -3265,22 +4608,20 @@ def worker_loop() -> None:
 
     # ── Health check HTTP server (for ECS) ──
     _start_health_server(in_flight, _shutdown_requested)
+    _start_visibility_heartbeat(ctx, leases, heartbeat_stop)
 
     # ── Periodic task timers ──
     _last_metrics_flush = [time.time()]
     _last_temp_cleanup = [time.time()]
     _last_watchdog_run = [time.time()]
-    TEMP_CLEANUP_INTERVAL = 300  # Purge stale temp dirs every 5 minutes.
-    TEMP_MAX_AGE = 1800  # Temp dirs older than 30 minutes are stale.
-    WATCHDOG_INTERVAL = 120  # Check for timed-out jobs every 2 minutes.
 
     # ── Main loop ──
     while not _shutdown_requested.is_set():
         # Drain completed futures and delete their SQS messages.
-        _drain_completed(ctx, in_flight)
+        _drain_completed(ctx, in_flight, leases)
 
         # Flush metrics every ~60s (each SQS long-poll is ~20s, so every ~3 loops).
-        if time.time() - _last_metrics_flush[0] >= 60:
+        if time.time() - _last_metrics_flush[0] >= METRICS_FLUSH_INTERVAL:
             _metrics.flush(len(in_flight))
             _last_metrics_flush[0] = time.time()
 
@@ -3309,6 +4650,7 @@ def worker_loop() -> None:
                 MaxNumberOfMessages=fetch_count,
                 WaitTimeSeconds=20,
                 VisibilityTimeout=FANOUT_VISIBILITY_TIMEOUT,
+                AttributeNames=["ApproximateReceiveCount"],
             )
         except Exception:
             if _shutdown_requested.is_set():
@@ -3318,21 +4660,25 @@ def worker_loop() -> None:
         _metrics.record_poll(empty=len(msgs) == 0)
         if not msgs:
             continue
+        _prefetch_fanout_rows(ctx, msgs)
 
+        bad_receipts: List[str] = []
         for msg in msgs:
             if _shutdown_requested.is_set():
                 break
             receipt = msg.get("ReceiptHandle")
+            _note_delivery(msg)
             body_raw = msg.get("Body") or ""
             try:
                 payload = json.loads(body_raw)
             except json.JSONDecodeError:
                 log.warning("Bad JSON in SQS message, deleting")
                 if receipt:
-                    ctx.sqs.delete_message(QueueUrl=ctx.queue_url, ReceiptHandle=receipt)
+                    bad_receipts.append(receipt)
                 continue
 
             # For legacy messages, extend visibility timeout since they take longer.
+            visibility = FANOUT_VISIBILITY_TIMEOUT
             if payload.get("version") != 2 and receipt:
                 try:
                     ctx.sqs.change_message_visibility(
@@ -3340,50 +4686,29 @@ def worker_loop() -> None:
                         ReceiptHandle=receipt,
                         VisibilityTimeout=LEGACY_VISIBILITY_TIMEOUT,
                     )
+                    visibility = LEGACY_VISIBILITY_TIMEOUT
                 except Exception:
                     pass  # Best-effort.
 
             future = executor.submit(_process_message, ctx, payload)
             if receipt:
                 in_flight[receipt] = future
+                leases.add(receipt, visibility)
             else:
                 log.warning("Message without ReceiptHandle")
+        _sqs_ack(ctx, bad_receipts)
 
     # ── Graceful drain: wait for in-flight tasks to finish ──
-    DRAIN_TIMEOUT = int(os.getenv("MERRY_DRAIN_TIMEOUT", "120"))
-    # How often to extend visibility of in-flight SQS messages during drain.
-    VISIBILITY_EXTEND_INTERVAL = 30  # seconds
-    # Extension amount (must be > DRAIN_TIMEOUT to prevent re-delivery during drain).
-    VISIBILITY_EXTEND_SECONDS = max(DRAIN_TIMEOUT + 60, FANOUT_VISIBILITY_TIMEOUT)
-
+    # The visibility heartbeat keeps running, so still-running tasks are not
+    # redelivered while we wait for them.
     if in_flight:
         log.info("Draining %d in-flight tasks (timeout=%ds)...", len(in_flight), DRAIN_TIMEOUT)
         deadline = time.time() + DRAIN_TIMEOUT
-        last_visibility_extend = time.time()
 
         while in_flight and time.time() < deadline:
-            _drain_completed(ctx, in_flight)
+            _drain_completed(ctx, in_flight, leases)
             if not in_flight:
                 break
-
-            # Periodically extend SQS visibility for still-running tasks
-            # to prevent re-delivery while we wait for them to finish.
-            if time.time() - last_visibility_extend >= VISIBILITY_EXTEND_INTERVAL:
-                for receipt in list(in_flight.keys()):
-                    try:
-                        ctx.sqs.change_message_visibility(
-                            QueueUrl=ctx.queue_url,
-                            ReceiptHandle=receipt,
-                            VisibilityTimeout=VISIBILITY_EXTEND_SECONDS,
-                        )
-                    except Exception:
-                        pass  # Best-effort; receipt may be stale.
-                log.info(
-                    "Extended visibility for %d in-flight messages (+%ds)",
-                    len(in_flight), VISIBILITY_EXTEND_SECONDS,
-                )
-                last_visibility_extend = time.time()
-
             time.sleep(1)
 
         if in_flight:
@@ -3391,7 +4716,257 @@ def worker_loop() -> None:
         else:
             log.info("All in-flight tasks drained successfully")
 
+    heartbeat_stop.set()
     executor.shutdown(wait=False)
+    _stop_cpu_pool()
+    _metrics.flush(0)
+    log.info("Worker shut down")
+
+
+class _AsyncWorker:
+    """asyncio poll loop for MERRY_WORKER_MODE=async.
+
+    SQS receive/delete/visibility calls run as coroutines on a small SQS
+    executor, so acknowledgements never wait behind a 20s long poll and a
+    finished task frees its slot immediately (no 1s sleep when full). Task
+    bodies stay synchronous and run on a pool sized to max_in_flight; the
+    DDB/S3/Bedrock calls inside them are bounded by the per-stage I/O gates
+    rather than by the number of tasks.
+    """
+
+    def __init__(
+        self,
+        ctx: AwsCtx,
+        *,
+        max_in_flight: int = ASYNC_MAX_IN_FLIGHT,
+        sqs_concurrency: int = ASYNC_SQS_CONCURRENCY,
+        stage_limits: Optional[Dict[str, int]] = None,
+        shutdown: Optional[threading.Event] = None,
+    ) -> None:
+        self.ctx = ctx
+        self.max_in_flight = max(1, max_in_flight)
+        self.stage_limits = ASYNC_STAGE_LIMITS if stage_limits is None else stage_limits
+        self.shutdown = shutdown or threading.Event()
+        # Keyed by SQS receipt handle; len() is read by the health server.
+        self.in_flight: Dict[str, asyncio.Future] = {}
+        self._task_pool = ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="task")
+        # One thread is held by the long poll; the rest serve acks.
+        self._sqs_pool = ThreadPoolExecutor(max_workers=max(2, sqs_concurrency), thread_name_prefix="sqs")
+        self.leases = _SqsLeases()
+        # Finished receipts waiting for the next DeleteMessageBatch.
+        self._ack_buffer: List[str] = []
+        self._ack_timer = False
+        self._acks: set = set()
+        self._slot_freed: Optional[asyncio.Event] = None
+
+    async def _sqs(self, method: str, **kwargs: Any) -> Any:
+        fn = functools.partial(getattr(self.ctx.sqs, method), QueueUrl=self.ctx.queue_url, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._sqs_pool, fn)
+
+    async def _run_sqs(self, fn, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._sqs_pool, fn, *args)
+
+    async def _offload(self, fn, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+    async def _wait_for_slot(self, timeout: float = 1.0) -> None:
+        assert self._slot_freed is not None
+        self._slot_freed.clear()
+        try:
+            await asyncio.wait_for(self._slot_freed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self) -> None:
+        self._slot_freed = asyncio.Event()
+        _configure_io_gates(self.stage_limits)
+        housekeeping = asyncio.create_task(self._housekeeping())
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            await self._poll()
+            await self._drain()
+        finally:
+            housekeeping.cancel()
+            heartbeat.cancel()
+            await asyncio.gather(housekeeping, heartbeat, return_exceptions=True)
+            _configure_io_gates({})
+            self._task_pool.shutdown(wait=False)
+            self._sqs_pool.shutdown(wait=False)
+
+    async def _poll(self) -> None:
+        while not self.shutdown.is_set():
+            available = self.max_in_flight - len(self.in_flight)
+            if available <= 0:
+                await self._wait_for_slot()
+                continue
+
+            try:
+                resp = await self._sqs(
+                    "receive_message",
+                    MaxNumberOfMessages=min(available, 10),
+                    WaitTimeSeconds=20,
+                    VisibilityTimeout=FANOUT_VISIBILITY_TIMEOUT,
+                    AttributeNames=["ApproximateReceiveCount"],
+                )
+            except Exception:
+                if self.shutdown.is_set():
+                    break
+                raise
+            msgs = resp.get("Messages") or []
+            _metrics.record_poll(empty=len(msgs) == 0)
+            if msgs:
+                await self._offload(_prefetch_fanout_rows, self.ctx, msgs)
+
+            for msg in msgs:
+                if self.shutdown.is_set():
+                    break
+                await self._dispatch(msg)
+
+    async def _dispatch(self, msg: Dict[str, Any]) -> None:
+        receipt = msg.get("ReceiptHandle")
+        _note_delivery(msg)
+        try:
+            payload = json.loads(msg.get("Body") or "")
+        except json.JSONDecodeError:
+            log.warning("Bad JSON in SQS message, deleting")
+            if receipt:
+                self._queue_ack(receipt)
+            return
+
+        # For legacy messages, extend visibility timeout since they take longer.
+        visibility = FANOUT_VISIBILITY_TIMEOUT
+        if payload.get("version") != 2 and receipt:
+            try:
+                await self._sqs(
+                    "change_message_visibility",
+                    ReceiptHandle=receipt,
+                    VisibilityTimeout=LEGACY_VISIBILITY_TIMEOUT,
+                )
+                visibility = LEGACY_VISIBILITY_TIMEOUT
+            except Exception:
+                pass  # Best-effort.
+
+        future = asyncio.get_running_loop().run_in_executor(
+            self._task_pool, _process_message, self.ctx, payload,
+        )
+        if not receipt:
+            log.warning("Message without ReceiptHandle")
+            receipt = f"no-receipt:{id(future)}"
+            ack = False
+        else:
+            ack = True
+            self.leases.add(receipt, visibility)
+        self.in_flight[receipt] = future
+        task = asyncio.create_task(self._complete(receipt, future, ack))
+        self._acks.add(task)
+        task.add_done_callback(self._acks.discard)
+
+    async def _complete(self, receipt: str, future: asyncio.Future, ack: bool) -> None:
+        try:
+            await future
+        except Exception as exc:
+            log.error("Message processing error: %s", exc)
+        self.in_flight.pop(receipt, None)
+        self.leases.discard(receipt)
+        assert self._slot_freed is not None
+        self._slot_freed.set()
+        if ack:
+            self._queue_ack(receipt)
+
+    def _queue_ack(self, receipt: str) -> None:
+        """Buffer a delete; a full batch goes out now, otherwise after ACK_BATCH_WINDOW."""
+        self._ack_buffer.append(receipt)
+        if len(self._ack_buffer) >= SQS_BATCH_MAX:
+            self._spawn_ack_flush(0.0)
+        elif not self._ack_timer:
+            self._ack_timer = True
+            self._spawn_ack_flush(ACK_BATCH_WINDOW)
+
+    def _spawn_ack_flush(self, delay: float) -> None:
+        task = asyncio.create_task(self._flush_acks(delay))
+        self._acks.add(task)
+        task.add_done_callback(self._acks.discard)
+
+    async def _flush_acks(self, delay: float) -> None:
+        if delay:
+            await asyncio.sleep(delay)
+            self._ack_timer = False
+        receipts, self._ack_buffer = self._ack_buffer, []
+        if receipts:
+            await self._run_sqs(_sqs_ack, self.ctx, receipts)
+
+    async def _heartbeat(self) -> None:
+        # Separate from _housekeeping so it keeps running through _drain.
+        while True:
+            await asyncio.sleep(VISIBILITY_HEARTBEAT_INTERVAL)
+            try:
+                await self._run_sqs(_visibility_heartbeat, self.ctx, self.leases)
+            except Exception as e:
+                log.warning("Visibility heartbeat failed: %s", e)
+
+    async def _housekeeping(self) -> None:
+        last_metrics = last_cleanup = last_watchdog = time.time()
+        while not self.shutdown.is_set():
+            await asyncio.sleep(1)
+            now = time.time()
+            if now - last_metrics >= METRICS_FLUSH_INTERVAL:
+                _metrics.flush(len(self.in_flight))
+                last_metrics = now
+            if now - last_cleanup >= TEMP_CLEANUP_INTERVAL:
+                await self._offload(_cleanup_stale_temp_dirs, TEMP_MAX_AGE)
+                last_cleanup = now
+            if now - last_watchdog >= WATCHDOG_INTERVAL:
+                await self._offload(_job_timeout_watchdog, self.ctx)
+                last_watchdog = now
+
+    async def _drain(self) -> None:
+        if self.in_flight:
+            log.info("Draining %d in-flight tasks (timeout=%ds)...", len(self.in_flight), DRAIN_TIMEOUT)
+            deadline = time.time() + DRAIN_TIMEOUT
+
+            # The visibility heartbeat keeps still-running tasks from being redelivered.
+            while self.in_flight and time.time() < deadline:
+                await self._wait_for_slot()
+
+            if self.in_flight:
+                log.warning("Drain timeout: %d tasks still running, forcing shutdown", len(self.in_flight))
+            else:
+                log.info("All in-flight tasks drained successfully")
+
+        # Let pending SQS deletes for finished tasks go out before exiting.
+        if self._ack_buffer:
+            self._spawn_ack_flush(0.0)
+        if self._acks:
+            await asyncio.wait(set(self._acks), timeout=5)
+
+
+def async_worker_loop() -> None:
+    """Entry point for MERRY_WORKER_MODE=async (same lifecycle as worker_loop)."""
+    ctx = AwsCtx()
+    log.info(
+        "Worker starting (async): region=%s table=%s bucket=%s max_in_flight=%d stages=%s",
+        ctx.region, ctx.ddb_table, ctx.bucket, ASYNC_MAX_IN_FLIGHT, ASYNC_STAGE_LIMITS,
+    )
+    ctx.warmup()
+    _start_cpu_pool()
+
+    worker = _AsyncWorker(ctx)
+
+    # ── Graceful shutdown via SIGTERM/SIGINT ──
+    import signal
+
+    def _signal_handler(signum: int, _frame: Any) -> None:
+        sig_name = signal.Signals(signum).name
+        log.info("Received %s — initiating graceful shutdown (in_flight=%d)", sig_name, len(worker.in_flight))
+        worker.shutdown.set()
+
+    signal.signal(signal.SIGTERM, _signal_handler)
+    signal.signal(signal.SIGINT, _signal_handler)
+
+    _start_health_server(worker.in_flight, worker.shutdown, concurrency=worker.max_in_flight)
+
+    asyncio.run(worker.run())
+    _stop_cpu_pool()
     _metrics.flush(0)
     log.info("Worker shut down")
 
@@ -3403,54 +4978,57 @@ def _run_parser(pdf_path: str, force_pro: bool = False) -> dict:
         call_nova_visual, render_first_page, render_pages,
         build_presentation_prompt, _PROMPT_OCR,
     )
+    from ralph.pdf_context import pdf_context
 
     model_pro  = os.getenv("RALPH_VLM_NOVA_MODEL_ID",      "us.amazon.nova-pro-v1:0")
     model_lite = os.getenv("RALPH_VLM_NOVA_LITE_MODEL_ID", "us.amazon.nova-lite-v1:0")
     region     = os.getenv("RALPH_VLM_NOVA_REGION",        "us-east-1")
     use_vlm    = os.getenv("RALPH_USE_VLM", "true").lower() != "false"
 
-    text, pages, blocks = extract_text(pdf_path)
-    quality, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
-    filename = os.path.basename(pdf_path)
-    clf = classify_no_vlm(pdf_path, filename)
+    # 텍스트 추출 · 분류 · 렌더링이 같은 문서 핸들을 공유
+    with pdf_context(pdf_path) as pdf:
+        text, pages, blocks = extract_text(pdf)
+        quality, is_poor, is_fragmented = assess_text_quality(text, blocks, page_count=pages)
+        filename = os.path.basename(pdf_path)
+        clf = classify_no_vlm(pdf, filename)
 
-    method = "pymupdf"
-    text_structure = "document"
-    visual_description = None
+        method = "pymupdf"
+        text_structure = "document"
+        visual_description = None
 
-    if force_pro and use_vlm:
-        try:
-            img_bytes = render_first_page(pdf_path, dpi=150)
-            visual_description = call_nova_visual(img_bytes, model_pro, region, _PROMPT_OCR)
-            method = "nova_pro"
-            text_structure = "image"
-        except Exception as e:
-            visual_description = {"error": str(e)}
-            method = "nova_error"
-            text_structure = "image"
-    elif is_poor and use_vlm:
-        try:
-            img_bytes = render_first_page(pdf_path)
-            visual_description = call_nova_visual(img_bytes, model_lite, region, _PROMPT_OCR)
-            method = "nova_hybrid"
-            text_structure = "image"
-        except Exception as e:
-            visual_description = {"error": str(e)}
-            method = "nova_error"
-            text_structure = "image"
-    elif is_fragmented and use_vlm:
-        try:
-            imgs = render_pages(pdf_path)
-            prompt = build_presentation_prompt(
-                [{"page": i + 1} for i in range(len(imgs))]
-            )
-            visual_description = call_nova_visual(imgs, model_pro, region, prompt, max_tokens=5000)
-            method = "nova_presentation"
-            text_structure = "presentation"
-        except Exception as e:
-            visual_description = {"error": str(e)}
-            method = "nova_error"
-            text_structure = "presentation"
+        if force_pro and use_vlm:
+            try:
+                img_bytes = render_first_page(pdf, dpi=150)
+                visual_description = call_nova_visual(img_bytes, model_pro, region, _PROMPT_OCR)
+                method = "nova_pro"
+                text_structure = "image"
+            except Exception as e:
+                visual_description = {"error": str(e)}
+                method = "nova_error"
+                text_structure = "image"
+        elif is_poor and use_vlm:
+            try:
+                img_bytes = render_first_page(pdf)
+                visual_description = call_nova_visual(img_bytes, model_lite, region, _PROMPT_OCR)
+                method = "nova_hybrid"
+                text_structure = "image"
+            except Exception as e:
+                visual_description = {"error": str(e)}
+                method = "nova_error"
+                text_structure = "image"
+        elif is_fragmented and use_vlm:
+            try:
+                imgs = render_pages(pdf)
+                prompt = build_presentation_prompt(
+                    [{"page": i + 1} for i in range(len(imgs))]
+                )
+                visual_description = call_nova_visual(imgs, model_pro, region, prompt, max_tokens=5000)
+                method = "nova_presentation"
+                text_structure = "presentation"
+            except Exception as e:
+                visual_description = {"error": str(e)}
+                method = "nova_error"
+                text_structure = "presentation"
 
     return {
         "ok": True,
@@ -3470,8 +5048,9 @@ def _run_parser(pdf_path: str, force_pro: bool = False) -> dict:
 
 
 def _start_health_server(
-    in_flight: Dict[str, Future],
+    in_flight: Dict[str, Any],
     shutdown_event: threading.Event,
+    concurrency: Optional[int] = None,
 ) -> None:
     """Start a lightweight HTTP health check server on a background thread.
 
@@ -3483,6 +5062,7 @@ def _start_health_server(
     from http.server import HTTPServer, BaseHTTPRequestHandler
 
     port = int(os.getenv("MERRY_HEALTH_PORT", "8080"))
+    capacity = concurrency or WORKER_CONCURRENCY
     _state: Dict[str, Any] = {
         "start": time.time(),
         "total_processed": 0,
@@ -3569,7 +5149,7 @@ def _start_health_server(
                 "status": "draining" if is_shutting_down else "ok",
                 "in_flight": len(in_flight),
                 "shutdown": is_shutting_down,
-                "concurrency": WORKER_CONCURRENCY,
+                "concurrency": capacity,
                 "uptime_s": round(time.time() - _state["start"]),
             })
             # Return 503 during drain so ECS stops routing traffic.
@@ -3581,12 +5161,12 @@ def _start_health_server(
 
         def _handle_ready(self) -> None:
             is_shutting_down = shutdown_event.is_set()
-            has_capacity = len(in_flight) < WORKER_CONCURRENCY
+            has_capacity = len(in_flight) < capacity
             ready = not is_shutting_down and has_capacity
             body = json.dumps({
                 "ready": ready,
                 "in_flight": len(in_flight),
-                "capacity": WORKER_CONCURRENCY - len(in_flight),
+                "capacity": capacity - len(in_flight),
                 "shutdown": is_shutting_down,
             })
             code = 200 if ready else 503
@@ -3615,7 +5195,7 @@ def _start_health_server(
                 f"merry_worker_in_flight {cur_in_flight}",
                 "# HELP merry_worker_concurrency Max concurrent tasks",
                 "# TYPE merry_worker_concurrency gauge",
-                f"merry_worker_concurrency {WORKER_CONCURRENCY}",
+                f"merry_worker_concurrency {capacity}",
                 "# HELP merry_worker_tasks_total Total tasks processed",
                 "# TYPE merry_worker_tasks_total counter",
                 f'merry_worker_tasks_total{{status="succeeded"}} {succeeded}',
@@ -3682,8 +5262,144 @@ def _cleanup_stale_temp_dirs(max_age_seconds: int) -> None:
         log.info("Cleaned up %d stale temp directories", cleaned)
 
 
-def _drain_completed(ctx: AwsCtx, in_flight: Dict[str, Future]) -> None:
-    """Remove completed futures from in_flight and delete their SQS messages."""
+class _SqsLeases:
+    """Visibility deadline of every in-flight SQS receipt (thread-safe).
+
+    Read by the visibility heartbeat to find receipts about to become
+    visible again while their task is still running.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._expires: Dict[str, float] = {}
+        self._received: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._expires)
+
+    def add(self, receipt: str, timeout: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._expires[receipt] = now + timeout
+            self._received[receipt] = now
+
+    def discard(self, receipt: str) -> None:
+        with self._lock:
+            self._expires.pop(receipt, None)
+            self._received.pop(receipt, None)
+
+    def release_overdue(self, max_lease: float) -> List[str]:
+        """Stop tracking receipts held longer than ``max_lease`` seconds and return them.
+
+        Released receipts are never extended again; their current visibility
+        runs out and SQS redelivers the message.
+        """
+        if max_lease <= 0:
+            return []
+        cutoff = time.time() - max_lease
+        with self._lock:
+            overdue = [r for r, received in self._received.items() if received <= cutoff]
+            for receipt in overdue:
+                self._expires.pop(receipt, None)
+                self._received.pop(receipt, None)
+        return overdue
+
+    def due(self, margin: float) -> List[str]:
+        """Receipts whose visibility runs out within ``margin`` seconds."""
+        cutoff = time.time() + margin
+        with self._lock:
+            return [r for r, expires in self._expires.items() if expires <= cutoff]
+
+    def extended(self, receipts: List[str], timeout: float) -> None:
+        expires = time.time() + timeout
+        with self._lock:
+            for receipt in receipts:
+                # Skip receipts acknowledged while the extension was in flight.
+                if receipt in self._expires:
+                    self._expires[receipt] = expires
+
+
+def _note_delivery(msg: Dict[str, Any]) -> None:
+    """Count messages SQS has handed out before (visibility expired or the worker died)."""
+    try:
+        receive_count = int((msg.get("Attributes") or {}).get("ApproximateReceiveCount") or 1)
+    except (TypeError, ValueError):
+        return
+    if receive_count > 1:
+        _metrics.record_sqs("redelivered")
+
+
+def _sqs_batch(ctx: AwsCtx, method: str, receipts: List[str], **extra: Any) -> List[str]:
+    """Call an SQS *Batch API over ``receipts`` in chunks of 10; return the receipts that succeeded."""
+    succeeded: List[str] = []
+    for start in range(0, len(receipts), SQS_BATCH_MAX):
+        chunk = receipts[start:start + SQS_BATCH_MAX]
+        entries = [{"Id": str(i), "ReceiptHandle": receipt, **extra} for i, receipt in enumerate(chunk)]
+        try:
+            resp = getattr(ctx.sqs, method)(QueueUrl=ctx.queue_url, Entries=entries)
+        except Exception as e:
+            log.warning("SQS %s failed for %d receipts: %s", method, len(chunk), e)
+            continue
+        failed = {str(f.get("Id")): f for f in resp.get("Failed") or []}
+        for f in failed.values():
+            log.warning("SQS %s entry failed: %s %s", method, f.get("Code"), f.get("Message"))
+        succeeded.extend(receipt for i, receipt in enumerate(chunk) if str(i) not in failed)
+    return succeeded
+
+
+def _sqs_ack(ctx: AwsCtx, receipts: List[str]) -> None:
+    """Delete finished messages with DeleteMessageBatch (failures are redelivered and deduped by claim)."""
+    if not receipts:
+        return
+    deleted = _sqs_batch(ctx, "delete_message_batch", receipts)
+    if len(deleted) < len(receipts):
+        _metrics.record_sqs("ack_failed", len(receipts) - len(deleted))
+
+
+def _visibility_heartbeat(ctx: AwsCtx, leases: _SqsLeases) -> int:
+    """Extend receipts close to expiry with ChangeMessageVisibilityBatch; returns how many were extended.
+
+    Receipts past VISIBILITY_MAX_LEASE are released first and left to expire.
+    """
+    released = leases.release_overdue(VISIBILITY_MAX_LEASE)
+    if released:
+        _metrics.record_sqs("lease_expired", len(released))
+        log.warning(
+            "Stopped extending visibility for %d messages held over %ds; they will be redelivered",
+            len(released), VISIBILITY_MAX_LEASE,
+        )
+    due = leases.due(VISIBILITY_HEARTBEAT_MARGIN)
+    if not due:
+        return 0
+    extended = _sqs_batch(
+        ctx, "change_message_visibility_batch", due,
+        VisibilityTimeout=FANOUT_VISIBILITY_TIMEOUT,
+    )
+    leases.extended(extended, FANOUT_VISIBILITY_TIMEOUT)
+    if extended:
+        _metrics.record_sqs("extended", len(extended))
+        log.info("Extended visibility for %d in-flight messages (+%ds)", len(extended), FANOUT_VISIBILITY_TIMEOUT)
+    return len(extended)
+
+
+def _start_visibility_heartbeat(ctx: AwsCtx, leases: _SqsLeases, stop: threading.Event) -> threading.Thread:
+    """Run _visibility_heartbeat on a daemon thread until ``stop`` is set (thread mode)."""
+
+    def _run() -> None:
+        while not stop.wait(VISIBILITY_HEARTBEAT_INTERVAL):
+            try:
+                _visibility_heartbeat(ctx, leases)
+            except Exception as e:
+                log.warning("Visibility heartbeat failed: %s", e)
+
+    thread = threading.Thread(target=_run, name="sqs-heartbeat", daemon=True)
+    thread.start()
+    return thread
+
+
+def _drain_completed(ctx: AwsCtx, in_flight: Dict[str, Future], leases: _SqsLeases) -> None:
+    """Remove completed futures from in_flight and batch-delete their SQS messages."""
     done_receipts = []
     for receipt, future in in_flight.items():
         if future.done():
@@ -3695,11 +5411,12 @@ def _drain_completed(ctx: AwsCtx, in_flight: Dict[str, Future]) -> None:
 
     for receipt in done_receipts:
         del in_flight[receipt]
-        try:
-            ctx.sqs.delete_message(QueueUrl=ctx.queue_url, ReceiptHandle=receipt)
-        except Exception as e:
-            log.warning("Failed to delete SQS message: %s", e)
+        leases.discard(receipt)
+    _sqs_ack(ctx, done_receipts)
 
 
 if __name__ == "__main__":
-    worker_loop()
+    if WORKER_MODE == "async":
+        async_worker_loop()
+    else:
+        worker_loop()